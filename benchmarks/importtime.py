@@ -0,0 +1,78 @@
+"""Guard the startup cost of `import us` and of the `states MD` CLI.
+
+    python benchmarks/importtime.py [--import-budget MS] [--cli-budget MS]
+
+Each measurement runs in a fresh interpreter, after a warm-up run that
+writes bytecode, so PYTHONDONTWRITEBYTECODE is cleared for the runs.
+`import us` is measured with `python -X importtime`, the CLI by wall-clock
+time over an empty interpreter launch. The script exits non-zero if a median
+exceeds its budget or if a deferred module is imported on the fast path.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 15
+
+# modules that must stay off the startup path, unless the interpreter has
+# already imported them before us
+DEFERRED = ["jellyfish", "argparse", "typing", "threading", "numbers", "bisect"]
+
+CLI = "import sys; sys.argv = ['states', 'MD']; from us.cli.states import main; main()"
+
+
+# without bytecode, every run would compile the package and its data modules
+ENV = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+
+
+def run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True, env=ENV)
+
+
+def import_time_ms() -> float:
+    proc = run("-X", "importtime", "-c", "import us")
+    for line in proc.stderr.splitlines():
+        _, _, cumulative, name = (part.strip() for part in line.replace("|", ":").split(":"))
+        if name == "us":
+            return int(cumulative) / 1000
+    raise RuntimeError("us not found in -X importtime output")
+
+
+def wall_time_ms(code: str) -> float:
+    start = time.perf_counter()
+    run("-c", code)
+    return (time.perf_counter() - start) * 1000
+
+
+def deferred_imports() -> list:
+    code = f"import sys; before = set(sys.modules); {CLI}; "
+    code += f"print(' '.join(m for m in {DEFERRED!r} if m in sys.modules and m not in before))"
+    return run("-c", code).stdout.splitlines()[-1].split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--import-budget", type=float, default=8.0, help="median ms allowed for import us")
+    parser.add_argument("--cli-budget", type=float, default=40.0, help="median ms allowed for states MD")
+    args = parser.parse_args()
+
+    run("-c", CLI)
+    imports = statistics.median(import_time_ms() for _ in range(RUNS))
+    empty = statistics.median(wall_time_ms("pass") for _ in range(RUNS))
+    cli = statistics.median(wall_time_ms(CLI) for _ in range(RUNS)) - empty
+    loaded = deferred_imports()
+
+    print(f"import us:  {imports:6.1f} ms (budget {args.import_budget} ms)")
+    print(f"states MD:  {cli:6.1f} ms over interpreter startup (budget {args.cli_budget} ms)")
+    print(f"deferred modules imported by states MD: {', '.join(loaded) or 'none'}")
+
+    if imports > args.import_budget or cli > args.cli_budget or loaded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
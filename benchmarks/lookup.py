@@ -0,0 +1,154 @@
+"""Compare indexed us.states.lookup() against the linear scan it replaced.
+
+python benchmarks/lookup.py
+"""
+
+import random
+import timeit
+
+import jellyfish  # type: ignore
+
+import us
+from us.states import ABBR_RE, FIPS_RE, STATES_AND_TERRITORIES
+
+
+def scan_lookup(val, field=None):
+    """The pre-index implementation of lookup(), without the cache."""
+
+    if field is None:
+        if FIPS_RE.match(val):
+            field = "fips"
+        elif ABBR_RE.match(val):
+            val = val.upper()
+            field = "abbr"
+        else:
+            val = jellyfish.metaphone(val)
+            field = "name_metaphone"
+
+    matched_state = None
+    for state in STATES_AND_TERRITORIES:
+        if val == getattr(state, field):
+            matched_state = state
+    return matched_state
+
+
+def scan_point(lat, lon):
+    """Ray-cast against every edge of every boundary, with no grid."""
+
+    from us import geo
+
+    x, y = lon * 10_000, lat * 10_000
+    inside = {}
+    for code, points in geo.rings():
+        for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+            if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                inside[code] = not inside.get(code, False)
+    return next((code for code, flag in inside.items() if flag), 0)
+
+
+CASES = [
+    ("fips", "24", None),
+    ("abbr", "md", None),
+    ("name", "maryland", None),
+    ("exact name", "Maryland", "name"),
+    ("miss", "Narnia", None),
+]
+
+
+def main(number: int = 100_000):
+    print(f"{'case':<12} {'scan':>10} {'index':>10} {'speedup':>8}   (ns per call)")
+    for label, val, field in CASES:
+        assert scan_lookup(val, field) == us.states.lookup(val, field, use_cache=False)
+        scan = timeit.timeit(lambda: scan_lookup(val, field), number=number) / number * 1e9
+        index = timeit.timeit(lambda: us.states.lookup(val, field, use_cache=False), number=number) / number * 1e9
+        print(f"{label:<12} {scan:>10.0f} {index:>10.0f} {scan / index:>7.1f}x")
+
+    column = [random.choice(["24", "md", "Maryland", "virginia", "Narnia", "TX"]) for _ in range(number)]
+    per_row = timeit.timeit(lambda: [us.states.lookup(v, use_cache=False) for v in column], number=1)
+    batch = timeit.timeit(lambda: us.states.lookup_many(column), number=1)
+    print(f"{'column':<12} {per_row * 1e9 / number:>10.0f} {batch * 1e9 / number:>10.0f} {per_row / batch:>7.1f}x")
+    print("  (column: lookup() per row vs. lookup_many())")
+
+    from jellyfish import jaro_winkler_similarity
+
+    def pairwise(val):
+        scored = [(s, jaro_winkler_similarity(val.lower(), s.name.lower())) for s in STATES_AND_TERRITORIES]
+        return sorted(scored, key=lambda c: -c[1])[:3]
+
+    queries = ["Marylend", "missisipi", "West Verginia", "Texs", "Narnia"]
+    full = timeit.timeit(lambda: [pairwise(q) for q in queries], number=number // 100) / (number // 100) / 5
+    blocked = timeit.timeit(lambda: [us.states.lookup_candidates(q) for q in queries], number=number // 100)
+    blocked = blocked / (number // 100) / 5
+    print(f"{'candidates':<12} {full * 1e9:>10.0f} {blocked * 1e9:>10.0f} {full / blocked:>7.1f}x")
+    print("  (candidates: pairwise Jaro-Winkler vs. trigram-blocked lookup_candidates())")
+
+    from us import sets
+
+    states = [random.choice(STATES_AND_TERRITORIES) for _ in range(100)]
+    in_list = timeit.timeit(lambda: [s in us.STATES_CONTIGUOUS for s in states], number=number // 100) / number
+    in_set = timeit.timeit(lambda: [s in sets.STATES_CONTIGUOUS for s in states], number=number // 100) / number
+    print(f"{'membership':<12} {in_list * 1e9:>10.0f} {in_set * 1e9:>10.0f} {in_list / in_set:>7.1f}x")
+    print("  (membership: list vs. StateSet)")
+
+    from us import geo
+
+    points = [(random.uniform(25, 49), random.uniform(-125, -67)) for _ in range(number // 1000)]
+    assert [scan_point(lat, lon) for lat, lon in points] == [geo.state_code(lat, lon) for lat, lon in points]
+    scan = timeit.timeit(lambda: [scan_point(lat, lon) for lat, lon in points], number=1) / len(points)
+    grid = timeit.timeit(lambda: [geo.state_code(lat, lon) for lat, lon in points], number=100) / 100 / len(points)
+    print(f"{'points':<12} {scan * 1e9:>10.0f} {grid * 1e9:>10.0f} {scan / grid:>7.1f}x")
+    print("  (points: ray casting every boundary vs. the grid-indexed lookup_point())")
+
+    def scan_nearest(lat, lon, k):
+        return sorted(STATES_AND_TERRITORIES, key=lambda s: geo.haversine(lat, lon, *s.centroid))[:k]
+
+    scan = timeit.timeit(lambda: [scan_nearest(lat, lon, 3) for lat, lon in points], number=10) / 10 / len(points)
+    tree = timeit.timeit(lambda: [us.states.nearest_states(lat, lon, 3) for lat, lon in points], number=10)
+    tree = tree / 10 / len(points)
+    print(f"{'nearest':<12} {scan * 1e9:>10.0f} {tree * 1e9:>10.0f} {scan / tree:>7.1f}x")
+    print("  (nearest: sorting every state by distance vs. nearest_states(), k=3)")
+
+    from us import borders
+    from us._data.borders import NEIGHBORS
+
+    def bfs_within(abbr, n):
+        seen, frontier = {abbr}, [abbr]
+        for _ in range(n):
+            frontier = [b for a in frontier for b in NEIGHBORS[a] if b not in seen]
+            seen.update(frontier)
+        return seen
+
+    abbrs = [random.choice(list(NEIGHBORS)) for _ in range(100)]
+    assert all({s.abbr for s in borders.within(a, 3)} == bfs_within(a, 3) for a in abbrs)
+    bfs = timeit.timeit(lambda: [bfs_within(a, 3) for a in abbrs], number=number // 1000) / (number // 10)
+    graph = timeit.timeit(lambda: [borders.within(a, 3) for a in abbrs], number=number // 1000) / (number // 10)
+    print(f"{'within':<12} {bfs * 1e9:>10.0f} {graph * 1e9:>10.0f} {bfs / graph:>7.1f}x")
+    print("  (within: breadth-first search vs. precomputed borders.within(), 3 hops)")
+
+    try:
+        import numpy as np  # type: ignore
+    except ImportError:
+        return
+
+    lats, lons = np.random.uniform(25, 49, number * 10), np.random.uniform(-125, -67, number * 10)
+    us.states.lookup_point_array(lats[:10], lons[:10])
+    per_point = timeit.timeit(lambda: us.states.lookup_point_array(lats, lons), number=1) / len(lats)
+    print(f"{'point array':<12} {per_point * 1e9:>10.0f} ns per point with lookup_point_array()")
+
+    try:
+        import pandas as pd  # type: ignore
+    except ImportError:
+        return
+
+    series = pd.Series(column * 10)
+    apply = timeit.timeit(lambda: series.apply(lambda v: us.states.lookup(v, use_cache=False)), number=1)
+    vectorized = timeit.timeit(lambda: us.states.lookup_array(series), number=1)
+    print(
+        f"{'series':<12} {apply * 1e9 / len(series):>10.0f} {vectorized * 1e9 / len(series):>10.0f} "
+        f"{apply / vectorized:>7.1f}x"
+    )
+    print("  (series: Series.apply(lookup) vs. lookup_array())")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Measure how `states normalize --workers N` scales across core counts.
+
+    python benchmarks/normalize.py [ROWS]
+
+Generates a CSV of mostly distinct, misspelled state names so that each
+chunk is dominated by classification and metaphone, then normalizes it
+with an increasing number of worker processes.
+"""
+
+import contextlib
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+import us
+from us.cli import normalize
+
+
+def generate(path: str, rows: int):
+    names = [state.name for state in us.STATES_AND_TERRITORIES]
+    abbrs = [state.abbr for state in us.STATES_AND_TERRITORIES]
+    with open(path, "w") as f:
+        f.write("id,state\n")
+        for i in range(rows):
+            if i % 4 == 0:
+                val = random.choice(abbrs).lower()
+            else:
+                name = list(random.choice(names))
+                name[random.randrange(len(name))] = random.choice(string.ascii_lowercase)
+                val = "".join(name)
+            f.write(f"{i},{val}\n")
+
+
+def main(rows: int = 1_000_000):
+    workers = sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    with tempfile.TemporaryDirectory() as tmp:
+        infile = os.path.join(tmp, "in.csv")
+        outfile = os.path.join(tmp, "out.csv")
+        generate(infile, rows)
+
+        print(f"{rows} rows, {os.cpu_count()} cores")
+        print(f"{'workers':>7} {'seconds':>8} {'rows/sec':>10} {'speedup':>8}")
+        baseline = None
+        for n in workers:
+            start = time.perf_counter()
+            with contextlib.redirect_stderr(open(os.devnull, "w")):
+                normalize.main([infile, "-o", outfile, "-c", "state", "--workers", str(n)])
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{n:>7} {elapsed:>8.2f} {rows / elapsed:>10.0f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
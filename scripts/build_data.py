@@ -0,0 +1,564 @@
+"""Generate the data modules in us/_data from the source tables in
+scripts/data. Edit the tables, not the generated modules, then run:
+
+    python scripts/build_data.py
+
+With --check, exit non-zero instead of writing if a generated module is
+out of date.
+"""
+
+import argparse
+import base64
+import csv
+import importlib.util
+import json
+import os
+import sys
+import zlib
+from array import array
+
+import jellyfish  # type: ignore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(ROOT, "scripts", "data")
+TARGET_DIR = os.path.join(ROOT, "us", "_data")
+
+
+def _load_aliases():
+    # loaded from its file rather than imported through `us`, which imports
+    # the data modules this script generates
+    spec = importlib.util.spec_from_file_location("us._aliases", os.path.join(ROOT, "us", "_aliases.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+_normalize = _load_aliases().normalize
+
+HEADER = "# Generated by scripts/build_data.py from scripts/data/{source}. Do not edit.\n"
+
+# State fields in the order rows are stored in the generated module
+STATE_FIELDS = (
+    "abbr",
+    "ap_abbr",
+    "capital",
+    "capital_tz",
+    "capital_coords",
+    "centroid",
+    "fips",
+    "is_territory",
+    "is_obsolete",
+    "is_contiguous",
+    "is_continental",
+    "name",
+    "name_metaphone",
+    "statehood_year",
+    "time_zones",
+)
+
+# fields with indexes precomputed for auto-detected lookups
+INDEXED_FIELDS = ("fips", "abbr", "name", "name_metaphone")
+
+
+def read_table(name: str):
+    with open(os.path.join(SOURCE_DIR, name), newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _bool(val: str) -> bool:
+    if val not in ("true", "false"):
+        raise ValueError(f"expected true or false, got {val!r}")
+    return val == "true"
+
+
+def py(value) -> str:
+    """Python source for a literal, on a single line."""
+    if isinstance(value, str):
+        return json.dumps(value)
+    if isinstance(value, tuple):
+        return "(" + ", ".join(py(v) for v in value) + ("," if len(value) == 1 else "") + ")"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{py(k)}: {py(v)}" for k, v in value.items()) + "}"
+    return repr(value)
+
+
+def literal(name: str, value) -> str:
+    """Python source assigning a literal to `name`, with one line per item
+    of a top-level dict or tuple."""
+    if isinstance(value, dict):
+        items = [f"    {py(k)}: {py(v)},\n" for k, v in value.items()]
+        return f"{name} = {{\n{''.join(items)}}}\n"
+    if isinstance(value, tuple):
+        items = [f"    {py(v)},\n" for v in value]
+        return f"{name} = (\n{''.join(items)})\n"
+    return f"{name} = {py(value)}\n"
+
+
+def _decode_ring(ring: str) -> list:
+    """(x, y) points of a delta-encoded ring from boundaries.csv."""
+    values = [int(v) for v in ring.split()]
+    points = [(values[0], values[1])]
+    for i in range(2, len(values), 2):
+        points.append((points[-1][0] + values[i], points[-1][1] + values[i + 1]))
+    return points
+
+
+def _centroids() -> dict:
+    """abbr -> (lat, lon) of the area-weighted centroid of each state's
+    boundary in boundaries.csv, in degrees of longitude and latitude. States
+    whose boundary crosses the antimeridian, such as Alaska with the western
+    Aleutians, are shifted west by 360 degrees to compute it."""
+
+    rings: dict = {}
+    for row in read_table("boundaries.csv"):
+        rings.setdefault(row["abbr"], []).append(_decode_ring(row["ring"]))
+
+    centroids = {}
+    for abbr, state_rings in rings.items():
+        xs = [x for points in state_rings for x, _ in points]
+        shift = max(xs) - min(xs) > 180 * 10_000
+        area = cx = cy = 0.0
+        for points in state_rings:
+            if shift:
+                points = [(x - 360 * 10_000 if x > 0 else x, y) for x, y in points]
+            for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]):
+                cross = x0 * y1 - x1 * y0
+                area += cross
+                cx += (x0 + x1) * cross
+                cy += (y0 + y1) * cross
+        lon, lat = cx / (3 * area) / 10_000, cy / (3 * area) / 10_000
+        centroids[abbr] = (round(lat, 4), round(lon + 360 if lon < -180 else lon, 4))
+    return centroids
+
+
+def build_states() -> str:
+    """states.csv has one row per state, territory, or obsolete territory,
+    in order of name. The columns are the State fields, except that
+    name_metaphone is computed here, capital_lat and capital_lon are
+    combined into capital_coords, centroid is computed from boundaries.csv,
+    and `commonwealth` only feeds the COMMONWEALTHS list. aliases.csv lists
+    extra names and abbreviations that lookup() should accept for a state."""
+
+    centroids = _centroids()
+    rows = {}
+    commonwealths = []
+    for row in read_table("states.csv"):
+        state = {
+            "abbr": row["abbr"],
+            "ap_abbr": row["ap_abbr"] or None,
+            "capital": row["capital"] or None,
+            "capital_tz": row["capital_tz"] or None,
+            "capital_coords": (float(row["capital_lat"]), float(row["capital_lon"])) if row["capital_lat"] else None,
+            "centroid": centroids.get(row["abbr"]),
+            "fips": row["fips"] or None,
+            "is_territory": _bool(row["is_territory"]),
+            "is_obsolete": _bool(row["is_obsolete"]),
+            "is_contiguous": _bool(row["is_contiguous"]),
+            "is_continental": _bool(row["is_continental"]),
+            "name": row["name"],
+            "name_metaphone": jellyfish.metaphone(row["name"]),
+            "statehood_year": int(row["statehood_year"]) if row["statehood_year"] else None,
+            "time_zones": tuple(row["time_zones"].split()),
+        }
+        rows[state["abbr"]] = state
+        if _bool(row["commonwealth"]):
+            commonwealths.append(state["abbr"])
+
+    # DC is neither a state nor a territory, unless DC_STATEHOOD is set
+    # when the package is imported
+    current = [s for s in rows.values() if not s["is_obsolete"]]
+    states = [s["abbr"] for s in current if not s["is_territory"] and s["abbr"] != "DC"]
+    territories = [s["abbr"] for s in current if s["is_territory"]]
+
+    lists = {
+        "OBSOLETE": [s["abbr"] for s in rows.values() if s["is_obsolete"]],
+        "TERRITORIES": territories,
+        "STATES": states,
+        "STATES_CONTIGUOUS": [abbr for abbr in states if rows[abbr]["is_contiguous"]],
+        "STATES_CONTINENTAL": [abbr for abbr in states if rows[abbr]["is_continental"]],
+        "STATES_AND_TERRITORIES": states + territories,
+        "COMMONWEALTHS": commonwealths,
+    }
+
+    # lookup() resolves DC too, even though it is in none of the lists
+    lookup = lists["STATES_AND_TERRITORIES"] + ["DC"]
+
+    # when values collide the last state wins, as it does in lookup()
+    indexes = {}
+    for field in INDEXED_FIELDS:
+        indexes[field] = {rows[abbr][field]: abbr for abbr in lookup}
+
+    # FIPS number -> abbr, the small-integer state codes used by encode()
+    codes = [None] * 100
+    for abbr in lookup:
+        codes[int(rows[abbr]["fips"])] = abbr
+
+    # abbr -> StateSet bit: the FIPS number, or 100 and up for states that
+    # don't have one
+    bits = {}
+    unnumbered = 0
+    for abbr, state in rows.items():
+        if state["fips"]:
+            bits[abbr] = int(state["fips"])
+        else:
+            bits[abbr] = 100 + unnumbered
+            unnumbered += 1
+
+    time_zones = {}
+    for abbr in lookup:
+        for tz in rows[abbr]["time_zones"]:
+            time_zones[tz] = time_zones.get(tz, ()) + (abbr,)
+    time_zones = dict(sorted(time_zones.items()))
+
+    # normalized names, abbreviations, AP abbreviations and the variants in
+    # aliases.csv; an alias may only ever mean one state
+    aliases = {}
+    variants = [(abbr, rows[abbr][field]) for abbr in lookup for field in ("name", "abbr", "ap_abbr")]
+    variants += [(row["abbr"], row["alias"]) for row in read_table("aliases.csv")]
+    for abbr, variant in variants:
+        if variant is None:
+            continue
+        if abbr not in lookup:
+            raise ValueError(f"alias {variant!r} is for unknown state {abbr!r}")
+        alias = _normalize(variant)
+        if aliases.setdefault(alias, abbr) != abbr:
+            raise ValueError(f"alias {variant!r} is ambiguous: {aliases[alias]} or {abbr}")
+
+    out = [HEADER.format(source="states.csv"), "\n"]
+    out.append(literal("FIELDS", STATE_FIELDS))
+    out.append("\n# abbr -> field values in FIELDS order\n")
+    out.append(literal("ROWS", {abbr: tuple(state[f] for f in STATE_FIELDS) for abbr, state in rows.items()}))
+    out.append("\n# named lists of states, as abbreviations\n")
+    out.append(literal("LISTS", {name: tuple(abbrs) for name, abbrs in lists.items()}))
+    out.append("\n# states that lookup() resolves: STATES_AND_TERRITORIES and DC\n")
+    out.append(literal("LOOKUP", tuple(lookup)))
+    out.append("\n# field -> {value: abbr} over LOOKUP\n")
+    out.append(literal("INDEXES", indexes))
+    out.append("\n# normalized alias -> abbr over LOOKUP\n")
+    out.append(literal("ALIASES", aliases))
+    out.append("\n# FIPS number -> abbr over LOOKUP, None for unused numbers\n")
+    out.append(literal("CODES", tuple(codes)))
+    out.append("\n# abbr -> StateSet bit: the FIPS number, or 100 and up for states without one\n")
+    out.append(literal("BITS", bits))
+    out.append("\n# time zone -> abbrs over LOOKUP that observe it\n")
+    out.append(literal("TIME_ZONES", time_zones))
+    return "".join(out)
+
+
+def build_zips() -> str:
+    """zip_ranges.csv maps inclusive ranges of 5-digit ZIP codes to states,
+    in ascending order. Ranges follow 3-digit ZIP prefixes, split where a
+    few ZIP codes in a prefix belong to another state. ZIP codes of APO/FPO
+    military addresses and the freely associated states are not covered."""
+
+    fips = {row["abbr"]: row["fips"] for row in read_table("states.csv") if row["fips"]}
+
+    starts, ends, codes = [], [], []
+    for row in read_table("zip_ranges.csv"):
+        start, end = int(row["start"]), int(row["end"])
+        if start > end or (ends and start <= ends[-1]):
+            raise ValueError(f"ZIP range {row['start']}-{row['end']} is out of order")
+        if row["abbr"] not in fips:
+            raise ValueError(f"ZIP range {row['start']}-{row['end']} is for unknown state {row['abbr']!r}")
+        starts.append(start)
+        ends.append(end)
+        codes.append(int(fips[row["abbr"]]))
+
+    out = [HEADER.format(source="zip_ranges.csv"), "\n"]
+    out.append("# inclusive ZIP code ranges as integers, in ascending order, and the FIPS\n")
+    out.append("# number of the state each range belongs to\n")
+    out.append(f"STARTS = {py(tuple(starts))}\n")
+    out.append(f"ENDS = {py(tuple(ends))}\n")
+    out.append(f"CODES = {py(tuple(codes))}\n")
+    return "".join(out)
+
+
+def build_counties() -> str:
+    """counties.csv has one row per county or county equivalent, in order of
+    FIPS code, with the name split from its legal/statistical area
+    description (LSAD) suffix, such as "County" or "Parish".
+    county_aliases.csv lists former and alternate names."""
+
+    state_fips = {row["fips"] for row in read_table("states.csv") if row["fips"]}
+
+    rows = {}
+    for row in read_table("counties.csv"):
+        fips = row["state_fips"] + row["county_fips"]
+        if row["state_fips"] not in state_fips:
+            raise ValueError(f"county {fips} is in unknown state {row['state_fips']}")
+        if rows and fips <= list(rows)[-1]:
+            raise ValueError(f"county {fips} is out of order")
+        rows[fips] = (row["name"], row["lsad"])
+
+    states = {}
+    for i, fips in enumerate(rows):
+        start, _ = states.get(fips[:2], (i, i))
+        states[fips[:2]] = (start, i + 1)
+
+    aliases = {}
+    for row in read_table("county_aliases.csv"):
+        if row["fips"] not in rows:
+            raise ValueError(f"alias {row['alias']!r} is for unknown county {row['fips']}")
+        aliases[row["fips"]] = aliases.get(row["fips"], ()) + (row["alias"],)
+
+    out = [HEADER.format(source="counties.csv"), "\n"]
+    out.append("# 5-digit FIPS code -> (name, LSAD suffix), in order of FIPS code\n")
+    out.append(literal("ROWS", rows))
+    out.append("\n# state FIPS code -> (start, stop) positions of its counties in ROWS\n")
+    out.append(literal("STATES", states))
+    out.append("\n# 5-digit FIPS code -> former and alternate full names\n")
+    out.append(literal("ALIASES", aliases))
+    return "".join(out)
+
+
+def build_shapefiles() -> str:
+    """shapefiles.csv has a URL template per TIGER/Line vintage and level.
+    Templates of state-based files contain {fips}; the rest are national
+    files. Congressional district files are for the Congress in office at
+    the vintage, as in the file names."""
+
+    templates: dict = {}
+    for row in read_table("shapefiles.csv"):
+        if "{" in row["url"].replace("{fips}", ""):
+            raise ValueError(f"unknown placeholder in {row['url']!r}")
+        templates.setdefault(row["vintage"], {})[row["level"]] = row["url"]
+
+    out = [HEADER.format(source="shapefiles.csv"), "\n"]
+    out.append("# vintage -> level -> URL template, with {fips} for state-based files\n")
+    out.append(literal("TEMPLATES", templates))
+    return "".join(out)
+
+
+# the grid of build_boundaries(), in the 1e-4 degree units of boundaries.csv:
+# cells of 0.1 degrees, in blocks of 10x10 cells, covering every state and
+# territory
+GRID_WEST = -1_800_000
+GRID_SOUTH = -150_000
+GRID_CELL = 1000
+GRID_BLOCK = 10
+GRID_COLUMNS = 3600
+GRID_ROWS = 870
+
+
+def blob(name: str, values: array) -> str:
+    """Python source assigning the zlib-compressed, base64-encoded bytes of
+    an array, in little-endian order, to `name`."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    data = base64.b64encode(zlib.compress(values.tobytes(), 9)).decode("ascii")
+    lines = [f'    "{data[i : i + 100]}"\n' for i in range(0, len(data), 100)]
+    return f"{name} = (\n{''.join(lines)})\n"
+
+
+def _supercover(x1: int, y1: int, x2: int, y2: int) -> list:
+    """The (row, column) grid cells an edge passes through or touches."""
+    if x1 > x2:
+        x1, y1, x2, y2 = x2, y2, x1, y1
+    cells = []
+    for col in range((x1 - GRID_WEST) // GRID_CELL, (x2 - GRID_WEST) // GRID_CELL + 1):
+        xa = max(x1, GRID_WEST + col * GRID_CELL)
+        xb = min(x2, GRID_WEST + (col + 1) * GRID_CELL)
+        if x1 == x2:
+            ya, yb = y1, y2
+        else:
+            ya = y1 + (y2 - y1) * (xa - x1) / (x2 - x1)
+            yb = y1 + (y2 - y1) * (xb - x1) / (x2 - x1)
+        low, high = sorted((ya, yb))
+        for row in range(int((low - GRID_SOUTH) // GRID_CELL), int((high - GRID_SOUTH) // GRID_CELL) + 1):
+            cells.append((row, col))
+    return cells
+
+
+def build_boundaries() -> str:
+    """boundaries.csv has one row per ring of a state's simplified boundary,
+    generated by scripts/simplify_boundaries.py, with coordinates as
+    delta-encoded (longitude, latitude) pairs in units of 1e-4 degrees.
+
+    The rings are rasterized onto a grid of 0.1 degree cells. Each cell is
+    empty, inside a single state, or a boundary cell that an edge passes
+    through, with the states whose edges do. Blocks of 10x10 cells that are
+    all empty or all inside one state are stored as one value; the rest are
+    stored cell by cell."""
+
+    fips = {row["abbr"]: int(row["fips"]) for row in read_table("states.csv") if row["fips"]}
+
+    rings = []
+    for row in read_table("boundaries.csv"):
+        if row["abbr"] not in fips:
+            raise ValueError(f"boundary ring for unknown state {row['abbr']!r}")
+        points = _decode_ring(row["ring"])
+        for x, y in points:
+            if not (0 <= x - GRID_WEST < GRID_COLUMNS * GRID_CELL and 0 <= y - GRID_SOUTH < GRID_ROWS * GRID_CELL):
+                raise ValueError(f"boundary of {row['abbr']} is outside the grid at {(x, y)}")
+        rings.append((fips[row["abbr"]], [int(v) for v in row["ring"].split()], points))
+
+    # cells that edges pass through -> codes of the states they belong to
+    boundary: dict = {}
+    # grid row -> (code, edge) of edges that span the center of the row
+    bands: dict = {}
+    for code, _, points in rings:
+        for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+            for cell in _supercover(x1, y1, x2, y2):
+                boundary.setdefault(cell, set()).add(code)
+            low, high = sorted((y1, y2))
+            first = -(-(low - GRID_SOUTH - GRID_CELL // 2) // GRID_CELL)
+            for row in range(max(first, 0), (high - GRID_SOUTH - GRID_CELL // 2 - 1) // GRID_CELL + 1):
+                bands.setdefault(row, []).append((code, x1, y1, x2, y2))
+
+    # fill the inside of each state along the center line of each row, with
+    # the even-odd rule
+    cells = bytearray(GRID_ROWS * GRID_COLUMNS)
+    for row, edges in bands.items():
+        y = GRID_SOUTH + row * GRID_CELL + GRID_CELL // 2
+        crossings: dict = {}
+        for code, x1, y1, x2, y2 in edges:
+            crossings.setdefault(code, []).append(x1 + (x2 - x1) * (y - y1) / (y2 - y1))
+        for code, xs in crossings.items():
+            xs.sort()
+            for xa, xb in zip(xs[0::2], xs[1::2]):
+                # cells whose center is between the crossings
+                start = -int(-(xa - GRID_WEST - GRID_CELL // 2) // GRID_CELL)
+                stop = -int(-(xb - GRID_WEST - GRID_CELL // 2) // GRID_CELL)
+                offset = row * GRID_COLUMNS
+                cells[offset + start : offset + stop] = bytes([code]) * (stop - start)
+
+    # boundary cell values are 100 and up: 100 + index into CANDIDATES
+    candidates: dict = {}
+    values = array("H", list(cells))
+    for row, col in sorted(boundary):
+        key = tuple(sorted(boundary[row, col]))
+        values[row * GRID_COLUMNS + col] = 100 + candidates.setdefault(key, len(candidates))
+
+    # block values below 100 are codes of whole blocks, and 100 and up are
+    # 100 + index of the block in CELLS
+    block_columns = GRID_COLUMNS // GRID_BLOCK
+    blocks = array("H")
+    cell_blocks = array("H")
+    for block_row in range(GRID_ROWS // GRID_BLOCK):
+        for block_col in range(block_columns):
+            block = array("H")
+            for row in range(block_row * GRID_BLOCK, (block_row + 1) * GRID_BLOCK):
+                start = row * GRID_COLUMNS + block_col * GRID_BLOCK
+                block.extend(values[start : start + GRID_BLOCK])
+            if min(block) == max(block) < 100:
+                blocks.append(block[0])
+            else:
+                blocks.append(100 + len(cell_blocks) // len(block))
+                cell_blocks.extend(block)
+
+    coords = array("i")
+    lengths = []
+    for code, ring_values, _ in rings:
+        coords.extend(ring_values)
+        lengths.append((code, len(ring_values) // 2))
+
+    out = [HEADER.format(source="boundaries.csv"), "\n"]
+    out.append("# coordinates are in units of 1e-4 degrees\n")
+    out.append("SCALE = 10000\n")
+    out.append("\n# grid origin, cell size, and size in cells; cells are grouped in square blocks\n")
+    out.append(f"WEST = {GRID_WEST}\n")
+    out.append(f"SOUTH = {GRID_SOUTH}\n")
+    out.append(f"CELL = {GRID_CELL}\n")
+    out.append(f"BLOCK = {GRID_BLOCK}\n")
+    out.append(f"COLUMNS = {GRID_COLUMNS}\n")
+    out.append(f"ROWS = {GRID_ROWS}\n")
+    out.append("\n# (FIPS number, number of points) of each ring, in the order of RING_COORDS\n")
+    out.append(literal("RINGS", tuple(lengths)))
+    out.append("\n# FIPS numbers of the states whose edges pass through boundary cells\n")
+    out.append(literal("CANDIDATES", tuple(candidates)))
+    out.append("\n# uint16 value of each block, in row-major order from the southwest: a FIPS\n")
+    out.append("# number, 0 for none, or 100 + index of the block in CELLS\n")
+    out.append(blob("BLOCKS", blocks))
+    out.append("\n# uint16 value of each cell of the blocks that aren't uniform, block by block\n")
+    out.append("# and in row-major order within a block: a FIPS number, 0 for none, or\n")
+    out.append("# 100 + index into CANDIDATES for boundary cells\n")
+    out.append(blob("CELLS", cell_blocks))
+    out.append("\n# int32 coordinates of each ring: the first (x, y) point, then deltas\n")
+    out.append(blob("RING_COORDS", coords))
+    return "".join(out)
+
+
+def build_borders() -> str:
+    """borders.csv lists each pair of states and DC that share a land border
+    once, in alphabetical order. Water-only borders, such as Michigan and
+    Illinois across Lake Michigan, and borders that are a single point, as
+    at the Four Corners, are not included. The table is checked against the
+    borders that boundaries.csv shares between states."""
+
+    # the states that lookup() resolves: every state and territory, and DC
+    lookup = [row["abbr"] for row in read_table("states.csv") if not _bool(row["is_obsolete"])]
+    borders = set()
+    for row in read_table("borders.csv"):
+        pair = (row["abbr"], row["neighbor"])
+        if pair[0] not in lookup or pair[1] not in lookup:
+            raise ValueError(f"border {pair} is for an unknown state")
+        if pair[0] >= pair[1] or pair in borders:
+            raise ValueError(f"border {pair} is out of order or repeated")
+        borders.add(pair)
+
+    # states that share an edge of their simplified boundaries; shared borders
+    # are simplified identically, so shared edges match exactly
+    owners: dict = {}
+    for row in read_table("boundaries.csv"):
+        points = _decode_ring(row["ring"])
+        for edge in zip(points, points[1:] + points[:1]):
+            owners.setdefault(frozenset(edge), set()).add(row["abbr"])
+    shared = {tuple(sorted(abbrs)) for abbrs in owners.values() if len(abbrs) == 2}
+    if shared != borders:
+        raise ValueError(
+            f"borders.csv disagrees with boundaries.csv: missing {sorted(shared - borders)}, "
+            f"not found in boundaries {sorted(borders - shared)}"
+        )
+
+    neighbors = {abbr: () for abbr in lookup}
+    for a, b in sorted(borders):
+        neighbors[a] += (b,)
+        neighbors[b] += (a,)
+
+    out = [HEADER.format(source="borders.csv"), "\n"]
+    out.append("# abbr -> abbrs of the states it shares a land border with, over LOOKUP\n")
+    out.append(literal("NEIGHBORS", {abbr: tuple(sorted(abbrs)) for abbr, abbrs in neighbors.items()}))
+    return "".join(out)
+
+
+MODULES = {
+    "states.py": build_states,
+    "zips.py": build_zips,
+    "counties.py": build_counties,
+    "shapefiles.py": build_shapefiles,
+    "boundaries.py": build_boundaries,
+    "borders.py": build_borders,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the us/_data modules from scripts/data")
+    parser.add_argument("--check", action="store_true", help="fail if a generated module is out of date")
+    args = parser.parse_args()
+
+    stale = []
+    for filename, build in MODULES.items():
+        path = os.path.join(TARGET_DIR, filename)
+        content = build()
+        try:
+            with open(path, encoding="utf-8") as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if content == current:
+            continue
+        stale.append(filename)
+        if not args.check:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+
+    for filename in stale:
+        print(f"{'out of date' if args.check else 'generated'}: us/_data/{filename}")
+
+    if args.check and stale:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Simplify a Census cartographic boundary shapefile of states into
+scripts/data/boundaries.csv, the source of the boundaries that
+us.states.lookup_point() uses:
+
+    python scripts/simplify_boundaries.py cb_2016_us_state_500k.shp
+
+The .dbf file is expected next to the .shp file, or both may be in a zip
+file. Borders shared by two states are simplified once and used by both, so
+simplified states still meet without gaps or overlaps. Coordinates are
+stored in units of 1e-4 degrees, with each ring delta-encoded to keep the
+table small.
+"""
+
+import argparse
+import csv
+import os
+import sys
+from collections import defaultdict
+from typing import Dict, List, Sequence, Set, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from us.spatial import read_shapefile  # noqa: E402
+
+TARGET = os.path.join(ROOT, "scripts", "data", "boundaries.csv")
+
+SCALE = 10_000
+DEFAULT_TOLERANCE = 0.005
+
+Point = Tuple[int, int]
+
+
+def douglas_peucker(points: Sequence[Point], tolerance: float) -> List[Point]:
+    """Simplify an open polyline, keeping both ends."""
+    if len(points) < 3:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    limit = tolerance * tolerance
+    stack = [(0, len(points) - 1)]
+    while stack:
+        a, b = stack.pop()
+        (x1, y1), (x2, y2) = points[a], points[b]
+        dx, dy = x2 - x1, y2 - y1
+        norm = dx * dx + dy * dy
+        farthest, index = -1.0, -1
+        for i in range(a + 1, b):
+            x, y = points[i]
+            t = 0.0 if norm == 0 else max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / norm))
+            dist = (x - x1 - t * dx) ** 2 + (y - y1 - t * dy) ** 2
+            if dist > farthest:
+                farthest, index = dist, i
+        if farthest > limit:
+            keep[index] = True
+            stack.append((a, index))
+            stack.append((index, b))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def simplify(rings: List[Tuple[str, List[Point]]], tolerance: float) -> List[Tuple[str, List[Point]]]:
+    """Simplify open rings of (state, points) so that shared borders stay
+    shared: each ring is split into arcs wherever the set of rings a vertex
+    belongs to changes, and each distinct arc is simplified only once."""
+
+    owners: Dict[Point, Set[int]] = defaultdict(set)
+    for i, (_, ring) in enumerate(rings):
+        for point in ring:
+            owners[point].add(i)
+
+    arcs: Dict[Tuple[Point, ...], List[Point]] = {}
+    simplified = []
+    for abbr, ring in rings:
+        size = len(ring)
+        junctions = [
+            i
+            for i in range(size)
+            if len(owners[ring[i]]) > 2
+            or owners[ring[i]] != owners[ring[i - 1]]
+            or owners[ring[i]] != owners[ring[(i + 1) % size]]
+        ]
+        if not junctions:
+            # a ring that shares no border, such as an island: split it at its
+            # smallest point and the point farthest from that
+            start = ring.index(min(ring))
+            ring = ring[start:] + ring[:start]
+            x0, y0 = ring[0]
+            junctions = [0, max(range(size), key=lambda i: (ring[i][0] - x0) ** 2 + (ring[i][1] - y0) ** 2)]
+
+        points: List[Point] = []
+        for j, a in enumerate(junctions):
+            b = junctions[(j + 1) % len(junctions)]
+            arc = tuple(ring[a : b + 1] if b > a else ring[a:] + ring[: b + 1])
+            key = min(arc, arc[::-1])
+            if key not in arcs:
+                arcs[key] = douglas_peucker(key, tolerance * SCALE)
+            points.extend((arcs[key] if key == arc else arcs[key][::-1])[:-1])
+
+        if len(set(points)) >= 3:
+            simplified.append((abbr, points))
+    return simplified
+
+
+def encode(points: List[Point]) -> str:
+    values = [points[0][0], points[0][1]]
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        values += [x1 - x0, y1 - y0]
+    return " ".join(map(str, values))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simplify state boundaries into scripts/data/boundaries.csv")
+    parser.add_argument("shapefile", help="path to a cb_*_us_state_*.shp or .zip file")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help=f"in degrees (default: {DEFAULT_TOLERANCE})"
+    )
+    args = parser.parse_args()
+
+    rings = []
+    for record, polygon in read_shapefile(args.shapefile):
+        for ring in polygon:
+            # quantize, and drop the closing point and repeated points
+            points: List[Point] = []
+            for lon, lat in ring:
+                point = (round(lon * SCALE), round(lat * SCALE))
+                if not points or point != points[-1]:
+                    points.append(point)
+            if points[0] == points[-1]:
+                points.pop()
+            rings.append((record["STUSPS"], points))
+
+    simplified = simplify(rings, args.tolerance)
+    simplified.sort(key=lambda item: item[0])
+
+    with open(TARGET, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["abbr", "ring"])
+        for abbr, points in simplified:
+            writer.writerow([abbr, encode(points)])
+
+    print(f"wrote {len(simplified)} rings, {sum(len(p) for _, p in simplified)} points to {TARGET}")
+
+
+if __name__ == "__main__":
+    main()
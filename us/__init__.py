@@ -1,10 +1,26 @@
-from .states import (  # noqa
-    STATES,  # noqa
-    STATES_CONTIGUOUS,  # noqa
-    STATES_CONTINENTAL,  # noqa
-    TERRITORIES,  # noqa
-    STATES_AND_TERRITORIES,  # noqa
-    OBSOLETE,  # noqa
-)  # noqa
+from . import states  # noqa
 from .unitedstatesofamerica import *  # noqa
 from .version import __version__ as version
+
+# lists of states are re-exported from us.states, which builds them on first
+# access
+_STATES_EXPORTS = (
+    "STATES",
+    "STATES_CONTIGUOUS",
+    "STATES_CONTINENTAL",
+    "TERRITORIES",
+    "STATES_AND_TERRITORIES",
+    "OBSOLETE",
+)
+
+__all__ = ["states", "name", "abbr", "birthday", "version", *_STATES_EXPORTS]
+
+
+def __getattr__(name: str):
+    if name in _STATES_EXPORTS:
+        return getattr(states, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_STATES_EXPORTS))
@@ -0,0 +1,26 @@
+"""Normalization of lookup values for the alias table, shared by
+us.states and scripts/build_data.py. This module imports nothing from the
+package, so the build script can load it before the generated data that
+`us` imports exists."""
+
+import re
+
+# normalizes lookup values for the alias table in one pass: a leading "the",
+# "state of", "commonwealth of" or "territory of" and runs of separators
+# become a space, periods and apostrophes are dropped
+ALIAS_PATTERN = r"^\s*(?:the\s+)?(?:(?:state|commonwealth|territory)\s+of\s+)?(?:the\s+)?|[.'’]+|[\W_]+"
+
+# compiled on first use, since most lookups match the alias table without
+# normalizing
+_alias_re = None
+
+
+def normalize(val: str) -> str:
+    global _alias_re
+    if _alias_re is None:
+        _alias_re = re.compile(ALIAS_PATTERN)
+    return _alias_re.sub(_normalize_match, val.lower()).strip()
+
+
+def _normalize_match(match) -> str:
+    return "" if match.group()[:1] in ".'’" else " "
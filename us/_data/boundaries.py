@@ -0,0 +1,3087 @@
+# Generated by scripts/build_data.py from scripts/data/boundaries.csv. Do not edit.
+
+# coordinates are in units of 1e-4 degrees
+SCALE = 10000
+
+# grid origin, cell size, and size in cells; cells are grouped in square blocks
+WEST = -1800000
+SOUTH = -150000
+CELL = 1000
+BLOCK = 10
+COLUMNS = 3600
+ROWS = 870
+
+# (FIPS number, number of points) of each ring, in the order of RING_COORDS
+RINGS = (
+    (2, 3),
+    (2, 10),
+    (2, 3),
+    (2, 292),
+    (2, 3),
+    (2, 7),
+    (2, 4),
+    (2, 3),
+    (2, 4),
+    (2, 3),
+    (2, 11),
+    (2, 8),
+    (2, 3),
+    (2, 3),
+    (2, 3),
+    (2, 5),
+    (2, 3),
+    (2, 3),
+    (2, 3),
+    (2, 8),
+    (2, 11),
+    (2, 13),
+    (2, 348),
+    (2, 7),
+    (2, 95),
+    (2, 3),
+    (2, 3),
+    (2, 4),
+    (2, 3),
+    (2, 3),
+    (2, 6),
+    (2, 8),
+    (2, 3),
+    (2, 6),
+    (2, 7),
+    (2, 3),
+    (2, 13),
+    (2, 6),
+    (2, 4),
+    (2, 307),
+    (2, 4),
+    (2, 3),
+    (2, 6),
+    (2, 3),
+    (2, 6),
+    (2, 3),
+    (2, 3),
+    (2, 3),
+    (2, 4),
+    (2, 19),
+    (2, 3),
+    (2, 6),
+    (2, 6),
+    (2, 16),
+    (2, 4),
+    (2, 9),
+    (2, 4),
+    (2, 11),
+    (2, 3),
+    (2, 3),
+    (2, 25),
+    (2, 61),
+    (2, 5),
+    (2, 20),
+    (2, 4),
+    (2, 3),
+    (2, 34),
+    (2, 3),
+    (2, 4),
+    (2, 9),
+    (2, 3),
+    (2, 5),
+    (2, 3),
+    (2, 3),
+    (2, 7),
+    (2, 33),
+    (2, 12),
+    (2, 4),
+    (2, 3),
+    (2, 4),
+    (2, 3),
+    (2, 93),
+    (2, 3),
+    (2, 102),
+    (2, 28),
+    (2, 5),
+    (2, 15),
+    (2, 3),
+    (2, 18),
+    (2, 32),
+    (2, 17),
+    (2, 4),
+    (2, 7),
+    (2, 12),
+    (2, 3),
+    (2, 10),
+    (2, 6),
+    (2, 4),
+    (2, 6),
+    (2, 19),
+    (2, 3),
+    (2, 3),
+    (2, 8),
+    (2, 6),
+    (2, 13),
+    (2, 27),
+    (2, 3),
+    (2, 6),
+    (2, 6),
+    (2, 3),
+    (2, 8),
+    (2, 13),
+    (2, 6),
+    (2, 9),
+    (2, 24),
+    (2, 3),
+    (2, 10),
+    (2, 4),
+    (2, 3),
+    (2, 17),
+    (2, 6),
+    (2, 3),
+    (2, 8),
+    (2, 4),
+    (2, 8),
+    (2, 14),
+    (2, 28),
+    (2, 8),
+    (2, 6),
+    (2, 8),
+    (2, 3),
+    (2, 3),
+    (2, 30),
+    (2, 6),
+    (2, 6),
+    (2, 5),
+    (2, 5),
+    (2, 18),
+    (2, 24),
+    (2, 7),
+    (2, 4),
+    (2, 3),
+    (2, 10),
+    (2, 3),
+    (2, 6),
+    (2, 4),
+    (2, 32),
+    (2, 6),
+    (2, 7),
+    (2, 55),
+    (2, 5),
+    (2, 3),
+    (2, 9),
+    (2, 6),
+    (2, 4),
+    (2, 11),
+    (2, 3),
+    (2, 4),
+    (2, 12),
+    (2, 3),
+    (2, 4),
+    (2, 4),
+    (2, 3),
+    (2, 4),
+    (2, 5),
+    (2, 5),
+    (2, 3),
+    (2, 14),
+    (2, 8),
+    (2, 9),
+    (2, 6),
+    (2, 3),
+    (2, 4),
+    (2, 39),
+    (2, 9),
+    (2, 4),
+    (2, 9),
+    (2, 14),
+    (2, 3),
+    (2, 6),
+    (2, 5),
+    (2, 10),
+    (2, 4),
+    (2, 5),
+    (2, 3),
+    (2, 36),
+    (2, 3),
+    (2, 17),
+    (2, 7),
+    (2, 7),
+    (2, 21),
+    (2, 4),
+    (2, 5),
+    (2, 6),
+    (2, 15),
+    (2, 14),
+    (2, 3),
+    (2, 4),
+    (2, 19),
+    (2, 4),
+    (2, 3),
+    (2, 40),
+    (2, 8),
+    (2, 4),
+    (2, 3),
+    (2, 5),
+    (2, 4),
+    (2, 788),
+    (2, 24),
+    (2, 4),
+    (2, 7),
+    (2, 9),
+    (2, 13),
+    (2, 3),
+    (2, 4),
+    (2, 5),
+    (2, 5),
+    (2, 4),
+    (2, 3),
+    (2, 6),
+    (2, 7),
+    (2, 4),
+    (2, 10),
+    (2, 4),
+    (2, 6),
+    (2, 27),
+    (2, 380),
+    (2, 3),
+    (2, 6),
+    (2, 4),
+    (2, 19),
+    (2, 4),
+    (2, 3),
+    (2, 33),
+    (2, 36),
+    (2, 168),
+    (2, 6),
+    (2, 66),
+    (2, 78),
+    (2, 3),
+    (2, 8),
+    (2, 9),
+    (2, 9),
+    (2, 14),
+    (2, 4),
+    (2, 13),
+    (2, 256),
+    (2, 3),
+    (2, 3),
+    (2, 15),
+    (2, 5),
+    (2, 3),
+    (2, 4),
+    (2, 3),
+    (2, 12),
+    (2, 19),
+    (2, 4),
+    (2, 14),
+    (2, 515),
+    (2, 3),
+    (2, 3),
+    (2, 17),
+    (2, 4),
+    (2, 10),
+    (2, 4),
+    (2, 4),
+    (2, 4),
+    (2, 3),
+    (2, 4),
+    (2, 4),
+    (2, 3),
+    (2, 21),
+    (2, 13),
+    (2, 19),
+    (2, 4),
+    (2, 6),
+    (2, 11),
+    (2, 5),
+    (2, 6),
+    (2, 28),
+    (2, 6),
+    (2, 4),
+    (2, 17),
+    (2, 12),
+    (2, 4),
+    (2, 8),
+    (2, 3),
+    (2, 37),
+    (2, 3),
+    (2, 11),
+    (2, 66),
+    (2, 3),
+    (2, 9),
+    (2, 13),
+    (2, 9),
+    (2, 9),
+    (2, 5),
+    (2, 4),
+    (2, 4),
+    (2, 6),
+    (2, 3),
+    (2, 8),
+    (2, 118),
+    (2, 12),
+    (2, 21),
+    (2, 4),
+    (2, 7),
+    (2, 27),
+    (2, 3),
+    (2, 76),
+    (2, 8),
+    (2, 8),
+    (2, 23),
+    (2, 6),
+    (2, 11),
+    (2, 7),
+    (2, 4),
+    (2, 4),
+    (2, 15),
+    (2, 3),
+    (2, 36),
+    (2, 6),
+    (2, 7),
+    (2, 6),
+    (2, 5),
+    (2, 3),
+    (2, 24),
+    (2, 12),
+    (2, 3),
+    (2, 3),
+    (2, 40),
+    (2, 3),
+    (2, 41),
+    (2, 3),
+    (2, 4),
+    (2, 5),
+    (2, 7),
+    (2, 7),
+    (2, 6),
+    (2, 6),
+    (2, 3),
+    (2, 4),
+    (2, 8),
+    (2, 6),
+    (2, 3),
+    (2, 11),
+    (2, 110),
+    (2, 6),
+    (2, 6),
+    (2, 4),
+    (2, 30),
+    (2, 13),
+    (2, 7),
+    (2, 50),
+    (2, 3),
+    (2, 3),
+    (2, 4),
+    (2, 54),
+    (2, 5),
+    (2, 11),
+    (2, 4),
+    (2, 40),
+    (2, 3),
+    (2, 171),
+    (2, 405),
+    (2, 3),
+    (2, 6),
+    (2, 6412),
+    (2, 3),
+    (2, 3),
+    (2, 4),
+    (2, 146),
+    (2, 4),
+    (2, 15),
+    (2, 13),
+    (2, 4),
+    (2, 33),
+    (2, 8),
+    (2, 10),
+    (2, 28),
+    (2, 24),
+    (2, 6),
+    (2, 9),
+    (2, 137),
+    (2, 24),
+    (2, 37),
+    (2, 10),
+    (2, 99),
+    (2, 4),
+    (2, 3),
+    (2, 3),
+    (2, 190),
+    (2, 3),
+    (2, 5),
+    (2, 12),
+    (2, 11),
+    (2, 13),
+    (2, 4),
+    (1, 3),
+    (1, 4),
+    (1, 10),
+    (1, 183),
+    (5, 350),
+    (60, 8),
+    (60, 4),
+    (60, 3),
+    (60, 4),
+    (60, 46),
+    (60, 4),
+    (4, 194),
+    (6, 19),
+    (6, 15),
+    (6, 5),
+    (6, 4),
+    (6, 10),
+    (6, 26),
+    (6, 18),
+    (6, 13),
+    (6, 4),
+    (6, 3),
+    (6, 4),
+    (6, 594),
+    (8, 22),
+    (9, 3),
+    (9, 3),
+    (9, 4),
+    (9, 3),
+    (9, 127),
+    (11, 16),
+    (10, 5),
+    (10, 3),
+    (10, 47),
+    (12, 12),
+    (12, 3),
+    (12, 4),
+    (12, 3),
+    (12, 3),
+    (12, 3),
+    (12, 4),
+    (12, 3),
+    (12, 3),
+    (12, 4),
+    (12, 3),
+    (12, 3),
+    (12, 10),
+    (12, 3),
+    (12, 3),
+    (12, 3),
+    (12, 3),
+    (12, 3),
+    (12, 3),
+    (12, 3),
+    (12, 3),
+    (12, 7),
+    (12, 3),
+    (12, 7),
+    (12, 3),
+    (12, 16),
+    (12, 3),
+    (12, 3),
+    (12, 3),
+    (12, 5),
+    (12, 3),
+    (12, 5),
+    (12, 38),
+    (12, 3),
+    (12, 11),
+    (12, 4),
+    (12, 13),
+    (12, 8),
+    (12, 4),
+    (12, 4),
+    (12, 4),
+    (12, 3),
+    (12, 4),
+    (12, 5),
+    (12, 4),
+    (12, 3),
+    (12, 7),
+    (12, 17),
+    (12, 8),
+    (12, 733),
+    (13, 3),
+    (13, 494),
+    (66, 35),
+    (15, 3),
+    (15, 5),
+    (15, 93),
+    (15, 64),
+    (15, 16),
+    (15, 18),
+    (15, 38),
+    (15, 62),
+    (15, 38),
+    (15, 4),
+    (15, 18),
+    (15, 3),
+    (15, 3),
+    (15, 4),
+    (15, 3),
+    (19, 331),
+    (16, 539),
+    (17, 403),
+    (18, 297),
+    (20, 73),
+    (21, 406),
+    (21, 12),
+    (22, 15),
+    (22, 26),
+    (22, 3),
+    (22, 3),
+    (22, 7),
+    (22, 3),
+    (22, 4),
+    (22, 4),
+    (22, 4),
+    (22, 3),
+    (22, 3),
+    (22, 3),
+    (22, 3),
+    (22, 5),
+    (22, 4),
+    (22, 3),
+    (22, 4),
+    (22, 3),
+    (22, 33),
+    (22, 991),
+    (25, 18),
+    (25, 3),
+    (25, 9),
+    (25, 4),
+    (25, 3),
+    (25, 25),
+    (25, 4),
+    (25, 6),
+    (25, 3),
+    (25, 3),
+    (25, 3),
+    (25, 3),
+    (25, 3),
+    (25, 298),
+    (24, 11),
+    (24, 11),
+    (24, 18),
+    (24, 3),
+    (24, 3),
+    (24, 4),
+    (24, 4),
+    (24, 767),
+    (23, 8),
+    (23, 3),
+    (23, 3),
+    (23, 10),
+    (23, 5),
+    (23, 14),
+    (23, 4),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 6),
+    (23, 4),
+    (23, 3),
+    (23, 3),
+    (23, 4),
+    (23, 3),
+    (23, 3),
+    (23, 4),
+    (23, 4),
+    (23, 5),
+    (23, 3),
+    (23, 4),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 6),
+    (23, 3),
+    (23, 4),
+    (23, 9),
+    (23, 4),
+    (23, 3),
+    (23, 4),
+    (23, 8),
+    (23, 3),
+    (23, 4),
+    (23, 4),
+    (23, 4),
+    (23, 17),
+    (23, 5),
+    (23, 6),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 14),
+    (23, 33),
+    (23, 5),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 4),
+    (23, 3),
+    (23, 4),
+    (23, 3),
+    (23, 4),
+    (23, 5),
+    (23, 4),
+    (23, 27),
+    (23, 3),
+    (23, 20),
+    (23, 15),
+    (23, 3),
+    (23, 3),
+    (23, 7),
+    (23, 3),
+    (23, 3),
+    (23, 4),
+    (23, 3),
+    (23, 3),
+    (23, 4),
+    (23, 3),
+    (23, 4),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 4),
+    (23, 4),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 4),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 3),
+    (23, 6),
+    (23, 9),
+    (23, 8),
+    (23, 5),
+    (23, 4),
+    (23, 3),
+    (23, 5),
+    (23, 3),
+    (23, 3),
+    (23, 771),
+    (26, 4),
+    (26, 4),
+    (26, 19),
+    (26, 4),
+    (26, 5),
+    (26, 5),
+    (26, 3),
+    (26, 11),
+    (26, 13),
+    (26, 3),
+    (26, 3),
+    (26, 23),
+    (26, 9),
+    (26, 4),
+    (26, 4),
+    (26, 6),
+    (26, 10),
+    (26, 9),
+    (26, 7),
+    (26, 3),
+    (26, 5),
+    (26, 16),
+    (26, 5),
+    (26, 450),
+    (26, 3),
+    (26, 3),
+    (26, 4),
+    (26, 3),
+    (26, 48),
+    (26, 636),
+    (26, 4),
+    (26, 3),
+    (26, 3),
+    (26, 3),
+    (26, 4),
+    (26, 3),
+    (26, 4),
+    (26, 7),
+    (26, 4),
+    (26, 3),
+    (26, 4),
+    (26, 70),
+    (26, 3),
+    (27, 4),
+    (27, 821),
+    (29, 355),
+    (69, 4),
+    (69, 6),
+    (69, 4),
+    (69, 13),
+    (69, 24),
+    (69, 9),
+    (69, 8),
+    (69, 19),
+    (69, 4),
+    (69, 5),
+    (69, 3),
+    (69, 3),
+    (69, 12),
+    (69, 4),
+    (28, 4),
+    (28, 3),
+    (28, 5),
+    (28, 3),
+    (28, 6),
+    (28, 480),
+    (30, 416),
+    (37, 14),
+    (37, 3),
+    (37, 716),
+    (37, 12),
+    (37, 26),
+    (37, 10),
+    (37, 3),
+    (37, 11),
+    (37, 4),
+    (37, 17),
+    (37, 6),
+    (37, 5),
+    (38, 431),
+    (31, 215),
+    (33, 249),
+    (34, 192),
+    (35, 35),
+    (32, 83),
+    (36, 6),
+    (36, 9),
+    (36, 5),
+    (36, 3),
+    (36, 3),
+    (36, 3),
+    (36, 4),
+    (36, 17),
+    (36, 4),
+    (36, 4),
+    (36, 5),
+    (36, 4),
+    (36, 477),
+    (39, 7),
+    (39, 3),
+    (39, 4),
+    (39, 4),
+    (39, 6),
+    (39, 263),
+    (40, 370),
+    (41, 3),
+    (41, 331),
+    (42, 165),
+    (72, 3),
+    (72, 3),
+    (72, 12),
+    (72, 3),
+    (72, 23),
+    (72, 4),
+    (72, 3),
+    (72, 152),
+    (72, 4),
+    (72, 9),
+    (44, 3),
+    (44, 13),
+    (44, 54),
+    (44, 3),
+    (44, 17),
+    (44, 3),
+    (44, 10),
+    (44, 78),
+    (45, 4),
+    (45, 391),
+    (46, 166),
+    (47, 279),
+    (48, 8),
+    (48, 3),
+    (48, 4),
+    (48, 7),
+    (48, 26),
+    (48, 9),
+    (48, 3),
+    (48, 3),
+    (48, 3),
+    (48, 6),
+    (48, 3),
+    (48, 4),
+    (48, 17),
+    (48, 48),
+    (48, 4),
+    (48, 1729),
+    (49, 18),
+    (51, 3),
+    (51, 3),
+    (51, 5),
+    (51, 118),
+    (51, 11),
+    (51, 602),
+    (78, 36),
+    (78, 3),
+    (78, 3),
+    (78, 30),
+    (78, 4),
+    (78, 5),
+    (78, 3),
+    (78, 33),
+    (78, 3),
+    (50, 223),
+    (53, 3),
+    (53, 3),
+    (53, 31),
+    (53, 3),
+    (53, 3),
+    (53, 3),
+    (53, 5),
+    (53, 9),
+    (53, 6),
+    (53, 3),
+    (53, 3),
+    (53, 3),
+    (53, 9),
+    (53, 9),
+    (53, 9),
+    (53, 8),
+    (53, 78),
+    (53, 3),
+    (53, 8),
+    (53, 4),
+    (53, 7),
+    (53, 48),
+    (53, 3),
+    (53, 3),
+    (53, 16),
+    (53, 32),
+    (53, 3),
+    (53, 7),
+    (53, 4),
+    (53, 29),
+    (53, 6),
+    (53, 3),
+    (53, 716),
+    (55, 24),
+    (55, 3),
+    (55, 3),
+    (55, 7),
+    (55, 6),
+    (55, 4),
+    (55, 6),
+    (55, 4),
+    (55, 4),
+    (55, 4),
+    (55, 14),
+    (55, 6),
+    (55, 6),
+    (55, 4),
+    (55, 4),
+    (55, 4),
+    (55, 5),
+    (55, 6),
+    (55, 6),
+    (55, 15),
+    (55, 4),
+    (55, 3),
+    (55, 8),
+    (55, 516),
+    (54, 511),
+    (56, 33),
+)
+
+# FIPS numbers of the states whose edges pass through boundary cells
+CANDIDATES = (
+    (60,),
+    (66,),
+    (69,),
+    (78,),
+    (72,),
+    (15,),
+    (12,),
+    (48,),
+    (22,),
+    (22, 48),
+    (22, 28),
+    (28,),
+    (1,),
+    (1, 12),
+    (1, 28),
+    (12, 13),
+    (13,),
+    (1, 12, 13),
+    (1, 13),
+    (4,),
+    (4, 35),
+    (35,),
+    (35, 48),
+    (13, 45),
+    (45,),
+    (6,),
+    (4, 6),
+    (5, 22, 48),
+    (5, 22),
+    (5, 22, 28),
+    (5, 48),
+    (5, 28),
+    (40, 48),
+    (5, 40, 48),
+    (5, 40),
+    (37, 45),
+    (37,),
+    (5, 28, 47),
+    (28, 47),
+    (1, 28, 47),
+    (1, 47),
+    (1, 13, 47),
+    (13, 47),
+    (13, 37, 47),
+    (13, 37),
+    (13, 37, 45),
+    (6, 32),
+    (4, 6, 32),
+    (5, 47),
+    (37, 47),
+    (4, 32),
+    (5, 29),
+    (5, 29, 47),
+    (29, 47),
+    (5, 29, 40),
+    (21, 29, 47),
+    (21, 47),
+    (35, 40, 48),
+    (29, 40),
+    (21, 29),
+    (21, 47, 51),
+    (47, 51),
+    (37, 47, 51),
+    (37, 51),
+    (35, 40),
+    (21, 51),
+    (51,),
+    (4, 49),
+    (4, 8, 35, 49),
+    (8, 35),
+    (8, 35, 40),
+    (8, 40),
+    (8, 20, 40),
+    (20, 40),
+    (20, 29, 40),
+    (17, 29),
+    (17, 21, 29),
+    (4, 32, 49),
+    (8, 49),
+    (8, 20),
+    (20, 29),
+    (17, 21),
+    (32, 49),
+    (51, 54),
+    (21, 54),
+    (21, 51, 54),
+    (17, 18, 21),
+    (18, 21),
+    (17, 18),
+    (24, 51),
+    (24,),
+    (21, 39),
+    (21, 39, 54),
+    (39, 54),
+    (10, 24),
+    (10,),
+    (11, 24, 51),
+    (11, 24),
+    (34,),
+    (18, 21, 39),
+    (18, 39),
+    (24, 54),
+    (10, 34),
+    (24, 51, 54),
+    (42, 54),
+    (24, 42, 54),
+    (24, 42),
+    (10, 24, 42),
+    (10, 42),
+    (10, 34, 42),
+    (34, 42),
+    (8, 20, 31),
+    (20, 31),
+    (20, 29, 31),
+    (8, 31),
+    (29, 31),
+    (17, 19, 29),
+    (17, 19),
+    (39, 42, 54),
+    (19, 29),
+    (34, 36),
+    (19, 29, 31),
+    (36,),
+    (19, 31),
+    (39, 42),
+    (49, 56),
+    (9, 36),
+    (8, 49, 56),
+    (8, 56),
+    (8, 31, 56),
+    (9,),
+    (31, 56),
+    (44,),
+    (25,),
+    (39,),
+    (34, 36, 42),
+    (9, 44),
+    (36, 42),
+    (25, 44),
+    (18,),
+    (18, 26, 39),
+    (26, 39),
+    (18, 26),
+    (17,),
+    (26,),
+    (6, 41),
+    (6, 32, 41),
+    (32, 41),
+    (16, 32, 41),
+    (16, 32),
+    (16, 32, 49),
+    (16, 49),
+    (42,),
+    (9, 25),
+    (41,),
+    (16, 41),
+    (16, 49, 56),
+    (25, 36),
+    (9, 25, 36),
+    (9, 25, 44),
+    (16, 56),
+    (31, 46),
+    (19, 31, 46),
+    (17, 55),
+    (19, 46),
+    (17, 19, 55),
+    (55,),
+    (19, 55),
+    (25, 33),
+    (25, 36, 50),
+    (25, 50),
+    (25, 33, 50),
+    (36, 50),
+    (33, 50),
+    (33,),
+    (23,),
+    (31, 46, 56),
+    (23, 33),
+    (46, 56),
+    (19, 27, 46),
+    (19, 27),
+    (19, 27, 55),
+    (27, 46),
+    (27, 55),
+    (16, 30),
+    (16, 30, 56),
+    (30, 56),
+    (30, 46, 56),
+    (30, 46),
+    (26, 55),
+    (50,),
+    (41, 53),
+    (16, 41, 53),
+    (30, 38, 46),
+    (38, 46),
+    (27, 38, 46),
+    (16, 53),
+    (30, 38),
+    (27, 38),
+    (53,),
+    (27,),
+    (16,),
+    (30,),
+    (38,),
+    (2,),
+)
+
+# uint16 value of each block, in row-major order from the southwest: a FIPS
+# number, 0 for none, or 100 + index of the block in CELLS
+BLOCKS = (
+    "eNrt2AWQVQUbxvH3eV5AVFAapZEuKQmxsVtBBVEx6O7u7u7uNAE7sIPG7gQFCzDB9tyzl3VXFt3Pmd098D2/d/bunbln5px5z3/P"
+    "3Fmzv2tqzUxEREQk7TTXCkRERERERERERERERERERERERERERERERERERERERERERERE5D9qoRXIUaWlViBHkVZagRxFWmsFqdDG"
+    "2lo7a69FRF6HDDlrxyNsS52ss3Wxrsol8rplwDm7Ww/rqdVLGuiV7mfsbX2srxYvaaCf9U/Hsw2wgTbIBtsQLV6OAkNtmJYgR4nh"
+    "WoFIOhlhI22U1iApGh3BaxrzL5+PtXG6cXKI8RG8pgk20Sb94xGTbYpN1c2TZKZF9LqmWxWbYTP/4YhZls1m6wZK3JxIXtXc8HWe"
+    "zQ96XmALbVGSzxYnO3JJ0PNS3UaJsGW23FbYSlsV1Jwwq+1Ou8vutnvsXrvP1oRHrbV1dr89YA/aQ1qZRNbD9khix0nnUctnjwU/"
+    "j9sTtt6etKfsaXvGnrXntDKJkOftBXvRXrINttE22WbbkmLNW21b0PJ2e9lesVcNwbxm2cN53d7QEiWDvWlv2dv2jr1r71mmcN63"
+    "EsF8YB/aR/bxIT1/EtScz3bYTitkn4Y9f2a7wp532+f2hRYqGeZL+8q+tj2WJZi98Zoz2b6w54T5JrHjb+07+95+sB9tvx2wn+zn"
+    "oOdfwp5/DWv+zX63SvaHGQBtVjIC4ciELGHPmXGw5yz4q+djEGs5K47FcTgeZa2sZUNmy2zZcQJORA7kRC7kRh7kRT5Usvw4CSej"
+    "AAqqaEl3hVA43nIWK4KiiT0XS9Jz8bDnU8KSE6ZE2HNmK4lSKI0yqGyVrSzKoTwqoCJKWSmrhFNRWUVLuqqCqvGaq6E6TkMN1EQt"
+    "1MbpqIMzcCbOwtk4B+fiPNTF+fGeL8CFuAgX4xJcistwOa7AlbgKV+MaXIt6qI/rcD1uQAM0xI3qWdJRI9wUr/lm3IJiVswa41ZU"
+    "tdjchqx2cG7HHchjTdAUzdAcLYL3LVHYYtMKrdEGbdEO7ZHX8loHdEQndEZ1q25d0FU9Szrqhu5Bzz3QE73CmotZ73jNVa1Pkp6z"
+    "Wt+g4aTTL95zf+S0ARiIQRiMIRiKYRiOmjYCIzEKozEGY1W0pJNxGB8+nSfEW47NxMSeJyXreXKynqdgatjzNEwPes5pM5DLctlM"
+    "lLFZmI05mIt5mI8FWIhF6lnSyeL4d40lWJpY9LKw5+VYgZXJel6F1bgTd+Fu3IN7cR/WYC3W4X48EPb8YNjzQ0HPsXkY5S1hHsGj"
+    "eAyPq2lJB09gfVD0k3gKT+MZPIvn8DxewIt4CRtQ2zZiEzZjC7ZiG7bjZRS1g/MKXkVui81reD3s+Q28ibfwNt7Bu3gP7+MDfIiP"
+    "8DE+wQ7sxKf4DLuwW1VLmvocX+BLfIVyFpuvkcNy2J7wdW/Q81+zL97yN/gW3+F7/BCvObf9iP04gJ/wM35BAStgv+K3oNrf8QeM"
+    "JS1hQNKZidq3pK3MTCg5YbLwGMZajk1WJu35WB7H45mN2XmqxeYEnsgczMlczM1aFps8zMtYz/mYP+z2JJ7MAiwYNl2IhVncirAo"
+    "i6lpSUPFk/V8CkuEPZdkKZZmGZZlOZZnBVZkpXjHicOCFpvKrBL2XJXVWJ2nBUXXYM0kzdZibZ7OOjyDZ/Isns1zeC7PU9OSRury"
+    "fF7AC3kRL+YlvJSXBT1fzitYxK7kVbya1/Da4H091ud1vJ43sAEb8kY24k3xnm+OP51vYWPeytt4O+84pNYmbMpmbM4WzG/5raVq"
+    "ljTTiq3ZhjUsYdqyHduzQ1Dw36cjS1vS6RTvuTO7sCu7sTt7sCd7sTf7HLbXvuwXFN1fPUuaGcCBHJTY82AO4dAUai5iw5L1PJwj"
+    "4j0XtJEcxdEcw7Gp6HQcx3OCepY0M5GTODne8xRO5bQUap7OGZzJWZzNOfGq53Ie53MBF3IRF3MJl3KZKpVIWM4VXMlVXM07gybv"
+    "4t28h/fyPq7hWq7j/XyADya2+hAf5iN8lI/xcT7B9WpYRP6vPMmn+DSf4bN6+skR7Tk+zxfiFb/Il7iBG7mJm7mFW7lNdcsRYTtf"
+    "5it8Nej1Nb7ON1Ls9k2+xbf5jpqWyHs31ZW+x/f5AT/kR/yYn3DHf6h7Jz/lZ9ylvwuJjN38nF/wS37Fr4Mu93Bvquvcx2/4Lb/j"
+    "9/xBRUsG+vFv/e3nAf7En/kLfw0++Y2/p6LPP2gOp7tncm1UMk7mw/SXxY/xrH6sH+fHe7Z/aTS7n+Aneg7PqZYlYnJ5bs/jeT2f"
+    "5/eT/GQv4AW9kBc+bKlFvKgX8+J+ipdQzRIRJb2Ul/YyXtbLeXmv4LSDU9Er+ale2at4Va/m1cNmT/Mawe+aXstr++lex8/wM/0s"
+    "1SwZ6mw/J7HBc/08r+vnBx1fkKTlg3OhX+QX+yV+qV/ml/sVfqVf5Vf7NX6t11PFEkn1/Tq/PoWWE+YGb+AN/UZv5DclHnOzWpYI"
+    "uiXeZWO/9bA9pzS3qWeJmNv9Dm/iTeNlNvPm3sJbeqtUdd1aPUsktQnKbOvtvL138I7eyTunqucu6lkiqat38+6JDfdI5beOnupZ"
+    "IquX9/Y+3tf7eX8fkKqiB6pnibBBPtiH+FAflsrn83D1LJE1wkf6KB/9P/yHY4x6logb6+P+tejxPiE4ZqJPUs8SeZN9ik/1aT7d"
+    "Z/hMn+WzfY7P9Xk+3xf4Ql/ki32JL/Vlvlw1yxFlha/0Vb5a3Upk/QmZ7NlB"
+)
+
+# uint16 value of each cell of the blocks that aren't uniform, block by block
+# and in row-major order within a block: a FIPS number, 0 for none, or
+# 100 + index into CANDIDATES for boundary cells
+CELLS = (
+    "eNrtnY2/HUdZx2ePTWhLQnuTJs1rm6YJeWnTXsknCX9C/xBsyb1JS0tsgfaiQoWIihBbEEUB0eB7fQlUhLYWsFpExKpopKZQtZoI"
+    "ReAgoqXx7O7ZMy/Pb2aefZ/ZnP192tzzvbO78+zZnZ3nN7N7hehreV0mxF4nhrGg+C6NpVqcPzIRl5WhzS+3T4Ron8vtzHrebqXc"
+    "OIew1IssvG+/++X1meKprVlzXbF+A6Esd2TC9I7eW8H5VV12OZrJdq6ln24j51/K6Bl6m3EVvh6UExbW/Pl9W1bv2xrT63tqTYqj"
+    "r+7NrE/BzLKyXMHuiKIVvIPRutwRRE3D6UvF26YdrcGK9usq7bfp56syJtu2ozNa8KMak7+5iojLUCm0B50etURW9wgeZTLukY61"
+    "t3/7JXJv7/ebVK8pk19l/O4ouUKPgnLm9uhVjfZ5tIHraWjXR1tXwKXaZ277qnW34EcZLOxs46jn/l11y36W78vPhOWYHm0oakHa"
+    "OXWvqDzqJ1xV4x5fvl33nYXx5b3xthm051jcU9E3dTTIGOZL1WVpoljrvQRqv2QIUbV0PPHajwKPzq/XrpblTCZZBLzcdbkk1jDY"
+    "EmRrDLZEWEHWaFfMGo2t0aSWE44rLS+tU3U7NrZEmACMllsD2Rorm98/8FmMzmvKFkGpRVBqEZRaBGTRczUta+suK58XZ9fYoibz"
+    "c1fS65ZHQX9fhcljUo2JUqz7PshSZYbu8UuzFmEJtGFLpE3gsiXA+hBu15ZgyZDY8PoksqUpy5YrMrO9E7D9W4Ztk7vlcrcRyzO5"
+    "mbm2j9nbyWXy2RbXMO62tP+m9teWIFtjsCXCzHZBtpk+tgT6hEtKv85ejtM28fpw3L6jYLAlyITB2sikjg5spKyfDItzFaGMi9MX"
+    "FaAvSvunuH1eNNgyZCH0T7vo/fpZeEdg2ZL7oKze5IuAyrvtMuzf++/H1dTXfQtddYvA/6BZihjEvVxfjk0ksv8EuC/achLstWD/"
+    "ZQ2473PYUkWGevB2tsRk1bdn3qPRXbvtfGMZ3nsWrb5Fk/cP1CJRb2Q5KG+E214tM+/+iyWYrW0SpG2SR3OZ3LOXrW121z7cMvDc"
+    "zDuOeSZwvnvbubZMGC/nDLdfsthCv2S5Bqt/fSyzmemu0n4NbkeWK3/H/WUNxwk7PtExQynbaGgR0G77EFRFPfRPmLjE78XQGlG2"
+    "USkt63Fs1g+SNZPErDmNhhfHMaVex0g9j5G9u44l2if/mNaR+zgfM6KUEeCzxFwjX9RvgDLJNwKqHifJ9H2F2A+vzvof8XePa+Ax"
+    "XDPj6C8S1zwN2pdfAt5c+TkNS8xxpnLj4nw/FvunvjwvlDGlrkauOKxJv9jlIeM5F4LF5ksVP9afEy/DXLdaTiKY/f42Mhez92hn"
+    "G5mMt71FCztO2KKXxas7p9oI+37HlL5PWkpoLCV3TSSy/xds20R3TVWU2qaIkm2z9TiMrktLuvsqdxmfcr1hqrsU3ZMRkUWUb/me"
+    "iZKMyr2lBLMEsoTNuEtR97sn0mmSsaLnkJNkSvM2/g2zvd09a/dVVlBK1gCiMqm6PSRTXdyB7wayj/+G21ehUbwRzBNEEbQVwxuh"
+    "1irSP9lZX8fZV/+yarpmJls7ZXp96xx5fxy8uQbV5x/4mBqryvKanpgxWfsTA+pf3pcpxLrcN9VlE+mfcumfLpuWa6Mu92l7pzW5"
+    "DNSknurXXNdlPanZON4E9tANq7O82VC63KipHkt1I1MhLW8G6ieOenOeirq/RcmE81q+ZSKZvxZskTE+jcdKFy+BOU996rgjjz/O"
+    "Zn5P4TjwI3gMjasdd+bs24zMXc+L7UynVdidBlPL+pj0G6i2Rah4a25TeY8iJGbqbvGjhN07EYclNRjex1omuxfmJCo7QZikaw2K"
+    "2AkWW2spdwJkfidgPhj6cgKyePPAlUyU9V0nSlYTtroya/NYrmjHdLWi4jera6jf80RXH3EgX+A+iy8gQMa7AtmKeGsmyYp6qhSx"
+    "Oh5F2HpTlEzmW1I3Rqi3AM3jCD2O8Jkr142JoQy3KttYY93qzJ4J3slmd1ZeN6Z88B7CtrXGqud0SaPlqueDejao6l7I7mWW47H2"
+    "dT8giB1gsPsJy8kBQA4YW/Kz+xWW/mwuB8QDmXRGqWQPaOyAUVplBT9AhBhffS3mcSrYA+SY4uN3AG4hpjydk7lXya3L77m5XLJe"
+    "7fzrr1Q4SiuemsrM1/QYzLx2BXgPaF2d6bm1XkL1EVYbbHXjQjmxTsoznGOXz7u56w4rr40r1+DlHzHqwaDrJqV/elDsNX7aG+TR"
+    "xPXfm0mt/15F4Z8xVDIiGRld88cAe1tD7G0zyTr+pFg1laznOxRWHHHJ9gL240CrItRQ4/iJSc6rl3h7plWA+svZ2LaK6+YcsZBG"
+    "vt/eULl6vsU9hG3rkFE3Ym1j7F7I1jbI7u3Jw7D5FtX8iPuJ93A/YernnJnkACAHAMGsLam5POK0PJc174305Zc8wPRLDjj8kneK"
+    "kxOly8mMvTPT7owWvwl5OclkHBeiGVeD5vHCyNLrMHOuAWfOhOpHrBg1bGZUv7xWettzW6Iehep8UIfFz+i60uFw7Zf6Jch/eeuA"
+    "5wHM/ZLm/I2mGd8JMPPnPN83/Yy9Sk7dntSa2fL6BzupST2FXr/ycvsRoTNe/hu+3g6yXRszKVofbRW5AWj/PlZwtf4/NdG7Jopx"
+    "Jv67gDh5/D2EbeuR3WNE8NOOuRnx6GemirnuqqirsrYRdi9kaxthec1/dqJ3z7Q2Qr1b0c+J92QKYd7N/dC/MufJyHLvMfTe2fZ0"
+    "Jwr7V2uJD8X1tOY6oHg8Ugemno+qOltH+6P7320Qfb9qjSjZPav7bo9QbGg9/5b6FfLiEM3LIqaXRdvV93bSYJLXiaMvb/CkIsRO"
+    "Oo7BSaL+Zn5R57HsPCPB8CepLyeAT4dYfH7eKUBOAbIDkB3a55zsMEpIppMdgBTlft6YQ5WWe99EkhVrqmzHlCB2WUX2vops7ieG"
+    "7ic+GCWLxeN5B2TYO3ko062QN8lWQVZN75/q1g70EGQPQWbS4lioLK33Q3CrhfKM8dYIpWfrtw5CD097ZDp7mLCcPgy3wGPNy+z/"
+    "vrdmpvHw7GhIFXGrvzOPCf9YYclcUUrNw2g+xsvPqh0D3nF5GBwXfzbcXr2bVIw5LDfT5bG+tmfPz02hzB3n3Sc9Ktbg5OAnSzFO"
+    "bluF0xz8JFiPMn3d3RZ20pLbD2vR5xStdj4bJOCzQSg/X81kON9fYbBhzOlBHsCphvyDU9A/2OH0D04Rt4C6BzsAwTrFLhm+Cufh"
+    "fVMXovAjcu2Y/p+uFRK7LEJ9DGgexzyObuII3zukUfxGlO/A+U2geRzzOOZxlImjC5//lwH7NTajUfxWz8/IVtNvE/1OLzHUnWv7"
+    "u0BNj6d0MYNZ1n4I84317yP+CPQ41DGqcuwdgP3ibJwoVc5+RWxXVIflNf89jTU9r/n9QNs70DyOcOMo9rkKUFRfXhTdxLF9sp9f"
+    "EB/QxnZy/gGNFuQDjHKpfmmiDxrsQxPl/INaDT6UaYNRL8S2E/bIRL8/oe2N2H0QakOm4l9ViPHV15iqPcZ5HPM4mrpe6qu7CD4s"
+    "PqIo3/uHxa9nOphJrVfBzfqm1BaHORpNR+PrzUn4CNBBpmSUUhsA44/H77aMx5tzF24l9CMZ+1XxUUVl4/Gpi5HsjwIdbFjzOOZx"
+    "tBWHOStAzkLAMxPMn92zLU42FMfpiSgphGYpoLkCZZi5pPU2l3zfJhOVWchvpOW/K9b3rpIV8O5U9I5Vyor11Gck1DeMrAAmLMx8"
+    "N8lKMG8raWuuAX6mYTV8puFU6Wca+plr8AeAfSJ49jHxwwPVH0bJLjeUjolcPgj9UZTsmqlU7/qaCIU8+Hkc8ziaiuOaQeiM5v3G"
+    "yIahR4AHv8EgC+LjE+lkIaOULWjrmuwRFlPJQvZJJwvkc6rCj0vrukH79HGNpT8vTGMq2MIsIsoWlG2Y+8RsA2B/QtgCZJ9uzF9t"
+    "Qp8in1Xpn9cpP60ja4apIg4an+0IbIgkLkSpE6z63QcNL7wJf/yPxSeNz6kOE3ZYYwU5DMjhEv7Ro1D5VtSfDhN9ErCmxY/CFpnO"
+    "DmtRFkyqoIcNymWPEnYY1CIOPer0HE/PPL7TxHM8bagopa+PmXCy0wY7PfU/JTs9c0TlnlWSsscsviOlBwE9DWixfT/Da582StLj"
+    "l9b68cl/qQ7CutbzIm3+5Irnbzvx3q/ie37LfCOz/lyW+tvVc/Xgs9bbWn2P9hR8Hszvs9ZZN+wnxD4RJRuqLxq3nzg0nyHPhbeT"
+    "DH3BYAtMRtctaDlW1Mpkj8Bcvch1eSwsfTrLb3VhRukCoAuAoj0tgJILgKJ6uuquZvI6/RQoHZ4+ZcnrTbaOZPsb4BbU+HWml9VZ"
+    "Xto8fmWOYWi+iPr5iYnWaTQle7TjkZM9ndc13a/6M9Weac32aD/5JL0Hme9SN8LF0LpPiD8VT05UsCdmx+3JKd9g1DFlT2gsL7fH"
+    "KEXZHmVP4QrV8UlAbT7IQeiDcBh1THRvyO55HAaUxw4H5oM8yvSWDkNeTaeNT49lroXOHs8cAbPc42IT2dZjRrlcn2Owxybkc7M9"
+    "n872mi6Pz9yJx7J65Cz/mWpTJjvZpOjxbEs6d7NN4s/IHjAr/n1sKnUb5nY3eVnx+TOaCnLlTJ+dsiud7LOEfZaw9HOsy1OZhris"
+    "WN5JJFjvC+Iz/vZWV3wXEs8LCp/N/ZK5X9Lm/Ks253xQcoZVDm/tDPksGfVV8t+q7AxxWs4A74U76+MMZGeYrP+5H6qLo7tNPh/p"
+    "EcjUOR2mB2RnC2SeB2X9uj+fZnkyXLbQOctz9ieUzDPN4//cICn7C5JPhsT2gGx3T4RCuW6R91Oml9W38aTG8uOR8y6OVTdeAc8/"
+    "KI7eFxQVbsgXxP6ZECtfq6czIfa0wdJ8R6dPz3IuxGTt/0p8car9TKE5GshNobM5HiV+R6qngQfytKb8d3mERaS5vgjEjUPN11Ol"
+    "Wy68iOJzzg4TltbnLzWyaVrrTZoowaxOHHp2bebleRa+CZTi0E2QbYKsiTg+Y2TsJkuzYZV9fpohPz5lBdk5UcE+P/0sWVpq50yb"
+    "AEvr/dfiSxMmaV7LL030N+KZTDtJDClN9/YUzON1mm9VpzsV+pTBdirb1dlThBV0J6A7AUXM97eEfH83vMzfF8Ll8PaEha0QJiz5"
+    "ekh5N199zZo41TAbrs8Qo74Waa2pYvR4aM2R7/O3gH05ePZ3QNdHqHkc8zjmcVxKcfz9RLnbKH/7DxPpTJLtgEi23WD/PNFXFF0v"
+    "nptovabrCeGzLhzerwCtb1jzOKrHkTK9FvVjcz9rucB6JnO7+EdxVmN5vVSW1/PsjKk1PzvlZt1Suh5QxBYi1FnmvNEYWejjAWXG"
+    "DagPnDvBJttjYf/EZLx194ivVmD7gau1v1E9A30zSpC/tpOx7v6pP/cM8bT2E4oZXXenQZ4FXtqz4txEJktF/TXEsPhzhaqzc4ok"
+    "2zWV/N2z2addmp5Vfi9ZSp+H2+16OeeIV130WM3jsssah8139Pun/HejrUDG8UCRV/rdTDE+ZfddRUN4ajD2eL4LdKoDD7lp9t/i"
+    "e0Qx/l277w02jv+JMo7vAw03jvDHbL5PYvnfKMc//g9ouHF8LXhG6/418dqJ9BGqf8lYbPpXoHkc8zjmcdji+DdQ6t+DZ18GinEc"
+    "ZyhxtK/nAGmS5eNaaIzquVpsPYv1o7O1xia6qWG58QX/2MRZZbQmlzpac1Zjeh3M47RAxnZs4z0hjH98cybJ5JKT70xEmbr09X6L"
+    "b0L2baJ0GU+0RZEANKR3d3wbaAtT/Y0p/Zf41kQqy+v9LU3cONp/wuSCh12YSa3/henZI2uankcmy2nKm6npBVArKrlcyP7TWcGr"
+    "Lc0f/QvkG5C1lkzW/AJhYhb5HlLfC5ZY64wtdsGKOFVWxPlV8VLDY5nd6xuGhhDDPI7w43im8XkAuCYcRuv3Dah0RPcZMCKvju/n"
+    "I/S7prML5OddU/afEz2rjHfLLatsV+tK6/D8RC9kkmPWz2e6YspfmJXP6RXZbyS7Yqb22POEqSVdcw5U/gLROWVvMt4rOtEPJtKJ"
+    "fU7Df0xE5x+o7AXx9ayUWvKKCfu6uHminL8ozmf7cbMXJ9qssJunxGSbrYy/nNd+Pp99Pj+TMD6fV8pTJj9v1n7ebGzh/LSWm7Wt"
+    "yXKobvwoyq59vgOmLi9PtG8ine0z2MuQ7WMyzrovQ7bPWU5Kzg3YF6HQHIe449g3MF2MkuXjz1cPROoIrkjo7y8LnsU4ZoNYjCMR"
+    "qxKqeRzd1NhX/1XJLSJVuLV219sUHqMyicnWG+w5wlYlqxOVpTVYnVyeyGe1TLJe5LW8XGNFPX0sbL0yoQSxI3BsxxwB0hkdU1LH"
+    "nygp2BXJKxS9cqojQkr/VE5tPv/zigSpel27jKO7mtM4vmOMtdHRNwFKCVBKZHGY9Ii4MhGAmfQIKInL0e0JMNqmUsTGhElqbrUr"
+    "toWM7ghABSyJ1t/Sk+oscqRLLlssbGyUlmysMPXIlWNyeWmq/fA3oS+5+6t7pS9B9tKE6U8vqY6jzgpuMlkaPVPEe/oIP6W0KyCd"
+    "A/XBzL6NJBklPxC5JEuSws9TSyJW0F2gpJ/lVK/R2uRVE+ns6uQ14jUCsR8Abe5Jr0pyXTXRmqnSOqZaSG4QhSSTNK33DyUvihdn"
+    "zjBX55nMp7y+8qdcN4ic3mAo/x2V7vnqfrEAzrTJBINtBmtvBnQzWDutt7m9G8S6ZF2yPrG5uzw/luv5Yr9YWNjLhIlSbBg+3L7g"
+    "nbWLTBaj58bz4a4BbGPwjO9IhK15HKHFEWOt7VLdr1uA0+UqRz0ym5d2bbJpKrmPLclWkasO68JN25RQFftvSvM45nF0EQfyfDEz"
+    "/eLcr6XsiBHH5sxfNOrBYwlhU3IEenPUwcOsnk9oYzrllvP5dWPIOB4j9SLHkG1hlRMe1pVM/1G6cNRVU+kYRCf9O7oN5NeNIRMN"
+    "sjFkgsHG0Ev0v3mnukfW1fuCqntk+qzGft97VN7xC6fuVeJwfR/lPF/k72LmX5e+G8vnOzbDrk5S+Vmxpo8Va6qSHmMVVlA3k2v7"
+    "Wb4+qiVl+RY2GN5cSlKm0pRcK64VOktJymTZguXUZLKsygrqZzk1War+Fupr5jXP4yx+uz65VuH574qIrtXWCHupWst6PuvLcItd"
+    "sKpzMS8Sn/Vi5lf62T4L43u5uEbIP71Y0VNtw8uldF8ntTG1LanC0k/bEpWln1Jdp5W6TuSqV0Nan2JvuXKW7qfYo6xNs2rbC9+W"
+    "bDciy6KYxVGwyc9KbLNYUbyQvVbEqesSVbFGQaOK+bsYyregxhX/tRHvd6PW2h5H+GOB9Nu4vvFxiL5Yw0rI50Rh+Sfp0SaqP3vE"
+    "8GtnTLCZsUW6hyNgD0fE1k5mtIasKxMeK79d0882HW1U0s0kTX82S6Ysp7Jk+q+kqs+fly5KHhHFzyp1e9x4rm4383exhzt2zj0O"
+    "R6hWY8ODH1v8ehk79uzdHrz9nTVcNiZsC2C03FgbaxiLYS3Iez1HfFZZMqSxhKbn2wpABaACUAFcbu4c5l0RCo1dUDcb+9nlvXC5"
+    "drV17UytOfXbpXeNaHXWjeiM3g0JlxXevspUz19l+oiDi5VZt6AboAc/BKXuNoflvn1Y9aZjDuaIA2V5eZv0MQv9SOCjUld1xyZc"
+    "YzHFQkdiBDyO6Phyv42wxmyqM944CX8UqK8FjeTEyLrUjYmU/HxI5CpY8TlXXooynRzqPSY1ukNapGZN3eo3Dvlvqvxb0SOiNcYR"
+    "hv52G/U8LHRIiRj9PhbpEQwtDjqyi8aj5Wi4zvZZ2EXCdGpn5roXyX53JRc7HnE2x5LNkdzpqOd0bJOy64x1zbFZyui6+ugwJdcZ"
+    "I9guRkea0dhzw6PRjY9td6J8JERGkEQdhy4RreKPYyjfxlDOKKIdSXxsd5RP3b06oZrHMY9jHsc8jvjiqD5fZUuis/SzOoNFL+Fi"
+    "lN4CaFH3PclWy7OEFeammPNQMEP7oPNVrHUB+wBzYELVDckNiZ2l/6afcsnfytkaBRkLxMbKPJB8G+p4fM70UXqVbbGwVCqxv99s"
+    "zHofmW1OB/dZ1ZSNGe8uG4M5CPp8CznzpJh/MQZPcY7JU5FCeV5S7nlMnhlV2ZjUQYC64Z/MSMZGJAJs39yXAHNEqsxo4TD3rJcx"
+    "eMpUr6WL2GfL+Oe16HNi8D7aXVC0IqBnGZuZH3NOXJ3szBRjDDsTqpjjUOcGyN+ugyzXBiPeddlTgX3FUXd+gMmLkWdzbBsxs6w+"
+    "ek3HxQsqYElXfdHYthz1dTF1BB0zOtJ+LRiRx6zJEfMbwZZuapTdlPAZHtd9efrmOXWk5CYyAnlTcijbhjpOdxMYvTPLlGFIqBwa"
+    "Syw7Vjo87U36YnvB03N12FzNPDNqG5Ojz0vyGR3PkyX18UJ1/E0fXas+/rYviZG9WuTar/oRVrY/4TCdbCXbyplZqh4znwGq/E6n"
+    "miylzmeSZroZRtDfEzny6Rb1eRj5xErObk5uNp59uTLZqtH8N+36NLkDIp+xKfyVLdoTNkVuJ5+zMd+npXNJJEO10etBVWS4pktT"
+    "P7cfAz+H5uEoy0X1C+GZnC0Wd2Ks/XYM34DVxhNCY/BEjfmMkPudWGPgfaF39rdRd/qeMZMj/6PO4ntyqt1zRHeyhMOz8ntB1Bnz"
+    "nR1bLOfkGHpk/CNf5xtx7S/WBeXxQvBZSjlz4OvM9q7rlzT/nAPPk0GOiM0n4fgRoTO/H5Fn9SZLs0la6hAo5WPSNaClDillKGsr"
+    "O+d7IO3Uge4rj990dEwqiaTFTzpTy+s/27fIZbZj0p/nUYcNzWdwzx2+DryFquw8Xw5rcp5v3D5DPNqfYEadhy4YcjyQB7K/xJtW"
+    "0qxdzdsRN8ubrKBo2y2980UTfatGveXmBDHT3xCM41fuuDSbBTS/6LHm+YQapwD535jxpuuxMuODvkGkTNbEzY9sOVPT8wo4eVnX"
+    "GZQ+RuoeS9V7zsVzzc285bSZPMo1xqw+id1PjW1x0P3j57FjyMz1vq+e3Rya5VZqT7vItvRP/S04G6GqfoRQfslhtnF2215oToKy"
+    "FL20nVXJhFzMPDdyxh1pD134+MeW+9Eo9iZNvfe3S3ZgKjReHKduSQrFXXtXHOHnsDSKGPPaV4tbE6p5HGHHkeb/lG0V7TPOfnN3"
+    "gpaKXTLDjbv24USR10Ktje4iqD6T6bWYrI/vX9ZDr3fVpWqd9PlDej3NeqF63txw5uU6Xvm+1POwzZrUj0O/YuT5airkzJzWM87x"
+    "f5tv5nLT4oj0piifY0FuwxBimMcxj6OpOMRglgOJ1LYo40LewzyOeRzzOOZxzOOYx3EpxiEGtdyaxFlrqnkc8ziajWN/8D6VbYnF"
+    "Zysf19YarL9jkfuiHEZrOYTvcDFZTBDlrh1WLG4mY01/QpHrJcyjQxnaCt5yd/EWdZQxqp9Mlm/FPB6S9RmHWYP000iMQDz26Ozn"
+    "eGjXoesYLCaxtyl9R4L2rjL6O3ktmd9Sc1HgcxzVpal9mWQk0L58rWMc1xFt1ez1Dy0yV6uG2wUu6/ab9LXVrnYhpO+kXF1crc3i"
+    "wHwKd88n7ojtEaHW0Xf/C7091e92qCclj8iQ+iThtf78czHtD5vxjBqJp8z9xHdvxf0OTt8n/Fz50qwH7qXG0yoM7z4cf99iGN+J"
+    "z7mw941RebO02t63972X2R6tP+rbj4TdiyrfR6perg0fQXpS9NsyPQZ6XDiOlt23iPk6V//fx3fZdF5r+x5D/sbsHnI1is7avNUa"
+    "adeJPGaS621fLrWna7Z/Ifij6Hs2o8VMPS5NxYGOSPltu0vqYyju+1h8LVP8fY8Y+oUo69avIp7nEnIbWrav0k+ewPNmaR9lFOB5"
+    "5fsezH5HqG0W7huPhHnUzbuK7fvkXUkuR7P7FpI30mueo+Y6ej8CMZNTn6pevuV20dB8A8lGAucLau9Bzyz1+EZGL0v/nVpCJ5x7"
+    "upnNqUzPh2wjV77xLfUMx22P6/yg1wTOtFy9pjrnO2csxHYMbWf2SCAXIR4/ahh9xDj6ivyxuHi/Df7onI/ZWmTfLCpBWiadmfce"
+    "Wztkv3O5+mDmeiOjvaTtPPKbhHDfOTFztaoj6Pa5epvuO71rPdkuonqOBGIjxreB7zTmkXVn/b47LZfhuNDdXgi0NXTXb6ZPfeks"
+    "3fqw8d4j1SvW7GerZyftZY/Adkair7vVqGGh61CAa10/s2zHhX9VjkCvy3UnUf1J6lgK4b4vuNscW9tmtlo0ux110hey3/3p8dNb"
+    "f95xGVnnjzbbL6t3hbjm7rZ77Zk5oysPVe+83DGJvvIQ7n6486bNnlFf+Y7vqjL7xdRrUfuF6DpH87P1PqG//672d/S+m1oftRzu"
+    "644E6vVhr4GOcemRcEaCyjhfenZgOj1lep64l8x1hWUfWXcrXP18nAvhnq89O/GPuNkj8+cL6F7mq4N5/22mtUf3VF9eE8coCre3"
+    "HeYous1Xxv3dMr5yzP1d87jwfXlbv9jHRuCKo6MkQuBr1dXfdbUNvvaivPryz9BcJjRHgXNc9LaHeg9VzwNXzmS73sqP2dj7wK77"
+    "F/e4cHNE23bN8rZsBblwZfqdNoYdPfObcHmMtCek99rcvbvu+7u2s8LtW6A8HreJal+Z9k+ElpvTdfWeTll3me9Z6NvTe1d07I7O"
+    "gsTfvN4zds2nQn1x3DtHc87QOcjp69J8xtXHN8vRzEONzeZz+75Fl+PgGx+Q9ULtte9+Se8L9P5BPShOmxN2jzQW/9V+11LvCOj6"
+    "QzluP/0S7GNST8D0Atx3Iruv3M3oN53Rb5v76u5TNOeLcu776PodCZpXusfD3DNPfHkUvYf67qu8HIxmyPb7EsffHYmwVb3W4cdm"
+    "68PY/HvUP3X1ufv8zn35jGveA/8JCzrnCc1Nd/UPUD8Cjz3Z80vXjD7a0/S9D6HOiC2vffSXD6OfM9Rx+6b7Zu6zBs/t8Xvr9rsf"
+    "em4b3be4s2ns7jb1DNCMFte8II53b59t6dqeLR40G2dE8i5uLohmybhGFfz1rjIz2Xe2cO/TvFwYeWv4zLDNKS/jn5ptO26FxSW8"
+    "hB2/r33pPh9seiRpJEYBz7Cq+rxzN3ltub6FPQu2n1FlzivueFkbz4H7Z8nY/f+6c8Z4jOfnVsunYswFOU+/jATNB4teA3ccp9u8"
+    "tvq5S89VvWWx5Wqu51PUmR++Pk5o9w/7OzjxGCl3PhSdgzES/Pk0rjxgBFzeERhtsHu5nPu5692kmNnnmtryfc5M/jLuVV9nDfet"
+    "WciZsj2fFmP/FnnzccwuQvfv2N5KZp9LFPPTd3G/c9A3vh9m3ue6dzfZ7tqPFe1H256bsL1Thv90lnR6uHWp3hv29ZHw/dL0zDm5"
+    "Lp3tTNe2v8MqFO/aNT+ZP+7HnY9pY3XbIJ7ryH2SkPaQeE/5+8ZOysZBx3Hc99pLy+2r5ud0caTsz8TY+khd1pDO1UDPiYTZV67j"
+    "QCDvta+xPDyfi8d8V36599VX9/pcfQt6r7C5GqitrTa3wtZCl/HmUE4fnzdn85ZseTK9tvAIH2eMr5n5G2j8F424oTaM84ZYOo/e"
+    "fDOsaxY1yl3RvCcRnVNrvtuHzuNx+ZNhzL+q/jYrLrPNz/a/+8L35hH8TjjbrCvUt+DPYPD/5RN657A/JarfEar/dRJ7j8r+17Tc"
+    "8zf8c05c6/LmgNTpKfLmOfCfhalzLfKOlfv5mRDGcvwj7DHOs4w7Dv9Tw03Ptu2Ccb81s+UKIY9yXc30bVSu92EO12Wo/jeHqjyP"
+    "Tkf6dLdYCN5zAHUZZ34C6qMPZQaDa95mOL1e/v1cv5PbR+hCvc8IUb2/4e459RWn6z1PsdzPbbMu7POgQ+9foferxNpyxchi7ifg"
+    "vyLHf1d2O+/wa2pcrfvZgpy5lzbmv2ovzesDOx5+/9vW42+v72+b4+x676//rHL/payq9cReMvceUs8Z67ZN441HhVDv9t5j0+04"
+    "J3aGQz32aH5JmXe2ln3W3O1HNPfNtu/rDed+3vQzF7w++Ly/G9ZcnC5cON/f8fTPVbM9C9DWXakrj6Wt2ts85LbiafMsLfd0d/35"
+    "DM1nl/a/hmub09F2HJx3OOCxXPsTHq73avjmsNj8taZHfPq5583vg03ft2zz5PrJYeisozKtkW3MxtyifQTK/nZn19+X7WsUYchP"
+    "zw7lOq93TsY4D9md+/XtRzT9djNfvG3FxnXRbO9AxNvj3BvazxLavwNx/96E2dbjtyELOFqLxj/4MxaF8D/Tbb/ncfthonIfOb57"
+    "z7yf2E8fs797WZlnQblXAW9UyfZOBO7co+7mATSV7/c9n2FYs7CG3l653veB/2adra9s7z9zmb3OtrcHhjpPOqTxj6afWxzKFXyp"
+    "5LXc5+Nt75vjs3rvbovnOQL33NBLxQUKe07lMI697e8z9dPmNDkfhP93AbryP9r24WxvO+/bY2y3z1B3DmnM80vQdRJXP5H/rm88"
+    "Xy+2fFXUcuJiy1fDfR7CdGnjuK/jq0T/i2TxXR/0by73d5W43k2A5q5if7/t+4dvHCHc+3kdfyOOOEbC946FMOLw/SXQ7nuM1Z45"
+    "7/pv2leLI8ynIDhx9NHCtD/+HGf9Y3m6hvs9iMEsbeWc/bVX9mwGv1eo/7YB9+dx6xXeW0vQfJ+4ziNz+X/L9vEr"
+)
+
+# int32 coordinates of each ring: the first (x, y) point, then deltas
+RING_COORDS = (
+    "eNpMnQW4VNXXxmfmAncuoaAiKYikSEm3NEoLKlJKdzdISXd3p3RIijQC0i2N9A1GAREk7p05337P/s33h+eZ5zBxZ87ZZ++13vWu"
+    "d619oWvAuXTP7/nK4/FMMI8c5nE55Dh92wWcOn/5PYnN84bm8bt5HHccp6s5ljTH616PZ6z53GBz/CfoOAvN/5OY9wLm/4N8Hvff"
+    "MvNobD5b2RzfNd9X4InfM8N8/mPzWh/zuGweu9sEnGSxfs9S85kl5r1q+j7zXeXNcZn5rt3m9Sfmc93Ma+kjPJ5T5vUL5vW05njF"
+    "vP6ZOZYxx/Tmcy/MZy6b5znN8yXm+Q7zPLt5Psw8v2YeV83z8eb1vOb/f5jHVPPoZ55vMcc4890Tzf+LmcfH5nHQvFbNHO+ax07z"
+    "/4fmMdL8X5/Pax4rvXYcDpi/O2qOLczxicbADNhj8342r/270+bRwDx66Ls4T52P13x2lzl+aT6X2xxv6Vo0LuZ5eXNMZMawpvlM"
+    "E/P5+ub5GPPYZB6lzHOdd4pE5n0zDnPN/2+bR2/z+mpz/F7nZB7Nzfe8Nn9/1vx/nXl8aJ6PNsfz5tgxZK9/kjnuMH/3lfm/xnKg"
+    "ecw2z/ea4xfmod/V/d9tPlfcXN9V83tlzfNn5jjEvLfNPIqbRy3z2tfm+Lc5PjXHG+a4xhzNx5xPzd8uNr+51jwJmNd1HenN8xbm"
+    "mM08L2Ie35lHD/P8HXPsbh65zOOmeb7cHDPpPpljCfPwmb/TeXUz///GPPzmoesbpnlrvr+ReX+zeV7HPK/IfWpjnuczx5PmOMMc"
+    "E5ljFN9/whx1b15prphHe/NYa57/Yo6/mPO+ZY6PGduzPB+V4Dj3zfEWc+iBuU8fm/eqmtda6TfMQ/f5jPlcOXM+Gqe/zUNLYpY5"
+    "/maO85iP+vvW5rmODcxnPeZ79Huaxw2Zr+PMUeeudenXHDDH1+aY2Ryf656bv9trjnXNsZb5vNf8UC5zPGNeO2SOG7jGJVyLuY2e"
+    "3uZY2nzuR/O+1qnmS13z/33muN88VnNPF/J7Wge1zOdfmefPzPFb89n5uvchOx9q6d6Z1yuH7HwuFbLzXt+zl9+bxhqabN4bYT7z"
+    "0hyHm/f0uRjz+FbzQPOFuXjcPC9rjoPMUXblgHkkN8+1VrOYx6/meR1zLGiOmvODzaODeRQy86CoOUaa16doXWrt6fq4D9vN78qW"
+    "lTbH6uaY2bxWxJzPVo23ecTrcyE7r3WfTmitmPcrmf9rXo4yx1XmmF5r1ByvcU79zGdSmaPmZD1znGgelzSHzevNzTGpef2UOWqO"
+    "pDL/z8+a/ty8r3NtZ46JzXPNy6qsK33mmNahef+eOY9z3J9e+r+5zv3mqHV3wzwOm0cX87n/zGuaH7Itw3UPzGsvGfsVOobsNeZg"
+    "vHuaxwXzaGde1xrTeJYzzzXfEziPr81rstcXzWOEx67dOth1zc895tEUOyt7Ibuw0fzI5+Y7mpnnH2pdmC9LYf4ve6X78pPmvHk+"
+    "zTwGe+z4a/0Hzd/8Zv6vc/jSPDrpHnntuF/HP+k8dd7yL/m1xrErWvdjzSPGPLphK7WuLpnjdPO927HB75jX5mCTdS/WmsdsHrLv"
+    "spMXzVHzRfZomTlm9FlbpTFtbo5VzPd9b44an6HYE33fu157fqc0b83/vzN/p/cf8n4Nc6xpju+Zv//cHHV9Xc3nNF+Omv+f07w2"
+    "j0LmtfvmtazYe/mSo/hd2YaU5ntjNcc038yjrfl/Bdly7r/mm9aUfKHG57yZL//Kt2r8uQ+FPPZ3ZQM0J7T+q4fs3PjYfPZ9xrqj"
+    "xgXbJX9eg/uWl3kcaz7bznz/A3PU+eo6de8OmOcD8ZuVOZ/r5vufmqPmcUr5KF2f19qaPub/IxgPrelx/J1+/7b5u51eays/8trz"
+    "HyBbKpuO/2nlsb93nnmg+68x0n36zvz9bM5P83mR5hf+qhP3vSTP65rjfPkb89Aa6MDcKMd3DjSPwroXjl1/Gn/ZrYleu04PmefH"
+    "OL8GIWtDS8lWmfd/NA8N+F/m9S+YW93NQ+tWPlrjLPuo35Kf+a11wFkS8HvaaW7x+/LnV1oGnA6P/J7R5rPPzd+2N8fz+Fx9XwJr"
+    "6hNzFG44YN4QjivQIuA8NHivp9aa/IH5u67m7y+YxzONU+OA88Ntv7vOcjP+Wvs/NQo4/3mj3Hv+qXyR1845fUczzQnzfsgX5c6X"
+    "j/Dj+ru93wbM/YpyfYh8tvyQ1n5t4TT9JnZuEP5Q+KwpWORvzl9rTH40q/mbLrLX5rXs5ntXbfF7Hmgs8fEFGHf9vvyDfJN8zG7z"
+    "2kFwUHmwVujrgDNrm9/TUmvGPBbgB9uZ14ft8Ltj/yPzSXOxrXm9kfl8PcY5A+f7iXn9vU1+z0FwzHTzfhPzurDhGtak1uvlrwLO"
+    "1xv87novrTluHsJ7Lczr/aMt/p3Cdb+nazavbza/p7ks+74M2/9ZvYDTYrvf04dxLmoeGrM8XuufdV+Tahz5fFHs7KfY+U51A86A"
+    "XX5PK/N54bGq5rhS12iOsgd3wL7TzeMeNrSEbJ58esj6k/XCN+ZxR2vUvKb1mbNOwPl0vd+jtSMsNNdrcXF58/8Z+CbZ+YUe60s7"
+    "47snCZtg24Q5fjTH5PjezcJx3M8S2JX+1QPOmP1+1+YpXtkPfmrN+pxtwEIF8/wt8/9emgNmAV/BXsczD4TzHHN+R4SfmJPylzmF"
+    "JcyjOfbvE+zi215rX/KbYz7zkB87YYzDFfN/zWPNx4B5/3fzOOSz6zOrOcpPC69W0zoIWn+cwrxWCFxThvN+yZzeqnvntXZ1CI9H"
+    "xrjN0twyry/B545w7DXJzxYK2bGc7Vis+I3PXvcSA/TSONbH6PWJrJPJXjtnNG6aQ6/N83/N67J7jRS3mL/LJTyBfV/lWKyn9Sz/"
+    "8DP+W/4+GziwOrFSL90zMIxs1QZzLEOcp3P/HX8kv9IzZMe1BXNJ2EqfmWBel01fGbS/Jf+p7/RpDWremL/R9R4SBnRsfLRcmAyM"
+    "uZT59oOwEOOVm9hV9kHjnpE5Xh97Wh57Phg7r+vWfa2IfZ/PXNV9fYL9O8OaOkscVBE7lUS2QbEoa3Cm1pXsjXnMId5MiZ/7RD4Q"
+    "/PQ9caF8hRffMwuMeMKxcfBBfJF84UDiDNnvcoxDOcZf1z+WWEY25oh5PPLY9SiboPsyhrhXsfV75lGF+3pb8R33TPhwMfFgY3NM"
+    "Jt8asvh1gvndH8AWE7B1muMVie/vMG5aS4+Id9qbh+ztn2COlcTGGpebzK+kfJ/s8SDGdwvYYCd4uBvjsI7r/R0fnJtY6S7jrPkj"
+    "3LgAv/K5YjndE+IN4f312IQvwZS/gN3l97uH7HXNwP4WBwfJxv8MXtX45TOfk18S7lpPHN4BLKvzE25/YZ6nxadNDNnYeiWYrzfz"
+    "X/N7I2u5M/dTn4uW3TVjKz8/w2fncENi2+18Zqh5rwjz4CbrQ/a7HNctnKU5pLiqpe6z+fzH8BGLmKsDGBfNg766lpC97jM8H0hs"
+    "I5tYWGtEOBAMoHWxwdI+rq/Xum8hP4B9Fb45yHr6Ab+RH9yuz0cLG+sehiy+XKSYCLtaHbwpPmCweb8w92OycKZ5NGMtan0nx+en"
+    "hMsYgV34j/X+Becue/8FPqMe/MAC7IB8lHBiZ+5hBs5zLL4hCAaWf5oA3pPPq8R1h++B3l8RslyV5lEWuK1e4NOf5LsV/2rumccc"
+    "8SZeyx918Nr1sAGb9RJ+LRc4aqhssMdyOR+Y40bmdkZi4akhO/fl9+5if+Tr2jLOm7jeHGC1othsxUIDzG+PNM9lB1+F7Pq7TCyt"
+    "uaJ7Mi9k44fe8DP1vRYv9QFL/ULcOFC8neIpxR/YhZn4WdnUUyFrI4TTt8kmaAzB4bo3FfHD27l/c0L2PnQi7k3MOYgnEu5SfFLK"
+    "/M2fIYsp8oSsbZZtGIaNUzySCn8v/6u1eQVO4S7+Qt/7mcdidX3PGtkb8FGE5pM5ZjEPrQvhkFHmkc48ZoK3VpiHfieHfKbe91p8"
+    "Gheyvv8L5lg0GKkB8d41+Lh6jM9m8/lvzHszg5aXyu215+YwvjPwTbqHwiVpmLdbiPGbg4M3GbuxQzynMK7HcrafwiXJF4g7k93S"
+    "NQsHzDOfF0/WzLyuuFtYJzPrXNxTlDgIc3wLru1ByN4vcTMtwQTFWQdaazl4rrmn+/jYfP4+nE054iP5/yMhG/MK//0GlhA+72F+"
+    "f7rHcm1zzP/HYA8eEvdf4joPMh+Fc2RD3jfXkcwc32bO9QtaX/I7drkyfkS80Ejmj+xpjHl+kvtTirh8KzH9QO5NWfN/cYofar1i"
+    "59In2OsSdydflzRo/etrc8xszqWk4h7OQ+f8injzV+bFnS8CzqsYG38IV2c0eEy4+HdzVGz+rvl8R2GhBIvZ+obsuvimUsBpbnD9"
+    "NvP9b3nt/dAY/aX1Ac92ClsXw5h/x3r6V/eJtVDUZ23h76xjxfzpmOPy9Qlgwhr4QmFU2dMK5u+EIYQnC8P7KBbWeSg+X2qu96HW"
+    "FHy3MFBXx/KUzYlNvsZfb4dnegyPtxAu+DrnXQLMr/vSzWvtqD67nbhqDjxFHq1dj+UxspvxyxSyHNK72LAl2LRIOPYvwNwF4Xe/"
+    "wM7IR4pLl52RHX4KHpsHv+/GQub12ti9hviZp8SlGcBCms+p4RD3w6dp7ErLp4ZsTkSYT/ZSOQjhljScp8bgLfh0rdstIYtTPpNh"
+    "V3wetOcnvlLx0mZiZ/nDAfBMikVlfxXDNsGn6nOlifNnwqd/AFbw4B9GMLdf857Wm+ZZHmyFMOIh7J446b7YgZ3E8rLtrVmnP4KJ"
+    "lmHj5N9yee15Cfcr7pgIPxTJOYwiD6B1uhzMqPsg/BZVMeC0O+h3cYD8j+JajcOozwLOwH/9rl1MjM1SbNmmbMAZ/rffXc/6nROs"
+    "jSrwpVnKBJxrz/3udRUAh4h7aFE64Ax76Xdj9yzMEfn00SUCzpMnlp/przH22rjjH3zfAc5Z2FL34mvz+fn3/a590hpXDP5Ac81n"
+    "15uwd1XlrcCXn4F3HyrnJexfJOAMumPid+L/e+D5q+b16f9aPqPTG/yV7qNsxE4wuOaT7Er6wgFn1Gm/GwMnZp33xg4I528C0x4h"
+    "NilNriaYP+A8Pef33Oa8pzOvF5jXU5vrusl57cBnixNsCqbQ/esE/pZNWywOnbhAuS7Nh/TMyZ/AyrnAcfWwM7PN79Qz138Ln/cf"
+    "8Zdwg/CFF6x3Dj7zO/P5Ibf9nm7ki/Z4LD/wA7GP9+OAc/ua3/XX5YhBdN9rsnbeYVy0fhXH/MU83yIbQ+wpnHQLzre413IG8qNu"
+    "TOa1cfoFcOnb8BLDzM1ZBXbV95w29il7yOJ/nctH8J+puc4exO9JyFFeJH+h764Elqii6zOv3wGP6hx0DxfhcxuzPjSf+3vtuta4"
+    "aq6l9losI9+oGO8B9/cU630y8yADGC8gLtU8vtXa0bklsjZY/qEy3Jiu5THx3krWzJfgXvkoF7cLE8sHey0m6ui1fjY/16w8cDXG"
+    "+wZ8SXX4DN3PONk02USfjUdLeK0tuwamUD51ObhHGHu/eS7fLL+dlu+Xr3hmXtN5fwjmF+clm9/UrDvZ2nXkVXMQOywIWuypOaP4"
+    "tajXclmngzZWrqHzBos+gceXbR1LjJqMXOQqr+UTFCN4vfaaIsAVwnPvgTtKMjeFR4UX8jE+QY+1w2PIa4pLqkqu9AS+SGutPf5S"
+    "MUgpYkLlxsXjZMEXKPbbaeahF65FrmUteaPkXmtrNB+akOsVt7Qswl73cJ/lDweZzxUjz5cKflLnljrCYqmRPhuTvc/4KPeaNGR5"
+    "kw3kz5oS95zivokPTDB4Z5H53FDz943N8TvzPDnfJT+Q1Dinx177fKlwvtfGqgewB/XgGoU/qpD/XAdm6EfMl4UccDnmr7CkcGcM"
+    "/I54mkpwEunM33eHX1sGfpQPU/5Fsecq4tu+XFcFONB/WOOatwLxIa+NG84TSx82z3VOf5qjbJh8Sl14idPwhMnhuerCZwtvC8O1"
+    "Izeoz5zgOsM5cN0/xR6K/0aFbG5Wmo0hrNehxFxFwXd/wyGsIE+kufE+PMAOfudL4sQrzK0txNrXye1UI8b6GT+idVA1wa6bU4xv"
+    "upDl4wPYsclBi30GmdfLmO9oHbRxs7gyjdM8c5+7m7FXzkG+ck+81RfMI69bgRz3dvJBWsNaj3Hme4SxZ0mPIH/qtbm4TF67Pgoy"
+    "3h3QGBwOWo5tMLmJj8Fk09GN6P50BIvLXvYl9yA8uytkeSrl8esx1r3421lwd4qnZVMjQ/baffClN1jnfo4D4P9mE6tMh+fJCM8w"
+    "nNxvUc6vBjxEF+xAZ+yN1q5syKugxd6aM8LOaYjPZFs1N46Lp1F8zNy4wtqphJ3ROb8ND5EFrks2sAiaHGFt2S7lfmX7hDWy49M/"
+    "4ztyETuVg7eRbS8bstxCNLxEF2ykuEfZ30rgvpPwGKuCNq7OT+7uJVzRGp4LY38DHlf8XpJ86y5wmnJe4vIPwjf8CAcY5bXcjM4v"
+    "CKcnbio/+ZER8MQX0Xx0xwctIK+v8+2CnfDgY+SvpSmYAIZRXFRb3Ci5szTce9ngYsS7G4ndysOPdCNXEYKPSk/+Yxs2Pjc+RrZI"
+    "9iwd66ARWDQbePI3/GAB1vgCON6HcC8NOR+ttQbwV+nA4Pr9f+CCl4UsllzAuu3Iute8F4G9AvzTCX6vBRyHsL7Oeyl58DQ2fHFj"
+    "5sFwF5qHf+cKOJ0T/G5+tzRcYB2wsPzcbx8GnGIGb1YEU+heKx+w54OAky/kd7G0dEGD0WHdA4MnM88LCo+Y888k/Lj1obMgR5Qb"
+    "M2r89N39Zas2P3R2ZYxyOZypxP/iaa4q7hEOMX+vz8kn6fw2b3rorE4f5eLur4hPhWF/MK9fTxPl4r6vmK+yfV+Y12+li3LjjBSs"
+    "C+GI2I0Pnczm9Wn41wvMqcpw7KfWPHTGmO8TzhHnIG3Kz+CF29jfA8wh3esDIYuPF5EDEa+t897HXD6JTkfjI/7kBJqgDnDQmfGH"
+    "1cjbrAF/CR89h1OL1/zp9NC5mj3K85SYsAEx3IAXcc7Cj6PcGDQPc0IYSGvur6CNaT+Dm9EaTvVfnHMxb5TnWIRdk8I418w5vYPu"
+    "5yX6gXfIH335OM5ZktncP/P/RsaI7jY4dJXPYs6qzI1W8KrCTMl8Fmtpjk/y2Byg7NtOxiu/+d17HpvnEz5o+sJxiplB+9n8njhF"
+    "cQiah7XMuacx/290I85pUjjKtQHC1tIm6PrP4Tt+ORznPCsS5dnjs7xiH7RGXmzvXe5vXnQnyiUo3/wxepwt5ncUO204GOf8VTbK"
+    "XQttWCf/wafKvzb4Jc7JWyzK0xi9ifKb4icqey1mf2mO8iVtfdYezyV2kXYrUvFe0GKMTPDv76AZe7AjztlaIsr1K3Xhf7TGm5vX"
+    "vcWj3HG7SZ5KnNr2tXHOLfN52ZIpYF7FRk3g41Imtrh1QVhj6bWxZxN89knW+iifvW8vmcvHiWlq+CzneQB7Op+4OR6+coXPYmLF"
+    "QR+i7XoFZtP1nQUHJJj7qjn0gXkuTcp1Y+hTK5ZMsHxPtflxzqqiUa4+qBa8hJdr7QdPVIi8gebybGzeLXI/R7yW860WYeOap+Aw"
+    "5YdlJ5P4rHblV3QafxNrrmUcG/JdsufCWPV4fSec5w6wX1t4qJ/gR3Lgs3NF2XGQb98L96I8sOKry3AySYitxbu9lWBxWDPw3Ely"
+    "QveD1m7K3svGindUnveYwV1LzWs+8/xd5aBD1vZEaZ3i75eSh0kKH/cUPr8x4zcI/icO3yeMpDhuMHayF7zvO3APJciJKkZbCl+V"
+    "OGSvXbFzWvBEfuyT9Hfr0EAqHxJHrnUK+TPxEi9mxznbq0W5+gndT8W08jHKtUXDReqzMeZzy6tG2Vwx910cyCb8gvBTMWLsxuSG"
+    "hHPjsXeae83ILXwCB1mFMahEPllxzCbi03PktBPBgyl/eR7dZw/4C2mgegUt/us1Ks7ZtD2pZ735e+WjFnptjmh30HKqrc37jWtG"
+    "ebbBKcjnyt4kHxHnvPoiytPQazmCnXB8xcEA0iSdxpZOQxeh67uCPk7xv/iDI2Ef6bVrNh82oTBxhbB8WTj6oegPQvCCQ9FGDYQP"
+    "1zwdwfU1C1n83QytpXQQ6eFCPuU3axBnLodjGAZGrEueRfe8ItrSX9CHfkdeqD3cjfCu8Nj1H+McX+ko93vFj5/yWV8xyLy+5KMo"
+    "l09uBM98h/ujed/TvJ+1YpQbJ9VgbspW1GS8yoFJc5EbGYr/PAYXnpdruDgkzklufn8s47aYWPTA4DgnvZmnQ8HT7dFb5oX/yob/"
+    "3m0+l7FGlDtH88HXaC12N6/vqx7lxv6ZsV2yIWcGxTn5K0V5pA1MhsasGfd3F7a3E3mvY+SitbY+MX9Xt7zxu2j9lSf8jHuQnbHR"
+    "344M2ZqBroxbmNsdBk6XH2qNpi8DGOAn+Bkfa0U82HteOx5z0anInmmeVvFajFkKvukdtCLS3T1nrZcgR/gOecZ15Dv3Y+Pkb58H"
+    "7XroC8cWAybxkNs5Dv9dCt5FSW/ZgLiBcc7ST6PcMepCHqQxGsPp5KGWMq7DyI/0IVbROt9rvlQ57+7EwMOJ66ZgI0v8EOesMOvz"
+    "BBhajxXkS/T7sT3jnClVolwdVx3iJsVoE3rEOavN/YnVWHmt7kr2XXHLXsWgXeOctVUs7k2D9kF+6MdOcU4bg6fEk8xH66scYGK0"
+    "mgnMj8wRNtZL5f0f3q1Kfv5V2F/BG+g+i49pwfoMc2ia82m8Nn+Q3Wc1MzvBNhXArLm4b73JmeeIsBi0I+cXx9zcYHDfevS24j4S"
+    "4bMLwTN+z99vI1/5Ct85g/uZHnw7gnU/yWtju1rEnWWZO5sj7G9Lv/A+9rs/PL7iWvHYO7HXNckf6vekByuBFn8k2nxd/2HyLx3A"
+    "oyfN98tmbMLPtyUuUP5QmOdz41TE+8r+S0tV1rx+1Lwu7fgN5VS91v7UEc5D4ybeurTXnqv0U4fgxIRPpUOuT75B+agSxp8nEc8W"
+    "b9fQOTNQV+NtDlO8UR/4sp7Y7i1eqyO/w5y8jO/KgL4/lTm/J3BjJcnrCb+pfuYkazANmgDFN8qfjg9ZTBsFX675JX8sHJYZffPi"
+    "kNWH34K/+IY8rviRsG4rrIeWX11srmGmuKagHe/VHeOcyFLWXu/CNom3f9Yhzhlt1rNwY2ew32vWY2f823n0d02wC/KZV8x9y+v9"
+    "X77/Z/I+fYI2drsbtHlQ+bXL4OGOYIQ28IS5WF8TyT0MJd9cyWvth3jgb73WNmcgHh8Cf9EaPZVwlvBsNnBlWWzNUL53E/zeEL4j"
+    "OfO3Dza1J3a7Hs/lK1J4rUaiCtdciXUaT/zyAxhyI3xHVean+KrS4LcLzPFV4J7v8b3Khw8Hh8p/dCc3dIG4bRHzJRW/O437nYvr"
+    "u0e8Wg8OKRlzYRUcjK7nO7RVymco9yBiWxz/LHJy4iYrgZdyoY2XHWtLvYSf6xuLTRM+vOe1tk2/G098qroN2bBJ6PqkO86ITR4e"
+    "suvTB05vCB6XDnwh/OA81uUSuLnyxGEtQlbHd5gYuAyx32by0IvJq90yn1tBXcJlMFN/xllcr9ZagvQT+GnF4/vQvISCNl+2FX5n"
+    "FP5F+tIujMkW+JfPwCvybw/bxTl+gx+E34RtI9DATCCXmQHf+xj/qXuyA4wse5hVnKjH8nDN0Ly/hbbzAjUfo8DW76MVELf8GXxt"
+    "Rq/l1tJ5rS31wy3J5nyAb9d9SkGd0Qr4TGFKaRNmos+PYU3o7xLjo6Tx+bdtnPM6b5RrRx+zPpeDg4R5xHtpzv9oPnc0e5TnA3Me"
+    "yqXNe8Pvy4/86rVYR2tLMW4KY5/FPef0Wo3O93CQP+GPm6OTryZ+KWTjvdJwoaqLUrw6WjaxTZxzJ1uUG0u+ADvLjq9qGeccKGTj"
+    "9j+kuzW/N5r1WYP1IQy4W/EGeUvZya34oV+pD7oGvtd6WY0eUjn8w/x9dubFAPLTmsu54a7aM38VN0835zM/Z5SLFz7FPjaHWwoR"
+    "l05Bl/M2dvdvdHH/OP/jbuXvpWUVb9AADroN86Yf2sOPWF9P4HTP872NyXPPBDsuQ+/WHc2odLr3iDVXY1++Bss9oc7sHHhgSYLN"
+    "ce1kjrUKWT41XFNViuu6ZMZFHO6TpnFOSTM/nnP9j8DVPUKW51YeTrimf8iOX7jO4jS4qBSavdfY8zPEjHnNgntl/nY9+doItID6"
+    "XmHvctI7meOvQctLT64d55Tfl9TNNw9i3OuBl4WLnxSPc/L8ltSzOJHlQcWnXVLtjAHFykFMemF9+BVz/aoBmZ1geefuReKcf7NG"
+    "ufFhZXJFM4mDi5A/LwJvXQjbUQz/tQT/9B788zow+PCwnk++pXCck9t8//fMjT7g4AWF4pxHWaLcNZYBDqkPmr6s6B9KYsvmcG+u"
+    "YBtL8/n+6FV0fQXzxzk1M1vcfBjdjvhRxTSX4LtTMn/kn/rmiXM6HErqGZfE5lTWxNt59jacU9Hccc7ctFFuPXAUPME0cpTCkxPQ"
+    "z4Zx56yP45yf0lte+CNitAH8fx26is8ZI+Xz1qNHXY5/V4zWC+7ld2KlnuDQzWD0P8AmS9Do/oZ29AUYTTZgRMjm7MZhCybljHPS"
+    "GDtTBGybCB6iuHm9dIYo9zcew+W72OejOCedef2g1+qfpslmm+/cGrS1yYm4j23grD6Bq/0Rn9krVZxzpF6UWwtWGn2walQW++x9"
+    "XUB94AnzfdISdk1mfu/tKNd26ZqXee392odWLcj8qA82LEnuZDnfo7yKxv897tticE1jr+XV5ZuFZyuGYp1kKaI8b5M3jIJbKwhe"
+    "ukDs+yX8w0Z0aDWxT1of1bn2ucQk5YhHM4DjVhMjy/+r3lb+T3azMDrXjPBfNeH9xM1LxzeXegtpaoXDmxFjPqBOcBB6IXEDqr36"
+    "nTp8jWebO7FOxtRRrj9qAU8j2xx7O9ZpnyTK82uE1YWnoR6oF1o1xa6Ks+6GLC+X72qskz9xlJtPEqYb47N1YL/BedRFc688pPiO"
+    "BVdinUEHk3ouw0ldYq2muhDrHDe/K773GvF4kP4DE9DxtmDsp5IDFy7/JmhzBpPOxzo57/hd290dvm44WL4Lecyl2OBm1E8Ls/zm"
+    "tXl1fV6cpnC5tMLSL37MuctuRfK940/FOvWCfpcrq8r9vABGaQR2Fqer+kvh81YnYp255vN7iT1Pglfj8FdaX5ofX3mt/1cc1ZRx"
+    "aQF/JFv0ofmeIkWiXDyu9TrWa7GX4t1JxBXTweFN0F/1AE8fJS7PBeYdj98swvqoSNxRC/5jCXG+bN5E8yOKQ6V/qQgnfRieRXb6"
+    "dtBiSOHQ++T2pTcSn6a82414a7dWHY51BiT43e9VXHACvrPRwVgnxVm/p4y5722I3bMy35egEazAeWn+Kfa9Qg5aWOVQ0NYOn6df"
+    "wtvm+37f73f5I2l0pHvaAA8iTcHR/bHOhcNJXV/bBG2S1kt/83orc58Upz7DB+RA050b7rMtY78grC8XXqRWeQ51FH6f5bFOk9eU"
+    "DuMiNSXi9RuGbAzyW8j6OfnhtegP9LvNzHmkPOd3OYFwrqovOdx34Wdyw0PKJ6z8JdbZ99Tv8rbpsT/ycV23xTp58kW5seNh6ndG"
+    "gHlnMu/U56EHeahrcLtaW8pXplpv5vm5pO7aKcR3DKOuRbnbC+tineeX/S7G1ONFIuvbW8JNxsO/al5UQQ8jnninuc5j4kOaZ/Cc"
+    "+SvSxQ7SwPyKbqqgGbyWXju/61JXKPxT13z/f0Grr12L3dNvNSVX8U+8rd+Jwie1SLDYSbyNNKqTymfwpL4T6a6FE+T/PkF7JX9w"
+    "x2vjsxnwv9ERNjc/m/giFf0JipjXpZW8Zz6nXMkCc7xpnl+jfuOQ1/ZEuZ7YrvV8Eba3RP2gvf87Q9a/34+3fQqEI/eSE+lAjCjs"
+    "V/21zd3tN59ro54j8bYWbkfQ5jTizPUJ5xcwzwurXqBkBk/rR5Fu/K15fd9neZuRaGmekpNIFLJzTr1AbpAXl2axWcEMnrGxkZ4/"
+    "fXa9BImZZB+/VC6IWi71BFF8fz5PBs+EJ5Gu/vcXYkpxbMq/1yKXLJ/UiDi6MTyR6oJkR698nMHT8GGkm3cog15RPsOb0tynZ5Ge"
+    "yay5JczH+1EZPFkDkW6dnuxoWZ+NmaSx36qaVp/VM+z12XzNGGIvabR/F0Y1r5cz4zjGa/XiNX22bla/ozigERqbf0PWlkgXk1G6"
+    "jaDVYHek3nGIz8YnmantVywuXXsHYqT0r+13zg/ZtSSerg1rQrn2atQnK1ZQvlKxi/DdEPNCMeUP0c2nuJTe0ygY6XL0LcijKUem"
+    "es+m8ALi0dTzRuum96T0ntPJ/J4C5FVivDan79YKU4cquzMarb5/XHpPn+R+T9BrMepWuKD64OK98Ar9RqX39E3h97T2Wl5R/UdK"
+    "0J9ANnwY8cvOHuk9aZ1IN26SL/nWZ+tI1OdiLPqrsvD9e8mXN6Cvjp/6J/Fp58y6kU5Dea5d5MYP098kEi5VseflBJtnFM9ymnuh"
+    "mDA63uK7Y3XMeb/r96Q1jjupue9Riaym8v23rK5EWkLZpKQ+q3kZR5y2Ezzw2Hz+XILlDt2agHibd3lqXqtuPiNdVyT5mBkhq2uQ"
+    "v//utV3H1dEv1jXH96iR+Bbt5UhyOfLXE8333jLPk8TbPJV0VFoPvSL+cpZ0t3Xfy9DrfACfVwlNQgvqbPaDEWXXUnr/ctJ19bux"
+    "wWfEEd8Qs991tTt/OTna+l2/l43YQNiowKuAU6WN38UAp9D0h+gBcdZj483j5G1zwX21wlZ9C8+i76kNP1LpZcAZbc6/I5xiGWxb"
+    "vxcB52JLv8vvLyAf0Jl4WHjvEHUOx8CPV58EnBOd/Z5In62dawe/dJNeAt8+DjjHmvldXlGxbTafnVvNuAblQpIQ99eBU7gerssk"
+    "36wxSE8euhEaurLoACcQk4Vxzyj0sHpPscuHPhvTTAnZmKIgse/00P/irw34/0PUgiYn3td3fwy+O0wtTH5ixJYhO496oEerI5tN"
+    "TKp7kBrMs/XvgNPSjGcp4utO9OCQzYwN2bzMSWr93PrIhwGnQXO/q8duDe6XrdS4id+X7mU3Wjb5vU/AVc3jAk7q1rbvwRfwiMuI"
+    "C7szZ7qCyRpRD/MKnKhY+E/wZinObxTczE1qzVeiq3pMfJ6Rmv623IMMXpsbCMHv+qmlLUvctYg+PcvJ+bxL/Cyd0DFyJz9T9zYZ"
+    "zDuf/NxYauouwqu6/SW8lkMc6LMxqniNKuA7jYm4lr3U9Vfg/7XRU2zEns7ke4vDIwm3XUJXdC7ejvF39KlKjwawHhxvY3SMzeiJ"
+    "0IVeEQfBi0eps2yLTn8QfmIl+tKPqEl8y9y3pt38nqToFl6Sv5C9S0e9uPKmCdEB56WxC59hF8J9ok6Z1x+O8Lt+Pi/6nvL41urk"
+    "BKahh7kH3p1H3f5UcjHilb4y3/Ogn61jmUSM8Q82pCbaQOlljxP7BO4EnM3md8tgx/7kvBtRfzXVvP+ir9/FO5+CHzSfK6IL+os4"
+    "bl3Q+tml1J1IE9WXmH0IsUURMLb82KwbAcff3u/i3U7k0nReM68be2bmv5+8/RTO/xi6B//VgLNnvN+NCf+BX51A7kbxuuavtM7r"
+    "6YXRG53Mm1qFreDkxsRn0vQLL8k+drkScIaY35coqSDaP9n93JcDzoHxdv0Pgkv4Cm5Y+YeEPwLOrl5+F5vrfkV6LY/WlnHsdCHg"
+    "FOrp97zwWvtek74Z508GnAxmfKfin9UfSflDxS367nTHAs6WRX6XX1YPJOln95Pj7Ydv0ro5dzTgzF3i98hnCpskEP9txXdpPqv+"
+    "dbb5XMJCv1uDVZZ7qbl27HDAmTPX796j5cQhmudJWfeqS1OvsIbGx/9O3rEIfMw16qILwy1ux6as4fV99M4Rp/9RyHJjc8zvpVjs"
+    "d/mnT8iD5SZW/5R8xhRyVmvIWWidNKTn1qrfAk4OMy4Zid3KoJHuzXoKwMtN4/z6EAdXor9YOmLbogcDTtaFti/Pd6zbD4g3o6nT"
+    "n0wcpLiq3/6A88T47y843wDcxZm9AWdpC79rX5rgcxOTE1ec3mBXwGlk/Kf0JcnJvcmOyz4spt5a4zIU/fZockPh2sWU9C9ZQh1H"
+    "NXz9eWoEb2DT6qMjvYc+7W/yghHwq6exE2WpMdqEdstHDdAi7m0z8s8byLclg/dbAJcYIB83F73hAbT3DdGG/0tt5Uh0VqPobfY1"
+    "vW603qLNd24M2tqiDPDy0vWvZN4Kv539JeCUNuM6nv5Q8ivinqQRm42uozY25hvWwzQwxHfkwYTtp+0IOPFT/W5ddXc4w2j4M/HX"
+    "H5n3PW3s/RsPdn7C+PVCy1SV/Is4uUTUz8iuZuJ1+ZDX2wNOq8l+298J25aYvEwZ6kHzo7MI17QWwc7spoY0MeO+nrx/JfjnY+Te"
+    "T7M2hDOvmN/rt8H2nUoTzr+I994acApP87v+QtcsfWQb9aMKWr+ia5jGNeq+9zWf/2GG3839KN4Vl3wLHYDyfY/od9DcfK7qdIsr"
+    "S+HbBxL7PSRv+BP1AinJM5RGq6dxTkGMv5L6kU/N9/1u7ssz9NvC3YGQ5Vplez407580fiIGHPUMHjwrdiYTtUyTtgScBdOtX/gY"
+    "fOPOw5+NX57jd/lHaYZ20x9zL7zRDnLVQ8B1l8lrZiPvWhHMdRQd/Fvk35SjKYyuUmOoOEzrZRH5yPT4x/LGXqpmKQ81HVvIwdYk"
+    "11wJrl71SzPIz2ykt2IM3ItiAPUvehC0fPkisL/i3mMha/9nJdjXL5ljAfIx8eQYxRkUUF9UzTVycTHxtq/nQDM+Cyb4Xf9cjuuV"
+    "X2ljXk87ye/64N6slwP0xpiEJmIuGsvK1CcXwsaUIRf6B/Vf1egzOZ55OxfNqvLES7FH4oGLEfssZm1pDu3YGHB6LbDx82jm5mzW"
+    "huzeNeLicmjOIsgrxq0MOBONv/0YnYf6DBZjPe5ibPoQByimlGZeOPDe0oBTsp+1NxOZ3/IvbeCxrzJPn6JbeUS9UmbsfgbyCU3Q"
+    "oh5Cs1UaP6S+JjrnP0L2vR7kn4UhYrFXfnL4lcmjdeW+iB9sGrK9LOosMbhhtK3jeIs8yWry1Br3fIsDzp8j/S72709O8wi1Yd3x"
+    "hZqDTRYFnES7/S5/kwo78xU28gq68TXwA7LPjxcGnPrf+d2Ybws18Jeoc2pPnr0q49sQLrcTcZkHnrkltYWnGf9IatrqEPOsQQtw"
+    "jHmn+9l+fsCJ6u13dUEbyStUor5zPxq8P/G7Wstb4Z1Ow9X3oMbnTzC+D77o7wRrR/ZR/3OLHld+83u5zPh+iz0pi47ky3kBZ9xZ"
+    "v9tvcBf5xZmsX/HpF+cGnJ0D7LhH4EvmkWcqxn1sQt/b3fTgPE5eqjZ5Wh95hI70o5kLFpZ9V36sOjqZZuRRm4BltoHzKlI7p95F"
+    "uYg75pnzumXWw0lyx3Wp1ZDWXP1H/poTcFZMsv3y/OgNtDZ3mte7dvW7mKU9eV/xk9Jj3AVj/Qy/K+zqR696GV/VkbrLM2CetPSq"
+    "G4EWeitjuBm94FH85U/0/FF9RwPyP5vw8/p94Vxhv1XM2cxowMbjY/YmWB2d9Ebi3/3M67lgyYrUAQrr1KAvSTu4103gxHDN5zB4"
+    "F63fwuQwf0Jvk8z53/VuRjMh2+cNx3uzTfxk1mE4j9mdfNxhcJSrC2YcR6M/z4lGWVzKz+bvSw6yuFz26CMffezwyRvN+2fn2v4E"
+    "leBf3B7C5vUbP9h13ZA46hY9aTLDaSquyjEz4GRfbPsstERLto76CNmL49NNXDHG767Dwoz1WHJgx+EXpuKX3dy61/IBus6f4YWW"
+    "kBsURu9FP6Nm+M1LjOV+7Gl/esgeQWddl5zP2XjLX1SAT0pOrncYfedOoz/O5LP2Z7zXrr3y9K9oTB2n7pPivfmss7+xhV+gi9xF"
+    "H+yW4MaCb/Qv0H3+gRrUMyGbw6+GT/kSHLyZnPRYxkf3SrqljSHbG2Ai1ymfMB+uaAvrag94YAi9VtMSL3/DmhhD3NIXHywebXhi"
+    "q93agZ71LjrKH6kV2+C1ebeM4fgbnqY7dmsvOGR1OOYgd1mPPgZ/oXOXD1XcFwXn1BWN0FAw1FIw9ySu4zFzeTo4Mhu1kTFof4cQ"
+    "n99Ec7ASG1yU+uPPyZd9RWxRhL5+HckTR/M3ReDRe9PbejrxXSx8wXbpdoml21Jbos8X8dncYYB7LW5nFr7jC2KWh9SrJWfsO7Om"
+    "fYzXZ9i9w9gG4dNZXssFn6E/82wwue69bNAgetxtRONw1zgJ6YJTg4+qoRsaR/34etX/m/elH1APp4L0dloJL1IG2xGg3+x9MGMP"
+    "+LHixOQ7weIX0OClB8MpZsofsjn72WhvHOLRIcztVPBU9+krIYyn+rcEtB2fU4OeF/3UJO6h7t0z4tXK9OlT/j07ui/h5Qtw9Cmp"
+    "Hy3n+V+P4jjsekN0GOL21A9Z/YDjX9pcx1ZiqCbm/dFweK/RgysOnBu0OpXs8AhNqKetAsaoQxxzEY70HfrvfgI3uwRtRZeQ1cPk"
+    "Yp3LN2yClxSOUx+xv6ldDvPeo9HiiSOrSF8P6S5KginSwOdUIX/WHX4trBfdRV+wSHrmjCJ3KTx00WfvjebNB7z+J7GV1sK3xMk9"
+    "sa8ViGdKogk4Qw+wHtzHXxMsflOMkQ0f4OrWieeT0W/lb+bSevS6a8jrv8Avduf8PqSPZQn0+5PR/KnHQMdwjQrncRC8PAY7do/1"
+    "qPyX8on3iRvG0N+iivO/XuaTyHd0Ah+dpJ73LDzyGnzpDvpP1kRHUhCtTWJ0lLWZD1PIt/2YYGOdn+Ex+nOdI3nekfqJH4lFU6ML"
+    "GA0/+C+atIlwA3PpV/8bv/Uv+YeH8P8hxmck8dMR9FUv8GG3WLviytS3IcwHab5WoLfxZK79HjzQU3D2WmLa+/A2g4hpYuGW1qPh"
+    "qUFOvz48ynTi3d+wE6lYKwPQatamDn4tfu84v6/r+gX+/F2f5eUGYYfOkOPuSZxzDq1YmZDNpWRlXvTEpjTmntZk3q0m//0RPjQP"
+    "PWTaktf55w0fNZ6c4R9v9HsfDSedjPWRmP4rt+D5muJbLhC77aVX+QViF63hY2Ae+dm+PO/BusrCe/9yn4fCx8huluEezANPPmM+"
+    "HmLObUBvOP+NmLE1OZgRcGp9iMN3cX4nyMkkpk/IUmKxXOQPd1HHJgxxLWh1ROfI2yh/fp88fCf0+8JGz9EVfk7fRGna5uFr1O/h"
+    "H3QyWgd/wrP0IvZPCg7ZAObKQC4mK7a5Jf37tKfFSdbvHOag7H2uoO3bl5kYYQ31QPfoYzmW3/mM2Gc+tqIwr9fHxv+Kbm49eLoa"
+    "8dQN+sWo/rsTsdiv4EfhqX/RYotX0TVGBS2+uIC28XPW4zCvzWk8Jb8sjkXz4Bv6FeUCf61EpzYOPUR2+q4Kc4pLeBS0eQeN1QNs"
+    "Xgw+ZyXY6wHXtoNYJRP+WD5CGuQQ2ssLxOOF4aXly7eFbIwhfqMrNuo467EbeP1f8Np49JIpWSMjyesdJSfVknXVATtXlZ7LA8BJ"
+    "21mrlel38DM2YxO+Xut9Q8jWO4l7ngu//jb27RW4OQ++ugC/e4+67/zicOT/fbYeuQgche5dnPaoCVqfnI1+ZcLOC4P2ukrSh/88"
+    "/VUTwYv8wl4r5+Gkb7H+z3pt78hs1G8mkCOWDSmGbUlO/DCc+z2C9RsLFh5G7F6a/itVwEjJia/aMS5zWO/FwRaXWK/zwXA7sG8/"
+    "03MuGXVbA6m//gQN4CA4zV58T164y7FosK7hm9PS93Y+9qgZr2sejgnZfmzp6GdXjHru6/i/LNzvsayD/cTvX5An01ovH95binxF"
+    "BXyIYtOr1P284nd3kp8bRi8agc/84I/BYGfxMaqHa0l8VoZ59Ip7X4ZzqY2/LkqcmIAtFJ85n30hhqMxqEnfhqr05HiXeHgHPWXy"
+    "YJOKU2c1m7j5GdrgR6yr42CRu+DmTKyB79FIa1249pn8adguHsLet0bXcZ883k6+cy82LiZodXVaTzHEGbLn8eyTtYf5I11GfbTv"
+    "O4gjzuKb/+baA+CMsfiRI/i934hLauNHfqXeV7FyG76nPtfzNnHjXeb7l/TxKoiOTb1o3kLfpfhlA33x/2E/jargsj/IT2l8fKyl"
+    "jXDDJ4gXx8H1P+K5xmsffWfSoQerRp3JIerVSvps3qEq+L8BvE9hMHUW8s//sMaCxPMav1n0c5P92oht6gmunUkfUfG229i3TdhI"
+    "+3soNz6E+PEY6+o/YouR8GHid5fBiXfi+9u8wQmpn4LmyOf45UJg7eOMbSf8ibtvEpxmMvC9sIdq2dLAl7SDg9Laacv5TKFPYgOu"
+    "ZzU8XHF6zddAXyj+8EtiiP3sveX25vRZ/voZsZPqL1/ih35GRyz7tSrCzv//4u1ePxqblcSyn4KFxnOeZbBLwgbqNdYfPkhYdrbq"
+    "OqkFvIqGJyfrX/i3Hmv+AD4tSD/lk0EbJ35GX40x8Fhp0NT/G7TzXbWFk+D9wn73LLahBvanL5hnNzY7A5zkFGz8IHifYuTsP0E3"
+    "8xQdsNbbc/QxSbHb87EpedCxX6YPRF78dlHGOyNYextz5hy1bGXRTXeAG/qRGrtYOPZOrM864PdwrPMjdRq1wKQp4H+PE1/foQ7g"
+    "A/KwXzN/C4Nr5tMHrgw9VaTrjKPvmrsXlc/WkoymDnoLcXxqeqZmoN+k5nkD6qUrEL/OoUfW5/jPEL1gRuNfO6E/HIVvbkWuvA31"
+    "3unwQ2XhpBrjx9pwn4bBp5dF/9YXXcGXzN/JxPlVqFe6Ty3HITB0StbbanDvFn7vB3DPp/CE7alTH4ufiWM+zUWT+il6kTVwI1eJ"
+    "wRWrLQpa2yp+X/m26AQ7zxPDUdeDh+xL/mcK3KcT+p+f602/7q8Y1x3wLefQ2I+FYzoCb92P18J7eyWGQ+5LP/Qp2KApcM918NcV"
+    "2J9KOE3abPmpHkHb83EXOZ+62K1FjNso9ii5BO/0itxPdji/U8ZetKan6FZ4zlZopBrQF24Sett+9Hgcw7m/hAPagXYlLfP2S3jq"
+    "U9QXnyP2iIHzFZewlnn2Af2FZYfqsG5+I++akjiiNutuFxx4RsajI1xZHtasMHp9n/2/5vlMau2uwrstxp6dZN2Gx2cd+7+M4fcm"
+    "gN9lP1SHm4q4qCV6vf6s2Y7o09OCo7+mHqUI81TPI0I2fvFT/6zzvcH62Qju6oO9vx/m3cjZvGasSqApLMMarQn/6cC/LmId1AB/"
+    "6ry2Ba3dvR60OEz+dj59OeLQVson5EInf5ua71XM2WhqlW+jl+wHpv6TvoZjpgecE7387tzshT5kOH83D9ymo/pCbSBm6gFuzgd/"
+    "Ih5uKDGH+ox8Qt3CAmxxHdZ6Q2zoT/RjrQJHoXtULGT57lHEvJnRsQsHiY/NZ67/a6/Nww8g3yvfm8mcv2++343DntCvR/Xm0odq"
+    "fl2cFnB+Wuh353NT7PVh4sl88DMr0SzKhmkvKa3V7lMDzkd7rM64O5gyN2tE/kkacM2HFl6rCbgOn5mevvmHqNvdNyngDBjld+Nk"
+    "V2/nsxrl58SmLantHhzeO4jY9g5cRCbs5yXGowV54VPs0xrmrhaY38mzwerqs8JVyz9dnBBw+u6weazqb/RK7Mb1bhkfcKLNdT6l"
+    "V+FGOK2VaAp7wDHONp/bt9Hv6mkVs8eyX636HNSB49b3dxkXcI6c9bt5sBX4j+HE/ppTPvN+svN+N8fzCVy6eJfg2IBzePf/+qXv"
+    "Yf63ZF59gD5pFTg07+iAs2CM37U7mrNd4buzcg8Lk8/fCvYeSM7y1KiAs+Om36P9j87g80ZSlyyO+60RAaf3H363z8Y5Ym6NRxKD"
+    "y94OWp41ElyzC5wsraOf/NRp7P11NEnZhwWc+n9YfUgpdNu9GFf5q0FDA86lyzYfHo6T25CLec0+Ssp1q4+pbFW1wQHHO9rv1kOK"
+    "F/iRXFxF6uhagll7wc0swZYkBydsg3OYwjzbAW59m/1MiqG7HANHOzDcYzpo6whScu1p4EnTv6FP+B0O8Bv82wX6SPyAxmEofMkK"
+    "8p2yB+qXotezDgw4Uev8bmwcTV3fN/C10nI/h+OuR16yI735VyYysUTQ8gzpwz3i8RGF0fIVhb/S/JwUtJqardQE3CQ3oNzZbDjO"
+    "CHo6rKMe7wf0TrLb6rOTDT6iOffrKJxruHfEW/TLkZ2ORSdRCT5EmrEs4lDQX6Qm1/0InzANDk05i9poxzVWa8jBKy/RC93o1+T/"
+    "NoCLDoAzurGOW5AnOUq/g6/gDeaiT9V1V/dZzDCN3mhdfHYONcXvvQ0nEua1ihIXnSOHOQD9/3LiGNnlnOH9RxkjzbskxIU/MOfK"
+    "4u/rggXykGfNC55U/ZYC0pbUj6Yl95I7we5hlxFuLJb6HOl6xKNkZx58ix1pCr+4lH5dyptrLR7V71H3LL47d4T1R7t81u7d9to8"
+    "ePMIy52+Rf+9v+nP/SX7akeH+yhG2vhLeZsJxO3qFa2+rMXD+waDwcL7eyuGvUC/Is0H5Tt3Rdj89Xri/BbkM7UetBeydFgDibW0"
+    "7tRXsjG2KAU5/LVgu3zs170PLCDu9JYZv+Uha7dTsV7akd/YQX/0AHUIS+A3lrKfyzW4G60daSG1ps8E7Zx9iP9rBH+1Fa3KNHKC"
+    "c4lluhEPhvdUnE0eOj5oXxOHOIX5swme5GvyEKXQ4Qp7dKM/pupZvmJOhuunt9KT+wB4Ij0a7dxgnC/guWOw/5WZz/nASbuIMT4k"
+    "HspH3JaaWuIh7ENckbU5FRvo1jERT3xH/BdCJxfHtacn7sxP3qYtOb4N5BG+ogdzunjL6+WF+xIunEeuqgfa2NrEd4PgN3bA2/UC"
+    "l35N3kbYV/vnTKHfTDzX8Se/3YIanAnw4MKYN4O2vqQZMc0o4voQ8VYrct73iJumBK3PnYPNbU780xp/Npy8TRR54eXsw9obHu99"
+    "eL0GxEyfU+dykBqhNsR//4Fd9vtsrJkYf7qJfrUD4Y4XoEO6TBzShHrG8+xlXo7+PhmpeXnMGjqJ3d/FeZwiRpxL3vsBedCb6HX0"
+    "fYOJlSZS5yu8qr62NbmOMnDHPbF92tNBfY8qoG+oiw14zZqbh+2sAWYahy0QrysbsMNr9ye7i03vz/dEo6fWGtBcaYXWIw95O11n"
+    "I/Zzly9Jze8OpJ/2HrilffDmc/ApT9FajuSab+DvZ4C3zmA/rhOLZAW/T4f/G4n2uiDrTr+jHrcZ6LE72GcxXgZ4783k7P7j+TX0"
+    "PRPwa0vR1l9hTO+ge1C98xLm9fdc02bmRCswZFJsy8Y39ParOO/u1AwtIH/0nPm1gjWhOFk5kpX4rxnocY7AFy1n/mzGN21n3Vck"
+    "33UX+yn7FQ3XHg3e/pu+X4/hnz9lrsxAj7OaueplX5AVcKn10F6F9zesyf5nKdE3/UX+4FqCzXVWpuZ/B+PZlz7uE8kNO/CNUXBd"
+    "jfGv4l9WwTnXI0btDr9YgF5iZcl7VeRvPwYHhnuj1ub7R6EznY5fX0scnJuc2ED2WW0X3v+VuGcbmqgS8MkXmf/fMCe70R+0DHax"
+    "H73ZxnPfB9DvahWc4yt8hoe1MwwtYVl4hr5g6KxcXxfG+Aq9spKgo+tCnjkFfV8fUTsu3ynbqz2SFqGD7MDfzUK/9hG4NB05Feky"
+    "lYdUnv8n9oz6D3u0iPxtFH3tHcZpK3m4/97IV1elXjO8D10GcHMq7l0zuLgh8JnhfQxvc07vhvd7R0cc/v70b+zf8yt98p9TS7GN"
+    "8+5Gbb+42c344uTdA06nGL9b49EkvH+78PVHD5w5f0XaXkzUBldCizKD9XKTWFDXNunDB84+8/nz4Pt91NGMxH52Me9ffhjpzqd3"
+    "3+hbuNZn+d+GxInR5HbOkGfNGN4XmL3Yk4GjcqLjK4XOpB98UwfGbB718ZWwL9XhnaQTeAx20vhuyWyu8+9INx/8GT0Ldc7ab1h2"
+    "s32mB05x835usOt59AFbMj5wVv1j+w/MRPfVivzreNZxFD2QFfM8oJ/CQbD6v/B2wsWz0YDkxK+NY82n59oWMW+iif8qwbdvB/tv"
+    "x7+VxO6exO6uAe/MhRdIwrnVfmOP2u34kJpg0Wdg3EnEMt0TbG60CbY+N/laH/bgfIYHztTYSHetdaCuNwlcxjB6mryHrQ1zCivC"
+    "+x0pxvLZdXkaDXIJ+u6fo4/VAup208AbTEXHkcAcHI6dT8FeGDvgRf9i/9MC1L9tR186FB/QkdhqK3ZxO30+s5O3u0ieuyN22MPv"
+    "10UnVQE/MRoc84B9XdcQz5Rkf78yofvOrNuR7rh0BAefZc5cYF0XgDNNA79ZkFzFAPrznGCfmZf42Q+5T8vJP+Wg9kr3vBL1yCPg"
+    "HKYHLT97nPhyFNxJdXJshbGxT7DLl9DJ7yJv8Cm2tRl5/BXkg5uwTqaSl9iN/+4ILv8H+zYcXJ2D3jx70VftZPzCdWMhepN1pybY"
+    "gcfNzNpaErJ7hU2gvnkPXN8BtIXPsA/aB6AJ9bItib8nkxNsCC6uQ4+JcJ+v25zTScYyG7g4G3rlAvC5U8G9y+Gu3NqikM07C5ON"
+    "oIY/zOvIxvb12bimPHUyveDK8sJNSMfbkDmwlnh2Lfx5D/B4e/aKyIRPTowNyAeHFNa3F+b+CGvdxi+9IG7v4rXr7zJ24anX2quu"
+    "7Ku5iF5RV4IWX2/kPJuh+/0OjJ8uvIcQ/r0+PG039iN4zrrqR9+8fuhPh7KP3wpw22ZiubTUvYrjuklf4YnEvCfDe51Sy/4r/cn0"
+    "e8WJp37CrxYHp55D4/09evVBnPNTsHZ3MPB2chcD8ePCsgPf2BvpNf2908PDbWHdyN/W4pzXgmevkEdNhp56M+9LP5YZ3OvFtwxE"
+    "n/8Be7RsRceVmzFKQpwjHctfxF/KbfnpK3CavOVJsOQa7q/0wC8Y46bE0JrTX4Lrd1NvmR19wyB0IXH4gjlv1CP76Zesa0kZsn1i"
+    "1Z8xvdf2v2gBf1AEfU1lOI1L4Llu1NZ9iP7sBXggCr9VkDi7PrFcLfhy3cf0cAhfkK+fE7jvNAlEunN9KFrtGsSz51iDiju1f4fm"
+    "ZbW7953V9yLduS27/R39xu+wd8ta6tqa+Oy5XQJHZqP+qjp+9wr7OG8EV32IPX1OX/k/yX9P5RqV3+hGHuFjjrJNIWoEt8O5jWMv"
+    "g6PkxmTr2/msPfyFfuWb0ZfK5kn3+R22WPeld9D2STtNLHKbOPjXMO8Nx1OUeHwy/v4R6016IPUsVJ4pPX0nVZf4PrmgnMQsk7F1"
+    "I1ivj9HJbKWeMwe8ShLW2Wv6bH8NTpKdl93SfgxX4FGS0APrAfd9KTplzf8+7FWcE9u1Ot7GyImJM+SbxYW0Yo0ew47XBwt8QP/X"
+    "T+FWUmE7o0/dd8oY3NmI/i4vqDd8K8LqOqRnOMC16PcUw4ufUL16bTQot+GeR7CP2zvsyaCxG0ZftL7MnTAeeRsd70GfnSfaJ8zl"
+    "H+BGN6ErTBRh7f9M7s1AtEyD0cb+FW/5NuWhZZ/Xsa/2WWoiLtCTQhr++nBpqudQPrQze/Ukxzcofp6ERnF9yPrud9GSFGL9Lac3"
+    "nHoylKCP8CH0x0nfyMtWxWYfgqcoiC2aS5w2BNv2LtixL3FAUWz14bCeDZxTGT1EmFc6Rr78B2KYa2gTp8ChfgV+Vf3EKuzuOPZE"
+    "0VqSlvIY+ZdZ7OudjjX8Bz5SOYyRQYsnyoD3GoOpD8GfPUcH8hEx8BTq7+MTrC71Jfs+76Q3177j952X1yLdeqTH8DjC9pG77zsr"
+    "bkW6OYha6DWEO+tEWL3eVviComCxCeh8isMnFd9239nwZ6RbfyA7et1rNU9/EaufZOxq4PMWJdh1Ngpe4D/W8qGt95190ZHueCke"
+    "XO61OmHpoBrBk9SCW8iFXXD7+dKjphh2fMdGs64uR7p+NkAefSP5qx/R//+BdvdDOOPj2LEG2Pn64PoO8ECV8Qur8JeD4AR0vwat"
+    "v+9EmvH7hRirEftXPkUn46w2dv98pIuRk1FLUBz9cgl09VXB6orrfiG2+gC/OpA1rf5mncES9eBgB9MrRH432axYx3PD//+66Fo+"
+    "a8/vUSN8hXPLAY9zAP/RGb+h/UyFGT9DTx2kTuZ3dPa6cN0D9XFLx34Ee+DrFBuqP/SX9ADfSj62HHmU++x7IvvbOpG1E1mpy2nG"
+    "nnzH0TkMgS/bzv6N/dATHAenFEBLvRle/hWaxMXkX+v6LN5/Gw4pFZqY1nA80g9FklP5Hl8svNCb/gG9qUk4nGD9RBJyCuNZo9Kn"
+    "5CI+msr8ykossJZYeAfz/QJ6+0/gRgZSj5ISzD2N/Ncv5DCrE4/OQy9fGmyh16uwT7LW4h/o8I7Tf64KfF8b7u88uKpP8R276Ff3"
+    "BfVkd9AG6z51SmQxXzrqM3LRTzoP+6+XSrBjFmLtLUIX5wMnRPJ70/jt3OiRvmKe32F9L8WefsN+6/eJGc57bc/QRcRzEczpC6zf"
+    "tfxtcnIWfcjdfO61eVDp31TTHd4rT3mlycy9PWC4asQcLj5XH9qQ1VruId75iRrDAFilGfmNpMSgO8jR/wN+Fs743NyfpGB0cTra"
+    "lzUn+/quwl+Vxn7MYY4qXtO+Gx5ypNXhrJoSp2Yh/uyIr51KnvcAY1iAGKcp+rGsnv/VF8TBWzWg38T76NIKkoechE17h/xpS2Kk"
+    "FeRdtP+R+gRnpU70NRimGPuJpaDX2Unu+S00e9NYo2PhMFahpy8AP+annvMkOP53xjMPOH02eHEcvHxl6lD/pk//z8Qc8tVvgb0/"
+    "hMMK94Bdxfw4Tj8h1QzNhj/uhH6nNzb0WzCu7NFl1vM1bNsW+O+0xCZTwQnCpCPoJfID2vps+KMUzJel5JWER8S7f0g/31HkSzV/"
+    "7tJX8iz9KI7iX3uwrp/gk3Udq7Gvn5LH8cATZOTziVknm1g3qruXplr1mjHwBD+jMdvJfOpP/n8O66MyWHoX/WwHkPM9BR5cCja/"
+    "CKaSRq6jz+6/vAycox5xKemjkQTeXVzqQ/af6Aue/gHcUgoOoRux+RDeSwLHoXxuB+5Xcmyq9qdogY+cTJ74KWtiFDmYGuiV9xBr"
+    "5KLO6Ft4TdnbTugdO8BDP2POZSFHt5W/jeQ+DucaGtAXqAX9tLRe3ke30JJ9cPoStxbEBsah0/gZ/jcb+UTxccISgQQbz7wFv9Hz"
+    "lb3vH5v7J3tWImjHKxn60UTwDkXRFTYJ2jlZgVzmgCmxzr+XbP+MT+CfpQe+OjnWCT7xe8Jaj7bYkPPm9eJvR7nasoPUqSu/lTaR"
+    "xSkf4id6Ms/LoxcvwRzMAoctPqIB+h75rtRBy6Gobn86c/YOOnT5p5qTYp3VG/we9dMYRhx6lTq3bOAJjcvlEbHOmFV+d40XYx7o"
+    "evMNj3ViV/pdvr433OJv2GvZjVODY51iAb+r6/+K9Szernz/WKfQTxYfPcEeFcLmbmGPh2TUja9g/jSGDx3OGD8ip68cwB7w7ydB"
+    "avO7xzpzFvs90k+cNt8xzTgyacLGoWWoH2FzJ+G+Gm7f9JDNu0qzNzex5a1HwRtUQDf1W9DW1y2BL88RtPFxYuzTinjLNaufb2P2"
+    "EZetyURetGzHWCf7DbuPcCU0AcJ39dnnsnazWKfJfL9nlDm/euaRP4ntsSw81ZN6Ao3fHz5bqzECznU/3L/2j31NPKb3M5tgSvyA"
+    "+kdoz46O9DPNT16tovm99/f7XbtckHk6C2zwPq/NJs/wHzqWwegfVYe+BjvSkNrZtOBa9d/TnBAeKGDOVX3+s5PDmgMXsgbcIR6k"
+    "J72pBoJZ36PPo+blHuK/7nBmpcBn4lrF41Zi3jQnDykbWz6xxXdz4EN3wI82IW8ifUNOaix3kiOoCl+9CJu4mH3JqmD/0qJrnkL8"
+    "LDt4Hv27uAXlIKQl/A4fMIv4zdXBBW1NXUv4hueJLO68hV/eAl9WDwwSIvd3lPqvR+wn1C/B5vTHE+sWxya0Cdp4cza6jxvEI6OZ"
+    "ZznhfxsxFvIx2rO4Izn8Etiij9HFduJxhe+pg+2OY322Anf399me0Uep49KcjWAMs8OxyB7loa+zn7zDEK5JccEHxPFtsTdbubYz"
+    "7FW8gLz5NuqtFBu9JgebmF7Hp+m1Fd6Doxn5k4XwisXwSdr3Rvdf60s+8Si+S3Ul4gXUh6sOmEr3UnU+5fhezVvxjRWo15Odrq7+"
+    "W16ry6yGDRReH06fh5nwQbkSWb1ZPsbmA/rgKv9QjJhGHNzSRLYHbw3s3FG40j+oUVF91RC0aOLqo9Chr6LGRfNgG/3olRNKgPPQ"
+    "fRUeV7+uJ+jQjpBn7Ixurg/zdT26IeHo9BH2ehRz9GPOnERf15j1sgRfKB3J2KDl/NbD8SQDX0qnoL3NP0dLeppcQgX0lrXpu5YO"
+    "fqMq9/AAfrM2+c92cNP6zfPEUD8QdyqW+ok8tN7bTF7nOOO8BLzoJSfwN728hTfX+WzPUq0P9fD7lvxhc7jrHHBJs+kzVQi9g+p+"
+    "ehCz90YLlJjYoBj7YP2Bf1lE3Oon5h8I9/8HOp+FjMkqsLzGaVCEvT9b8bcNwa254Ua3s1aakJfKQ06mBf28iqOfzEh+NT/81des"
+    "19Y+y7V+E7Kc6l36Tmt/gljs0Rnso7jGD+CjotgHSHUNd8lhLgRHTkGbtJJ4rgp9pMtQO1ANfPo4XD9FDJcWvPrrG/uP1yOvc5+8"
+    "+RFyyhXIs0onN4Y4ZTnn+T2Y0uX1QlaDX5n97EYQQx7z2R79Z4hfEjh/xYyqiVO9yAtpjen7qf6JxeDAcoD/+6PNla/MQd3MFO5h"
+    "B/zKOfrQvk2f/J8iLK7ohD47L/g2ytj1VUG7x8R06qUyoeVUH9Z+xGvJ+P4cCVb/pj3AGjMHyoKXnoGvK6GhakIdjWKY3ugbcjD+"
+    "Z9G4RRJjFcfXFyYeHUqdU1/GWXUZ73D+49grKIAGbx77HGmNaV7Izq8JWlug/TjmU2fanvhiOz7J7aMaYe+D+talZR52wE5oPC7T"
+    "b643cY/2f3jBNX9FjHYKHLSVevTvON9K6NvmY6f0ew2DlnfoB2dfFQ3gHbiJFdRKFQza2pwxaF5lfxPBlfRiHqwnXkxBH8YO5NEu"
+    "sFaHML/a4tOlgRBf0RoeOd0bevrq1IN3Ir8RTw50KPviyWedAJ9/RsxUmV792YjX5tOrV/dTutHdaHvc2D7C+gPtZatzlu4+LfGB"
+    "9oholWB5FNWPnqH+WuffiH3LM3PPe5Gv7QI2kF//huvJTFyi+1s2kcUHBeE+u6Cv3MN+EPvB4IO9/9sT9SEx9kR+xw9fPBLclgK9"
+    "VhvWt873JH0MT4Ys13GAemVptB8yjjPIX5wkxtP8/pG6K/ncAJ9dDydzg7Wh61JeSjg6adB+bzf0883I02ZGD/+QOET7/N4El8iH"
+    "zaIfv/yBNBqqRcnGvRWne5f+gV8Tt9VBN9WTfMkOc99a+Wy+bA6ca23WZyl0JLJzq7HF4f7m+lwq8mW6nqbmd+8ErU44F3vYPSP+"
+    "jsCHdMLeloAnqwf+fYd+kaoXa51g59de+LZV+KusxB75wYmvI1wY5fLW25g/0+h1VpP+XoWJpZJTF9qb+HE/dq0RvMlNxl3j+yX7"
+    "GH3NfaxMfNiCPN9B9i0SXlC/0R7Mb9mDDfjY/uQx1mOHulJP0T689xBr8inxksYjb5AcKLrOaPJa09Drqb43vG/qjDdqqfexr2dW"
+    "8vwLGU/VhdxEU1qVfXo85LPWUY8vDK19FrVehfuC2DthzCfgxgiwvtaa9i6XnmQ6NuokvGBZeKqW8Ju63p4RVouVgb6F8rfbiVef"
+    "wTN1JmeUk/np4Gcnwe/qvj6B5/qd2Cg1fGA7eLFwzukdc16KyQ+jM1JeKZp9umfDD/SF055FfVQB8o+a5/LNmcAek9HXp6RO5Ht4"
+    "tT70051C/Z3WvOJxaTJeGkNQK8Hio6f0uVtBHa72H8pHjvxYuH8r+DEX3NjuBNtj9Ht0LVrTzehlHYc9EObXPFP8VJr44NN4W8+s"
+    "v/sCrdpf7FG8NsLmVmVDNe9fo8+Tz2gXsnvcqr/aH+RI6pKj6kzdTG94QeGsbiGb4w5rh8J9ExqhozoOz5Ifrc4M7Mck/N8rNOLz"
+    "asY6/W8k9VxgH6IZXvud/arEOitvJvXsg5+6RZwSKBXrTBvu9xSMsHvProc7OcJeh3M5jzw+m+98F5wpPKNcynnqaVJTg56SfSj/"
+    "hZftSPxbEf1KPHzlDHLyncFjq815DPkzqeeOz/KMs+kPOSPe2pC8H8c61+8m9ZxIZP1JXCKLfV4Th25Cy9sYTNMEv70MjZIWn+6L"
+    "N972iiqWM9b59oD///dlX46mYQr8aPEcsc6x/Xb/shq8f46+TW6v0+yxzqJ9fhdPtKIWbAXY0J3j2WKdjfeSuvUfO5gTil8zZo51"
+    "Hm/2u3rlt8BrG+COxd8VyBTrbNli6zH74y8ToUuVPd+cOta5+bPfxfKdqf2SX733Xqxzd7ztA18N/ekB5kgL1nTCG/3a+hMHl2Ot"
+    "V0FPcBFctAcfPoW5FaIveiP2ty5PfWI5ePCFxC8t6U0i+ziLa2xK32Cd29p3Yp3/ptj63lHwQpPf6Av6D5yKOL8i8FMbqbvXfFUv"
+    "qJ7Y9MLY8o/IE2ntv6ZnTL1QjDN6sd8j3qcRuZOa8CAVuV+yg0UjLF5e47Px3geJbC//wujb1LtSnF+FBOsDczEHluHTttBbcQFj"
+    "kIG9wPKTg2gesrrK/PTzaPs6xlmx3PYrzkGOeS1+R/iw4qMYZ8FCv+sbZsEflGOv6bH075mHFk32+1hMjPNott/z0mdzWffBi0OI"
+    "41IxrxPA1e/gh2eRU0kJxl5LjBXWmz+4GeNkN/cpymfHbit50Wvg+lz0y/P8HuPMO5fUtVdvs19ScfSDldGcXINjVZzhOxDjTDb2"
+    "Rvm4WuyN2JT4WphH/EYVOKKy+A7FF6/oj5uaWrRW7JvYFk28zvsyfzOY6zhH7N0dncdfYINuYLAa5Gny41/3U6d0lH1vvkET2A9d"
+    "9m1iia3oToLkmoQVP6ZOZf+2GKfMCL9H/WOFjZ9RR9iSe/IR/SV30wcguDHGOd/a7/JNOejnMBn/pZhmvnl/QFO/u1YaEo+kApP3"
+    "p975MrxDa3gtL/UWN6n1WEO8uI/zF85R//9MjMGXxP2qj1IeohjjkIq4SLm9bRtinAbD/K5t0KM9fEJ38hod4LsewceexNcrLn7K"
+    "XtgnqYk6SJ4nD30b3Lys+f6/zLwIY8Kx7O3eh/2QW62PceoPsb+/GD1fuK9WPfjguuS0tV5/8Vr+4aD547zSoqyLcYq28bt1zVHU"
+    "wGkeV10T45Rs5Xdrb3IyvwvCTRWm7q4NdWSF6X0rTHaVfs990WPoey+Qi20LBzIfnmQAnFEh+Kdt3K/r+P+d1Gr+DO7Phd88RFy8"
+    "m8/rHh4N2l56F8GTL9An/Q5f3Ik+SYPwD3/gA455LfecnPuXjHXng8s+Sh+k94id7oG7U6PN7bM6xplp5nUh7s+H6JA6rIhxCjex"
+    "ebFm/F41xsqP/n8GvYp+xW59jZ/tiY7/MDiuIHsgy9e2XhbjVGln9y1qDe8mrPzAa+v41Md3DzG3uL4t7L9SC7yyhNqSdtj75vBB"
+    "NfjMpqCNMWbDTWxif84IMGxftMEf8P19yeWPhyfuD9aXriQTddT76Mn50xt841PiorVwZJmY7zfgO4ax58dW8tul4LNSwD89Jafa"
+    "D5yQCP5wPTZ8YhhDUOf0Gdrsy/CI11nvk9F2Lse27uU3S8OXxnKfv0e/uJF8awn86iEw1df0imsLJmgPXzUKvK3xVX9EzdPKzPuD"
+    "xCOz4YifEMN0g8ttiU4zHbhX63gZOZxn2Pg7S2OcSR0sLqoFLlFub8SiGCdZW7+r4WhPrrogPOMhciZ/c33ViR/PUnO8jLoYzb/b"
+    "82OcXE3svroT6NfgXo/Xrq1j1FRlpwZwGPepEXHNXPjg5OT7S6G99jHe/6Fj22F+5wNjh7q8wUHmRz+2KbynCzqTC/TyOsEcKgMe"
+    "cvvezotxIozfWE4PqvDeTHnYf3Mx+OVb5k1l4teOzNlY/H3emTFO/3/8Lh8W3pfiIH83k/ypcMSBaTHOwOZ2344ANqInGEBztJd5"
+    "39vX7+Z0eoE3S/NZXc+cKTFOn24GpxBLNaWmeiJcwBH6364md5RyYowztYXf/a4K3A/xWlfHxzinXvv/v3YkBfP7Per/EzHP6jj/"
+    "2wtYeCB9WBcxLsZZ19T2halMjF8GbNObWCsfOSTpIVaTB+iLTW1GrPE+tXbK8UtnmZ9eKEvok1oLPdmPaFbED2yl7qwW3Pp5/EYq"
+    "5uoUNBj5qdkQNhwUtLzvGXB7FfB9afaR+JP9hp9jd19Sr6/+fbXoadaduhDtI/gaTcl77KlTHN1dB/RS671WC1SV+zEdX1iMvhZH"
+    "wfPqhTqM8/mEOlXliatRh3IT36y+ivnRAneAUw1h5xrAv4pT7Mr6qglOn01cfAm/nA8etQ81Er+gd6jB+bQiZ3QWH9wP3qQTtaEh"
+    "dN7iKTrTw6gadrAQfdrOwFctx+8eJB66QMy3GQ6lErZ3K763DbUO8vdp6KfxNri0Cuc1l17tCfB2D9GDvQvf2pr8yWB0VdXe6Hd5"
+    "Hc1UA3Du+/TYKICeuAvrVHNUtRxpWRPz6B/5Idys5sZz9h2K5/cWMkdXwIP2Ieej/sEVPP/rxTkGTrQWde9zqeXJg59Nw73ZzudV"
+    "l5YHzV5teo4rHz88aOsddI+UH4nAto2jJkH7uvQCE2mPg4ljYpwZz6zuYiGxTAP0ANNYpyPol7GMGuxLcLz10Xt0Ij8yF2z3El2m"
+    "6ubajo5xTvb0u6+JF1Cfd/FqsczH0Wib56I3SUrPzIL0TlwI/12cWGoYOZol4Lam6OaOYCsvsp7HUt+QDjupvn8N6Uv+EPwv39Sf"
+    "PSAyjoxxjvfze84xvxrgh7aQ8z02PMYZ88zu67sYPbvDHqr7sMd/kgv4nr5L4k+a/BjjPOnqd/szDiUGWgSu17k/AoN8QR4mGfmb"
+    "CviVcT7bXys751WPeOMf+qh+Q93tSbSJ4b1pv2Ud3QOrzGWsw7ZW45GD+VcYWx3eI3gTedEUcDLL6G+xDzukcdnWM8ZpNd7v3lPF"
+    "59/Dg+U3rwfN9b4iHx1Fr6bR7Mf5iP2xr1Jv0MNn85U7mJ+30ROFa3QzgPEXwWflhj9axL1cyf4GL+Cj4rFZ297QndZES3UJ3fMU"
+    "6v+bE8f94LV7Qp/Gfu5Br1MUrBnGGVrH3dDVDaU33nK017+jR9wPvliELfocXmAdead75MnOwUmJj1sBfvqWcx+Kju0g/dfkw7UX"
+    "d1fihyc8xIm0gzMdhB5VNkif7cQ8v0H8XYNYfxF6q3T08zvM9zSGA0pP7XwsfVA7okfqjE/LCgZqg54mD+PwDXmpZtTcLaHHXRow"
+    "ocYvHvtXFc1UUzB+M/BVb+KMXdSSHfdaDvIGvJLu8bfdYpxuo/zumujEfrPlqHWYTJ/cg+gHBpIrEC99gPWfqHOMc2Sc393nSvdo"
+    "aiJrIxpw31PTk74OMabsbFJ0jap9nNchxhn9xO/O3X1wdzHUFVcFt6gWZDtxbb3Edk/z9j6razrssxzEa/z0Y7gnL/0klxGfrWDt"
+    "1DOTKEWC9UPag/M/cz6JxQ3KviinlmB7IypvWjO83wlrtjr4V+fZq3mMc/FolIslxsI/p0JTfgzsUQH8LZ85s0mM81FHv5vzOIT+"
+    "WHPoGfbnCffxKXqz9s7/8hwrqTGuC95uRc5Afjx5/RiniMHnR6jt6ILtf4Fd0j5W0hxXJocxCR709VcxTo++Ftd3Bk+twj7rfqc3"
+    "739RLKl7/8fCP4XQnOh8D9eLcRZ2tPtTKq8SS38L7UMvHuiyz+Z+wnmpcP1fA3SbzfGB4bm9AN1HUnz2dyEbezVDu90QvnmA+d2r"
+    "xZO647aWvYa11ldVj3H+M/F3c/LEd+jbcxbcdRv/W5N+alnIiQj/vAZzTsZfRmK7T5EnvEvtquKVdtRHhX2ozm8c8UsialU7gH87"
+    "oxOX/QrR7+qnkNVX1aY+IyU6xyb4wd742ZZw3Zngl38D792mX472kslNDtRLj9Qh6PyFJYvSNz0531PSjE+SVn6Xm+8JRlasI23K"
+    "C/rDfEUtrHRJp6rFOAdNnHqZeqGK+M9m7AW0FW4yDfvWtCR+y/tFjDPYzMfp4NB4+q0/oc/6D2DeLPhmT4kY59XXfte3raOe5RG4"
+    "VTzdl9iea0VjnBUmntsDLt6K/T9mXp/fzO8Zj0YrJ9qZtOT3JvvsHHiBrmwpOOskfXHK47ulW8kCv5Wa+6r5eoU+yhuZT3Xo35eT"
+    "urOSYJdR9H6ojI/IwRwaRd6wHfqutdTrJae/TpIiMU6dmv7/3xegEPuKZSEemQmWeIWOfBF+rgT1ZurX/x4YpRR+pw5aZY1zv8Ix"
+    "ToHqfpdvzPuGBnV2oRjnSnW7H6y+6xD9Ao9/EuMs3xLl8kOpuIY85Nilnx3itfmHMug0D8CvqI6oBfvqjHhDN30f/7gHnXU18ud3"
+    "IqwdK4lmowj+R3h2DDnfP8Ddu+FzrqKzrUV9xDLGciH28jHc6xZq68eiPX6LuKIb+9/8RrxZGyykmKcxfYuUcKoH9h8IBqnBfovP"
+    "mTM/U18Zw1h2gHPT/NuTI8a53sXez1fwc7pfxczrL819ngt/Jp/Uiz0p85KrGsX/l4GxdxBTaPzfTmx7eb0gfkpKfXe4vm0zmKgP"
+    "XPsg+KXPyZ+WZLyOg0kfcH8yMU4P3qhDGkEe6H04/j5h3SixiVvbELQ157OIffoTb21kzHLC11SFD9pHXK2+WFPp71sFjJCVeoh9"
+    "1M+OpM6wC7xSV+6dbNeS7DHO7W5+T4/Edo8v1f2pLiY6m7EDTS3flh8/vYA8jux3lywxTsvOfs8G8/lu1EBnwKeuRH90yjx86WOc"
+    "9T0tbzwVfqkEeqFBaBUKEc/8Ck+m+77+ZbRTI2OUR3Uy1clf/QPf2QYbegE9mvij9UHLe6+7E+1sWRjl4hzZq7ZeW692Ad4sE7HY"
+    "x/j+I7ejndCiKJfrGYeGdBm8qWzwTfZ98mKH+l6JdiZV8numeC03HKAPdePL0U6BGVHuWqyHdmMhek/Zn/Lm/aSV/W5tVEfqlyfC"
+    "X31Drn0vGLc/fZYVtzQKWl3WuEvRTu3JUe78zP/GfsC10JE8w9dtpZ/h6T+inciKth/wh3Boun+xF6OdiZOi3LhwOfWX4vky0wck"
+    "gZxsGfZtHhO081w9VL9G+/0z/GEzbJa7/7T53hv1/J5wbYDilprst3cf/JjAuhhDnWksOjf5suGqOzQP9Z5bQi4lM/WpFcBEmjt3"
+    "2JtTHJ3iogro3l8Rs6l+UTahsc/WSM2BpzxI7eXBCFvXdpGeX+uZV+vw48o767550CEMjLBcnno4yL5IT6rPq65f4/BlImtfnyay"
+    "PqlqhI0ZcmNvRnBPc8MZ7KeGqXXQ8nWjWf8J8APqa6q1c5g8u/JCMsIj0WvlQU83mt5bXxKf61zLs29De/opSPt532v3yr0dYesd"
+    "uqFXq4/9ycf1HFZfGmILaeQXgivzsf9vSWoVw3ustoKLqcN5N0qwvn8ddQkX4GAeJdhe30/QUF2lFlX5z7fAuLPZz+sovngpcWwk"
+    "e1FofqQK2flQlPUrziAdvFUsOXFp/bYnWPt4Au58MByfdE5nWVvi2i4nWF/W+rWNLV4+t/dqzmurix4ab51fTvqM/U7tRjvGvjD6"
+    "+4Xch0rar0m1QPRTX/ra5nuWB+3xSNBi4u7olLIk2BqIhWjMS3Evhd2Tey1X0wRt2A9gRc3rpOgy5p6Ldpp9HuWuLe3R96vP4hfp"
+    "52VzNsbb2DYj5zrMfP7khCh3raUn3qtHj3fF9zqvW2Br2bVfzkQ788dHuet3FHWrus5Q0PqVD45HO6XK+z3h3sbL0Z+9DX7qzvxY"
+    "AFaRBmMje2VVx8/uoE4iNTZzOfjMg99WHkh1C8Lp89ifIjPrKBlzI6yfmUANQLjHxGnmUg10HsKk0speZ9+pB+icuwYtl3MDP5mB"
+    "HFUAX3MuaO/L3X3RTsVyfs+LCItN9sLBfsc9DO/rovqKRPTJvsBcWAMP2oA4/QlxaEr0kvXplyhMUHJ3tOP5zO/64XgwRFvydDu4"
+    "n8IPz4P2+u6jJzu3I9q5WsXqCLRutnntvBlK3NqT+s1Y9MOdyG2+hT/tjG1aSx5X/TQiiFWvk9sby7p7h54iihWF+6aCr9uhpXtO"
+    "vrE4+79kou5MnL50NufxA9Wx61+xj1hedKpFOe9pcGHj4NzeI9ZoCadTHP3gacZhIev0FrWPe/iOScSSl+DPCxPX/UE+Mx/1ZwXQ"
+    "TR1kTvdDHxLWpE+lj+Z76Il6Mm86EC+0pq5BtnzYpmhnzEdRro/NyVhr3dRcHe3EF/O7eKk0HKReT7bK+PcyfhdfpkEbtRL7Kn+c"
+    "b2W0k6WC3425S1HndIP+F5+CG9eDLwuRH/oRfbfOVTy1NONt4G+7MP5dsWMl8aP34UuqsV9mfWLGM3AG77Ov1jf44k+IH2cQr4aI"
+    "F2Zz3SvR+Jwkd6a88BC4+rTocPX5WhG2d1cXNI9X0RIUo75rJuu4ATFCDvzXWvoY6/t0Hq/QZ5+gr/U18mZF6ZH0OzGJ4rkC5EVz"
+    "gqk2Ek/qviRgJ94Cj5cjN/MdPMSOoK3HGUrdxff4sS70RLizItpp2zHK7R0yCRtXCgzfnZyI5uiVZdHO5tJ+d/19z3ms/T+mzgLK"
+    "yrKLwsy9Ewwg4A8o3YhINwiS0t0t3SXd3d0lnYIS0t3dCAiIICAwNNIxc++d/9tznm+Ja7FGmPrifc97zt777AOPkIE8qzOfi4/O"
+    "eT7vS/W/9D7NmBOQnBxAMXLzsojowlfDY+JQLDCjWnjsKP4MWBwRnSS/6Yp6s+bLgmufxwsgGTVFM9b6IL43BTxlABx6MNxMMLXY"
+    "TL6vsNuzCX4ZBsZdn/y6Cvq3+WAYk1gv/0MboD+j6JdORL/3JuLQF8w7rkYt6/b7fvSZbkp8emLi5Slw8/34ZZ7C1zwRmpI59A30"
+    "ZyZKVvbzSzyjk6IVGMv8W/3uhLMiomcXjh3DmZQnV4qZ29g9IjokV3gMpqq1ER5sGFkb5lU2B0tbCsaVGx+h5NQFa3lukzyGs9UE"
+    "R3yELqE7z+sj+qP9XtsvdYjf+8BiMoMxqB9OOHsm+pDf8/3X8fd8wBl6i1rEnbfUEj1XHdZ9DnJG1evKc0s5v1cY0RP6QdLgjTWd"
+    "+j0e+UI0P+cZmGA41yP9eF76kn+mFlRe/p55GvJxk/76BPlxRryqK3osdk/3Wu+WegCLcf990a8MgBfMwj0+Zd3MRR94mZhQmFxo"
+    "FzjWKrBYdx5FUjjyMfgJnSNf7wEPPhEN9Y/USwvRucwhR17izkAg7ozgfFyNV5b+XoH8IZg8+nv438P8Ge01rN7vsfOiPNxRK3xh"
+    "7hJf74BZJoL7/Qbeawx6bekq/6G/aDG6ta14q4zHx2k03OBlelgm0ndxmnVYjn7M65y3/Tkj97h+c+yBb9D07CAv81HnDwbvuIb/"
+    "2ARw6kbs3030U1R2/abRS25D769+mLP0k36Dzly4Wj7OfvGzqekzCgYjOI9eaCD1Zn3yu0r8zNXgFVnhz66xJ16hD6zK9T1Fv5ME"
+    "7r8SZ1Ay5u7+Qa6RgRxqJXnSZDAc6Tj+ZG5DXOKQ9tFev3F+6lfTWRtwHtaBgN1fEnohlf8qLyiK9kt5chZ0pYfwxklC3RTsN/1u"
+    "avZtNfKBG3C2woG0Ny/6zRuxMTyrOBppyDR/QHFIPqFzwN+T4AFRDz9BvY/J+G6kQYtX1mdr4YPfzqaOPpuh0T7S/LVLof//26lL"
+    "bgSZyWyAOWx/MFepOJqN63gnp/BYP6Jq09ItI6Lbpjc+ohz5/0v8lq7hk9QNT4I+aKcfuRwefGYq+qHduatN2cOhzKQbz6yzldQY"
+    "eegB60bcGgCHlhvuZxtxLgpdQQH2bj30gGc464Yz1zQVGNNMesVaMVd2KznrZPrelsJbHSQX0Z6fAD6jz2lmu3ihvvC5+dF0pUGT"
+    "UARtSSp4mbj4O5XgnBkDl7aVuPwrse8zvCG86DNP0pf6P3yzBsGplCT/z/OJ98Rarz2Txuy3IWh5ipDHtCYujSAe7CQveA/elxIf"
+    "z7NoQZ4wN3FhsPXxbaTXYShzeF/QN68+wsHskyacXU3Q5JQi9l0gD9yPjv0xflNaG8HM3UmJ315f8LIv4CamoPc+TIzKB+Y1Gm4/"
+    "s8d0Zw/wxB+Ot1w2vq6/3/Q+HcmnVtJnm52+nRx4rvaGvwx4TTebGpy2Ev0tl4hbpcmjB5AbbkTjMZY6MR/12zv0FWc5s+LigTYb"
+    "DqAWeO3fvIe96C1n0wP/mF6PkfBhn+Eftp469nPmDso/rRl9hy3xL4iDXmwMuJ+uOaHX6rGsXPt55qXvijKd+VX29Uae426/6fKk"
+    "m5P2okjA/AnKMDtOOidpU4Rvt+F5fQPmmgqvknjsgYbkF8p/dvhtjf5FDO0JTikeLrbzLm/hJ9kQH6vVxL7SaHs96ALPkcsFoXs5"
+    "HmSatKTkPct5ZjfQ0PUAR1PfwhI8tjrgo+iDZxiMbi4vOJribwQ6r0l4aE+FVzkCht+O80XxcCbexV3IV1aSb8xHH36GGuABPbb7"
+    "Pun33U9O2tJ5BvWCbP0PdfU2YOc9eU8T4b02wNOPY29mgiNZQu5Qgh6GpvSkLiQvWEm9OJseTK1t7aMc+HCcAAfKS77dkrw3BRjc"
+    "Bt7rnk/4vcRwRtvonyuBt1tidNTF0ZD/Th0r3cYh8E7pEh/gN5MTT9ha6Bj/5Zrn0Hc3hL3/lrlds7nfkXg3nUD33oba/AdyjLV4"
+    "q44Fr7gFnluNXvPlYCZ/0lc6ANz6As9fecFK+MhlrOf41B06u5V/zQW3Es+Ti/6X8/R9nyCP+Jx8Zyh9RVfAL9XvH8wZ3/ETXDg3"
+    "1/uG/PlllPGiJT32nn7lrIhiXVbH32EIPoj78BFxNQRNyRG/BKcLEJfKoE05Bi4ibPQYe/kX9tVc+P3y6L9/ZA2PBTONRFfaghpn"
+    "LmfBDXQW8hcpDJ4pTYu46LtguoO4v6roYcuxj1VHlSaf2og3rt73WvDSo+5sRGaEf4aOtxF5bgM4wpdoNBKASS5lDs449IIJ8QNI"
+    "xf//D917e3in+uy/C/RTleW6tsLtCx89CCZZCF/XYfhWL+GMVy07izm831HfXGLv12EdrobjK8B9Lgdvuwv+/gKuVv0aAc7Gu2jh"
+    "3DmQaz7xiqlL38dB+OSL6BZ0/miG2Ai/9f9NJp9aw+9T/+qmgD2z5HiMVCGGTcNnegs6w2boQ7QXlaf/Qt9ANLzDJs68Svh6j2D9"
+    "D2AWzHX2WC/mNHWFjxEuWZ7f049+pBaB/zxKsnLmNES3VoG9/i81eBv2WASzY4PxFlpLnFqNnuktGtomxJHW6I9HEMeWE29LkKMK"
+    "g71C3nSInGuw67MFrrHVnaGNbvUQvSFNOC+qEScnMyOhld9wEcUGnTf/+C0eDcLneybXqXcvfuRXZiyOgmPJhy5jDhxRNfC4Zng1"
+    "zmeOZmd0Z6mYxZmN2VFRrLUO3FM5arAerP3y5IzF4JjPw4uXYK58WvbJFWZwNsJHsCY+LHWo7dvQp1fskz6tI/wexfzcrM2+8LY3"
+    "ud54fN9MPHDf0Lek53wEf3RhSScbRUTv+TZ2DGaWGe2U7m9rg4jonY/CY3iDUuD6tcA5/0eefIR71jM7Vj8iOl5wnBgcLZK+FmF0"
+    "9ZwgPUM1j5M0rXF+Ye2MTp7iJHcvnMAz1/n7dY/F0mLURR3DY8Va4fybxLINlFsmiBUrjvPxa+fjUM0Mjm8YQqYkhg/lDrHndCbY"
+    "fNKKMX/w1gfb5xXh2sQ/lEP3PZv4shNcx0PMFoZ8wGtndiw0/I/Y68nxsFCdrF770T7j/Iqiy8xOjOpMjFLcbCBsNcj28Q303F2o"
+    "xSbhkz7Y+TnSGLbwmW6wAOtd3/eIvezOD8pNHXQc70mdt6/xU4jjvjf42xP4w4g3bkadMoY8WOdwduemq4hjdD5WlcYxxPqgH1OX"
+    "Kq8MYR6ZnlU6r+GR+byWX86gBnyNPmsUvlcVQw0P1vsQ/3eIuUjJ6df50Wtr9bdg00GWAY/vhW5yCrh5mMdi9Cj6PS9T7zQJthxF"
+    "Gg59TrX7fJ6rYsVAMLiZIab70hzWHGj+ZoObCr/I7qVfG97irsf6GJsF23yCCj7TFt1jtlYQMXMFONE++e5ovXktT5jMPGzhCRvw"
+    "GZSXWBEw6KFg0MnJz12fqZdorB9xpnVzft4faF7XkNt/oH9Tc9T28w7zeKw2HBVqdU1JMB31f6mXfbLXMMEDzAvWc7+IvuE+sfkV"
+    "Ouju1EgV0e3o+772GgdQAGz8GhrU68T4P1mP+r7EYOsxOHnAtOM18SWSplb7deo786hq6jfurYrP6qT4Hw3XyhNpXPQZv+F53cGn"
+    "9oIrVCGnvwuetJb1PgFtRX3wCA8Y8Jceq8P7oHfNh19FT+ZdbMCvtgcaslBycvk/jfeYrqSax2LdQmpazRUf4lz3v9IoOC+toXK+"
+    "gNVS6j9Sb1LGgOEQqaMsbzn50c77wfQqyfdD8fBvv2GeC8EtHrCW5U/VjJy+NzXzeGJvU/oiKvD3N9T08cEdlVvG81rsrU59q/f/"
+    "PT1jqt9UM+oM2+axmcq6lp3EKWnT23os/4yNf4NyNq1zzWGcjieg60vaC7/nquCzOntHeUzHob/r2T8Dp7zoFLfPo8wHTu+hT5hx"
+    "e6fgJwfTB1wE/cUR/IUOo1f6HV5DPrr78DmqCYegPXwWHO2i228D/pk1YLFS87T64l+lOvo082f073pv3cG4gwI2g1n9C5uZKVyG"
+    "vdEZ3D4TnNcRNEmPOHelgWvC/CT1734b9B8nPYDvLw0+t9NjNUMruGZ3nl0W6na3j+1fj/3u7PiW1eDdjsITxQuWpnejfam8eg84"
+    "uNZ35YDxiO3InXqRW51mjsR4copR9L+XoedA+VJK1k5yOG/F/LfwlFfe2IyPs1E2j+djpO3j4ZGW/5SNsvw2hOvtBe5RP2D6/ozM"
+    "XTnHc/HB754C+4lNv0UEuVRj6kS3P+wf8pWYHknlnD7L7X7CQ+IvcL/+UYYzVyXXXc/5ORQfgpto5ctw/n9DXPHi1+B6TO9lTqry"
+    "JsWhvz7YfNGEzgUqh9njt1xBa+8cPa36dz0jzVR45VzfN87Z0saJB0+chzLV+Xr5Km3D5yWjk/yFOJ8/7xyol5yPvZyP3zofNWdF"
+    "Xie+KPMkmx5pvSz7PxgXt/+9/V7pmXTNTehTkN+YchvxylrPu53fm8W5nkzO95fQDPcPNoM6faRpo95EWX543Vlnyvv3xrUzR/Nz"
+    "pSMQP7id9yTN/BqwkJ85E1aRZ1Zj3ryejfi2VdRbB5hl05SaVNq0LWhsNqMJlDfocPlve00LqfOkRTLTMldPaHEtjnMoyd/2XFyL"
+    "h3tDTHOnuSXaR+tD0PQEGze7KMR8LfY4H+XR/6f6Rpw/65zFek25jMdifi2d/17DpFsE2xl/y2M5gpJBaRHktTYdfPgZ9z8+yLSA"
+    "8hv6Ufmp83N1/clCzE/5lRNI3zn/XyvYejGSOXHwhPP50c65HaH3F9+0ZRljWxypEW76vbvhlnvccxK7d873HXJ+rmZ4T3F+zj5x"
+    "s87/z8avOzf7TLXrvbg2a+NaiM3LzeFshuf6vvjGKe3z2FnexW/63vofTV8wLcrO1j6cswk+Gr8zA35tg9e8yvJ5LJ5NQR8wHn3t"
+    "HrAvxVLlT6HvrZ7/ANfzDAzyb+raVMzpGArO1chjXhDdvYY76ZkuIXbOhZf7iHdVVrDdqcQJrYPP/IZ9tARHvwmf5A+xHqsN4aYp"
+    "+NdrmF9Wj92P3vtIchzV3SeI2TE+0arH3xvHkh/eJW641Vxzg42nzRlmeGLrMON/kzqfL+b8zOrO38vrd4RaDB/k/HtP51qGhplH"
+    "dftQ0+Z4vLamFGeElabDj+Y3D/pXuGzhQKq9F+Bf3S7Y/O4iQq1XvAu40BjmXat2KYtO7g/q6hXcr/rbFnoMF50OznSP5ziN+k75"
+    "gPBb+Vp9j45c/Kl0pTGzLb12Lj2mF6Wc8+/yxt8JTxxNXjkbX5Ca1Kya2/MZPubigSrgY7iYvC4AntCB2nUSdfhmet+EWynXv/3R"
+    "cLy7+D6shGMRv6aedeU2p+BMVRO9w/9G+W9/ONtu9BPqeZbyWD3YIdh0H+pTn0R803k2DV/86vSWbIRbK0heNopzLKl7xgcZbluH"
+    "vvdcQXb+fqD+yI/X/EF0lCnRcgkPkibvd4/1X9bxGGb/K9riPMG2LsUri0toxHr9hRj7D/2Fr6KsNtwGnr482DDJGuAEOiuOkPfd"
+    "gTuZCeb5GF8efW99+IPy1FgvwFzLOHHsiHPmfO48rAJ+mzUUB237YHRm3eG5hb/UBoM4xlr9GYx9OZhjFs4Q1Tb1wZo2gAdr/0+J"
+    "bbl7kHMfWeD/K6F1WEKflfbjC4/1K5z1Gk9VRXPVgiy+HAMjrwsOqLO+aZjlWV/HNY7lgbNPxQOrjlU8eE+/STKvcbIf8XHcRW7S"
+    "CHxO81Qq0p8Sid5McVx7XDlHOupwxWbVa4mdeHzVb3ODB6MNFC4s3y5dv3TIi/3Wa9AenEy42Hh8z5TnTQLL7gA2Kz1cdnxGZ8ON"
+    "LwYvjI3/6k2P4cTl8H9QXagc/4XX+iWPe+x5D2cfnsSrdHqUzQWvEzDcYg0+YWOYw9WQfD0l+oIs8E0V/PaclTfmQe8r7Eu+ONKV"
+    "q4ZSr4bi/k10p3q+X5MHT8Dnp43X+tKXeQw7VK60k/VRHQ5DcUpnqjiRqqGGu91int0FcBl5dCp31/OMxX30Q4ehZ6n+i7HUETfg"
+    "csQDbvpges+5zLXrDrcT6rG6KVuYzV4rEGI5uixK5CF3gvfv8Riuej7IrlX1aVZ4/InMT1NeNCbI8g3hUNLo/IE+5D4zTDZ5bB8o"
+    "l9J630FfmzQL8/GZ0tk8PcRi0x24b+E2Wi+qa7LBd/2Er72wg/Wh5ieQ0Wt1wFydc17rixDGNZ85W8JdthPH9Hyy4ycgXddQ9GMn"
+    "qZljwZ8rpuTwmJ9HU3QJCUOMq0qKLi6F17hQ4TUDneekc1Gx+T741zl0nJ3h2w6AF1+j7tV5GVPveoxjuoX+z51/pVwwBN8qrTdh"
+    "3VFoFcJ4bjXQc64EC1eMD+A3vAatdTy0NF8Q8/1oCuIEG+YcO9S8dxLDGe7ANyolvGg4ff26zoJ4CJWAuygGr5+Z+UbHqY90jiVD"
+    "T+ZHN5jAa/VJS2qaTnDENTyWF90Eq4rwmZauPD0RmcgDTpFnyBv0PPMz39Kr3Jo+0CnU1u68Wz3ntOzDZ+jd93J+7eAcHcd9Z6XW"
+    "LAceno45xN+g4zqIvnkjed2Prj9qkOHNWufihJaH0AcSYr2Vl+hzOUpf2iZqtjNwbyXA1f5BSyTdVnuwqv2cR5HU6i3AzpMTP2LW"
+    "FutkPn6Oj4mXxfl5Sb2mQZCv+2HW1XN3Rgt6F3F4PcLseSwLsXO1G3OUXwSZluIYz+7zUNMNn2cNSAj2O3iiat4ZXIdiwUlypCtg"
+    "Rl/AHa6gj7knvs9jmWMQxprW+9H81l/JeRaD6ffGdybm/p39/tZZK3mDbR8Pd+6zt2YOhZg2YiZ689r8UQ31JX2tp+hliY/GWRj2"
+    "8iCLO4oren7yZZSW4lqwaQm6o5cYiw/j0FCrG5Z77fxs57G8tKHz9freFaEWz/ayhteyxh7wvFN6jX+PYkbGjFD7eCbIOPS0wbZf"
+    "fdRvSdm3P4NvbEMH9GeI4RCae61n0zjU8o3EoaZNWuDUY5U1iyC2nX0rnZ97x/n4Isxmmz/xG58zg3dVF57hgdfydy96eflo9wC3"
+    "Uox7wvs+z1lemXz8GHlUYTRh6heL5mvKUzcI+z/nXF+4ct4w056UjW3a143BNrfrtPN5edkoDmsfrGY+XM6A9RXFw+/gd+ZWHDNJ"
+    "aswez0/+LE5ZheZl+qmUb0rv85izVefwePqO19In0gIvxTz0+er3LqZfTeupq8f4s1Ih1n+inuoMMwLRRZwi5KyzHns6n2/mPLvb"
+    "zt+TOzlIIydPS+jcy/0vrRdOe0mzY1s6n7vvJFZe53Mtne87Hm65h3ReikE6V5P6LE9TfbDNCbKtnzhxyXk+vrfmL33H+fwXXtNt"
+    "pHee41Ln/9c4i7NGiOEV0qTMCLdnvtX5nHrztqKF+RzeRH8Pc753TLDxsgWIx+K0fsAbQdq/GcLHFOtCrY6fFG4cfxXnPqvK48J5"
+    "f1l8pqe5iu/59oBpEeXxHc68wbbONfzqt95QcVLF0WIq19Z7/NK5jh8D1lcr7G2J832a2ZzRWTTqkdT6U6/XUOfrpvhtXlWAPEG9"
+    "0sI0NNNOeahmzX2kbtM5XRedgZ7n516bCRTiJJFPnQ082LmHCvJCdj6ud64rtvNMqjsfL/jsOn6SL7Lz+XGh9nUPhW863/elc9+3"
+    "nF/S2vn8Iufvfzn/vtr5npvKC5yv6+v8nBfO50c7nz/nfL6B82+VnD8jnAdQXlyycw0pnM8/d55nOb9h1/IIVTyVF4n6woKcn/ck"
+    "3DD2X4ItFg1w1lUqn/nrCjv+K67Vid8515fSZ/ir6pUHHsvnlN+oJy6v1/KvK17TgM4Isdh+Qu/aZ/VMVTxu1qDFlaf8EDS/BZ3/"
+    "b+V8XXn8qYRVLGX+XDd8qlXjyMtf71+5fkKfYRw14f+z+e28Esaqc2RKlF3fbHq4xZ3MdJ7Vceffhztfe9hne1QaiSmad+r8GaY6"
+    "2/mz0/m6/c7fK/tsHoX4mpH0OjVAg5YGPPYh2M9MfJ8KwkmoPpCnini3gXiyrKBOPoCO8St6MFaiIS9Dr2UnfMB2Udv/iXeXQIBQ"
+    "uPuXcJw6k1841ynvmb5gSu3B0luiW3lDDqrcKxbauW7o2WK5PoT4ZcgDoRyc5jXOTX19PnKSFOR8Y/kd9+Bn++OVpDhQ32Nncibm"
+    "rT+hV+EltfVXeEeIr9G5EoE/hXCu7JyZDclPn3Gv3aiHbzLDYxw+/2tYL23Q/i6Hz3qGRmA59cpm9E7K8Ur6zHttE7OfttNzPBZd"
+    "zu/8vDB8hwvh9dCA/pJzaDzVN6wej9vkzj+ARb5E71KfeqwZuv9k4Cs5+Nw31FDHwQKUU/6ApnQXveLrweybc4bWw+O4LrhxJDqp"
+    "pviBHwLv+JZ1lYNeoFZ8/yH4Xmkcm3osb2zJvEWdkU+D7ffHhlNWjjDZbzNSz9GbcQa+sCZ8QWV6JrvRc5DCb7VMiPaVx3xBK9LT"
+    "pvtOFGy9bQvRPrnraQS8h2YGSKuk96S6LG/AsI231Pp+r2lef8GbeLvmSCgPcf79pc98IfahEyxMzNFaWCT81mc/Q3voFXqy6+Tr"
+    "HalPWnEv19DeCO+JZK/NoSciBVrdHNQii8BOV5KDV0SH0Jee1LHUAf/jXXrpV1wEZ9sYvdImtHd34ZLVY72QWq8z8bIxGtp83Idy"
+    "xjCwtpyuNxHaM3lNLOQ9ToIjX8aayYjnxip0nWfRss/A9yWt2/tO3OsAJxoPfdJI/CgWo7sSP6pc8oLf9lNv5sUrJ9sMx69nqPM7"
+    "pq86yHyrouj1yIwf0F+822XkTFnxIhTmM4uctTzPZCu9iD7iZE/6cqfhx5gffZrqjIHwsIfxfVTM/AA3OI13fY77kv91G7C1j8xw"
+    "aQpnJg3cHPrDf6I38Ds0kNXRONZF35UMnb7y8M0em5t+i2vRDKr6PP/vwfGV88pXLCcY2zm4SvUcj6FHvrDP4rT0WXpOmgOoGUvf"
+    "gkUvo/f2EPGqBh7C7dDx/E4vzmJ06a/ou5b+KpR8sglaFO2LRcxdVa18Gs1NInT56ajvF+L9E825NIc6ow3P9WHgv3lA5cAzz7Oe"
+    "/wLzUh/mCLCFQdRkwpH/VQ5Df0QT9Po3OB+FZyYjV9M5PwMPkczMNFCtcZF+vR/h13Vmadb7MerEx9Ti6ptoi8eI9vEzcMYKn/QR"
+    "SovS1WczLG6BfZahhnsM7635BcPxbNDcwP7wup2591v0ZCSHXy3MGbMV/OMcXIz81yYwL+gSPSxziZnfgaGvp09hPXoAYfRd8LW5"
+    "wvVVoFd8ButzLdjeMvabHx/jkczxk5Zce6uIx3yBz+JtcQCtchnq3WOsmwvoSvbhCemjn+AX+kE+sF/0R5qqM6F2Rr6jXle+WgSO"
+    "pz8Y+FTmAVwmpxhBr280eotWxB09h6VwLrvxXBKvrJjxyGdrSudPATQarpbMnUUbzPnrYser0eefxU91HT5D0q7O8trnd6Nl6U5/"
+    "bxnWs2KgPGlzgJv9Ay5flT3fD+21+sgU18PxnFX9sIs8S3rPvxULAxarw/Ds68/3nYW7/wpMLQ09o2PJOR8RY7VX5QMjzkR5krx6"
+    "b/nNS1f4izR8P6EbbwpvkY7+zuKcP0PYawfB+mvSz7CN/d6TZ3aUHKw1esjyeAukI4brXnReiwP5hxlR7TiPtjPn9yo+kNL25GWf"
+    "dEUjLk5LtedQ6usFbp4XMK/iaHiZbuRvv5B/7Xdnhcm/IGDnfTf20Vbe9Q3WXCvuQ3sld7DtGXFHOl/XoU9OAVZ0CH+s7MSnFZzV"
+    "xZhPqc93oJf1JNx5UfLwluD9SfECq4pG6Tj6+9qcc13Qlw7i+r5g3txAj3E1yt2uw83E99q+Lo/u+Ge+9xJ9ptnBuvJ7rF8nKf5M"
+    "/yOnl4Z/Gfceiz4k5TNZWCOqoaKYf6G8uAF6smxRpkPayMyJNWj8irLXNRfKS1/XbP4toc6igJ0VKdHAdITvUP+DMKAg9k0e/FMy"
+    "EHf0fMT5VOe+5vN12/CdbEIv0WzWVQfOiFTklefAZn9j36TibB5IPvQTe784+3lhwPbfUtaTdIIb6dcaCc+1lLNqOPXEK/pkRzHn"
+    "YQe6gAZwwm3AwTfgedqVWlB4q/o8hcGkJN9pw9qQ/3MpNItN2evn6TO8QC46jN/3Hde7mT6etviy5gFjmwIX+Qf9IbvAuYTV/Us/"
+    "azBn0Rji2xHW5DD2Vl3iRk5mBV8kJ+5Gn98hcPcG5DmtuY9fyX33gj9eIaf9Ee3kD+Qo8ie5x1zBO+iQS+J1UJq+nvdoFTsSV4SD"
+    "hgaZDkGxVXVJR4/h1e4Z4s6mns56CuVZTeTsqOQ3javbpziAnp+G9HYu4PrOkDvFY717WGvp4cv+oWdL9X8UZ/sCZjVmBHdtS+6/"
+    "D665Jt/bAL3JBbQCo9mTXcEglbuEMGviPL2EwjDucsbc4zldpjZbzf166ItqCo4+imfZEc12EB5QwoOeoS94iteYuBzlzHfhUKSN"
+    "yo/vVzfWyHZ67/qh33tObJpBX+0N+IR+eF/Eo1/qNn5GNfCUVw6r+CiNWRGv8RzCdLR+IvzGUZZmllBN6vPl9LjVRlPVkfWeir7K"
+    "SfSftUDbsQcNoc6qVfg7uc9kJBi/9lElJyh0DljP9S/0Srn9TeM4m8TjzkGPMoTfkwUPyO/wUJkOZ/3Ub7FBOMR9zkzlepp/Gx//"
+    "NM34XkxPm7ixQejoFDP2OvnMiYD5hmiP/eqzzXGNfGYafMZUuLAyXO8urisPuMB26tgA52MTehiT4JmdgWc1HE2k2y/Znu8tCs5V"
+    "32+6oJpOcdyR3ubzeIEOww9bPKy4guz0/OvdpkHj4wUP0Fmm+loxribvJj2cfW/wiipcRzbyn/HE5A30mNzGQ/EQ+pfE7Lmb7APd"
+    "Y37n92qG9CPwrnDWrHufz/Ca+pY9nB1+dw/nTFO8i7ZxTig/Pev2mTE3sjXPeTn7+xo5XwSzYoW9C5/uj95a6+90lOXUyum0Dlaw"
+    "3/e6c1b8hjNOwZ9J2LF+vnS908hjFDsb+qyX8Qxx9gN15Bhys/Z+O79fghEKl1UPagvm5OSity0CbDIf9UhB9tYktCMtOQOGg2NM"
+    "Q7efmnr7EvmN5mjpfO/MHELNkxcuUNVj5430kRv5ubnBQyaCX+gZKr9TLSDccyz9To+ZH6u8pZ3f+okX46OUFbztLTqjKPKoEDR4"
+    "X6IzqAmXK0xamsY39FN3oB/9CbhpDTyAJoHhZKY2a0M+9TfefcIwKnHOtQXjdP3GCvBzledt8lkuctxvtddNMB/pQvrjdfE3HtYr"
+    "WNsd2Uv5yac7Uvfd4z1tBKMtA854l98VxbvRGaJ5t8plrpLPNoXvvwvuEOa1d3/TORDX++3rc+HbIe5KeU4GfJ2WkFdICyBuVPdx"
+    "y7mvuc47fe98lAdMbJ67vJmlp9F8vSfMb5CnzhK/4Tjq64rRq6JvG0c81+8rAM50iblXRekJzgw+fAUurRmYWSt8v2pQU0mHl4Be"
+    "3YbgUNuoZRJx/gqf+Jce3JHsmbrgXK6W9NwnPv2VyJvK4zsnfik3s8m0X/+NstnabkzdjaYrI/vnN95jfDT00voKtxvPrNXfObvr"
+    "4rcTwvnaGp19HvIgnffS0mme2GR6T0YR92fSfz+JMyMdMVA5rsd5P+o3V2+CrjfM+bu4/YTwv5WYPZqINdcbHHw7z3kiff7/4rmx"
+    "mlz5CXxFHfKNU9Q5BdFBX8L7Kh09Z9K1jCH3Xoffi2qPScxf7c4+CqM37Wvqs5fMA9T+rS69nc+0TJX5nf3AsL6m97ETmGhl+J+r"
+    "vL8f3Fn2AeN7xcnpZ272W079XZTpzfX7IqlnlLsf9Vl81BzYtXh1lgAb+JOYqVhZiDm/v8MrVIEzrPmJb83ZT+JDLPTktdGtXSfP"
+    "PkT8fgOW94HzNhVYVy4wnC/ohWnFXngFH+t6rilv1Axy17uuJ3G2IeesfBX3E790TZ/Rn/ra+XfViuvBD2+Cy6xE+zMbLnYPPIL2"
+    "/RX6dUZwtm5DX1APzWQnat3UzJISPvpz4L84eh2+/wl62LLEt/bEh79Yq4PIu7uhn1Ye2ZB+8BLg793I69qB4agPYBr6+9es8RPo"
+    "IP3UWd3wqJTG6w39TA/pvWtMf7p0nfJdTotXpmoI9RfoPh6RG9Rkr4s7UD/meDyvBrFfyuL1mJncurrr+cN1LSaPlA7zALMqdD0z"
+    "id3Lue7/kefEYv1twTNavcsvmDmofKZO4L99sYneslr0ia0DM57nMx+bMvStzaL+eUPuIf2GPEe+o5f6Etj1TuJWB/Qen9MfeNtj"
+    "Otad1DbyCP7TbzjZZmZctGY/dGDeSkZy1u14uYeRX6hmHM5+XYnWuQT4yyzq3GJ4N8QDE1gKXijRs3CFcOf+5NlS1I+fr9dqTHf+"
+    "m3TdP+ER8DOx6jb3ORLcU/4y6q04S3/XdfzJx8BTvsbPQ550j4iZHup+l2Mb7+p1g8xL6BvwhOPkJdJJzuE5diGmTYeH+ge+ajln"
+    "8HH0X4pV8h+Zihb1Gli3ON1O1J7V6dMaSHxVD00oZ2cyaoRpnIujwVQngH0/ouf7KpzWdPKt8qz/BdQ7b/CfGAiGshfvvSp4Fhzl"
+    "ORahRh0BXyAeuAl67Ceso/rgAhl45y3JxTfojGLG7wFmFKuX6wyxS2ticsB4ntzgkSOZA7oHjCQXvVTP6MHS75NPdCe/8R6XqKn+"
+    "ZE5XLOaedWXtKzdrz++8RB3/jLmC6t/00ucobETnxSTmESjPlgZZXnCKIzuZm1jYaz0V58k5tuBb1AwOM5Te35zkEyWoQduSj6+H"
+    "T9c7KEhP3Bzi/69o5Woye3MfMVa1pdZ7bXp57/As71GvVUAHUC9g3jSag6V1UPWdeQI8QMt6hPy/BnnxK/Af6WpHU1dlpI6vj5/o"
+    "IfLnwcxNyIinTjV4ilbgNpfwtdiK/2tG6sJZ1G15+BrxhAXwh91KjtKQ2rsQuuDS4NvNPNYndY9nNZo5BtHg1FGfzBHKiLdSj09y"
+    "tAHkM4Wp0zfRn7kfvDIJ/QeV4eUPM7M1GK+qCvBIG/C+VZ9wPnL3OtTewpmG4DeflJ7dLOCwtdwZEsTMXuAVO4gx7fEL8znPWTxU"
+    "dvyt9H0JqWnzc23N8QlLA/59Cl5DvPhHt18QH4CU7JdD7Jcz9Kk/Y62NhWOpB5d3kZnyLYib7dDLfMcssH0+q9sfOwFAPWjz8EZ7"
+    "yTwZt67NRp/BafikPNRdifBIUv7aB4+4Auyf23iM92WfPCc2KV6cwwOjD/fyPef/U/ap6gidy8ofwvEEjdEFe80bvTk+CIfgQFQj"
+    "ZaIvQGt+hXM/24IMr9fZIP/tPdzze3iy/vi+ap3oLInmfvtw7YnAGDei406L92VxuCLVdT3xVXwc6799XwztwlrmgAjrlvZLsV8f"
+    "Xd/HRJy7ig1tlSug6X/LeV2fc01xZYbHPPT3UVce8hhWfhOeUiSu8oyb5PHS/XyAk63GefmGmCBs7jaeKt94LBcTrniVnOMi3PUw"
+    "8O2trLN3YA41qAmP8nxqketUBPt5AT63gffyExy3cpxJIRaT53POSGOivas5FHpuyt/EGSvPeAOmpGfRy2P1X396PzvSsxyX878b"
+    "/K9yvBPkfV3RYvWgH2i562mEx1Jh5il0QociPv4D80H0nHUW6Cxvyj2XJ89KTp4zj332OVqdinhLjSTnXEAt2I69XxEOuR0egvfB"
+    "wB9RS1aBpx+KxmML3uZjwLYzkMNVxQ9Euba86JWHnwmYNm6lz/Zpanx6tvqth+YE9XJW+q+F2dyHT+lJPaKctCR+LH3JM26C3Rwm"
+    "b6hC30Mn8PXMxKcc6Hsyc2ZL85sDznQE/dLZeCbbuD7hNfKiVcxXTjsPnYjOnob4WpbnTC1M/PDze97gEzobLCQB++hOkJ11kdSi"
+    "q8AcdI7PQnu2Ch+oJTwj5U4bfbbOsoCbKM79FPTfDJdd9JdE8E6lp5nB/Vcmd/2RHFzr+BT42HPwpL/Bva6jidpGL0AwGpWF5EKL"
+    "wTkyEqs1fyE3fb6F6Q0ohE/fP3htDKBu9FBLfs4chDz0itZmPuhp3mFF9NXSucnb/wzruhz1ss7szD7LL/9ijskf5M/fURvX85uP"
+    "xBuf4ch9eV/ycFBsXOeznFP8t/L9iCj7eh2eKfDoKw4fFIRng66hgBNkHgUbZ7iOnsGucLe3ibHSUK/wWR/5Z06cHyZdtvPCF6u3"
+    "zQmeOdUv7Xzs4fycECcJqeR8TORstHphFksrsP6FkyT20Gfisfj+DR4FP9GH2B9vsg6845HwyfnI+ZvC9Q6nL0iYUdOAnfn3wBuK"
+    "weM0oj7U2S5v1l7w2SXg9EP4fa2pqW7hyZCU+KNnoZ5rPW95mSZhXQgDPuo3zL1VwLxn6tBrl586Vb6gNziz6hP/NLtGtXhd+rr0"
+    "+xaCeyYiTswHg3vA79lFfqkaNzk9VPfB0UOIi9PI+XOA94yllhQXp75C5Qp3/TbbrA+85T24m1rgDIvxf9jtFHSXfabj1/OXb6l0"
+    "YT19hiG9emXrJtt7m2U9x3kB7Z0LWR2wXCiSOXcv0aWNBcPtQx1+FKw4H5z1VviFuawBzZmugeZHtZm8o76m5vuJHLkZPNZM3nMd"
+    "9tI6arq16D717KRPfoE/bBAYg/aitAptyJ26gQefpYcuN/nPec60lJxjx9DC9aa+lQboN595LkuLtpd8eCc4lmpd+UJ0poe6F3ny"
+    "bXTVeZgprBgXJ2Cx6BD1lbCdBOiPhoJ9N0IHpHfow5dCvGMwuME9agPFjwwevESDLIf/kv1ULfo/vEbasKgow5A0lzQzvIOuf2ik"
+    "1X/1Ii3PXBdl9cvRKMurKn+wXs0dkRZ3O5Or9PNZHbz9o/EKST8aR//lOztDtj51/q563YkXL53fFZ95MwnwBdQ8G+GdzyMNPxsG"
+    "N/RFsGFxc4n/35BvxSXnEP67KdZ/Pc0POZN0Hi9gjQlj6uW368wJ3jce/vYlvjDtvIZFrUbnOuyd1eDv/YavSCs6j7OjNJjcNd63"
+    "3t8An+k+a36w9Z+Ps2+Qx2asqa9K6/OzgOE56jFQ/LmMjqwbvH4bdEF9ne/L7bG5WdIznfPYrF/xD0fxve4FJrYBLFB58Fjme1Ty"
+    "2dd8FbBcYzZeL8HUw93AfVSnf/5Jf5Ry1pjZzH47x5r6jH++he4tiJiZmRmj8qvVOSj/uUZof92ZX8LxpYGpTkzWflruN01ZbZ9x"
+    "jpf5+n7giSnBsDOCGyX3GbcYAo4/j+ceCi6jfkadf3+CVQj7laY2gN6uD9zdRXQzrqerenPEwaqfT3tKfNEWeK9SPFN3Lof2UHq/"
+    "+d4sijItm/QTqh/k/eHy3Dpnf/abL/xLvPMe89zEBw7mrOuLjiotc10qErdSwfs3w695KzEtP3VzGnovhPtk8RuuWAa95VbmU05y"
+    "Z41y/WfRXX1w50SSV7cGa1ZePpHapyjXWRV+RPugu7OJ5Ru3Lcri4DjiazF4nke819ny1ZDHr7PAVoDz5vpkzt9UdAIfOK/bwZt8"
+    "QU75G3nCIXiESWh85FuiGUfzqacnU++nJ+65/ouV6a9Ljmb8Geep8r1MrK8x1LFx8SjZTR+7B/1ATWq8sXAsnVm3o5lXI4y0EP6C"
+    "ozlHkxBjuuGr2Y66IZT8LSPzrBMHrDYaR3/9a+qJGdx/fvKv2/TVqw8nHzh9H+b8pYHbagiWIR5sMOfuLjyY1V/9gL779GBoDYhX"
+    "GXk+TaijdN6Im9hJTfIDfOlmNBV6zurxyAdWfwo8dA1ayCj8u/W1ofitikcti9ZCZ3dZj2meKxNvlYhXI47rZ6r/rB5zBgL8/h3U"
+    "Mym4T/Emt5kvIV/Cyfgj9wZnUj50x28avy/Qi1XF23cs+Xhc8LlyvOf7zE38H9rznvTbbOJ8HOS3vtZ5fsPIL3PGdsB/cS0eDkP8"
+    "hi/Up05fHWU5fHfw4m3MnB1N3+b+T/yaP+BJUR4/8hL0/jWGqx0Oz5AOD40n6FvcuTc1wBV3knumZc0Pog/4d+JdevQfK/Du3cCz"
+    "3YSHzAt8aoeCwyblayfxbhWX1FO4iv2QEb3GRvRnW8jPxhFvn4PVXuL+uoMFzWI+R1zyvObcwzO0rIrtXo/FrurUIsXBCGK8PvHT"
+    "1zMYFDA8MSH1XmvWZzfOsYNgqbWpBf6BJ9T8xBrov6bwLrQectJTFiCmnqf/+gT6XPH7rZk/oHhx02d42wZiUgE89dV/rPx1HT1L"
+    "w+HC2uFHLa5NfGHnEFsv+am3FjCnNhxcIZw5Lps+Wv+lnvdnzGfIzLNZyPcVwhdfZ8MVv3krf0kfZGG/4X9TwBe/gJsswrl2kvU1"
+    "H3w3Nv8mXH8MPaVaw+o5FWYunHUicaAyfd0FmA9QGl/rAujbxeml8pjmsTE6kdmsk0jiWSjX8zn+4pXR9MxEYz4F3OdLct1RnGvC"
+    "5rSWkhNHVsPX9+N3CNe6AlZUmXvrwD77lfyyOTpKnTtDfcb/n0a/P5+zrixY+zz24Gv6fuLQTzEBvqgqON6fYAPpwHoWgN8MZP+2"
+    "Z7aX1pKwgqZopdaBnSSD16uALnI86/EZuMdS6pJFxKJ5rm6BGviL6P/mWD/jnbuaz3twwaPQatRAuz+YXEP5Uie8YMKo64QJNYcT"
+    "0tf66fv3sN7kw+xBPzsYTLwI/SON6a1JTt/LL8TW13hMpkGb9jvzgkrCGyUBS9lC7aX9PM5jnnQ1OdPU56PcOT+6gK7sv5Z4lZwl"
+    "/9gBlvM581WT8DWtmK/+kLmf29CbNcJTejMzdVeAJxbjmZ2gt+0X+Nkc4JAL4Rnn8XUdiMfbeT+V4TVK4AnQhLwphO9vTbwsDu6U"
+    "Bg3u/8DzjhEv94JP1SOuVQIbm0sMbkRPj/jdvaznxmi7lpKL5ObvyosTU2PGp/4eCDZQgXwrOZoQ1eD90CTMcXN2+jNLU1cs5Lms"
+    "AZtaSJ27CQ3FDNaleu7SMk/1a+rTFPj8nAOzSwZP3BAsLDfPZwExehln5b/EhabUPZo7NpMzbwn68TvEhtto1B9xb53Jo38j7/iR"
+    "Gj8x80VcrVkYujuduX+gXdjGM6gJ1yQPceV+neA7DpF39wSXWkO/bz3O+W8/6eXrxPpTjpES/nAbePo3PLOP8KsL6Wv7Gy3UVfZz"
+    "JtZNBe77GPzKejQ3b1jX1el3uQavmBROqAT1SEp0Vz+zP9x5KvJufUAeqdims2Ace/EyfQ1TmHup9SgdTSy8Lw6g19pPXhGbn3MO"
+    "Hm0RfXDJ0IMpxl7i/WSjD6E4vN9iNGpL0dv+TJyQvj4xesmF6CByUbe7M6k7cR01OEMH4Mt8kNxhDHtsJPXDenKW+uRAyi0mem0m"
+    "z0PySPkWKicIxa+tHTWe/PsimLeYE19txWz5Ul6Wz7nXYobm6AljTKv56jqr/PSUOP9e3Pmzkf6hP3zWW1SQPoho8Lnx1EmlpZuV"
+    "ZtRn2N1q8HfFF/k+aE53NWL3XvpE4lCvf4U+qSnc01vyg3bwwV8xV/JXMMuJzL4U3jMOrwOt63MB84UpgG56BPs3O2eQ20MovvMY"
+    "OM0c+FXNWXD32V50Ic2IL1M5u7TOh8LLN2HOSUL8seRzLP9e9USqb/NIsNWma+g5boc/URH8FvLTA3MBL5+W5HrP0DJX5jkrT6nF"
+    "tVeEg4skx6lHP8VxPHA8+PEeRmv0CF5nCGdCQXT0rlajMJhheZ7fMuaz3KAWe8BavkWvxGTqiSzEn/rUMcKGhWd8Tpw7ic5DZ7qw"
+    "tnP4Nag+6+A3Xj0/+Pw77j85dZPwzJxwXlob8mf+lxlsM5hDo/M8c7BxSs3BZOvh2S2c6jE9ztFgCHuYveDOh1EeoLlTcZhfrPr9"
+    "lHiGgGmP5jNbux0a52K8C517O6lLJ+MjJA8OzbVuSRwoA/6xkfVdh7mcSeD50sMHrHNn+hK/vvJaUiOdkDS5+elvXQrvsBp/pfrk"
+    "mg95T03IYXYHWe1TC3+/H6mT+6ANikVuMJGep06cb7PAR7ZxHZf5e0lyPu3xisyFGImOqi+993PRF8SHS1adNVd6d10LvR3z8Qbs"
+    "Cx43kli4Gh/f48TV6czZWIxWchL5/BRqnLoe45AmEHM99BkPpo76GkxmAuf9KDSZ78hhu3DOH+JPVmK4zpEy+IbuRsd1Cv99/d7g"
+    "gO0x9QWIW+lBblCafG08dcxjsNnn5ITJwDGESyoPWgWPKf7zN7ihieCMek9f08e70m/r+HPnozyVpW1TjpgUvrwlOe2AIMvvqvD+"
+    "76MFWuUxX4pqzCvu5bXZ4nuIP8OovyugjbxKn/sm3pewxJVwr3Ppj79FTnaYOYtvWT9ZyXMrUPMmYQ76Ify5OuMZdZv+9hP4Qgwj"
+    "N5UuQPEtHftGMWMi/QS9mUGk/GMo+vMu7IWE5It/gzVsAmOKhx73IrNftqBx8bDWN1EL36AnfDfX+5Q6eAJ4VBowuAa829Jgjg3I"
+    "s+fRF9KFfRaCv0EDPFVXoMd2PT/nc3ZEcVbOpCc+FbVHOdaOW2v+hp/6UDibLcwvfY1HgriUXNQrp3l2JcFG+qIJPoQuLRk9xuKK"
+    "XqPxFDYhPKEU+fImcKjyrscg8VmamY4Bm0nk6veCOdMSc2Y/YJ1UIU6kChhu2QYtbhv4nT7sr43k0NfQ4eykP2o72oP49Aqeo+dz"
+    "mt/Ol22cc13ol/+dHpjNcC/yIRV2Ka26+n80M6EWPniH0UfPRMt6mbrnLBhHVvAW7Rnp1ZRnlYCrzuj2e/ptLdwmbxxNz4SftT2Q"
+    "mKFe7+JwNIojXcEHPsCtjHVzP/1uMMAe5L79iNeh6Nj+BbdLTh6YCm4yHX4u8cHQktPf3AU980E8PQ5x7ig/agEelJt34GoPxpE3"
+    "NCGG7+Z9NiCm1eK5R7EuL6BvHcLeywT2O4iaMR2awgOs/b5gcg/RoE5Ee/g92rk9zKbKTC+S+qiOUINsBmc7jNZzNT08WjqHnAcv"
+    "zXxWdIdj0XfIAyslPhpa77EDpt1NQj/eK3o5L3ts5t3X9KhvYaZON7/hsN+Bocq3chBztlUTDA6y+r2xOy/1Ey/vZMzaOcKMKNXD"
+    "6Yj7n4OzDWK/jmSO6jHeX27Oxx7EGfUfXEFnMJ21sQSO5CLawQmf5Bzn0W7MRtPzAN1KXXjZNOy75y4WAwfTmPfbiZ6DteBMFfF4"
+    "+ZuflZP+YPWZVSbvbIxOqA0eCf3wTPiBGU3aF/LOmY8GazY6vNrsm670BHTFx+8FNdd4zpNCxJ1QYm4rarU/6NVqzjN/R64vLZI8"
+    "h7Sv2sIPVnV9PKh7++EL+gvfm48z9Gfmdvek9ktCjTIAbbb4lLxwj8rDFzN38ww5Q1/mf6ygByCA9nEYmurncFD1wUd2w6vUI/Zu"
+    "om+wEmdYAF+Ao3BqZ8Ab1sEn/8Z99YDnCAc/2MQ9Vee5ysd8FvNA9c6OBux5LkATFUydEE6+1Jaa6TV5fj60TgF8CC5wDiWkBmyI"
+    "z0wYc3BzkDcJv31Kz9pW9G0pWMf3qA2aoUU4S27dHz+o86zDLPAJ35B7uPhjDs661PzpBca/Ee60M+diZTCxaGJaGfQuA9F8fENt"
+    "pPXmoe4LJiY1wlMmKzjRFryvYtELUJr8dRY/V1h3KPjNWvCi+ZzXW6k/vqdm2k4M3knca8jZFzNLDt30ZTRxccEMPHAmZfl5X7H2"
+    "VP9eo2YfBF6nc0i+UD5ytwXgxG/BgFvC590E871OPNnKs7jL163l/SSi1llFb+0Ecui2zMGcSc2wH05sEXt/O3XvbfCePnjzJYYf"
+    "zgWm8S15mPbIt+Sk+/HLldZlL726+6ilXYzzChonxcSi5FjlePfvWN/CcVPDK9TlfT3h/C5HHat32QfMYgQ4jWqMpfQ4nOR572Y/"
+    "76BnuQqfz8F83CrwxopT8sfeDR9UD5ziW/iPYejJvkBnqPXTlNic4hOPib6c8d+jRYukL+UgMb0kOPJw8LZGn/S5xeP5fsQ7RVrJ"
+    "zGjcFMeq0/cpPWk2uMDeYMRpwTq/Yp+Vor44R23VAhxyCP20y4nl98CJs+AH1R58Mh+5V0H0GwP5/N/osVOTA2/F8yo3M4VG8gyu"
+    "g4Xv4Mzrze/bzNdthzNwvcXmgQ8q3op/SsL8jYLoLpUfzAbLv4U/+5/kodXY6xnI3/zwjX7O34HspxHEKzcf+YBPj3jVp2Aqk8CH"
+    "R6A3+xYcfgNn7Gryryp4HP3DPnVra/05DH5xEFyoPvH3Deu7IlrppNQXWznz/qE2v8v+uUHu0I79V4IaJyta0c3ErIXU36c578VL"
+    "ViN2FKDWPM0zHsX5/BIcrSNzofoS0xMzNyUneVZXeGV3lpu4oVbo4Nswg/hnvq8C13mT626DV+9U8of05I898EoQnveOOqEKfJ3y"
+    "sCL0FTYjZymFdrspmvL3+CNMBrNSvTiDPp2CaOdmobfoCN7ynLkRv1BDqgbUrJ3x7P3OcBINiCE67xQfhlFrDCJfyUBtdpxn9ztY"
+    "QIz/Lv7IWsNp8N/szNeOoPf6IJxLMfqS/uUcU52iuWJf4/NXE99zHxpN9Wu1p89NuqFz9JPeIF65+ccq/HUqM0tOazRDwPZfNniF"
+    "peB3CXmH0eT23eHxz/Kut9AjJi2Xero74/nXDp7pFLj4z+yDN2hTRqNTPEtN/5r9rh7QN2AHncBphzE39QNrpBR5SynWbwrq9Wnk"
+    "u9eZZzwar/0K5GKLwOL/x7urx+dewdvkYe9kIpZkg7dohTY9LXn+TrjSruwv1wvwB2Lgj+BCx9Cvu9ewHk1ON3C3vvAsX6An+AFP"
+    "Vy/nwwJ8r16DA8+lH+wo9zoYrvoIOU4ZuLc8zDIbxdktTPGd3/iRUdzjXPxkahNX3NpNGGlK9kJD5kWmoa98g+txQp9UMc4BYXkJ"
+    "wD9dvw3ti2Vw2IpjqT3m4/cNtXBmZl43xnPlgct5g43+gKfWVmLxTucCZ/ks72lBDP6Z97CJvqZ6xPfN5BLCZLyf9OUtRycsTVfB"
+    "gM1yfEn8/Rr+yp3dPJJ84gS66cRwduXBrDqjFXbnIRfHd1J5zXtwkLnMs2+EDvcefK/Ws+YctQHLrkg/TjF6vEoTW7tQVzTg33tS"
+    "7yUmx11Ln0I+8qEI5qFLzywe/CQz08rRl5qcev00mP9DavnR+L30o480Ieu5CLlJzBr3W94gXXMo89SFM6j/Zyv40Dp6Rldx5ucE"
+    "Q3tEj1Av9KjX0Qb9DP+mPaz+wRBqN8UWn894i5/JtyKoR35F6xRE32sf9rVm4IjD6AT/35/caT/4tXiD6uDg9/AzrkVf/1xww7zo"
+    "DKaTG33L+83APIca6MJqc8YMZi7wWjSzRcjpOlATlCdulub9joz1X6/TUOYM6Z0NYiaVzqHFzHU+QTzcSH7VFy5yi9/8ATJRW8i3"
+    "Osar2mNeNeIN/+bMEFcUzbyINGBTe8ldilLHHKRObEw+/xZ8Ur5zG/Fj20ed/oSve8hz3Ec9uYz7/0gf6HS44SX4C+0AU2hH/XiF"
+    "/PAqusSC1CE/o7nMR711FB4lxiuVeFOb86Uw3JH0T62YW/EZmM1l8tl1YAfpqamO8k4ugANpDcbojugVbIOfjXCIFh5bQ4XJ5fL5"
+    "DReSPmsL9dNx4pR0F6fwZxgKr6l4uJxc7Tt4oez4tn0PznCRvKUQc0bb4NWQHY3hebSi58hBFVca+MxnrCz6gLro3ibSSzCGekD8"
+    "wnbiTTHie078uYSFv+Jcy0KfivrGy4Av1GUO4h7q1SFcRyFyyObwSgvpXfoGP1/Fxub4DJ0Ho6wBRvaI8zUJ5+g5uJuh1MK70M4n"
+    "JFfV/MW04Pqu54zi2Hce8zTNDCbRFZ4iITh3IuJ3beLdHPKPd3iOjqA+jE/OLLw9NX06A5nbuxyfpQ5gnDdYG1vRNggXXUtv2U74"
+    "6lP0S8uPJg343gjWcQLy+JNwFor3RYLsrDtGfC/F+SJvLfFFnXhHBfF1ekYckM/sQXix1tRfKbmfwfh05uL8cP2Zv4S72Mm+L8f/"
+    "63kloB6cCkdzBI+gS+QKjzgDksJFuJh2I2rXZugSG/L1b9l/RXj3uz/B/aVf0PW8B5vWOhlNz7HmrYjD/pzarw755UfqYc3R1pkf"
+    "4fyD5jH85LMeifY+41jGk1+PoXZy54vJE2AF2OB7/Gc0u+/uB4sZbZ2bqyQOMmCzwqX7W81MbM0VlY+Tel3VX1Um2OZ3SmdYyGM9"
+    "AprvJ+xZMzx+9pj+dh798/OYjXbE+Vxjj/UPzIYPK0zNqLNnc7BpwOvSh6eY+RtctXDDNB6Le+odm8AsQJ1HWosVvPj9sp8TgdPP"
+    "pTbLG9u4tRfUbGudzXY/2HTa4n+SxosVq7TXPFI6Mtd5t3qcNTtVXoEe4y0e4PniBV9Yi747PtjvUPiaPcQP8TAP8ZLWe/TLX975"
+    "04XetXUee7cXvVbTPQZjlw5bWMUOr+kIJ6MT3EVtKz2CzgM990Tw9uIvduKNLy5QuVsR5s5XDTbPukrEtmnU8hXxM9kZZTNBu360"
+    "HP0btBJJnH+fqpljUVZ3nHFxB5/lUtK8CMPN6rcz9qLPMJzZnN//RJmv2v4g86dqy556DN/wC7iSgJNp7I9v6Ndrzt7QGa6ZAbmc"
+    "PzO9hgEp1oVxpvcFZ1Ps0JxHPdflHqspNFtBdcOoYPOSWwxHpbnisZhfPQpdpvDo9lFW/8nPSrW+dO/SjBX3G3a7lFwuHO3KE3Cc"
+    "qtTRijUJyJXqM5tEOsoxPsPRn0Ra7Nn41vIceeo/Rp8bl1k0qgGEIwh/LBGweQ638RNMiXZ20EfTGzXw2/ndk9xDM3rE20sfdI75"
+    "79ImCZ+TluN9pNVMF9CVNo+0eigy0jxbxTup9lnNnNHfwFM1CyEfPUI6U4s772GEz/KfIsysiUePd4wHLfrNr8EcBuDdIL79GNqg"
+    "pcRe5VcNPaZLq+Y3re/rSPP2UL9Oa+VKaBO0/2+7feDK4f3WhyX9gOa5fEGve2uwwzP0XE3xmOZK6/0j3Jl+r/b2Krxwk5Erh8JZ"
+    "6iz4wbnHpPzMr8FvQ+lPuks+mYc8N5w434U+uOqcJ/8S5zZT+z5F310KbOUAWFlj+qHGwpPvppaqTR+66pUnPss5vndr9SDLJapQ"
+    "t8gPrSkY5o/4PSgHrM55s4N8qj3XNgVcuZ/X5kC8BVv6C2/fz+ipjIP3RZTz++W5mQUtZSjYZH3m2oSADSVCH50BHZ/W4TZ6YYW3"
+    "paZv6+soA2M+0J83Ah49mhx9NP4SwjOVO93DB6Ins00OEvt+9VgPxh5yiR/RFSv3k4ZLfe6LnGvXXPOW8Jfac4OZo6l68SEaq2Y8"
+    "O+kGF8KZ3AdnnAn2cZE8yPWK6AF2H4u+pKL0IfYmP89MP21V5mHGpWduCfnXOPCCpHDV6r38gXzlDvt7Glyg8vYfmTU1GZ+acDRQ"
+    "C8DYDuHx8hH9qXJFebYLP8gHjjiHdfUTNc8yvj8betoZ5K/VXD9ANBMvuNZz6KQmk1OoJtS8ln3k+3+63i7R1mMtbE/9mpXAz1QL"
+    "/QrvUYA6aULAaprQKHvuWdFlbUN3v4Ia8C2YmvJWcRujAqbPn0CuqXkvtaiPijHTTL9HMWwzPaFj2KdxObsvwXXuooftMftyLnyS"
+    "3v11v8WDTvhCCL+JQz6s9Zki2M7tqvASy9FKZyYXH4xe7Tswjw7OC5Im6iu0SEvR2BaCo7gIF/WRd7EejD45/PwhvqcpWLN8Do7A"
+    "PY6Dv/qMvH8X80emwfWOZp+kIHeYxHrW+nqHfjcAzvYtfjDC22eCsen9P6eu03mhtXSE2nMKGE1R5l7PZ57ba+KetLd1yCtj+jdD"
+    "DaufRU/uaHQMT4nTQeTvA9EPVIQrOEefnHxhdRaMYq5eDq9hl5oNtIT5rjqv+9CnkAMfkg/c1zPqnZTof5aB8XfGO1K4ruryx/Sl"
+    "vgT//A4f1EN48PUBK4nDGdcEHDMLWHIV4kki3qf6i1JQv7Tmdx1nvzdDd6AzXr7Sg8GDhVPvIl4qLuXC715xT3h/avIQeXR0Ja6V"
+    "gLfv4zMcSzOmtR73+w0/2YG+W3n9CPibZOArhfAxuE8P2xa3vzTarkm1q2blfcHshxrsZ2F/qo2kVzvAPZbG70dn8MHo/zTKG4lr"
+    "09FI/IEe6Sp8VXPwk0Xgsmnpp8kDj3OW9zGSWSpfobep5bf4Iz+Zy/T+r+K5n4UXi83c3QJgjTqP8zKvch5rQGs7MTWj6jDN/WvO"
+    "3LK9n/Q3lKZeqwMH8ws6qkbEvxl4TPQLMs3GZfpmV6OHaUvMKU39vBKdijvL5He0HUe5npnUot2J+/LfUk42CT72FPmp8krh0+F4"
+    "qojPKUQNK75OfeMn8O0X3jAdnuF7emr2sSYPg6eXxff2d3QxX8AffEQ7tRpeejNn0CL6qEv4Taf4hhmMW4m/NcEtxL+IG5f+dRe9"
+    "82OITY/wPkpBX8R5/N/HoGluTpyfyFlUDy2c9oy8Ebuj4buM7lCx7im+NCvpwSkDpv0n+pqS+N+2YM0Wp+czH16IWkcRXEMm7nsy"
+    "PgR10ZPr9wmPUv7Zwm8c723w7230EGyH2/iWONGHvqDUfsPwtlEjdGV++lfMEtfPa8t630aPQINPPE6PMC8rPjjUBXLcsnie5OBs"
+    "V5+Z9vwav933Ss7tYXiZDQLvv48+ojZay2toEr7EDzEK/nQSPm8tmAe0nHwuOxig6zlVKmDrLC26wjC0PznxmJrhM5xYXIVyJ9UD"
+    "f4Dn9QJTzgofnQ3sIzWzCSvgS5+Efs5FcHmKL7UjjQ8pxzttw7l8iPj3HT9/JfykywmWA1Pv6v9vtkUX8PIQsMjC9AP1oc5Ohc/S"
+    "EfLlnFzLft7bGvr+PjCbsTC9DL/RD5GcONgMDfg73u1evEy7Mt/nOjrfufA1y8nzdQ5c5xoX8Ny3+uxrM4JZnSC25ybGqe9UdXVl"
+    "zqED5JFlWKs78ak747N/1zrV7IFD1CmqgTPhN3EOTD8ZGOUU3llm1uUB+rBf4x00AJ2O1unIEMNkhH/oPb0n3nZEU5yCeTN6RxVZ"
+    "Q/+A7ynersanag3nakpy7RFodm7h+SfMaTy9OrGocXN84tv/FXXuYHyV/+ac0zmVGr5+LznWYfKOpXgHvaZfexY55Qb4DZ0/ms0u"
+    "7075mCuWLoEHeErelxaddV48pK/AoTZE57yMdSSfhTnM7fLAw/VDY7SO/vOa+Ckpn9fs2enwgGXoMZkMX6w40y5gM3rew4NVh1df"
+    "gV5qIlj84E96DGMxIzUabrktesMg7n0b16v77Uet0Q4O6xXxYy2Y9kb058qJ1QOvWVjBnJXiKWLDTxwgH17He52AfjI//LL8pHKy"
+    "NtSLfI18Kz7alw3Kh9R757f3uoY9mgXN3TL4I81Zj0Lb2JB4PJpr130k5Tzpy5k0kJxlN3Ns/GgJlYM2xFPnHDVcOLom4TqaV58B"
+    "TEEx5yJ6iwbEuLZ+i2F5/fYe4/EeUpLnPWHPJ0UPOgy86zH9fN+jVXyNBlmzi6u7GJZyrYDtnbLUux2dzws3rE3f2Qr8+fKwp0qh"
+    "A5UXpjRYyim1j36IbZrz+eQ52ZnTfogzMjFnTHs3/+N8c3mQOmgpr1K3aZ0p58vvM21ONziXp8w/EVYxnvknMT68fuMjShPv67ie"
+    "fdTeo7gO7Q9ha2fIl4pyNmV38XbwOL3XQ/i1p3N1z5zBirWaO3Deb/3n33JuKAfbzxrt7jGO/xY8e1l3Rl+Q1V867/Oiv+lPXpqD"
+    "+FyDmPsFWIHq8wP0b02Cf7pMH20X1mVpfLk6ctZsIo70JO79jFakHXNgxBMcRWtSE/5M1yXPj+7wfF+g8xF2P91j8W4Wa1P4XEf8"
+    "mV/hf62z6b76joMM909Dv9g0NAbTuF89k8dgcpuJSdK1/Uz9d4JZItd5lqfwR9bPE75aCx1TVfKwsfgqNuS5baImfQfG0I/5KFOJ"
+    "lR7yR+lL7zJT5iicdCQ4ZnY0JfnpvarMn47U/m3I2d6Q9yWDxx1HzvEUfn8de1Z5cWHmXmdCJ/Qd+N9vcBZ6z8K7prLHQ+DI9tDn"
+    "UBJMJBf1+3z6cd/Qpx4MX5YCPeEFcLWGeOtoX0iL+AuzIzugUWsGjxfBrCHpyzTXYDO5cG84lpHkfzrTdzKHtQg9sA/JHbviBzCH"
+    "60wOb/SRM2MeuvFSzAqawDo/A+f2mvkvx9AVhfDxEbpLFzeUT+w5NAV613PxqT0Avit9xjD6CxVL6lG3pwcf8ZEXbyWvjyTHqI1W"
+    "dRFx/QHx8V/XR49nm4TfF8djvqh5iVGq7wqhZdN+zED+XhLstTM42VrOddVhx1kPwsdew8v66IvTO1WOEMH8mnDy/hFwYuH45HSg"
+    "ZhsA71iA2kk6htbgsA1c7S4ao0ycbdXQPfWmFzQfmFsfesZ2g+t2YU0dh7sfg471B+J1OPqNQdT+GeBn++N/GQdfIp1pijGr0OpE"
+    "w7Muoo7KxvzOE6yXVeDbA8i1GjMDLD33lxoOT3swh99ifE7qq4PMI9M81NXgDeupGyqACe/g33KRC7dCu5iG/iflNpojXRBsaj//"
+    "lh8Mfx/+sdL3Pfebf/NLzqshnPWziFniR//hunPjv/MjPHsu1vM+Zmn15pxIg378Kd7u19AIVaH/NR9xQfzTdfDqw8SzrcSE5ui+"
+    "h+BNcJL6Q7hmAmJ/J/x5h9HnshocJDn1gv69FefjUK4vLh4xD8Gx15OHNOIcX05Ph/aJ6pxneKgu4mx+jN7oPXqzHj7zKt1P3/F1"
+    "nvEffN1HarLfgqxujwUn3wu+KTmYax9ygM8089JjuI3wBnFM8tGf4rfeorI+q79G4L+QlryhLxj5cnDw76mNFO/LoRdSnfmL33jp"
+    "AdTP3ehp2IxOTPWRtOan6D3PAD/TkvdxEjwlLf151chrz7qYrt+wponUf33AV8Wv/MD59hd64S48t67k1vq6JfRNLmJ9rmHdleR+"
+    "9TXdwHyGoSefRY6Ug/ep/ffMb3l6kN/W2Cj66CeTOx1jtlIp/H1WofvzM6v2OvziS3TMszkzmhJ7s9PP+xW1ZE5q4qZwYnruWru/"
+    "Boxf0959FGT66zBi5jQ0fyNZE/Ph1Iqy52rTfxuPe3yAvq79J7rJyjzr8fCvhcCPUuFDLdykPTnrcDDcm/D5G9kX7cHFcoHpKI/1"
+    "Rxrf0I3ZEyfIgQ+Bf9xBO6L70bn8yG/xdDDabeWjTcBC15HLqU75Ksq4p6ngTJojJz/2vj7btwPoKSrG2byedfJXlOFb8chvhxPv"
+    "46C/PYSewfXOFS5XCk3ndM6cjuAHXcm79fvk9y6sU18rbP4oP2ccZ/xx9lZlrulveDPhWsq/L0Qa9iJt9yi4KeWwX8IfrwenaYJe"
+    "Ujl3dWrsldQpK+H3ZqBFGkl9Jgx8AB4H3zsv6HSkrfnK9IHeoNY5Ts6s/ZjMb/MVwqjrpnEd78hxQqh/1nBWPuAaK8PXJiR/08zv"
+    "NW7vDp6kQ+F1CqAPHEreobPyrM98vIXbTSK3qEJtMJa5Z98Tz9KwNhujyYogZx6O/nUIOmFhTYr766hL0+NXPgi9TXp82TMxG0Uc"
+    "wEnxp0HGNYlb6kAt4773Mh6L+6fRp5aiHqlN/ZHSY1jvA/qoVd9JOiK/qcZBhhdXcfE0vBjGiivymx5F52k68jjlqgk8xm1NJ1+5"
+    "SU4Sj16fZz5m7QRs310HE59Pr8D3nKerwYwTos1+h+eM6n4P8b4B8xQGo6vsRM2cghpsM+9Yef0z4m5R9pj6yddS45RiBsoses53"
+    "Uz/nhEPUdUvLEDN3yG/85Ux6GsYSF59wzfq+LewBXdcL+juXgF8XZa2LR83Lubadfqh91PMT6etajr67I32ZfenrioUXsjw78vhN"
+    "L5YLPcxGzo/rnDGVwX91rgiLegtu2p21kgefjxCvnVG/s1+qwMctpU4Srq7zMp3f8BjFyUt4ib3kZ6r2nweX2wE9z163roUn6Ua+"
+    "ou+V/metx2L/EfrJ6hLPrvBOSsKRqLfkHfl5dzyrC6JjGsF5pdxAvvHSJqyBsxT2NAzuIgfz+IbROy58bpYTZxXLy4HpbsbXpDkc"
+    "x2ZwrXHUT8mpC4d6zGs2ibMob4p78pqXSBunIDjgsZpc+20mvTdTyFnvwIsJe17Cc9LeV/zZiAdBG2bd/sD+CMBZKq5P9Ri22ZD5"
+    "PLPJm65StxXAZ7YNOpJIdPen0dktAge7GPTfLBnxFQuCrPdc+Mc3+EaqjnmuPc+svbr4YmlfROL9cozapgzc+ij8fqSdUkz8H7iD"
+    "atEL5KBJOJNv4CVbn9zgPf0v45jJG4UfRAc4R31vlMe0dKlDzDP9nfO84zl/qjt/pogj9Frvnfyk9YzqOx8Vy7M4X//C+f8KIaYP"
+    "He41z6s1YabtCISZrjKr13Sqw+n33BJlmqvjPssrtbb7owUfwf3prK0cZLXblx7rf+hPvRSP88ULXx6Pmvoe3mDygQ+mV78t9ZjW"
+    "eDfmW2tN3YFXnM7zbYo/VWJ47PToXR+RezdHOxFFfdGTNTcT3kv57t/MGT7rN01Rbvqrt8JpTGI9zkADf4r+Fx94Tgq07yF4Gk8D"
+    "H5XPyCowCMVozU8W5izfrypo51JQI3dE96x6YLjH4vNDML1jn/SdxMV75Q+0V/pd8vlej/YghGtswxzctnDTtcHfxHkpn5f28Cnc"
+    "SzxwFc2NEZ69Jtgw3qRwRmPJHy6hm2+N53V9cJ9MnIlt4N8fEquLorWfhC79OHqINZ/MBD6JzlI/dyVxOA1zjStSk+Ykf/+AX3w4"
+    "e0fePL04Z2ejBfZ94h/xLzxrhM/2lfTJD+XH47f4qnchzEPnTn/mw18l35OGJwgNynKw/fPOc7nh/Fnq/D79v/yO8zr/H1//Lg2b"
+    "NJxBNg9YZ2ojr3Hsc4PNz93nfHzofOzoJK63nI/fOfFyq/PxW3y1kgSbd9zs2Kb31ftQPFU9quuXbugC2su26HETw4vo+isGm6fR"
+    "dyGG/8wGq6mHRj0XeOB1tLpl2Zsxevsgi5OKS2vpKZPv1Qt54TrXUs35U9a53n3O7/jDuR7NpnvnMR+wwyGGo6bgXctPS31TB53P"
+    "L1R+5DF/je7O9zby2Pc1I9dTLdMbbiYXWifNHVI8EL6bF18F9WroTO4jnTb1wmTy89PopRR3w732Xkp5TX+9Ibb5yQScvydxfu8K"
+    "tPta56uZYethHvcuNP/y0tP6q+H8nhEeO6tqkXt0BletQ014jzNUmot8zp/5XtP+vsCX7iRrSrn2zSDrBTzs/PsE+Y15DMPWu5F3"
+    "UXav+boOwhe+BL1334N/JsRbTfj2ZXxEE+DFVQf93U/0FSjeChvdynPR1/dnXkYR/Hkawtt68B164zd+IB3cYHX6106CsaeBw6pH"
+    "jZucWPrEb3mi5h8L2y0eZfVMKz0/9XhHmZ/HOfy+2kUab7cryrSCy97ZbKruUdZL+gJfYc0JULzqCT4VxtmtXFIxXtyPNAcJ8Zkp"
+    "57P7f4l/bRR14ghylSv0XCVC3/Ynebji4gKvxczC5F8HyeMTgbm/wleyJX702ju3o8zvRLqrPGhIhpP7yYtZeZkwryloc/Us9IuV"
+    "Y32G5nYPOEp5cLOO9PmJ21IOMBcPyFPcS11i9VK49gfcq/bPKI/pbd8417ULz0idc0V9VuNXjbJcv9F752x0gmh25+81nD3ZwWee"
+    "TQX9Vu/XB/9cTX0oPEVrTb6UX3lsHyqf3EQ9rv04kR69UeAsC9AVa/1Iq65n8hzt3Rm4tK6spwXk+ynxB3U97vrSa9uBvbYLXmAn"
+    "+EpKsJgL4EG6zl5wyl+C5aXlTOpCHN+DhmoMPHRqMORK1Oh5qaUSkIM843kI/5DWuwL7bDM8u3DN3uh0XKx5NH8OM9OtHLiJO6Ps"
+    "JPzS5+DGy3gWXciJFbeV5zejd20M67HkJ37ui8nDD6DhGA+O/ZT8uBx12nl4MeECBahv6rCG1G+rGRDSGYlvrghvd4f69z7r/hH7"
+    "Nq6zXlrDQat22x5pez7Uef+X/FbHbfDjraxYGTDvkCg0ozncHgT8xx6hB5zvs5pXWPXvYHQ/kqPlgw8+BSfRmLr/f/SH9EDrfA79"
+    "xG/on/Rz7zGbMQFzyU55zNvrOvhkyQ/GHTcIGHbn+jR2A6NJBNfuemJ8Cy82EY7koM94wIl4iddgxp00v1H4qKZgXSh//MZvGE8x"
+    "dGB6LvWYG/UjvRN6N5d4hgvBgAbjv/+E+Rz1OIfikF8vJ4atole3Ln0/mkHUlfO8H/02ZdAQK+Yrd8nDnL9t5J7zqfOrgU/mReur"
+    "vdjSY9yS1pE48+n0uitPVF+aNG8LPJa3Kxb1QBusHHYqXnA6C4/7DetR/00+Z7Fml/Y72LS1+nfNHhO3pLp8AjifPNcfeKyWlW5X"
+    "cV9zkF6A37yihguBU1iPpuwofUexmTPVhd5fXUtPJygOCDGsIwCn2Y46bCYaSdU+4ueUz4TznFWnTqNWEf9y2GdetOoHy896V65f"
+    "nz6hm/QraZ5ba+JmeWqUU/jP7Mb7IhV5zXv6EF6jG8jvMbwoPx4Wd5jrs5MZIIfhQHcx80cYuXyDL1GvSWeXnBiaH5xR+Z74Nq03"
+    "1TClfYYbNXf2hTjKV2/Ny6vtK8O6J7+zOmV5pNWrB/0WF4VfPIMPe+Wxelq1QkHmpafFS7gXmr4q5O8X6MtPiS5VGgXlwmOijPus"
+    "D2aVmL7Mf9BcPnM+381r/G5RcqSWYFbiVVb5jRvQGTgJ74zbvKs4rO+u8Hx58eL8nRommn3ZBfxI/42LtNrgvvNR/s/HfDbbsw3v"
+    "8TNwkLjMUD/nNb9st99vAN6U5/CSLk5vyDh4tkE+w473RNqZ/aXfdLVno4xDU010la+PA3++EqxccfUaGoB3YGNbvcYHvWdPS6dR"
+    "hNiYGz1rV/ojC6DXUG/xX3ATnelbCQ4yXKg5/lBl8VFZx7quR2xRX38KtJSjOHuquTMW8epQ3DriMS490mM/exe+n1nIrQfCSWku"
+    "s/LWF8yVnYEH0nPeczLytrXU+NoP0mwsdr5PHOhRsMwMPtPFlET3W4eZ3+H0rkjHLC6rRbBp/695LG++judKa3Qcp9FYZqU/SbqU"
+    "P9BNKS5lwXdD+ZlmPxVDvy48QT0Y2qNT4WiVtx0PGDek3GcPHPJCznKtxZORVlPfgrdfGDCNsniuUh7rT95Ob3Fn8vcS9CpqXShu"
+    "boZvTAAmmJw5eQO4lwngBlrizXzWJ6/5VTrvD8Oniu9V7/4tNDwlyT89oTbTULHxS3zt15AnfQ0WmRcPmHD2hvjQKvDeFzlfVuMD"
+    "3sJnHEV18pWUeM+kY85VXPjikmi/2+EHtZP52pr3kdFr/KziwjbWbgmwkORgzM/hDUaRm410PrkGr32t57Xozg6idz/P/XRjD/3E"
+    "PNXXPusDLcl9JALTkx+XMDv5HB7UuSj8mV5SrbeEYdZDrDk34psX0Ae+BD77C4/hbw2CDQ+pDYfSxG9anPfU88K9haEJF5S2RLmR"
+    "sDbl36odxQusQ7uheCjO9y6e9sJWKnhsLyUG68iB7mVUbMNwVYNmpce/ND3IwolqOs9W6295sPXAe4Otxyivy1cH2zPXmX4NnVAb"
+    "tGQx85PhyLKgb5QWWM/nJ7jmIOqt7OBVCziXu9Mj9Ce8e2tq4fb03qkvXV/fHl+zkugYnoKXK3Zq07wMstlTrz2GayTF5/uPIPOe"
+    "uOex/Kgys8k38L4X4R21grh0h7h+Bz1jO2JxFnwMuuMZPI58SjhyNnTXin8H6bEWViuMvVKYYQYJQiwW5vXaz2itOdzybgqynGog"
+    "Ob58phXvU9KfdpZaYBnc11Fmib/lDN1ITd8Hf8HvqAe0RqqBv8Xjfc2H45tFr7Py5M89tocrExvHousVtjwJDvsY3IfrZaT9I0w+"
+    "K/n5NLRjt6m5xC+Ww79feryYma5hlgP+qzwzyOYH9WA+fA7yqdroRb9kdp1+dzWPeXVV9hj2fwcf6+vOev47xGYxXMXDPhc6OuXG"
+    "YcF29v0B9leOfKQMGMptMJD0+Iic9xiOo9hSm/6BBpxNf+FdsoX5HHoeMz22ZzNSc7Z2n5vXMNi2+NIEkwOWRWt8Fp3PBvj3tXC+"
+    "tcjbBoC7aB7CCnR74v1zBVs86Y+/geq5K2iOt4EvnHe1VrGMr9XaOAkepDl+4/DzEY433Wt15V6vzYYuiS6mLPVmCH//k/WXjWeZ"
+    "1GPPv5PXuHg95y3gTtq/EWhoCpEXXiUPqoQ2+wr3WhzfiQBcsat9y4oH6AB097rPn5lxrNwzD/1wXbiPi84aKBps71y4pXLgYc41"
+    "JpJfjOYWB4xrEiYvbHcg2tearodQtPG/5cGac+OJecfJjweHmNa9Fb087nyY/vih6exMTp2XnjmFU7lf4Ulr0UUVw/8wP7VsZnDF"
+    "qdRu2jsN0RE9wlM7LRrY9fTLLuasvQzO24HZxHfJx7WPhONFsv40j0QxTPhsDXKr5uA+2mtN0YvGRs+/Hr/Aq3AjJUMMO0nMfGN3"
+    "floV5nBudH6P1kRfuLXTeDz1h387TH9wEe5zrXOuruA8O8F8VPXmbfP9N/9TuEph1sECv9UhypcPwxnUhBNxZ6Vo761BB5YNbdEt"
+    "tIAz4cqvojPeyJmfn/2aib6VEuBVb9FCFoAXn4IOMwws9SvmQ4byvIbSq97LZ/hFOXD7gehnipIzpvcZv/sUvvs5WtZFkabjU34k"
+    "/EL7QbxxgWCbbZyBOQR/4LstXEW46tj3Fmse4rvyOxrdm/AY3ehlSOqze+zx0XCbeviEqe5Mx8/qwzMvhKbgBhqp+mhdD5Dj6efe"
+    "iLKZFeonUi3cAr22vuYBedQZ6mHF0MX0Y9QiT7vB1/8I5rmQczUteNVP8Dp52Yt/oWnS/BDlEWWYk306yvrxlAf1dvP5WOZZqPWk"
+    "fPc2XO9szvLT5KZ9qNuagafE6Gl9hhel9dkz7kifzUW+7xficXZiYbjHfrY7g/SRx3KZQ5yxP5GTLoP3VI4lLHEpfPcbMMsL5DLd"
+    "0KCv59xU3CqGTn0FOeFf+LxM5Zzpzt/F29Wl1kiKp08henROwePHoyf2H3DSULQ4T9BtS8+1lnm+hdEsxXg0Mpe+/AfjfBe9N/yp"
+    "HfOwxlPbvPKb98+rSIvjVz6Ylu3ER+MPrzuHnmbZz/CbH+ygKNvfT8BZp/xrHhkRTrBK4rU8TOf+pki0MM7fC3rN66Aj2pAQNEyK"
+    "mQ/Ahu7j5fKaGX5tqPs1X0D8veo14Xe7Ptr8wH7E8V3uzHHO0L+cz8d3rkf+G+s91icuL67RaAauw12fAtuti7ZvMflBPLQHmp9c"
+    "G/82eb4Eo2H8iH7zOLlT3GCr/XS+az11DzHdm+7lqttfTL+bar17wZZPRhF3VUM/gGMQ/iR8QDmgcLNz9HQMYB6P8nKvzzRfiglf"
+    "8FE5XxT9ZEmjrIZ65STl4lz7vLK1LD2zzrWRkXaelmIGmfRhqmtyR9m91eJ8quisF82ISEsfRDFiwf1KEdHFk8aOyf3u0DusPTyk"
+    "YkT0xCSxY2rcXty/YmnJQhHR62LHiSX9ViewkGB0Ruq/eZQ7IrpJgtgxZ5TyNdUMhTgvdxC79X2PyHem4I3/ADy2JlzGaNaQNBfb"
+    "OctG00f90NWT0df2HVjhC/CbauQ2w6lneqIj+BZdst7zuCD73deoUfdSd5xDm/8IbYF8R34hh2rNz3N731uAhw0n7n3P73kJtqLc"
+    "XBxsArCcZniHiQ9X3pQQ7nsaeYZiaFzmtLxFTyEPMJ0pt/kZEWirKuIlUZAe6in4F6hGrQUHsoA+7Rrk8cvpd8pDP8xIfL0f4Y9S"
+    "C76iDDi67u0KurPF7K33aGhVEy8Aq2oPHpGdNfSReezPqaOFlZTwWLyXv88ExYlgq+3Wwh2V5npnoCXI4jEtRDL23Spi4U34gjac"
+    "g0vI//t7LBfM5LUzrBM6yovobOXTkxRt12d4fk5EL7KPfszZaPjLMvf4OZ4fM+hDKgmmIU3k1SibgbQfbFfxVtiQ/Ijz4OsrHkOz"
+    "R5vTx7Drk7lja8k7KhMTttCvmhx9TxJwoyH4XOpZCMdyfeIT0L+zg17bX8HM3uKbMwSdZzT4a0u4qtXwqQN4n5vgZyqA2fTxG7e3"
+    "A1+GAvQQFsVvrzK+62PQezWlXyYr598oft5q/LQycV7/jo9SBXKHj/CIwpmfoln8BZw4KXFgCvjwa/ydNFPqPL4lnalzx6GXjOX2"
+    "RaKhXgrGVzpbRHQgXuxY8iFsgqZM6z8umtelSSOiFzlxbrkbJ9DYpKYHoTF46mxyK/UXjEIX1R2MxdUxneY+1Oufwp05wzN8iy51"
+    "Gjnr2i8jonssd64rzHRZTb1W3w2g/1jPX3FV2u6VzJyV71QZ1sorn+lDu9O/k5bzpwE6Nulkte8LOr9nghPfS3NGKZ7kAKdQPv0q"
+    "fkT0HideP6Cmmwl+Iv/UefRflwDPHk68Fw6c3Gta339ZRw3B+yuhkcjJ9+yB599DrZQd7iAP/dpbqLcLk78Vocd4Lhj1VGbOdac/"
+    "uxT1QFX2ygTw+mByZ60RxbOA3/jgHs5H9TgXYI3WBDsQdr0bH1TlGTPiRERX+l/sGH1hC7A0YVHLvYZlHMA3PITfIf4lZiYsc1/S"
+    "xo6I7hc3dkzNWI2few08/S80ZHr/wn8Kgw3q3Z1lXpHir7DnCtQyjwL3o//ZETumZlddpxw+RosXZLnibXzytrKHG+FLeJK5117y"
+    "22LE/Ai8Nt/RZ1seHXRTfBIC8OttqFn+8ll9fIo+rpv4SU9gPvZtzhW3PyqcmrYHWvuR1JpdyRPj4zf9BxqDrs/vRycLiR3zM6qh"
+    "i1NsGENd4M6eKsz7kB5iPPe7lvO3KP5UrdDjBjiD5+GZL73EBOoB5YupiEWbyOO34GsXQV35K3Pt6tJDoa/P7qO/3PkoruQqfr5N"
+    "79yPLuRcf1NmJtRiZtsZYuRhuNw8eNR4b9yPTu6JHYM1/wo+vIh5pTE+oB7Tn/TEo1u6h9zMZe0Cb6fnV+T4/eg3G8Jj7rm0Oz+M"
+    "dTaYHpUNYAtzyHGmw2EkIk/pQs7yGz0j0jlo3/cEQ52Hl9lHtLVlwaZvBVk+GYEuKiN+NtXIub4lTs39pF9mE7V4F3wLGoRbDVAk"
+    "oWH/6sH6H9eue0ofYmtcmL54zq3MZTjI1zTC77Wn5z/MOwv6I61z8Wrin1KGGH7XlJwvEessL5iHcDedoUPwZ6hFvvWEM7eY1/KH"
+    "veCDL5jVXIJ3MYUzsCdevOLH3XMgD/0N4lL2otN97DHMoWZsi2upvab9SMQZepafV9tjz+37eIbnjgq182q+hzmL4MRbybVG4xOw"
+    "WZo4xYVg074cYpaxcqIWATuH5tPvod7+gM+wsP+BtQyJslmTO6Lg+SLte+UTmZF42xpe7Qg+0lvAlw/Qf1ALjk057kzmSIrXlffd"
+    "Jbx1p+D99YTzeyk9eb/hZ6v9p56w1/DKzfA3WMccNre3XfdxnDNnI+ee8sm3zs8pphwYProZ+hXVdGPA5JUj/IA3ZCT9RdnYX919"
+    "pmf/jLxkBrPcNlH3SQejHFZ6f/E/85ybFc7ZwUn4Ejv/Hvne1tzf783fYTl5QVvqzAn4ZF0k//kFnn0f81/TEl/Fs/2Kd9/m6P84"
+    "zd+o357if7koyrzv7pMn6WNtdBHV4dmywmmohuuNt9CI1fejt34Mi+GExau7+rw27LWf4JzPEq/PwnlpXYt33cPPLEw+exncSzyP"
+    "zsu4HqtLTtBT8hUzm76nhpF/g2pGd35IXXRLYcy4mIVfVBU+fw9fpwL0tfw25350xSLhMXNJKhC7p6Ij7E9e8CPnQzLqt0ng14Xx"
+    "91a++Sec/mDmfcajlimCz5Mwhvp4UQk/+DzYer4GhJqWPTY+ZvWDrU5ZRuz9EGT7NSf5Tid6qfYHm1fubPqve7DOhJeJJ1Jep3N0"
+    "Q5T5K8ovthr9ytrzGX2mVxNuJ4+26ZHmsZAGrmA9+6I4vmA9Zt2Pnl0yPCbf0D1vh9fpQX10BNykI7nkLXqhDhPPd4PTvqYfy9Pt"
+    "fnTpN2ExnEZlPJ2H0cf2Ff68d8GEb1Jn/EQPRSzOQsXJH5jruY1cdBP6/NesvbvkhTVYL5PhovcwQ+AMPoeHqGulv/Wjs9AZ1zTY"
+    "ct1l6LVdfe5S8KFXrNe/6S+Spuwm50V71msduJs/4ax7wt/2ZF3Hoebpynnup0+oM1qjlGhhh4MtRvK1bYiD96k7d8BZu57welby"
+    "hu7KGf4LNe8VnofWxXB0+FO5n1XcT1b6Pk7R73KLfXGcXPBbZgC1DjH+ay/9Y33Zb/HhI1OBP/XzW+58GT+w+FxLc5/x76oX37En"
+    "FZ+T+k131IE8cwT+e814n43xtH0B3zsB35gM+K415Tkr17pIntqVvGUm9U8ydJ0upz6aXM71bVcdnyxg97Gefkb1C06hD0x5QlzO"
+    "bdenNxH+Ig3ovWiHfqchM//m4N9Wlut+QX0+CJxgc9P70Qf/DYs5i7eRc19G0ygdxbgG96Mvvw2L4fD7gq8I5xtX9n50ig9hMVq8"
+    "dXAAMbNwi92PzvYiLKZP4zrvvRz5Xk5wptc8swVwPKP+z9RZgEeVLVs46U6Cu9vg7gzu7u4e3N3d3TW4OwwugeAwuA3uPrgMJMGS"
+    "7px3Vu+/3+V9330MAVr22bt21VqrVuGD5ULjpr2bGx/sfzlTgezZPzhP4/E7vE++FUSveHFwpdpgbNPIoQaT919nL8dEk3UIzCXS"
+    "23MGx1iVmFQNn4KGzP+8xSyDCfS7reLctkW3048ZXMeI315/5S5gP8FwOqeJ7XmpsXahu6sNttfMYeqQAuBEqzlf54kL3tfdjy/i"
+    "CnRj15mt0thpPlcH8FLlC92Ib4XRVcyl5ygnfTGbwCvHMd/7KN9nE2cxOd9nDDzlfu7ZDfRzKI4IIyvKekwlBznN3mxIfdmGz5CE"
+    "3Lg25207nJhHJ+1rYlNC6qb93Ofy945HD5XyIPk9HuVs/4GOTDlLJWYCPcIPQNjEcp5hE/oRL/P9tsO76H2F7d9h70sTUw7eMzo4"
+    "xRbw3p/kVuX8TF4xGF3+Svqy9J4685kc5n6aA9+i+jY69eRHZobnx4vtI9r2LHiWSSsSHd14UfxQ8rJ/r9NHcQCcqyef/wpYWQl6"
+    "ouYR3/3AcJ74Gm60NTqRq/RC1SKenkMH58Z/KBr12lb8HtKDU+0hLnZnz56nj8DiXIThTSS8ohw6ibl4ZD0CM+xC/6UTLHEm+dJH"
+    "cr2lv/nRxcer7ADa1xJgqk3po6uKbuIwrxEAxnWK/f+eujsBnJewAmELpey/q7gTk1nVB4ljfYkf6jvSPfHMZWJUJvZSUry1j3jr"
+    "RuqR6eigp6Jjr0qNNhkvnu5o8VtT10z1rgM+29eI7xf4/inggtPhwyd+JQxvLvF5S3+b01Kb9x2BL3wCfl+WO1bnTh4qhZgbshIu"
+    "QGtRm36TjdxD41ym7tgK37sNnbl0zrPAsBQHlxR9ZVX5HM2jqVgMD+G5N4u8sop9j+aJgxWIdzPANyfiRaB1D8tj3xefonli11mw"
+    "mIb4Rq0BP67G3Pcn6JCC4OQKoK9bTv+97tTJzDuqgIfNzeyvrLj266+lT0Kc330+fzn8zDOCHZxAS/qM/CYEHcN76pNy6H8UjyZm"
+    "eWUttb/3W/qfTxGncxBjjzhMj/pAcPrG6Dtf4L90jfy0E54ni/Bo0ByjyfxMZ7NkplfWVvvzT0NvNJ+aYRr7rtucUGvHJj+P/m4O"
+    "d5x6qLJPCbUiV/uZWWfgnV/pzZSHWfDEUOvhcj+fytEMvtqVe7oEOihp5TdRix+iz6EY5y8uWMFzvEWFZxyZFmrda+zvudtz4WuT"
+    "lHOn71iyo4lTpcmDi9N7sk79jXayNz+GnQtcNRzgLGrJZfQOB3H266JDGodH0FjOTit8RLdSExThs+ozp0ED2RSMuwmvO45Zq+fw"
+    "XhAfK691+bzdYq9PpKf6IPtiMfGmMlxKDjRHs8H1ndxve+F9TuDndue3Gdm5iRVv0Eeod1PaeOGA08BmpxIrosNhenVhSeA7vnDf"
+    "LYJ7OE9doP2amzmU8ppMR09I0SjTQzmeuCt8IxBcWnfUQ2K1i7p2B7GkPHW+9n4suO2M4I5a316c5SLEvupwalnx2Pcjv9e6beJ+"
+    "vIc+pjPvd4wea+U1/Zml1YrctSJahIT0Qd8h5qUGZ4yL1mAS3gBnyYM3oq3Oh0eP9l10tFPKLXXGFlI7eH1I/+MZfmQfPcSL9Dj9"
+    "epWZ5fMX822UV6XCH+I2HIfqRNd9czf2OWnqCeVXBfGf3OwyPWy6K884zAzoEfih5cVH7yY51UK4r3rMtO7BjITY/P3E9Ai2RAc9"
+    "g97Lb/BrG6jnbqEn6sr6V3YYD7p5zFOJZE3Fz5V3m76QiXikenrcHCZmvINP7En/5xnuo+sRBvdqH2Fw9/Q/zHPIzHcv6TD6L2EE"
+    "yn1OwOXH9DN9A2e5n0eD60aR3zQAW5T/6QbmRz4HP1Kcah9l9EHqiRrkMDGgO30I0r4Op1ZPQU/PEWYX10dPVob+PfHEqqGlSRKu"
+    "mITnKezuAp47ccFHq9I/1gFv3fd4lNxhhkFVPJfiuI1+fwDaDd2LfdmLr9DptafHIy7fOyN/1pncY4Lb5PzT2Jsz4DiUO93BQ3wC"
+    "3yMG2GodauC3aARbw7fNtIN6lB1Mqle37w67fr5tX1IX3MbfI2r2V+vUXH+fnjtMXX2YXHAbmJ30LduojSK43/bhK1aRu3cBnOoL"
+    "1k55ZCU0kqvIg+vhEb+PO7sEM2PPwwu3J77loCckyG1yvhT4jm0gb+vGjJKo316jAjjUKfKx1szt3YHeuBKc8gP+VwJ/YOH5zhRG"
+    "X5rbqy1HJzUELXAedFjSw8+glsjBLOdR7AutT7Io4zX3Cw/oWDyvI3iKyF9Dv9ZhXtAbntVN5gKpX7YAnkenWa/m3HsjWYNKeCl8"
+    "Z15oX3q7tKbCDU7TG6bc8Cd5gPohNlDLnManYRT8WEpibwWeeXz6ORRbl+BFXw4c5wV9+A3Bx65Q8y+hLnke9T+9RRX8eeaCdwej"
+    "D/sH7Pyg9b++tIqs7w9moI/BA8s7m3Qgdcoqeml7ghFUQ+8xGWytMjGmFr2WD9ABdKOnvANnewsewePBE/5EE7qQPn3V0dIl7+N7"
+    "DmYus3SI4iPKkgdcBvOPG/U/DDk795z27B345GjMsE7MfToNvelu+OISxMpw1uQbMzW9syjjw02uJuY0RwvSgDqhGf+Tn9gbl9kT"
+    "ygN+Mq9L66GehwA0AvlZT82i24kn8g16Zz06TrfxLuoFZnGNZ9yeu7gB61vObeqs6eBiqm3f40/dAG5kL/tkAP3q6sVXjNL7Cbvu"
+    "R62n+n87/n2Km/XBMQ7gU3qT1xP3noX6bC6vK8xceeob6pJ7nDvlfTqDoxzm+Y7gPvP2h4+NMvsvHvrIzPC28eD851LvT8NjfSg1"
+    "dAAam9j0tF2XN7DbzHkSd7WYvCcDXpP6DvmIO0WY/6U1Ko9Pz194m7fGC3Yanych9Zp4AM0sHOMyuVQYeaN47ILsjz/Iy7JwnhPT"
+    "77WJ2l6zPHMxR2E8tWVm8pUd5GeJwY9PcBelwIP0Al4YdagZ3zNPpTQcfHJ0WNK5iEMR7hKKz/swnk97ejF0R3ei3hoKf9iAmHaD"
+    "2TyVXKZ+01zDocwkVxw8TJ+d7pw+eLwrVpZCj5SFe+WFw2h4Z9qfJx93e0u8s9qSI1Qg9s7i858iRujsy6dhJ894DJxqIPfIembR"
+    "f6HHLpD5Sd7v2wMf7V74WK1hxod6KCoQj9JyTzdjtpzwmMH05mWkvijBPT+TOmMaeiL931e30agPwGtQ/MwtPCOEVybn3z3m36am"
+    "b0mfsx3PsTm+Epqp1pZnIV7ZF31iIp6d4pXmC47kHo4Dr76aHEbr3d/XxE7hosJ2r+FRehQ/5A7oWCN4jl59gjwyzrpNXJLHgTz5"
+    "NMunMryccATp9VWvJ4EfW8A92Ia8dRI6uL747irGt6bnuRJnYzb5ZCawqRp8jvjMYErqNDNbdpNX6CwuB5uZSMw7SJ+ozsGM+YaP"
+    "+8L58UErKSxjSELD18aHr1E8+UE8m47WbfNv8yjOc9+/hmcaR011Dj+VCeyR4tQg3nzjO3dVCLqkOWBfB4gdQ4k5fYkjWfksX+HA"
+    "m5JHHST2xiLvjAF2upqaswZeWGvRr+fE8yUmeN0i+o7Ow//MJRfajQ9rdPowloIpBNJ7rzs9hHhfm1g2nnvjLrqcc+g/FvN9VoJ/"
+    "T+QOO8xadvmtX/QHNfhS/LS/VPDx2WMnIgVzmrpC3y97htfWaLvAHwhP1hRuQnGuOD87gp/yPGZWleKsKec+mea1NdkuGu7Rs50d"
+    "LPo4nOGlVK+tf+w//wR+PhN9Qe9fr6wf190e7XtVuNbr3K96JtU/v7IW2QWhNCrqgVpG72VSzupJeuLrgkE/4o6qyz7oRR/SJ+qp"
+    "beiKH+Pb+oLc1pe8ZxSY9U76yc55c3lwoDC8ofqQE61Fh/UCLGgS+edrYtFKcB9f6qAUxPRPcHpb6CM+AkaShjM5i1g1hJrlGVj2"
+    "ItZlM6+dgf1fhVp+NvtgJ73KLs65k94cN34s6+GgBoCJFwK3vvLvK6t83SgPB1sMrWQI3rmKZxtGfbYeuv08fEcxtBpaX3luNQD/"
+    "KIPvnx/rWh2uAsmCJ0d1sW6+rOswfq91maKeKPs37+hh6+8wWgv1a03Aw2Ib+HEz8l+trXrq1uMTUoP7W/szJv3w98HEWrO+Lelj"
+    "2YD/SA44Xh88pS6Aaz9iv63mrnwHPzyUc76I2ncSXNdStOI3vBooZtDJ96Mm9fpA9N/H4eWmokWvwIxIeZlpBvFj9HLd8DaWv/1l"
+    "fDa0ToeICRvYu9Xh7daCgR3n7LbmDgtn3Wrw9xLh65EMHU4NcvMa9IEnh6upS6/uNu5MC28onX1pMPaxdh/x8ZgMZ/gYPFxzfsrh"
+    "86gzGMV51F7Z4jD8n87DZz7PZM6x/IWFG9fxNT2N6pVJT5/PeOpT1RbSi6sHvAB6EOVkC31NTjOf3EEcaGKwP2Gl6kGNzbk4zRlX"
+    "nr2K+1zYy1jm0I0iluisXHWYfyefSP19B3OwC6NNa4tOshc+lDfYp0uJVc28vJWv6b9SL7C04LscZn7xAO9MFT9z51cFe68EJynf"
+    "hax4Ei2lntyJP9MW/BkcDvO8dDfo+S3Ad1dajdX+RvOW1/659OwtmB+Uh5pgMl5h1+EXpT+aTTxbw3ktjb+TNI5B9Bc3gsP71+vd"
+    "4ms+d2N6TVbz+fx5PT23k+xxeQyo/yAmd5r4W/kCvmemwzW446JgfrqTDsM7BOCHod5t+chpv6iPuSK+psqHztOLLz2JG+3QPnDY"
+    "5eQLiquaazOSM9WfHqg7+EKIH5mhNYNbTcKc06HUZE74UmGAzZym31R7LATN6gz4UfER0vqo1gyD79f+e5zGYEnicuQZqNj9JsRw"
+    "BnX9zV3tw/xFxeqrdmKc6IfB624fMrqFMvblMiWuvX52ovb4D6NJmUrtXpGcqC0eJoPJKTvw592ID8PJk3ahiSjEfO1fxIs63I+K"
+    "/W9ff7JOpPL3US9XKHVMIjTys+kNL0sfv2ou+QeUhAMpzjxEzWj6kzuyCJyw+uVu4MP5FY1Rjd9meyYgLnclNxuKJlWzgD3+4/bn"
+    "ahbT3+MV8A69pzxJpOO6Yb/mdns9F0faa0WtL/1VdPTrWosO6sfCgzYADH4O81TEcQqDS0B/80h8PFTbjrn9yapgr0cl+okf4B0Q"
+    "8tv8OK1tpbOfrHX5/D090bpfK1GHbMNPM/zEJ+tzIn9PP2UIPpWz0CtVRI+wgs92F73OYfAyYRYx3KaufcqmKbX3kzWwgL/n2UUn"
+    "Vm8m/urezeUwGuFxzNerR96n+qUjsUP7/S2+CRacWh3W/xp3v0djzLPRM1pDf0IW+Ffldh2oo3QmfF2mbjrI/O7CLpOr3nMbnHsI"
+    "M4a704vXlzkAJzd+sorZ63cazZByBOUOcXyNTka9jafw3dlJX5p3tmta6mLlpfXotauCB+cAejCTeGc8RZnPngw8tgHY73C3wcjU"
+    "5y2P3dMr7c+T399Hc0r1GcLJCR8Tz/zRV0xEd/gI7DYhOsV9YBAlwYz80fq63YZbqQlmOq/BJ2vFGX+PrjMX90kyOC/hwF/rfrJC"
+    "z/p7NJBtidP6t2eKf7L+OuHvuROywZmGgAvpmSSP/ckq2CXAc1/pztiaxPDK3xMZH4BHMcxzz5DY4IuDCpqcomM2o0VJBA6u/2sY"
+    "abD5nXYAqGAXQKH2l+1lv+EsO6Htmdl+rZeW9SGlvc8+2PVEHjt2PTAcRCswwIP4DpeONHeA8GXdLXWlXbM3x20848ujpd3EXdIJ"
+    "HiIPd+I8eJ9VxBSdi2LM1QhnLylWy/t8HH9f+vG03Jtj+ftt6UkUjhFO37L0pfLw/4in9RlmcxyFX9IdqV5n4SfnwA+FodwEl4wN"
+    "1y/M9Sl+WdKEHov636wQ5RAJmedXzTvnRveh2+i/t1MD6+7uhwdgRnCboWhi5C8grFl74F96vNXP5Mv7N2Im6i7yZeWtj9xG2+BC"
+    "y/SLHpx5zOeaR2/tAvC+7ehkj+Httw0dTWNq7wX0SI6jTilGLiDsewucdRAatozoL87BDR4F/xpMzi4eLja4wWjOTVr27E0wiifg"
+    "PXnQx3XCl3wYOH1X+homw8MkA79rQ296Ju6bIsw28aEH4w69GZp5048aah01oOYLZGXu1Hf0/J5ZTw7DUwiblkZlEz7bjVi3EXi4"
+    "78O7QPeNMDrNm0lGP8EQMB2gLk8M8/vt98Hw4rTNedb8Evqdc+yZoy7Tx1/nt55CcTW97aKzhv1nz29b1gSXwdRq22dM+1D698pw"
+    "Pj7EzLjUo5vhQoWpyV9PsbO1w+jUO1LTbKeGOMddIO2r9pI8w+T3UNHP6FLk3TuLsyv8a4bT6PG3O4x/7H32YDt8EkPx11wODrIH"
+    "vLIEuLT6/ILdhtPdyfy3R8wQl8Zbd0E0+/X3yXfQbeqbGlEGO5B+rxP10wBmBYqfWuMyeiE/ZsLId3MYZ/8o/ZnFie26Sxoxa0B8"
+    "YDO4IsVcB99fsUx1hDwRFF8z/DJcaQt8/suAJadB/69+AtWrxSJM3l4Hb071lysWvYf/lb+i/JSz4SWz1238BYPBaIuClctnTa9T"
+    "l3nQ8gN7gf/vKfSDus8f4Kc5Az3eXpeJIc3xBdkCrrqTeQzT0YR0Zn6E9rx0NOo/034NxX/A/cucrfxg+/JDCCZWbECXWxhMRHmW"
+    "MGb1K1Vym/UQz/0CP+VA+LUJ1M9JfI0f+nvtK8U6eraVWDzB52oXsx8CuDfVD/XJafyxxGnq3ljAvKehvK8wZe+csBlgpsLllSNp"
+    "jrFyI/Xkz3ea3r0ZvE987twC9MqqvkuBNmcU8z1T4QvxFzxpDpfxadQ9cdjX+HMJi85A//Ux4qy4JmHOs9xGB/0Un2Yfcl7FgMlo"
+    "+qvjxdaaum4afqn6ngH49kgPW5NekFXUC8vJ4XMyV+SnvT6F3KYeqEYd7IfPU1dyWem6LimnjTKeWYppWmNhygvxzRC27c9cN+W+"
+    "eq69wS1y4MEzFb5HWNJLOJMXfJYuzI4SR9CaXOgjGp326Nf/wOdI69UC76laxPIjYGbXqHnzoVF7Cc+pO6sQuXsFNBXz4Jd0llry"
+    "+vXJMUfgaSUfJMW+lPavqe3vLe/6I2hZlDOsQ2umGqIPWpsg8OsH3LND8GVUnFCOO81laiX52mr9c4FrXATf+kU/Uwo0CadYpw/4"
+    "Jy3h5wPQiglvWWJ/LvkBC8xXjqPaeAzrJ53qZXKO9b6mFlhMbrYGzrwwWJ56h7QmTf1NH2w7nsVF8u7T+OXqbOrs5afe1lpMYM+E"
+    "cI8pd3/Cfw/ifvwGD3caPv47/lf/ov1vwj3XmzwvjLvpFPl9NLDUv9Ea5yau7GD+nu7nM3ibNGfv7MULQfXjT3pzlvE6QdRf+rkv"
+    "fvNNOFPSRXjmO5APqJfrAvlhbXLIw/jDSEv1itpXeLH2kvCYBvQYxnaY+1rxRxor9WJvB1sOg38eQz20hhxjDzrRGS7TwxgAXxBE"
+    "nIzAL3Skt3+aej6U516LnugEnIUgZka+x+8nhDiyDS5gOz43m3huVXmGK3kNN3F8Plh0KNrEBejS9+NbmQq/6j/AQdNSNxdBi7CT"
+    "OrUtmGt1dK4X6FevDWdXjHmFf4OztsX3Uv7Pt9DhPoR/GY2WU/4g/vjnSpMmbio6n0v1Uy/6eOXxL+1UG75zee5pP3QSI8jTv9EH"
+    "+RZ94Rl4pNJg4OKQ+oMR7oNnCWXvag9MRMM/AX33Up7VRjSAo9CRDEaPXp36shT1Zk9qcWGxYfBJ8eGPHqDJEM6gu6oQ616KnFU5"
+    "aHlq45X4Kreg13MMOXoz+vHeoM9+yXuqTlc+JZxE/t6LqU2EAXp9z8PRgp/mvKzF/38UObHw6jHy1tMd72d6ru+hc/DqZ/5GE6P7"
+    "4QN4W1q0xjv53NmiDDZXEE3zZuLJUvLMQM5fP7AwX7xQGqCnWAAXE8ya1qCmDKFXTf6qwb7Gn2k3WnvhLVM0Pwut7jd8l//ivipN"
+    "fN4Pbybvic58ryP8e9X74vGz488Ryvw0aUOEQ+ZE/6peo8/UIi/ZK/LVK8DeEfetO6su8S4BXjsdwOTGsGf2cSb0nQ4yC13YsvTw"
+    "lZzGL/lP7tU3fH7dfYtZ14voByuDfU/jbOQA/5pBPtCDGrAqHqCN0I6OgSORNiE3eccMfDo+wdvWB2vKhbYgLXnJUPiOtHjXPfA1"
+    "M0NOgU0eQDtwixzA6wOtumIA935OtMqKM0nt/XbYbTz/5Ud4k7xoNHmifHvl8+Syf63CPMNfzFyR1lFxOsJl5gzpuSn2q39uE/Mh"
+    "1Gv7gnkNK9jnSorjOU3cnck+kwfQDzwik4AVi9uQN/ZOO6Bnjmli2Rd6JMPh3kLR16Wg56Uu9VFdZo7v8vlf74D+/BYa39poxiag"
+    "o9de0R6UZ61yJmkj9az6OM25UQ9CBHdjOXSXvngXah6o6intg0CH8Whw0wd8HK3jSvg18TPSEAXjpR+f2ePSTNZo+Z91pniAR09w"
+    "w/7OIwLMe+Y8YvbINGrdGbz3+lrGs0L3TauHRp+gHhAf5jDqblg9w9TL0gNOQEM4/6G5n7qQpx9ymZ+n2Gcwjh0djC+b8BVf4vdR"
+    "avhLuUz+29DeN6dehVvRagT4eL0y1tBPGnUl3IpeKcCjHQjz9rCoVrd/nrhigAcPrE3c2k2NrXgWeinc6lEhwOPLsYA+BdVarS+E"
+    "W5e7Bni+q+LgL7z1myU3e1qxdrjwLfoAg8Am7oItDgkwNXtP5gh1T23uLq1pR3QC+bhb4ocZznfjdxP3U+HTuQZMQDrgYDQljcAW"
+    "9LMMaAqSkk9ov/2NzkPagc7wYa2Y7dIQHjE5Gq6O3PHX6V2uTG9TCHx4pd/46vpw0+n47Bmpa3byOUsQnypQWyrvessMwyDu7S9o"
+    "d9ozx+wK2qY/6RcV36Zn8ievnY777BJaoP/AksS7aR5INPjWFeDxz8HLNnq9q7j79X7yUlC/VQI4pWDeV5r2pOTf79E6KY97zDzn"
+    "v8l7pC/Vd5KHTSv0KEFoIbrQk9oQfmQW9/4X9lJWsPvh3Oed6L18jG46NxxYT/BlH+KEcoXzaMCFE2RlntEbek8awlG1Rgvuhw5G"
+    "z+o/ehky09cejc/cH/1RNeKX1qsd+2MheKnyxp7wBB2pAVLjM1QfTUVCar2jvM4l7pA19OOcYb9EZ33Wwp2sJ0drizZvHLM3G5Gn"
+    "lqavcTK46QnuuW/M79zJ6w3EC2s6uoDt6G+8/vFj0Is14bUjwV8S4zef0/5+A+RRZB+gtn7G96m4/ftxJcKtp1/8PfVWcfycNE8o"
+    "kx2bxaFERRhP0lByLB88eHQOxckdJq52RT+Tmnt3E/egV3u3glrlAJruZvQF1BkSbsWKHeDxqLPwHI/PPoxgr6v+WD843HoYM8CT"
+    "/y9l36suGNc73JoZL8ATP1MQ03zQxQnX6yoOWfek03g3jGNum/xAxWEecBqeKwV1TyZwYuFdXfA4E8YejVpQNZhyoDjMeZOWZDWz"
+    "nmu7DLeks1OLvgstWAw49BnsnSD6PK6iQRevmVm5bZSpQf+il70AcSoO86Q0O1pnVhhqAYfRWYrnmYuuuwB3gHqIxtHr2dt+1vc1"
+    "49nXrLlq9IPg6sXIv7waJD+82btHmJjj+GnuO8Wtf14bHVsvzSWw76cXJ8Kszk+cHnwkCD+w07/Nx1SuK/5qO/jTDLTw3/GcER6o"
+    "ecof+e/deHjNo68o0/Ewq9lTp6dvozJ3nHLtlAfDrJc3zc8bUXe0R/ug+yex/eeXbzk9PTCLyRc9sxWCw6z59s8Ho7XYTtx+dSDM"
+    "6nPH6cGhyuKPJmxt9/4w69Bdp6f2y0yNWA/cRnsvvf3nMezPkZ33Tou2Y96+MGuj/T7l0ZlUIgZW2BtmdbRf7yYasSi+z0hw38t7"
+    "wqzq9uspVwvAu1KxdbH98332vwsCc7uB/r/S7jDruP0+i6lX8zIHYiu1X3tq74v8z+vj0YN4WJSYvw1dV49dYVZf+/VKgFfV5K4r"
+    "ZP/81y2zPp3B+RTj1+4Ms4JvOD25YAFyanEk8+yf97D/fhy4rszoyWbYP6912+nBEELJ2ZQ7jLB/vuSy05NHd+Hv6z6ZuSPMqmC/"
+    "TgN60k/DTxSyf57WXqdm4EQOnmUs++dXLpq/P4i1D6OPfjt6zKzE33b4pKhubLY9zLp73enJYysxI0N324UtYdaD807PHp5AvTOL"
+    "2u0gtWBsYvcUfI50fr5sDLP6n3N6tBg9+Tu6n+Ovsj/3GafHv2sac1OeURtuBVNoxZlcC+4TDA+/D072Ks9Wayi8/Bm9ty+Il33A"
+    "yUdQj0ajX0fr/XlxmBXztNPjg3sDjl73w5ZFYdats05PnVOGOKB9l8n+eRX7e2RgP1QC6wuwf27Z36Mw2v1naCV/4CtQhj7ueUFh"
+    "Vhv7dRuzP+JxPqMWhllnPzg9r9md7xpA36o0shOYt5ZwQpg1/LjZj3XYjxepsTOg3aoCD9mZ2KK4oZ6UGHh/af1nkY8ppxXeX0Nv"
+    "5jT74QwzituAscqjIoPDzAGWj5E4RNVw0cDCszNH4BZaIWloB8PXyf9tC/0WPujbsqH338Uz6k5P42b8Htujb5CGeYfXYyTK5AzS"
+    "2StPW+02HFARZtG1iTRY4yZ0wX+AM4waYceXY06PX889MEiPFnVwmNX1hNOjBeoFRnWYfrvlYEpdiQttwDHDyPdzcK9HgA1tRtfo"
+    "+XVQmFXafj7N0RmfRL9dHp1t6gF2HI7r59GbSeujuaVvI02fQwy0a/q/OdyT0roJv1dtWx/8NIJ5a7pvxffMwu9F/0b+AQs007pf"
+    "mJU8oZ8HA44GVpcUH4XinIk19Mn1JQeZBu+suHyhe5g1q6yfpx7+C+2ij9kiHjxulf3nD0sbXeoacIHvYMXKi2sEhlnROvp54nAK"
+    "/EbGwtup5giw/3xHIT8PjzmXmKUa/nOLMKt7dT+Pvq8NmrGV4I+KUQvsP/9ey8/DH8Qh97wK91Wbv6u7d3DDMGteXz9PbV2Su+gB"
+    "WK5iZub6YdZt+8+bElsjiFcdE4dZk6b7eWKL8tTyzGuRT9UY8jrlE5WYg1AZnf9TZ5iVb6KfZ16qcu5z9OPXYPZHOFrmi8TtbtTi"
+    "TqfRlO5kL63nuRQgZ5OuMC3aOvmMHVG9rBmXLqNhWO0yHL34ilCPziDUajnZz2e+wzwv8XIt2E890eKIK0xEPPmT81gA3uh4QJj1"
+    "I8TPo2fxIQb5cHYSsR/bc26F20pz+I057H3Qh2RhXqn6fQ6gyylOH01dO1HoJQze/oJul7lrphCnK5ITfUJD5c95FmZZCt1AX7Dq"
+    "JMwIFt/fmTk7++GcItFV7IJ3iAKbOU5cHgpmFQSuonnHY+GclqI1mcEzCKeuyAO38QOvez3TvMxaf81dcIYZF9PQ4v0CD8gP19YH"
+    "n5d9nKO79IMpTkzkPQN5bT3rmcyoO4pmMC6c33R8vc8zuzEL+q811OSB4P0/6e2oyKxjJVezwKZysjZlwPJikIePgWtoB66SBZ+C"
+    "98TUceTp+h7luctXo5lVfSaMNhG41hj63x6h57lOrXeTej+9y/w8ntvkbp/BvhfC1YbBRY51Gd4qkj6+tswYy2b/XHNuzoab76k6"
+    "YDq9LMLaStn/YLK9IE3th3bADnzJ7EK8sIN952u4/Pn2Bo9lB60adl1X+5d5H2kWOou7Z7adYkoS+lGlTVCNqDvG4TJ6pVH2Jloq"
+    "DbH9+4f26ySxLw/Nm2pmf6659q9jvxuOP4s4f2mgXUbDVu+HiUWK43omvd3mHDy1X0/8d9VPRoeS95vRVCVjlqK0OkNY923kM3/A"
+    "IR4nr61A33pvnsUmcIK76Lj/xPf3E34veaNMX1k2enL0WuIW+qIxKod/RCr8DBbi9V2DWt5zd0eZfbMVb8iz1KM9mPsoncFs5Q5u"
+    "4+Vgke/mQavRldw+GxrivtQAT9EFrYFTeEnsUl3kIgc+Cv4djZzoOPfDQXxxk4KDSzeh/DI6vvrVyZ8i8MvyzMp0GH47FH5RuddU"
+    "ey+1+WV0SQ7wsvb0fzxFx1qSXuY46BYP8f2K0B8vjP8pvhjZ6T/7wesoP41GjSvdrPAlPfO/7LWKjfZC5019wPGJcauoDV7CUbQg"
+    "l7kOH+WdkzH0N9+aQdRDwrbE1yRjzm5izrswYX3BG9xHgzivV+EtrlAzefv+I8g1TzAzKTV9Nqvos0lNnSfc/yV44SLWZCz4zVJ6"
+    "wd+Ax45l3Y6C/zSA934DNtkE7WJe7vR59HnVJzc7Cx+1EBxPsSYn/sbeOTfn2OO5eXaXmYvbgj3+BtzwAjq9SPCw4jzz03Bzg/FV"
+    "2MyezETesh5cMTG1UAf0Ul/pR/5BPlOS/dwVPcFM8KoI9tBWdBOleNZz0Xn1Z42e0n9aGU62G/zDaXDSvNT5LeCOx6OpmwcuGZP8"
+    "NJK5a53B5e+h95tKb2Nr+ls1fF21/R7m8whj6Qrvlx+MQDyDzsF3OKqP+OdpRpyewwi8DTQHR3zdAHKwS+DMu7lnQ7h3+6BhcDAj"
+    "SrmQ/NRy4f09BD6oNtx5KDjySmqsefCImZjFpzv5Brqm/uDVWa3/8brKl/ehL7vlMjq1JOj3c4CHL4On+of4eYcadDC4+Q08fqaC"
+    "gQs364yHl1dntRXP3IZ40HTkOfizP2fxjHWfSrcayAy7eJxD8V55ueu2k0fHpX9Dc50bOY1G9j/7gC+Rh6DTrPcP9o90S/IJVm14"
+    "if1XBYwtN/nTKbxoxHvfQ//1kVo4DZoYabY1G2Ilez4O/WK5wKhyouFpj24im4M+Us6HsJ9hUUbf9xEfam8P1gr4MeVme5jnIb+Z"
+    "LcT5dcQhcYK1/A1v86fjfx7Pp/EbfwqvPZD9oPu/Hr5Ls+AB64OxXuEe6sR+Gc9MgnPc/0/ALs7gW33VZfJfzbjQOo367U7ezh3t"
+    "R/wuA3a9iZ7mC/gWaD9oDvUoNNDi7RLZz+tnpPHKlV5iVoDhg6WxTwg/0RRPs7j2Z1jkZ3juB+i9NNNPOeIY5jZ0Jrb4E+/C2W89"
+    "4CQGwCmW4A6pS94qntVJDtkET/SB1H2K76pj1C+qeWi98Uu8jm7gMTOGShC3DzHv/jJ79iOYW37O0A3i7Czy0u7kwpPok0lIT89Y"
+    "dC+lmLW5lHP8kP8eATcRnbkwl/A1jIEf20D0GlvwrDhJ7HlEb/MSt+HN8hKHdAb7oK9KyncZRV/+WPyAJ4NPZkRT8h1/jdZ8znvw"
+    "BH3QHbaDp3uDPqktejEf9Ek1wHyjgSOmpUbIh57oIhqJjHAb2X7rfz5AfPHq1v2Yb7OW3Gos56oEeaR60XbAmYlXWedreshrkTNd"
+    "gy+tQL5RGF1zJ3i5XWhSq3Em3+Ar0h8uRnNGkvE9ZoOv9OTePElu1xi91i1wmr7MVsuCL+dzsKAh5Mxe/dkOZs3rbtHrS/8bM8rM"
+    "SBYWpfOkfFdey8/pl1Mt1yLAPEvlkVXJA7fCrYzBt+YIM06D8JWZxnP6gDdFEDFmKHeGXu+zw+iZf+GF7Z1v0BR+bBEYZwW8bH95"
+    "3w9s8w98jwcRA1PSe90ALWkS+vo64R0r/Wgi5sW+oz7tz933mp4y3WniVUeilZpKzVoSfv08HPNOPCZagafGwMtzMXnNEjzreuAZ"
+    "dZm8rh4axB74eiSiz26c13uJXpxV5BMvmJcSD711G+rV1WgW55PLK/deTI/qAnwIaqC3jWQteuMlkYH7aiz7+jgzhmeBoxbg/kmP"
+    "1k41rOYyZsMbLDE+PgNZd901S/Bk70g+e8fr8Rtl/HJiEhc3kFs/RAuj17mE3kv7QnPaLlE31KIf6wi+DsoRehOLXPDae4hrj8FH"
+    "lZco/ymCF1BXMAN/uK42nNWj+BgMpRbozD3cmNg1lxixAR5yFlouX+aubYKnPgKmm448577b5DmZqbPaerEg+wNrZmce6o+Z6KeV"
+    "O2nGhL5nHryKM8O7X+f9OlPz9QXfF4fw0G3qAcU+3UXVyY8Lwt0sxZOuGufpGjmBuLP3xDjpkIaAIXn7LaPLN1XzUFmnLeRBc9wm"
+    "j9qCXli9OWPglNqw/z6gfVDeepV18GMu1VxynvpRpl+hOXl+IJ7OXn/retxPVfDXuUbuvgs98SL47R7ovJYSJyPw6qzIHJ+m1Dt+"
+    "nNUZ3GuHibXrqblc6C7awaPU4EykQTtY3mXuT63rQPQYJ9gL++hBj43/cXdy+9R4GqlukhZY9aT0iO3RBms/9GQdlI+rFrsu7CbK"
+    "8MWqIZahc57oNjnxEjsBkQa0BFh+f86veq0v+5p9v5J9FQHuOIX4H87dLU1rFJ5H3rkQsagdpYvX9xLmKExirctgGS3oM3S4qc+j"
+    "zLNTXuVCdycBkuqzFk6zf9WXG49+RwUD9VBHozfmJjMFs/gaXkQauFHkVDn9DMcs3X5Z8hthtV/Q689Q/eQyXHcLYVP2+/0XaWZD"
+    "x7JfU7Pf3JGmR1Q9eopXq3+amW2pIg1Gfdxl8qOUP4yucY7L7Lt1v0xukDrMruHdxm9eudl15nkIj1CMbvLLaFXqwHEIPz6LT4Hu"
+    "afn9PEDzsQkfheHwEsccpsdc51saNZ2jEPpQFnFec+Ft24KaIRazSweAy6zHk0K1RTJmX7RBF/qDvhsf9uIKvC//xH/6IedUf7+E"
+    "/JYcRitcFE+Hpk4Tz7Sf5pQ22EbAkjDrxVk/Tx6Xl1xY+yT2l1BrUWN/H83M1L1cMq+pX+4Ss1rRzx43hanlo8AyLsY3WFIBpzk3"
+    "xdBn5+ZOSoQ3YD08a0bBmc7Cv6gz/czjyV27oh/7Tj42CVziXZTxTT2J9+EbMLH1aMKOkr9kg69qyM+mgHs8gANozb0gbEc9XpV+"
+    "w2jnc3Zic08uoNbrS3xQHaT+ijtol2Ojo7qKXmsv+d827wxl7tRO1OotmBOkOHjHYe66aeSX65lpcZtcdBo1Wh7url14gF5jLbbz"
+    "7CqRO62nP82rEQ6iBjjL3VAarfBbcpgvcBua3y7uT/tFObl46IkukzNK/6TPIW9neVVpzyl3knZNvI4wunn0iR/A23onHMBbfMo+"
+    "M7O7MBrlqcTvuzxb5aSb0RArnh/QfAq38d9rh6ZT+05z4+QPHMb3SYS210XfqWKndPPSMKtXIR0+r13IvXJSm0zCb7s3OeRQapkn"
+    "eHic8jU9ekvhZjVXKTGx2RfvsGFgyFrPVejMLuDXmJ3cpT9eUte4Ky/irdQd3+s19JEEghdfAz+pSe2dnbwlAxhhazCep9RG3nw4"
+    "DtjLEnRWiemB+ItesLb4HYeQg+dAf9GMeu4a/lKN0Oocog4Z8xtHshj8TPt7C30uudBGXwNjqIxW5jUcSp/ffDxLUvuX5mzoc2eH"
+    "F5vC66mHMjNcUwQxYhpeIN/gV9exft/pFWtObhITzHot2EdqaoC11CzxmcU+irN2Aw+uj+Sd88EoSlJ7hFA7BrPOd6iPvLM304CJ"
+    "ZeVeXo1v3xBmUCbnrvhJfNMdGAPM7j5+toNZ/9I8r2Hk/d66dB2vXYc4dop8sBM5zhK0iA3RGnpnAZYE+96EPm8Dsa4eepzp1KIF"
+    "qIeP4h+2gH+n2NGH/bEOzDqUPPQAeoxpfN8QMBQvZv8BTGkj+O5yNA03WfNL8CLFmI2j2ll5g9b1NOucGoyuF/qc2GgFG4MBfEZb"
+    "5QvWXBidTFJypdpossriVfYPmIBy5SrEqY/wK7XR7Cv+zAarPkEPTEFqhQ3s+/Ssl3gD1UD3yVP9iYsX8JLcR0/BdPLLjV4/Xur4"
+    "t+DyndBap8cz6AFnrAZ4eh6e6yrOfAz4hPn4xo3jXtkGVjqa7xUKZnmV59iC51SFXHkHPNdhtLmJ0PL74tG8Ah/Cnayx8hzhbans"
+    "+Lsar5Ib7LM36DM7420/kbvlGNjNn+iQhY8ccBu9wjFyh5twq0vBq9rgqb2SuahjmIOlftNo4KwhzAKLwblRLtkMT/cP6FdGEve8"
+    "2i71L6sXVHM9xdPPcxsv7gXs9e1ox11g2wPRFwWjy7sET6e4XDvKzDnIhb90d+4O7YPx9Cmfoe59yvk8Bw/8Nz1l96nlu6ifN8Is"
+    "Rh8wjgr0gYczy2sUOVEf9uB3ctaf1DjFmEcqjlZ3zyA426FguhmoSTT79hJ1w2p4E3mvZqMXaCb9iPnxXr2IX/5muFSL+Ws7yVsz"
+    "oYsrjgZZ/LO81M9GmH/3jvorPRjncrwVMlGDqc6Uj/4n9nJH9nUb7tRj5Ind8PZ7wfnoyN01gvupETryAeiNdpA/FcTb5AZ1lS/9"
+    "6EeIV9HJKdag7w0EG9Z76BkXZUbLQGKYzlRct8EANYugP3jKAHogBpCHrwHzyg6HUZM7Yw5n7ho1fzQ4/0HEpxJwMCl5TcWTGPRH"
+    "3ACHjA1mMADdXye8xUajyde66zmXhnNJBxazCw67IJ60ycEnN9D/vYwaWX52S5hN8A853HP4tHfoiOS74Av+pD0m7K0ke0b7W3f9"
+    "lSt27mbHil32JtKsT/Ewk8Ez/uDO1MwmYREPwMXn0K+t2X9/oDmOwg82G/5fEeDDseBV9Fxe0Wd9kxhXlz6hUfjrip9LDL6aAGxt"
+    "I3mNzq5yD90B4r1/gl+VxFNPsfwfX9Nv2pweluLk5MPQBoZS+/2Lfj0HXOtncucjaE7WMQNCM52UZwwFX5NnRTbwxmbUi83hO+Pj"
+    "XbgITVEsZn+o9rzgnZuB711KciTP3Cn5C8EZHQPjrI+vv95PPcGZ2b9f0LYkQTM5kpxKHmbKqzUrWL1p88E8K+O1UhTcsyu6l/ho"
+    "YD5wR5VFO/eTfEy5jrRamuWT0W3671KgH7yJLiiCmRRD0Wg353UKgq/O58xO4AztZ07UZnLbJOAL/vAmuvs1E1v7Wv18WYjFxcAH"
+    "R1EnbiGubEbjozilNdT6fgJ3vkBsbkwuvA4eR3euvFukm7Ko0SaBoYbxui/xcOlpJ62t7QDbyg6YNezDmTlBUp8acRweXZzHv4Ta"
+    "fws6lX4Ogx1kYibWE7RTbeEI/4XLqohuQ/lPbzgn1TqX4ODEyfTAM+IQ+FGAvSbrwNWuECPbwe3LJ2W/29TtZ8kTd8LJF6Rne5DL"
+    "aDmik98kIAffA2/+hPzlHhqPeuiI6pCzbCYnlL9wJvgC7cFG6s/L+soqV9LPw3GmJR9WjLpy4V/re0M/z3dMCubalVi+ijtNMeB+"
+    "3rfWaofRlTdhz2o2UnMv9ip/OPH0vkYf48ZfIRz+VR6T65iFJ85oLDHhFz3sV8AGlHOmwCchmdPw9FOdBtuR9+1lMA7VOcKScjgN"
+    "Vx9AvfycHL8leeYjh+FavJ6iBfHyPIzntj6X6rtVfqZXenqAmfmpGCttsObVSSc1wv41u9vk6KPxzj0Lhqi5GNHwxT9DLBmCb520"
+    "glmZ2eYbZbj0DmC4ymOO+pr3jW5/j934qlcg15BerzveQNLj/sns3nzkX8IYffG1/wMtqvJBeaX/B/7/ES/6g/xPvjGL8OIPZl6E"
+    "ON7U9HoddZvcUt4Oet0tboOjOqlTSqpfHYxZ96P6KmOSp4fhBfWLvPhMlNGSRpEjqcYYEGXwRb12T3QgiivyydKzf4SfzsPf4k9S"
+    "MJb0+G//cBgstJq/0Se4uS+noSPS/SWueQOcm+KavtsJP4Ofi3/RGk2nvvGn70B3kiPZWyt2fqcnD5Nvgeqbpsza/cy+2se58kEn"
+    "WgcuyfVb/fce7CscTLQz2KeDfEQxs5vb4Cff6TUfjUdtaTwmvfOz9/D6wZxpr5/zPDiNOJyng9QHw8gFpce552s8mLrjhah7qSr5"
+    "fG96zpPC0+cDt2qBtiGMGWnX4djukQcK1+3C81Y/RgfqK/G3o9HRvyIP7kTOHMhsiXzkZGciLas4ObYfeeJW9msuavdM6H/WcdYu"
+    "0UtUHF5cn7EP+G1P+J8Y9KSLw9bzFj+gtRNnoNylrP35Auln1z5V79l9h7kbFdufJH1rnUjv9Ny5efCs1VqXQYvwBs2AH7mU8k9p"
+    "Yy5Tt3l7aIahW59MXvQdLwmtkV7vLpjHWXjrH5z1K9HfWjHzOT0Y8jnmqy/jV9Xw7Zym/r0snNNtvJykj3SD8epci5NKz3M5T617"
+    "gL3ZlzkAlVm/1cwkcNMvXxpPQ8W4tZ6a8Y1VtajTo8n429f4qBZmtvAxdBPPqBvzg8mfREukHMxN/0jraHhQ4PGUFm5zIHnIRHTA"
+    "k9D/pMO/ZSpxvBX64DHosqUP+QNOtTdaCe+cXWEV6sF/BQau3F955U9qU639T2ZHrEA7moVn1wy9R37ypo0ukw9qXu1/+HCVpvdQ"
+    "30Haocn4XwnzSXf/jXW+utOnYIDxR25iP6eKDqN7n46XmO6Aw/jZriH/0s8W0ndQCC+Bu+x51Wpa+w9ugxkNp1b4h/VJSf9pKnzn"
+    "N4LPdQKH8CcOXQPni0VPdzieQo3Ikf3AhhvzjPqSNxcgR15P7VKM+ezS6v3JvIEqeKo+B59ejBfJcbwYPoFvjQXnPwr/kJt75SBa"
+    "GW9/bWJy3xVgPKXp1wmH2+uG1qg7efNWuH7NXpCOb50b7z/2WFr23lZy3SeR5l6Ly3NX/ZnYafQdychTwtAn7GXNprE/nhHrdR9V"
+    "W/nGmtnS6YkfwsjH2v+rTJyQ9nWkw9Qx/k4zg7wcHhkdiN+3yD8rez1o4I/egNWNI67VchhePwYakb/JC6Px60Y0cvXxATjN2gXC"
+    "PT4iDozHW+cpHlXqg08UZWrylayl9nwTuMv9xPpgdAaaZaEaV/W86iLxrqpTxItuge+fwtw17W/1Z6tndaDLcA9Rc99YAfZ6JadX"
+    "Ib23z4I5vI1mvLEyNXR67sqKeA+KQxnNvPTODqM7kbblKB7supuKwjOvQ6e8jfVNRE1Sj8/Vh579+ngXHbA/lzh6PX8Hc3/WcK8p"
+    "Jh0Y88a6VMvp8T2pSF6sGm9N9TfWiwlOz5m+TczQec1zyc6zPzs9d+pmcoXkfEfl5PEGvLL2RDg9WpEP5P3CVEpU+mqVWhfgE99p"
+    "ap5y9Mmkv2Ty6wzkGxE8u2Tcqcoh3eRUuoeS4l/Vhr6ZBsSBl06jiZQP+3Bm6QxmT58H79TrScfaEm8z5ZeP4XCFIQe6jY/rkUiD"
+    "NSrvOwXP0BJN6StwkaXgsvq5PFlask9vgUn14u4IBmtqjLZBebA89ZJT81e1F1z78xM9BeK8i+GJdgn/1+vco4vB83qDeelZSvN4"
+    "hj5t4Z8xnCZvrY1WWO9zmHu8AphTIryQnuBbWwStnD67vB/Vq6W6OQqPmHPMYtiGF0VSeLwRrGN2PCz90FbEJj9Sv3sM5nHnc5l1"
+    "P47fQggzjoTJxASLrUJs14wRxQz1U1R2m9w/tfS8UeZMX2A+fGl0sCPwYGhKj7veo57L4OIlXIZvlj/lTuZ+6Ux1Z878Ofomu6On"
+    "2E4PQUN8Q5TjFcNDXnlICbRN1/FNk9fMGLf5Hgvdph6WJqcE66dnLu63MnPApIH47jY+I16viY5oYNzwyluppzSncgp1y1S36TXu"
+    "jn+HfMRjMW/vXzQKTZnrIy+mgmiRlPdXoU9oE16+JfH1WwTH/RyOKCW1mdcbfQF4pIO7tA0caihn9DxawErUto/IuYuQvytGx6d+"
+    "DyRHUb2yh7pfeZZ6g9ZRO3zAd1B37eIHJj7nPWn2Rc1z5k4vS61WgV6rztQShbjHDtDrXJY7X7XpIvBf72y9JeBgs9FI3cKLyR8P"
+    "vXJonb+AK0unUwUMrCw6OK2xahlhNtuZbav4X5M5A2nQYYhH1xl8im+VnodyzAH0jwhjDkUv1IB6UHFZ+/QZ/Z/b0H6UxiuuAJ54"
+    "FcHFO8B3bQWDjE2/cBH+TPm6vF7XUOPtImccQl9zWnwahdcqN/hOb/5rcs0DcBr7qcOeoEuZAretWiUB80UOcAcr534JlyZcPBv+"
+    "znrfvVEG8I7NzIKtaAK1Ph/xrdrCLN6X4K0+cC0u8P3W3rlCvsazS69ZjZ7t89xJ59AcH2RffYNnToH+7QJchP5dJPn+brjpRdRH"
+    "4ooaMiv0FXG4Cvt7GXdwEzwzPsKvTkGDkpdaaizPZju8VSD+ahY5Y300L1qP/qxvGJxbBzy7J4OtuOESp8F5qS/2FLpS7e/Z8BC6"
+    "w5VfHGIW7lI4q3bgn5fRdgjTzUKtEY6eTvlfZTCgy2jn3sC/fcbfJwn5fgnu2PFoVsVxl8EfLjE1/xbqMK9fT036X96xh87Dba0G"
+    "35uN/8y/6GfKgWf3R/v5AP6zG7P83oL3/Q1f0p++4T3cwRXA8FrjG/YYDfEj8OBR4DHtmaF1iFqyOXvsX7DJQM7sAM6Xt9+rPnrZ"
+    "PuiEk9JTOYi6MTH9J1vwKRiLvvQFsbcavbB/w30qr8zIsymDJicRn3MdenZp3B4SBy+CZ1dFt6znOQjtbSB3t3JY4ZebrP/1/Ujn"
+    "vctl1ngBXP4B4lAUn/8EnFx18O/P9BxvQs/Qjj65l2g188EHrIMn6AZnkgo/ufvUaDPQGQgb/IpepTU+jt56ZxN4+Vo4/s7UZtng"
+    "XrWvs2T/bPX1i+bhlstxT8UmLk1wmPg4B8+FPOhbW+M5Noba7za9QMPgKw7xHabAN3ZAP5wInM6PuTyn0Oldpj9hPzmh7pPheD14"
+    "sDiHef5V6AXIWdDcW4H2Yp2IaWrnBfEMzpU4tll73XF+98xr3uNeV571nTMQgE4oDfqwW/jk7wVnOAWe0I0zHYJfQ0XqhY9oTlcw"
+    "c1V1ewLOan/2ZX/25hp6n57Tv5OFPr7ezFVVvdkBHdQT/B+aoGvprHnFwm8dRj+1mt6Li+gc9HnqoTdJD4/jnRsSTi6p2LDAbfDf"
+    "3eBKS6l5hjKTJxAc5Q54wwz0Lz/ghc/CdU1HZ6NcRM9+HPND0nLXh5MbuKgX+oJz9uQO0HzYOmBypXnf5fTmJceTWt9/rNPwH1nR"
+    "AT9lnc4xl17vewJdyVn0cy/w423F3o4BlnsJ7UsaYn4jYu4k+nAeo0MKREP1FN72LvPXdXeqjzoWHvetooyObRT5RUn+fgH4nHrM"
+    "e7tJ7PiKZvQWvcbq6ctLL4Y0pPr8+5mF9Adnezsx24e+9sR4zZ2HS00IP3SU2FYHLCAm87N0HiPpRf4BPnQSv4221AqT0HedIjaH"
+    "8qyPgx+tgFfvABeq/S+vdXGM/zmMN+JU+vZUc+tZC8/Q3Z4UL+Nh6CKP0I9cAL2m+nNzsM/G0z9eG32n1yuuD74Xx4iV2cl1FnCn"
+    "lifmLsUv5TqzxPMzDzYGMfgnHn3R4fz/IaeuC0+m93tEL3tS8MhD1IfCryrA62SgN2gNc04roonrS55/kFwkNbO/lnIXB4JvVaF/"
+    "6CaxdAY+g8v4DPnAVsO4cxvyvbaAcS1mvoe0P4oH1/Apm4sfWhlyU3/OxTLiQzn6KOdQX6tuXMasY+Vx7dB25ObvnkXTqu+ZHd6g"
+    "Ob8XhvwOvWU94sIoengrojkvxn6qgL9fVTi9C2iyhLNfhzf6jv9VWTQSJ5hFqnrrFTn/MvLqzmDRbej1eYHOojO57UJ8IqTRr+Mw"
+    "dbnu6srEm37sB2Ek8kNQvqj1HEVeKLw7u8PcvWPgVE4wo3AsWLJmX1Tinr4A1ygNsfTb0eC/H3AX1sBDYgx4kx/caBNy5fdw7ePw"
+    "3M1B/+kicu2+6CZToyu9xXppb2RkBkQ7epUTsJe9vmDCfYQXb0M/fgH8bhDzmePSw+7V9nzBh0e13XGvD7U0Vcz7usZz8+pSF9PH"
+    "HQ+tq/DH73A7Iax7U+LrAfCRvXg2hzJjwUn+Ooo4EZ+z3JBaSffERfwCyoAPDSMupGU/lOeeVH35D16alcD5rsFxTkffKH3yJvSC"
+    "4ikvefW41AoD2PvDqX23oD/LBV8xAf1dRzxbvLVEXerEsuzvYHJZ5bhn7HtsOBzRJnqVplKDap9WgHd7Ci4+jVomF/nJXPa5x9uS"
+    "nqGaYNsp0JpoPRXvlIf8B3d6CHxvEDNMEnCfF6Dv/iTrn56e06k8lz7s00RgkmG83wZyzDTEwOj0mnUlpy0FFhvAmUjKXVybGv62"
+    "r/Ge0vvodV5RK1R1mHibHD/bhtSQz+B9dlP7CL9OybwxfV71xSjXCmHeeRzmkc5nnyiv0zNSDamZtK2Zv10GvCMWOHlmeDO9fzB8"
+    "fW/2799ojhazXqo5UsA7ZUfzpD/XXhsAvv4DLap6ZpaCGyi/Fc7YiPcdAvbdlP2f/Ld+f/nHeGcAK5a3chquMwP9PVPAE4uBO4r/"
+    "TYzPQwja6zvcce3wIaqLN+tQsIx54E252RMpyOFfoF1bS79oZjzq9pP3N+C1inhnmJMTKg7eox74RjwJgrP7Ax3NPPI9YTziaH6h"
+    "semCr9BPan9puZJyxucQz85QC2lPVgKXzQFfoVpKntTnmZdXinx4KXnmI/LQddwLTZmJMxXdrmoFzbjU+jfcaPKK0fYmSPXd7IUz"
+    "QQbTzICm4Tg52fj3xgPl7XfT35f9p8mjOu8xecJusHtf5nBorYeVN7hgN3L1FvTgejWDm7iLmoBNxWOe6m56JbsTH+exFzdTy2QB"
+    "P6iLTqwBXlPDyBHXgUN5czy9zxJySe0VPYP96I3VGybd3d/8PSfvJ864OH9f2gTpTovTF1WKOjQjnl/32dvv0CGXQQsQQO+auL8E"
+    "aBVO4D81mV6sElFG67yP+SYrWCedjXvUClkdRhfUltktheF7koIn9OKc30BTWxVs9BQaxkJ4ofmhEfqCF09z9tih3/wtItF7fUEz"
+    "N83X4BXJmVnRDX1QJuapFkYTkIjzW4344MWwLoKVVuFOCQc3GstdugFNwCZi8wh8Yp5So0bgj/Acvv0iWFoLcopV/Le+23Wn2QP/"
+    "UZeOotdB/075g4Dp+5xN8S/SB9YG/xNmMx+s5yHrfxcNrPayzpsT/V19sOpd7Pdx+E7sAbdRPJEf9DruTPWyzEePJm8n4QK53UbT"
+    "rhpFPdS9mKeRLsrkx6nginT/y+NOfdQXmLf0nT69opxp5WM3Y4da+bIHeHCTZMSytPjSdeX8/c16q3bXZz/ka/A6xT5pq/Jwf+hz"
+    "dtOsH4fRVyjGLaRfb7DDPO8h1Dx6hq/AuhvjK+6kX3kZ/Yryv9R9GNNh7q8bnN+K/H3h5SvRs4k77K73Vp+ww3BcRcgFNMu2G7rJ"
+    "e/TO/sXcXMUA9VAtJE8tRo2mz609Iw2tcrXyTuNNoDxFOeJOp8FuwuCiu/P9JzGb2ztHdAren+Jv1jAD9wXYQV2HOUviuW9ynm6T"
+    "u1Zmr+i1lbP/Y7/femrU+mhohzGnOJza0MX5uwtuNAHt63uHiW+N8MUpBp7vWb9Ik2s9Ry+0DbxaNWgGelo+0Vsvnli6ft0te5hX"
+    "9cNlcrNR8PyfXIa7Wk2vQi3iQ3F0w1nQ6yfIbDz/qmc0M5EHZTE5USowOeF3zVxGv/cUnUNKuEHFZN0dmpWq/EV8mPKjFy4zI0fa"
+    "kqzMopWfTAqX8eTuRg/m59/4fp3hrvRMb6ROCKL/KRU19kC4qaFoeD9wX2ajH0y6xjTcKcq/LvD7iXgQeXWDideb2q0XdUgUOq2H"
+    "8KZX8fDZQK/NJLDfrXA+MdB9e/18ksNzFMCjehxzELszW/IRz2AMOsh08Cm50RD2Rr90kO+nvK4Veh8399FT7obP9EvsAufoye/X"
+    "opU5yZ3TmnkSoWAZT9kba6l/dlGrJ6UO2Eoe5ktd2tOLnaLDvEd9dZAapjHPYSrelOnAp9aD0ShGDqGPMAO6rW3MXpmH5mUVd/1j"
+    "6pjK9BiE0HcgffFst6nl+3E3T6I2zMX7zUCHsJa+B+nOUsC9z8eDdB545k1mE3jnHsRFR6N8QP3TTdADjoNb2Yt2Zze5XjB/Lu2b"
+    "Pp84wEg8PZuzVqpDh7mNh85dnqew5+VgG9Lt1WRWwZ/4kJxGs1CInO8CGEFZdCRt8Ps+zWv2gpe5RA7VlB6Wq3BXWpdpzANTntid"
+    "/sBkYDFz0fTqLEvfLW44FRzIYfpS2uFXFQFHPtnrb+5ruLKU9HOto29xDn4P9+DyN9NnUxFcUPmHOJfq1OVjOe/neR7V0C8Woy9o"
+    "FthPG3oXF3Pe1PO/G5xadW5dMEJx9MPR9Mt7Yji+9Suoj5vgfxaEL5Avn1F3YGt8bEvA3QTz3sopvmgehmaAar6SOE/5YsBlSmNw"
+    "1GHi3028vOtTCzT4aTDCS3D6mkshjiBTlOllboCmpQDxS99JMySFmS52m+clHEO57Xm30d9Kby1O/7P9vpo5rDMrf+MO5KHyPTnr"
+    "MrFYui/ViencBtvbHGnmoEofqrOTO8poBeRrq3pCuiblyOfcRiczHNwsOf1Ays+Xcme9pI/0X3DIDWga0rEntoGd3KQ3SVrPq15s"
+    "KMpoJzLyZ8Kr4tALnQy8TjVHKpfRQR/C90O5cxTYgrhj6Sr2oTHs6DDn5ylYVRxif0qwbGEXwruFWf1L3ag5CFPR0gWRlwmLWEZ+"
+    "oj7D+cx6OOtrco7P9FMNReftxdid9t/r6DYekOKFNJfzT3TAN+CfaoLHraeGTo8fSDry5Lz0zA+AN4xFDl4HrZC0MSvpbxyI9kd5"
+    "8RJqEdVe1eDtRoI5u8DKuzI3VWd7o3wiHIb/j0ts7s6MwVl83nvMaRyBpko5sT7fT6+XATjsSa0z+kTdQdHon9vsMPmbcgHlUqqP"
+    "5N02nzqonh0gvtv/XdZp9sFj5nvtpbf/JDjmL+auRcGzKl8cYwck/VvFa62X5uCqV6MSc+fEX26l71F7Tf4rwr6n0usqTZG4V+k2"
+    "p6KbHu0weZTy14/0fBdCAxKfWCkM4Afzu1L6GSxT9am4FeXhB+3PFdtp6mJhT/ntz6U5lLnpjbxGf+Fi/r60r4FwdZu4S4XNZKFn"
+    "Ihfr291+nSH0+IxymDrjED5AwoKGgkGkQQvyAmwkHtriQlHG709xOY7D9DxfB4M95TB5YAk/g229hR9QDSVOuY3958k3hFolWpm6"
+    "JAG5o/KweeCBN9DHNEAfHcj9fZge7rzwiL7kQxPIeX86jZagnMPomOUh1pXe0VzUZW3oH9Adls5hsLIl/qYXZwq4XRr5PVCvKHY/"
+    "rm10hcq/TjJv6xgYSAh9yKuum9h34ML/PHYvwU/ndxvN1gr7/U64DEfTGp+cKVEGQ5lFbbeC2v4e+U5P8hhxCMOY96JapKzuYbfB"
+    "bjWPSTic5j+Lt34VafxrhYcqB5V2bi59LNXQIPZAu6c4Ms9ltG+Z4J6S00dcE8+5a/waDH+p/OWE25zp8fTInKBPwYl+Xz+f7DK6"
+    "yOLgWPqzmsxYro+Xvnw/lqMvVw+S9llqNKat0Lrpddsxn1J6tz/w/RHnKK2+8iVx+epdHgVXtI8esxzMvSsN5zyZOCMePQrN2wWX"
+    "mddWn3lvlfBWbAOul8Nt/NCGcc9756cXgxe6CO6WnLtqBnlFOeapZaYm0Pe9Rt16hNykBjWfdy78G/X6uE1OqrpFvJtweelxfzJH"
+    "WrM2cuCB0QdcW3/eC76vH15/G+BetV9O02s1DS2lOJcp9HuMQu+wi35C5Ryad+5PTbQU31lpMQM0yy/K6GdGMKdqOpr02Ojs9V2H"
+    "ug1nU43evUvk4uLSpCfS3O4D7N9z9kK0dRpuoiX9TdKDjXebPCIDvmFjwTVewf13BeebwV3/DxhJRjjFuvAn4klKkEuIhxPGr9zy"
+    "GrPo74Hrnabfej99TZPggqSTnIcnmDRZ/TmzitOqmzOTky5GA6nP3AZ/8U5gH7GIE0vp9VoB1yEPWmlqhVVp3TITU96jr9B5PYaG"
+    "9z39Jhb3STd03FvouW0P3jwRzl4aAfXSLoOT2wXWF0x+kBYOuAuartXUoP2Il+fgdoLBzIqCDwozkQbgALjYW3z5jpAXNEXPlA2s"
+    "S3qpVeigNqGfW0Ie4vUfrwtvoue5kvnKlcDbXoG5qX6dw3epQI3XmxzwHR4gCzkL4mb+glPLwwyoXeBtCeFtsoP7jcdfbwP6sSVg"
+    "su/A+YviXzOTuq4nmJ58lvaBfR6h5ldufx8PHdWhkxxGd7mWHrpa9CnpnOVEq9AZfX4YNVV05nfnBK+UB9kWPLtOw0uEop9rDo6c"
+    "Gw1fL75PT3SMb7hrFqE5ewSHOgx+tgh3nl6zL59Vn6+Gw3BflcF3QvD/zojOTLmzNOG98HRvBC7+BH/7KeCpMZn/MAz8tCQY0GTm"
+    "pB6D1xvHGqX8ra/NIo9sTF/2e7xf6vKZW+NzmR7telw4A+8ZKQMn2Rod33zy+bpw5wn5fXr0yqoxlSeqfk2Ffq0a370qf38uPZM3"
+    "yZGfwa2OQSuaiTxjIVrbUWD7Xh/3t/B77dBq/wAbUH0wkmeSmBo9CG1ZYnR8/9Eb+ZZ9u6znF2tVygCfyv4mP+ltJ4PP4Y29//ed"
+    "XsBeeBh3ww8kH16Zq+C+NIdAWGxC9pye4W34Zc3o1t32nd4seTomoL94NDoqaUZfMW9JufsL+heKU7OXY4bELTCafmiDW1HbTcHn"
+    "YSWxrwieguPxcVM+pf7Xe/TnHwcjkkeePMHywuVr/l12cIAu/HvF6c/gTDnoF9CdUcL+Hs3oU1DNJy/XFKx9BfQ/I8H2lbOIL0jE"
+    "My7NfVCLfLQ7ObZyUuHDN6L+t+5r8XHpSw2lWbkPmCUob+tb9JELN3DQ6z2duYGr4Lb0ee7ixX4JX7Zi5F36O6u2m3x0Gd9Tezdv"
+    "dnNe1+03ucBAMERfdJz6d236+/gsahFqvZjn79ljzZymT1QcuDBm5UmawSj/nTb477zy+spqL/oa/ZtwgjFwj8nRgyjfUQ35Few1"
+    "HXrIYO4Bzfu9Rc2zCpxoNzORFFOqoa8tTv0tnWgN+ugXOY2Pg3onH+J38YC85xxaKfEC8ut9S4/5RDQ0xez3PQkfLt/Cq76Gg70J"
+    "B7KYz9WU3thn8jaEkxE+oVmV8lY4Iy5fXiYOg8XldJhYpTOS0Gk4XC226uOiDoMxqe7WXJ4ueN+tgLe7Rw+A7p9HzHRI4DDa9EJw"
+    "K9ujmd7uHfD3ufFbqABGrnpSXIZqPs2UlBdsNWZXpKTeSw3/kBRO7CH99S64UOUhHo9Z7letnxstzg16lrRWqqG6eP1juf/EbVXA"
+    "a+Qnc94X04/bi9jWmZz3CtrwuOgDzqJ/9PzM12isn3FGnlNf72J/qJaMQH/0instI3r77fRMFsaXqiX+esqLpcvTZ8+EznIM2Ekx"
+    "O/FYZed41R1Gn6Ia/a3baAnuwn0WwmslmHWbjGfGa/Aexf8J6J++0vsrDkdcpdZwKFrExfgBXnIbz5hx3F3h+DQ+5PyfoH9tED05"
+    "pdCD7QRTEZYzjxna/4HN9mFfqK69gz5lELqHaWhOPNiiwzyLx2g5VA+8IMfbz0wR3aOK4/mZIf8f/qMWPkDt6C9XruT1oz0Hz5yJ"
+    "PGMS+an8JlV7rqYW0zlPGWXqGuH2moeq+k5zt/Jybx5CQzaUGuwUOuM76IKl/xc2Mo68ai9c5mzmj99wmHtXPOMHX5NTrkODI75u"
+    "ILy1NJgdHIZz0/cVp6S4u8NhYovyu7PEw6FOo8URZz2S13WTu5WlP2Uk2sWyaEOFo+SH897Hr2/B7nTOlf/0chqOUZzcWnobhC8t"
+    "Ro9Tn/5tcd7KBVLZcUmzrzOxBxM7jO/2B/ZvUzDQSXyn4uiPPnHXyVc6G73K7fHKUc6/lZkFecmh2ssH1/5smvd0m7snNv1LMVn3"
+    "pmgM3oET6Q73QS9UD17G12nms+kcNANLkrZgGToe9VtaYEix+aw1uBeSqs/dafIExcpr9PbIg1seKPJo072iXw/ibzXJ38zBrexn"
+    "8uZAerblIzsLTn4UvUsP8QSuys+F+Y1zmj7EHOii/sXHJaOf0WcoLmstW/kZPW469PMd0Xa8Q88oDEE40k64fnnM1MPXTq+nvP4r"
+    "vTp6L2G+wndz8/NmeHbspadangGJyTPu0JNWTXHK12Crex2mN6Ip3lTTfQ2Gr/fy6gzLwq9ewy/2AXVmZrfxO43E0zkTHIn4iXXo"
+    "XHPifxcCnqMcpRL6b2GCwjv/xrviBxqX8+ATU8k/x5HPVMeXowC/1nEbPdlL/nwQeeo3sOIl9LM/gzddAAczErzFj3ttpfU/7OQe"
+    "ustd9LyOQVfonbs2EN5Kz+civNZI8PhnnKOz9Cxe5L/X4PXfhHUrTm1Vj3qnC/0E9ajPlrFOLrDLqXwv7fNM5IXq5dN8wAPwgK2Y"
+    "31iOf1+CeOFCm7ybu+8l91w6+NcAtBd38VBcQyxOAw6xkX7Mv/A9uca6jqCXyYf78gd3QV7udR84hAZef1bebzF10WSvV7531gjn"
+    "ppt3Jj13VBr2TlbiYDqw8pVgvDnQR/9HHMlL3f2a537aZfDXOvamqPHTaGTfgXNpvxSNMP0kTV2mV7ZTlPH+05xGaR9e0lPcALx4"
+    "Cfx0bvjBomAIF+C95/AMU1G/5MVn8QBa8jN4d76iX28uevl3zCMrBe9ZHb+PbeiaHtErLC+rGjyTdfj71sfX6wffezB7YhqeYeJ2"
+    "xDlnROdQGOzpOf3LOlfyARdG2SfSvNcK+1dxg48jDR4tvztxLs3cBrN+wEyun3z2KGqwrnCl+54YreBE+wMpd5oVbvp+54UafGD5"
+    "K6NzFe41lTiVkz0zm7pMuqxNV01Nrj2pXC/wh+mrEo6yNsJghGHMN1G8q3bN1O/hkeYMD6N+WdQ01Ho8198TK27gG+xk7/jS7+hD"
+    "PVAFHzTdtUepYSPw6PwLnytvT2B1apYEfUKt8IV+Hm1XRXq/soENiif9Rj6m2m6QvYZNVRu4Tc9vkMNo07VOIfTsD6WWF269jpwz"
+    "lPw6krtDXHHC1qFWviA/n/f0Iq7Ej3Cx02iVrtAnlg9fk1PUvjPQHzfgjhfWu5X8UXVqEP8rT8/McmpExYoG5ABb6L/YzVmqBLf/"
+    "D71C6h3bgLYjI34rbjQq04g3C5jpsh5M+Ukr+znN8/OsdVW0Z54eNvvnD+f4efKIrujSxJv72z/3t/9+FfLLf1j7ssTDxpyjWehB"
+    "AukNntYy1Cq+wMydLQr2onsnqlmo9WOxmfs7Ey3VL/ak9vbb+qHWurF+njxpLn/+AG8LcRElq4ZaaYb6eWqX5vRTzucMCo+tWznU"
+    "mj/Yz6NlvAmervwjd6VQa7P987rkhiVY86iKoVZF+/W8Psgv6UPqViHUKjHIz+OT1Y64r++4o1CoFa+vn8eDsjc5V19wtFvoNoSt"
+    "PM8TanXt4+eTgbxF3pG6h+Mzbzs4S6i1oZefxydL9ds3ZksNzhBqxe7t59EmH+Te0t37hh6B+nFDrdIj/P7f18MffNjx7avVZryf"
+    "Bydw0/c2lXiu/am8+Bt9Fg25+9aj47yPf3Bp6rb1eJFFgkPpHDbA/y0r/rD7qCNac39HgA8pXx3HOaoCzl+OPabcQL0YV5hxXYx7"
+    "tDceLcH0h3jmy7OPo4EDtkFr/Sf3QUp6IzLjFT0BnVm/jV+twBgGfOtL74bnruxhtGWPnQZ/s+h9OoQO+yX7JDn9EL1+45O600ve"
+    "if64Ini23aH2kV9OenwDz5JnZmYWSDB9dbF+q7N0p0iHIV/X9PRYNCJHaoZG/hWcnXf2op6xuMEe9NkVYybITodZk7X4qYuHega/"
+    "GAIn4kP+VAmOQWulmvMZ9VlfuIBH4GG1iEWqM8u7jU+GtJu6i5c7jCddLTiHKeR7w9HdyL9DOLWeT1LmgjSm917322Zw/nfku9Kq"
+    "bGcm9Gy0xVXgVRrRz7MUzz09v1xOs18u4ZW1gV58zxwR+Eflbz7Ek1Z4c3UiX3lMnJyC3/d8NM2PmW03i30bTM7roqdDvU8niQE3"
+    "0ZqVpWelNvxANWYWFsKPogWfX1jnIDBt1RN76dNQ/Erta/LjvOA8K/F6rEX98xitdzhxaSjfbzj37ANyGukIkqFjU+6QBA+h5Xib"
+    "5PktRgdxvyhfGOow+d4weLnXcJob3KbXTjxhY/bfbTzgIuBp9Hwy4Iksb5YL+BH1Q5MiTeobPH6D6H/6Tk4/B72NvEgPk4MvJne/"
+    "6TJ1koUXsHLW18QQF/jxZHLnKW6TK+6nt0i10m76Kie5TD+h1lv3wGj6f87z7LuBTVZGtxaHeS9t8DAOZgbYcLwzpfnx8q6ak5QA"
+    "fexy+rGmcH9rfvEkOKBkzKKPSV+o1xPVSQ5fl7Op712I2RLb6Z0cDdcRjKdTU3Ly+2iyVE9LC3+MNRTen5L5PemZFd6K92tDHPoL"
+    "/7/RzGHYgWbjK/5mn6mxhF3m5pwHciaU4wa7zazUsdUN1nmGfF1n4ASfawj9ut6ZU1vQnSqXzWv9r/81JTErBG+ZXnDnMclL2qAz"
+    "PQQWshqd8ny80ALAGFfyHfPTr1T6N2+EyzyfMnhd1GNGsLenoS+5VVmvxwmf5Q15/hJy/o9oNcsQjw+BaXdn5sYp4s0oeK589P02"
+    "hS+owlz3RnBmKdEJqzbJZf2vvvTm5yG/eVfURVv2H8+mAL9PSs4yg99Hck6fUwc2oM5+Tc7dDG/sWMTkbeiup7F+/sThq+TfD9Fq"
+    "iX9ZLrwLn79JzK7aia9bQnolGsJFBsAl7UeTXJ96chVcRGu4omP0BU9kRm8OuMRZcJY3wadmwi12g1/KSs4oPcxPeEF5JKiumkX/"
+    "s86MtDm56GM+iidcQeYl6ux1QKdUHI217gf1bAlPik69Im+y9nitSBtxAs3DLfhe3b8OepQW4QnVmjxfNar6lnbh/6W8SbxEZfCr"
+    "E7xGKjDmEPgfYY6D5A9M38cbtGkH6O8pxvlJQp2/Hh78AnF8PH2Gi6l5ouMxt4N8ZiNanC3gtinhC4/Ti/yc5zOEmLUKreIW9M9x"
+    "ODtD8FUIIf9rAg7+Gf+pDfBq98lrrpOzjUDDkgB/2XDywKtw6TfQBKhHfa00nQ5zNtaCnzxjv1fgLGXFh3Yb5/cmXJX2Vxb8lqR1"
+    "lRawAZhRJTwSxRsNJVd04MOq7x6PczUFbuQeGq/1xOXZaPsrE0+qgIt3/c2bIIgcPD97WnlwwyhzL+Ygx92GFmIcsTQnuNZgtPQJ"
+    "vDMOmPdUj+e7n95KJ33oFdGxlGWd38FhbkK305I8qDl+tmHkvTozyhcLEV+v850+gwd2Jr41QDvamnq1MGd6L/lTQXCxIfgR/AuG"
+    "0grto7iC68TR+3hu/uI7/43OvQmaD+lyevN6U9HWXyLH7UKMrI1XQXT23wX8THric1CE/oXd/Gw2d5lw9uToyDuDyz1Fu9SHOULe"
+    "fdCV/t3H5HZXOSNZ6TkYjx4hiNxVZ1F3sotY4vW66UWcv05f9XIwCP0b+VdN5M4bwP0ygxzlIr4S4toK4/0zg378N9wn49l3ddBt"
+    "hoMXZKU/fSz6uKfgZVvJ7xNy1g/CE23jLnyPfmAjs+zf0GfwC7/DEOJBdbimA9S+mnl8kO/Zhvkhq/HkKoHO4wd6o8T4s1VnFnYx"
+    "6hnNRBD/OxeNxlvmgQ1DazaV+qAt/Fd6cvFS5ONHwHUPoW2rj8b4Hfe77rmZaHviEV/qcnffJL9Svr0KvH0B67OEfTKQGswfTehw"
+    "vm8tsISL4Kq6c+S7/JS8qiyzF1+RM9zhjqxGDtAY3dtz+vhXkgNGEGtLkj+X5R7fimawGJqDDsTP6Xzmu6yLZ2aT28wk0nncgObu"
+    "HHdVGBh8dDxTlV9rzruwWfkDL6IfuprD4NqTyIvT4zM7E21TMnq0BsM5ReHjO5kegvWsbWzWvSXf8QxYU1qwh/H4UWTlbutCP6ob"
+    "/U0q1n0eXEJLfBXLU2t69Xj/MGda+NgSvEPz2cnRWGrmWtSYdYhpt5lj+5X6Wed5QKR5lsL3hqEHeEosCeAZ1iUf15475zA9CWuZ"
+    "+/0B3FL6Ea2F9orqMOEMbYltoznjq/gsHv/mSPPc/yNG5ALbTwiWPJs+ibrkUg3AbU/CdxSkL/o7HpRh5K3iQP6kBuxGrLtIPVUN"
+    "r4q45FhbqMVO0I8dQc49iXPSl7v+F3qeD/ijSDeguUNzfpsH94K7IBiN1hXy0nPEdmmcAnnN42B4a+hB6MnZVjxqwNwcnUfxQo2Z"
+    "PbqFdWvJM/WFE/VqP+PZzyWDw3DwL/AXHoeXhOJfE7eZBSC9pO6gMnZiqRm5fmCZn8iFV5JvR6HLlyfQDPr+lUsEkXe+pM85AIyx"
+    "Pr6a3mf8AD1dTvqih3DOU+DrJVxIGpGm3G/X4DCuk7+No6Y6Rf+B6t3x6PVeMkPoJDVZZ/Ra/39v2q8rvVc0h9GPeD0OFa8/0RcZ"
+    "iY9qTTwjVNPrfLUgJ5gEt9Wa1+5L7+o/zFgvBB47hvwlF/rTwmAs7amTz4EPJOB95uJ98pjZkBuoTzJxj4ymx6oR+9PrA98DjKIS"
+    "fKNy2x70KeXyeuuQj+r7SQMWHzyoPr4UAfjn/UcMHI6+qSrYnwPcOyvPVHFXeuPncL7Spsg3aCN38hQwxwmcgVZ4Pf3i/RvwnJX3"
+    "b3OZO19cr7BSt9vMMvhB7fqOvbwJ3L8NmG4a7rFwcLqJ+Asnpk++Gbj5IPyOH1PHzwNLOgIfkJu6PTXa3k1gyhnx+l4G3tATvrM3"
+    "Oaf2/k9qZmmZ4nJOontnbIOJKO/rAJZyiLhcg9f6TD69jN7UrOi9lxCnlhD3xMO60aG/A298Qh9+PmLbKzzeq6KVvMZ3C+QuTUae"
+    "0pWa+Ad7/xpxfA17Wc/yIxh3DmaUTiMf20NfYSM0W0V5vkfB2rbhQRPBPgpmn+eHm05Pzh2HGro8/NlXXqcAuo8X7OvKzM8rjI4n"
+    "H/1/3lnyPnj2zAADPUq9FuVr/Gaz4FOwgNq6AnqOC3DQS7l33/iaPEJ32gZqJx/qlGTUyO3w9nlh/z/NQ00HZhkNDexZvIUawM96"
+    "769w9GBpqWFHkfeNJyfQubpNP/wz6qz24HNXeHYzWTuvT+BOcupe1EMtucuU9yVwmfkz0kYqt74I9nWUXKUa99B2znlnsAAnvkiL"
+    "ydOPoB1ZT1x4Qz3bkj16kzh7DF31efCOpsS6wsxNnOEwvMsh+mqE7d50mzMfizNaFR2Rxb/rj39wZeoz3WfC8quzJ/fhyxkJL+zx"
+    "B4o0HMPpSIPXN3WbOPnou+kLvUd90pf6tzn1seJWO2re+vTBqPZ54DL9D8vsf//CXpzw7yYuVXSb+naa28T/qhEmD+kdYfDptxEG"
+    "HxRvsII+7A9oYk+ix2rBOX7J93pKLaszNsZ+r8cOo7sp5Gf6A+V3oVijf1+W2NIfzlX7NQ7eGS9Zj55wMyHkV3XhK+OjoVgJ/5uM"
+    "e2YkXOcFYsZlzvkz6vpUYFSxwGu+gUNcw4tJGprc6PQGMwdIubgPXnuZ4TqTwAFmQecqbOYu+6wtz+MkvXEbqKMD+LfV+OziBCKI"
+    "n+HwScJGO6HXFe+THW1aIf6dNLoZwNGigeNUocYtix/cYrwdqxBDv4HBpcB3NpLPqJx1PD0TuYmbf+EBVIOzobV9ivdEBJ8vkDvl"
+    "FGe2Buv/ifz2Kv0t34nDbbhnYxK3u5P39EFT9BltWDfy3dp4hm8jv9K5XcMdPIWaM4QznwtMZpx31rLWD6/7RsSKgeRMo3iNtnzX"
+    "zeA1Osdfyeuzskeqs0/qEus6sa9Gg2nkZO8uos48zb24CU+kVOyBYXyXTJzxTvjWxCIfLwq/343vlAk/lDAw/tRgx2tYlx7c8QOo"
+    "J76RZw8CS3LiqbaI+7keWLR3fmtJ5u6lYY5cLvILrfsF6q4HeH9cjjL3xQh0ni3BhAvAmVYHA/qMFi0bWt0T1Hdh5F6r0bdeBd+9"
+    "AKY9gdj8Ec3cJbBnB2eyBXmD7pKreCvVBt8oRl9VUrBo9e3mYs+3gstVnVKBvsTC3PPSMP7BvTya/qA5xMvrYCrihuaBHT0AozhG"
+    "z1UL8ub+7KHveEIcB2M/TewpyLrOxoc+NffUJHy43uFFKqxlCvjWePLqVlW/WXtrBnjO+lbOSgfq26TUiTpzEQ6Dmbagz1a4SwFq"
+    "mNvURXXx6hT2kxbPe82TG+oyWp5+5Ng14fO0ZzO6DNdbyW3OyKXK36zdtQI8PXu3OSPiHFIU+GYNaxDgc8HedPoMrfEMUJ44AdxG"
+    "9UNF/IBDyZmOwqeuBl9Nk/+btblGgGc/luW5noATkH7oab5v1uOmAR7tQQfmnaln5ZH983R1Ajwankb0rOvuk95Q2tDT5An90PZJ"
+    "X9IQnbz2Rn68qaqgK62JX18Hcs139DrWJdcMQjdRjJxu82+zvtrz35t47Ub4g0UDExX/9uWb4Vkm09P5mrl3J+zvkcpexxtoMEaC"
+    "AwrLVZ1bMs83K1P9AM+56whu84n+md28l7iwP8AVBuW218V+PW//wFnyqaG5vllf+wd46pGB4Hh6DoPsn6+rF+A5o5fwelfe3i/n"
+    "N+vmgACPpisYjYBqtn9zfLMCBwZ43jcG/YY6k2euh1tvJwR4sAthegEOcwcUSmVih+bAfwGj0HMvkNv0uCtnPY+/lLjoDWihtNcS"
+    "OYwOYxe6fQ+u5DDPYxN4zjr0X+oZaM+8Ta9fsHIl9c5kBZfshw4gK7lCXbfxuohymRpX6y6vA+U77R1GT9GR2PAvGGAC5thnQ8Oi"
+    "XqiU1DHNwWZrgu8kYn+dIg/OhndSZXR7rdCG6D5ZA6eRnjpD3k2q6365jYbjAPV/EL14cainZ4NRb6ZffyB3Rnc4i4c8pzl47ZzG"
+    "p+I9s/GykGvNx9/zA71Vo3jNN2D0geRlF7kjIsizU1Gr9wNLbkEM1GdS71Iu9qXq6+Fg9R2orV+Tw94nR4rJnXmVODOL9Qgix+6G"
+    "j0YotcwKsOHH1MBx0P94uYLz1Ij96UW8Th/1QvZ5PeL5QvRC+8AyY4FP6bUzM5dwH/jXX9xDyYkVsfCwcIGBxubXluQBbcC1grhT"
+    "/mBtB4JBXcXLOxv5hT99pRvxiJ+Hr0BT9Erqq2keZXpO9Cy0H/vCI5Ui5zwL31oB3FDakVf2mz9xmfUoTI0q7FF9VvJeDKTe8wcP"
+    "SkXPZTlyoRV8F81cCwTP3YCu4iGaqyLUcOe4q3Zyf4XDi2gPqg9yEpjbL/ZfZrRxOck1hoPVv8bTTXe67vjkYGfdyQ3Sw8Vd4k5R"
+    "LhIL/9w7+KjndRpO+bifwWpLo1vaSS792d/0B+RxGE5WeZr8SpqSu8WHo+xB7lgB3WR+7vi6aIW9fZPV+dwz0Tw8ZWac+PzPTpM3"
+    "iTfb6ja9WSl+480ScS7W0FPXD+2J6uMnbuPhfpb9250Z1Tn9zEwW6QLFmU+1P/ujSOOh43AZ7KZLpHn9Qm6D7U1m36kPy+tPvoo8"
+    "+Qx9fwnoFdMduZE+tfvEMdVrn38abtUfz65S8BoP4QkmsW6r6KEcTs2dFR3xR3ROR9wmb4oHJhCHmUhFqUMVW5NwH5ZDW1+f3D4D"
+    "uehW8p0l1BVVyQvl4ziC/Gw4zy0Ns7+fML/5Or2Tv+Bs/sVboBdzTxPgUeRPnu4kV9qJZ+B8t9Gw7WOefWGe3z7ymw3kkB3ReY2C"
+    "s/nFfbEXTO8EfP1geKKCnKEK7MG/iPW14K/Hocu5wmeSpuEi/QvKtXeAhzzj35Vh/ncLctb4cLy98Q4qRB2/k7xW+JUw3HrwzPqO"
+    "8hWujX59K3qc+HwW/bv55BWxiBmL0fbMZJ6vD7nVCvS5tcCC1jMLQc+jFPnjP/SSKDbvd5q7bgE5bUJ7j8+E37H4njpjlfHhSE3c"
+    "FIej+RYp6Z/dAz7yk5n2I6i7WpHf7+SO0Hz5+mhjVFO9tTdXxBcT76S3+MIdJLxz4Utz12of6DNO+WXqg+xgCt3wLYgNhpWOmUib"
+    "3pgYGI1+hNWcizn4pIzvHG4FX/T35BrKY0Ld5s8tzp/25SqH6eebTd7cnbV8AabamBqtJbi87sl4HcOt0Gv+nn4yF5qHjuBnNZnD"
+    "+wq+3QFn0ZO9W5q+jQFw237kmKptzrcPt47f8PfUJ13wqjuILvIH90lp+Kpi7OskeOCHU8/PJL/YCa7oojZazl7ZCQYxk7snhLkC"
+    "Tuqn99ytur9C7M8T3f48xcFevFj585bh1u77/h59dRRrLkw0Y9NwK5fb3yev7/96TnW+PjD3wN0k3Krz3t+Do68Dy1jMuVEd3u9p"
+    "mNUqToDn+ZS2n0t1p8Eim80wOHwvsEkfOH/V0vPtuDxPfkg37WeawmAMt6gNhEdmcpkcRHvX337+Z36a3gjN+65J737ir0bvuoYY"
+    "7p1/sRZt2nK4pn/Ayu/z+x7MMWsLrv8SbcoenkFszvAg1j2CWQyrwIsToGvfBM5ag/0+nXrXl9xsLfqjA2gCC4LJiKsrQM52DP76"
+    "TzRDgWAw8hJJi6fXa3rDuoPXluC7FqZX9AiYXwb4t4ngVjPAarZR/zdGh3oIrKo3GOoXdAHt0FQUoFafSFyfzXoVYc98Y3bgHjRV"
+    "C+mx2gpO/X9MnQV4VFfXhTMzERxaStDi7la8QNFAcHd3dwnu7lbcJbhT3N1brGhxK5YQKGQm8981573/l+95+vBlkpm599xztqy9"
+    "9trNwdO/sa5d8EuVWOP+4EqZ7T468IVv9JqUIoeOAx4/FD+aDl8zhed7FG3G4lxrOXCGg5z9QcQoTeGCX+fvaqB7q3NXm9y+CnGr"
+    "1iOd0/jJj+yNhPC7u6Gl8iv18vPoTiyF8yKsWTaoHhpfBfHX6ouqQi7aCz5LRzSVF+AvI9Cs7QVvpA55tH0/+v9O+tfbYQtT8vtJ"
+    "5FqVqHW1RGP0LBhZKOc8FXmXjUcEY1s+wrttTq3CH07GYPoIxMNaRN/mdnSnZoIrNac/px7aAOPxU9HM2XLwr87PUnoQy9DvsRsO"
+    "bEnW9XdiYnFohEso73iI7yqBzz6PNoaXazjKdYo7/x29wcZwOuOQA+yAR9ITDO4kWEgW7LmDPVqf622JHU/I2f8IVtmI6+6C3Z1H"
+    "3+Y38N9dcI3qE6ek42x/gFvckzyokG1DwVcqcv/xeYZj+Pvf4SZmAHfrR7xcAHyuHpygbLEwxXZowYj3Mo/4JT59r7eZRRkf/cV+"
+    "YNl1qYvlhKO2iR7OqtjQ49zvTmLYHtQA+uFb9UxWovXyDS5UP56NtD1UE9cMB50/aaArbl6ApkURtI7lk6RxWIj69F70dhNRk1CN"
+    "LjGzL1/AQyiHvT0ca0ZQLmaq9AHz7sV8+nXEaH3g65WiJ6oDMVxC7Psz5lw0wzaGsh/ukyMO4ezHgUvWg77Ss/DN7qN9dAh/UxLb"
+    "sp/aUHdyi1TMamtNv/pNNNyy0yOg2CMX+yoaLpJ6bUbi0yuipxdNHW8hua0bXkOU3e/AM9vFPt8IdhBAfSg9fM9u1Dk6E1NfApNb"
+    "gA1oQs6XHL8yD+2VrvQOD8a/NyVGSQtGIr+ygHygCXPZRrE/OmOLUoFHNyJGnAYGMBhuQ26w8sFwTSLRwetCXe4T8dBf2Fv5sOto"
+    "pi7mef/Gsw4Gm/6buV5pqMuVZh+2od77F/2D14kDxsOvlI1ZzOfsIr+5CmdC/PLD9BnNAov6FV3SO/C8y9JjFR/NpNfYUGF/B4lJ"
+    "dd7+w37dhSvykuf2DR5AXNZgDz5lMrzhr5zfB8w8DmN9HZzjaDCqO6xzJM/A5jxWwCYcJ2fNAq9vNByBduBKM9GDfg2uM91p5rSo"
+    "/2MEsy7aUWf5hxxYNY4qzB5MyJyAzdT0i8Ff3sP32j2cq8gjU4H/xAHzKRerFzwcfNENH30yWMqwGBNr/grOtQZM3s77lvDsfoHT"
+    "MwccYCFzVZT/BbnMDJUl8P6OM8dKmv5dwFGmE7vUgAexGnz6G+clPzYqhBrUJzinUcz3Vcwcidaar58DvSDhnyHkNKFo1C5Gy0dr"
+    "WR87OA4uW3P2x1awcj2jUk7Dua+Ezs1t9v5DsOjx7OHD4EutwGWXcKaEzf0JZiVd31bUwcXHaYI/rUTMOJ2Zsy7mh/clViwAD/0R"
+    "+6sN9uB3Yv0YdCtj12K0N7rDk/sPf2prwGxlz/SHN7iHvoKuxIP18VUL8JUT4FaVJn68zz4OZc2yo/uwn/607mDOt+B4NsZv5qF3"
+    "5Q52sytnsRK+fA0xZzp4Tq/oW97JtX9GgzYBPPE35Gu3wR7+4Lpm4vMrc23P4Y79AZ84J7X1leARkcRtW8kdL/JZ3fGDWfHj5cH5"
+    "v1Ovn0du1Id6aRC57Vziha7EKzHY485gZ3fArNYyc/A6Nv5QrJglD3Xw7dT71D9ygGeQmnpRWzD2eHANNLPgDfHSdzQvkpAXjYHj"
+    "94p76w0vazp8kIfwtP+lFqn1yctM1LL0BZ6Hj5ODWRdp8IFP2EsViKPmoZv6ll6vXsxTaAA/VPWYUmBihcAvQ8GNtsNNG0UM8xN8"
+    "h+3YmnLEBR3wywfYX7nZGx2wlYM4A4Xhz1wkL9oDV2A+OWMW9F8TUn/5AHY0EkwrM3HeYc5MNfCHXsQL0hnTXPrhMeZ+ZOteEa+c"
+    "QH9FvlCYk37+x23O9Xn6+RSvB1i2UBzUUZyTP9mfq+jJycZ+2hBjNA0ax3omG8gBhnIGOpCv/gaXQ3WHVegwRcM5LktMcJk9PY1c"
+    "foo00N3md+Xoc/gT3H8cc8Trcu07HabOlI5YLw/6Sj7OIpopDeGQbiBfykXuthMbIlxWmnFv4I6mpG7Xljkn0sPeCA+lPnWVbcQS"
+    "I+FY/QAHuSwx5Uz65FugvbGe59Wf+v1lcugM8D3LE2t0AdftRW9Scebe9vGYOFDxSV+PydOagnH8gD7cNngU4tkdw1aIc6zrkM6Y"
+    "9r5qVdIiPIzNTse8IH1uAnKvgtQ/+rFfbS2eesxI6oN2Uz5i7+34ry7YcR8n02G0QrX3NRdBuvE/o7n1gt70LXC+23Afr5lb0xls"
+    "U/3ZiYgVnuLbm2AHpd8VAD80ETUrp/XDK2sP3/9uEh3VCqRBvy/WvM7i5POyS0mZsZgD7bBZ9CP0xO/fxc91dhs8tQSzRHN5TH76"
+    "L3ObpR3TDzvhITf4Ss7Sk5g4BN96DG7UOmZ6ymZp1sMWztxN+KKqm8VHkybcY3yLYu777Nkgvs+FTZPf3AyfciV8qW3YCeWX0pLT"
+    "500m969LPXwh3LEE9NSHo68WTo0zI/tbOVUVeK/nqac7yaPsPOEKvWJZwWk/gGcmQ/+jE9ezDu341OjQerA5ObimPfC1lYdWYzbp"
+    "FPKxhMTLy8kV32Nj1lOHUN4hrULN5GgNJyKD2/TNfwMHfcz8jlrUVBQX58WHK1eb6jbact/pQ1Lsk5SaqWy35mDMgXvVFh2GYN5/"
+    "jl7o4eT5d/FPw9A5Vv29BDjQF3x7VuxmP7DzPnDmveRGW8C84hFvlAeHz4I9ukteJ73tN9SgeoLT7CVnfoJP3E/8UytWTL4GXtV4"
+    "ZlBN4Fx3JZ+046je9r2QWy3i/H6FD1qCsxXGeW5MzcZNLXEU9f5H4B9Zwc6OosN0h56+Srzfnzh0NLHRbHS7M8BleAt2XoVaTgpq"
+    "0OHob7iZETUU7KcxNfBZfOY2+J/1ybWK0+fQkDhyFByAfPzcn/yjBLY7hN8H0kfQn9jhE/e7F3u8nljtWKxegNHgmXWJBZfgm37i"
+    "vAbQU3Sc+yrG2foKBj2EOFEYSTxiiHP0igVT+wiJMWupWnUL5sD8xOdkg9/91DrERQ5EeddcCfTVUL5QTxMfcS4z417goxsS97mo"
+    "9clfKpY49UeUt/3lQJ9tzkMcKZ/Q1nr96bVAX2+JE2xF/23YEeWtdznw/3VR9oOVNKZPS7z3uugcfGOPD4IDewz++BFm/ur9F7ZH"
+    "eXdcCPTxo/Q8P4GpPCOe0jWqB2rK1ijvfOvvMpBbHoLT+YA4LQZO3RB6UJIze2MX/JKsYLJp2S/90MSZxnPrgU37zHkeuCXKu8/6"
+    "vhzkwcfg9bVkj7beHOVNf978/mfep31Vynp9rPX6WvLu1di3jOFR3ozW51UAw0kMz+nyuijvzgtm/ZOBh3QhZ7hLvDyLPEP+Pof1"
+    "93svBvpwlJx8TopYZyjA+r3/pUBfHaIGeItyl7dro7xXzwX68IJz9LLr2hasifJ+Phvow9fWwpfch4aZMJtWy6K8R08G+rgdGdjv"
+    "ytHDF0d5n50K9PkEP/goioebLIryJrI+bzDclLrYsEWc+5zW70dZv69L3t2GPbeO3PPfhVHeh6cDfTHGTuKFmtjRnewd5SuXFkR5"
+    "Sx0L9OGUmbHnOrN15kd5v1uvDwTjPUIspfhcaxlk/X7Z4UAf5vcZjEX1g4fzrPU5FOjD0pKDBQtXLGS9Pv54oM9mfkT3QbnDh7lR"
+    "3uzW99gY1HCeX1+wln7UPd6im9hwdpS34JFAH0dsD5wAPdd/Z0V5L1jXUxz8awJ2th+xezzr9xkPBvpir1V8j4v60hx81FbyxLjU"
+    "xMKxQUnBkXTuPs+M8kZZ3zMD+zCHXsuC9L00sX5//Izh+WUm3lFe9H5alPf9iUBfPcEJxtITvrjW6aX1+0KnzL4ezbzhXdxLNWz1"
+    "Eeq3whD6E/9kYpZpW+v9K6x1+QUcuge58/2pUd5xRwP/P1eqB5Z9lrrUPOv3m6z3NQfz6MC67QdjGmL9/oL13D6CPQRwPzXwW0ms"
+    "36+2nvdGuFhNwfZegxGr7teNPV8Rm3CNHpkK4N/LwY1X0ePyEe6CfJZw8TjUrN+wN64Sj53Fxvo0j6ZEeXNbz7c/mO5Kzv137NoE"
+    "Pu/1ZMvOW+dQdb4Y5mAmRJdVeeFozscGG2/Q3x81fMtX4L4+XdBJUd7RfwT6uE458RmKx+ZNjPKW2G/sUB3WWvFc2IQo78hDhlfZ"
+    "CTxW+zKb9fpM67rv8NwOsg/9x0d5Px4I9MWpicDS9TwmjbPsqfX5Hemr3IKtaU59rw0cijBm1XTmPPehJ2sS/vg+HJA75JOKZ2tS"
+    "73gOpqK1STsmytvGuv8haGq8AQs7QAz9BTyjKc9mOb1VuahFLiFXUi03B7jzY2Lh3ujzTAerWw9GVx5ORwly7eFo3S6i1lGG+Gom"
+    "OXYW5vG2B3M7R+23LrPu06O7c5az/o0acwX8cTZ8SCS94znQNCweKx/dPjrK29Q6vz25Ns1CysFndUPnXn60vfV3xXcau9uCHF94"
+    "Unbr9bLWOUrMHPdkxLaPR0V581n2LzkcveHEAd6RUV6nte6nqSGNBd8bbb1+3nq9Ov0k3bn21tjzWiOivMWs3xdlT6QiDqpkvf74"
+    "qLE/DfBpf8FV0vrfGhrljW/t53zUNPNTA19pvX5xm3nfROrj8cEjFYOFWr9/sN3YnbPkQmWwMwfRM9X1lbf+LsDat83oM6uIHXgG"
+    "LyKj9fux1n4fSU2pDb04r4iFD2HTD7M3Z9A3ngKcaTrfG07PyzdqsOIFK47Zzc+F0Q5ISgy1FpsWBBabFe5bW2KxM2AcI4jZZ9uY"
+    "Jj5qAbFZAmZQt+V8xXDdz4ZEeSdb65qHWnIIsfCLMOscW/tB+tXSRjyMTlk4dvkT56orz+oZmri1eQ43idtszZnT9P1OBOcLgrfx"
+    "ivxqHPUIxf/xiYOWMYtwMHtdc8qeUV96YF1fNssuqabUlbm9eia3wFpk+1NS6/yAX5qB/1RUu95jNBKyc4bVJ+mbfQQ/fyQ1f8W3"
+    "pYihZANmWd9bz9qn59H63gF/P6H1ehnLT/UjV7tEnuQeHOWdZp2fg8z5mwt2MJl4rxHnaQWxzyryyHSDrHO3y8Qve8mDhOM/GRDl"
+    "PbDf2OlWcHFlw8tbrx/bG+jjrvcklr2NXxHvsnf/KG+Q9fsu9rPCP73rF+X9tCfQZ1N2UP/QdY3pG+XdvyPQF2+9A9PJQCyh/Xq5"
+    "Z5Q3bJeJI5pxLbLV8bpbr1vvS8XZH4xNjgdO+alblPeX3cY+hMKl0J5tbr3eape5rzzEIFqLpNbrryx71Ygz8Cs8m4TW6zWs7ylA"
+    "jDUCbOoqPIsE1u8bbAn01cUmU5/+Rv6n8xjeOcpb2Pq+ycQoo+k76NjRinN2mTh5q8Nw2PUct7W24mfr80rBH05EDDa2VZS3kvX6"
+    "BPpWw8GQ77WM8ma17FJVctVM1Kk9TaK8vTaZz3HDT9TZ2l/bssuWnerBmbpLnfBpLcuPW58zEa5YfeL80fiY7Nbvl24y69OXs+ib"
+    "k1Izyrtxa6CPu7ASGyTf06uGFeduMvdXlnvQmdxcPcqbdGOgr96+mPtQPJTVej2v9TnfiL3HUet2WK+3tv7ezRzb2+zhVvjck+zZ"
+    "eeARY0KjvL03mfWuTK1b/exV6A1XLWQTfJOG5LKf4QGMAj/yzYGxPufb5kDfOepLTjKb+D8r++MgNiOcHvIgdA8U/96pauXB1nVX"
+    "hTdVkTi0GjFyU+LYU1Us+xIe6MMuexJLhPEchQ11tX6/Z0Ogr+eiEPUTrWNF6/W91vsGUb+0/exsdKRr8lzjhkR5T60J9NW+q8G9"
+    "kd0dWDzKm2FGoO9eQsB7ZCt6ZYvyXnlt+W2nwV3LwZVYD6cngP3hJq+sRo/WWLjkN8FyS+ADVlBfU607H7pRuvcZcFhPEt9Mpja3"
+    "k5kHd/BlxzkH1bDvTupM0/Evm9A9Tg4XPgUz0f9gNupHONA76HlsCDc/AbjCWuKNSOp8s9g3A+B71+D+U9jaoPQvzKGvPwiN2sLg"
+    "/LOx/eImq6dhAT0W8h/b2EMXqCMXgL+tGFL7szMzJeQzNftyOvwY9UeNQo93A3va9uFFsYnV4FbEIRebSA/FXdavFrGtZpjqmXVh"
+    "Po7mBBXF76aGwzQam7gF7tNZuKGvYs1Ib8FZeM65CUETowf1jMPY5WjqkNdtbCfG9FXUpJ66hHsKRQPnOWf7D2aLaSbwX+jcCL9U"
+    "nJDXZYgvDfEjmchfVKPq4qQ/iflvk5hp0VD9WpZzyJfW8ulWMBbtMs9/Br2t/tRMtN732ZdNwO3nwffJxV6tyFmIT93/IJhdCrj3"
+    "v5ID76euW9JahKHW98WVXizz96LgXvZkBs8j9IivoT2uOmcG+u3l+z/SF7iD2PgOPV/neS0h/TO1mQelfpBE6JfLJp9zmr2inEBr"
+    "Upz8fyMYrjgR+XmmO5ivk5JcVu+v6zT5Sxryi985I0OshTvsMVx11ZaqorOivF26+q2ZA14P/bO1LjNzUPsn8Q2vV32YAWAj24g5"
+    "J4Obd4avJr3CZcxaDgTD+oqWrIve9rHE0b3Q2RS/8R05lG+GKTHgbLgKTZk3OBM+QBvO8FR+HkLs35TaZzQ8g/oOo8GYnRmgFfEP"
+    "+elPKu9vNENsXZIL5Hw6v5l4nvmoQ25lTmlu/IdqC9JvrQUeO4tYsjV1tRvEpMIgB1B3vAXvRdevum9vapPSu5a2YDty3bq87yk+"
+    "6z15b3Zwji3w6jvA61gOx+g+2N4I8NbR1FL/BSvvyX2kZW7KTTCtz5ynJg4zv/sjGNAPYDLviJ2PEZMfYY5mb3qYT/D5b8hvLjEn"
+    "RvYrJbPdNB82klj/bzSNFoHxfgLLLUmty/bVk4ktO9Az8hIuwm1ygdzUCPypp88D75qLjmFTnsk09lVFdOQ2e4y+YxdwlvzExc/p"
+    "lRK+M4k5Zafhgq6Gu1yTGVdv8ZuriGsGUvdKBbdYwPNRcMdnxJF6xlvQV8uCjfpGD98H+Ab2fQ6E45ITTaoj7LH81LuTU3fbjC7B"
+    "Qp7NNzTJVXttSd6xGmzhD+6vGbWRvTyD4eiS7SS3XsAMryTETYvIP6QRcCOWbnRStAfGgjMNwm60o4fobzQilpIbJscXN4PzFUb/"
+    "y2J0Lppgk/eRAzXjui9SkznODPKnPOcYeNF2X0hOeJenwEQyYiPGU+dugM1aRhw7l57PVXBrTpD7p4EbKRsxnHk8+cG4FJdsc5t8"
+    "9xF1jJMxRt+pJ7laVXCIZ3xXZ7AO8UezEgvX4YwsRbcogLVuwb7qiCbLV3QoG8OPPASuFAdfuIQ6aza0LsqBp3cCq31OXbAc35GR"
+    "vVgcDaQT8G4f4l+j0V4bCba0nZm2vXjtNevTlBlWzdhHwcSbncEnIrG3Eeih+/jraBK3Qa9iNOu9DKxiLX1+fpznUei1272tE9g/"
+    "TbD3yuNGw8mdAH7QCx3CdPRgLyO2LmDnq2BHS+CalyGPL0s8eJkauPqmbsKtC6OfYS375RM9+W2JkYvyN5ewF3OJh+0+3Tn4gnVw"
+    "dUKprZ6lFyczf/cL63kBTvhIcIAm1Hh+4vumwXFrBiftHfMHR1PP136QFklp6m/T4Cvs57Oi2a8dwDSWc62j8SW1qMMGEbecIM/y"
+    "wt8J4LnMJJ9KShwi/sh5NCv+YSaL7K+TuXN/gUvkhiNzANyoMbrp9ly+f5j1oppGI9bdxXXYNUTZT2FBKfCHtcBod9NLoTUZi39+"
+    "Rq2nE7XvO3AV5sMRbkj+I56kdCpSECdWR592hPd/XP5w9IK6sNevwmmvRKyVnPx5Dvt4Kn3wo7HN8/n9H9jQ3PgA9V5HEMsMAB9o"
+    "TIydi/h8BDlhKXph+qBZm5Dvc1KDLgiOVwt8VfszymV0vmSbpf+SndxD9b6R+FubE3UXbYGm8JX/xE53BivfRX9HCFzdo8Qssim9"
+    "Ykyu/pH9oX2iuZ+B7Jv+xHVh+KBG1GUy0+tUDM2ZPPj/79RlGhBbBKCf1Bd/l4ca70nemx4NC1v7dRBc7APEEd/RJyzDuVHt5ZV1"
+    "GKUXmzzGzMFcAGa0mzxNs2QVI6UmZtgH3/8o+gnVyEXPECtkhcMzkHmJM4hZPXChWhJPLSF/ioR/Ph2dvAf0XjSBH7aDXGcqcclG"
+    "/KmuX73RH+BGtuZczSBuCsUHF4Y3tpZzPZJ8OD57KRN9fw88xmeFU485wfksCA67CJzyKNz2D7HmScgHNuL/J+OZRKAXKn2JbnBf"
+    "EvBMIvCTE/FRCcC8TqGnsBs72J+6UDi8xG/YzuXgFXPhAaehLheGltcI8tQk9EfNQANIPs+JZsBe/KL2QzB9Corx17HGFeC/XsHu"
+    "T+U8veN59iCG2cNzUJz+BH7eN96r9TrHPLHT9EcMAQtvylzzHfBXx/K88xL/bMTmdKa+fhNfNRp/34fe9wLwl44xN9ZFv1xb1vZn"
+    "6kG7sZs2V+cvcoVGxIlNqG1dIc9ZBD95Er29mdC4SET+Pof1yAK37gd65kugRzyVOO0GGFJ8bPB+uHAlOf+HwSHzglWc4Z568d3D"
+    "8ZNu6hZTwIlfM3MjFXsqL/ye7bH6DTrgKwfy/KKoh0xj/khDnt8bcs759FZewpY2pOa0kNrVJfpa4jHjMiNx3zLi4nT0VCvvUZwz"
+    "Eo2CUcRbTu4pqa37BB5fiOetWLUpet55iEl2gk9U4SzmR+d4N/0tzeD19SMu3EbdLSl4W1Uw0KnE4x5i9Wfw/v+it6cuPLpj9MHW"
+    "Ik48TByeEy75aXopfHwEh1lDm/PWE67KOThd44lZFCcLF2mLRk5b+rfqkY9XIl7LQN1zGvH9Q3hx+v/KyzWrRPqC4uOIfyicphQY"
+    "Vif81S+c92b4vin4xEyc70B6RMrDBwogTk1ELVfX8DMxWCh59WnWZBHveUxfY3X8RRV8zl/U76cTO6wntsxlc56wW5+Zm7uI9d0C"
+    "DjGMNd9KvleOOG8KrycCs7X1LarwvNbBeT1OLvqBWDAUTExn7RB6WEnRElDe+I1+KuXj8oGl6SmZgF6U9qH6KNqhbVOLe5kK10B+"
+    "I3GMqd/VYH/VJr5php2az1xDxQY5PQbrlK1U77j0X/4AI32CvsEB8qBMxKcr8BfShT7jMc9yLvnEOWyc7kE8esUUZT1mpvoB+l47"
+    "opt4DX/ehLqr/GUFh1nPYeR4BXmGujfxqA+z/jPgeuUlX3JjS8fyDDPacTEz5TcSzz+AxyAbLn/ShRnawraV836knh9GHnGMe66O"
+    "dpOubxO4aRswmdQ2H4OceL91v+1y+vl90L8pLZ+WN9JbJU6QL+buSNz2DL176dF4kkd6e7qCfPFUNe5hKvmvYuud1u9negJ9Z1Zx"
+    "7UI0Yss4TK/ZDafR6h0K//QksXtlYt4V5JGax9wTnrg/vuokdnYGe0y2Pr7HxE2l2T870DhryjqISyNM/mBwpJWPB/psznpizJN8"
+    "rvDA7ckivdet+yoBhq6afBh8w/HYWtmm6tbfjfWaOupT6hbbsflOMB6twyb/SO8f0YF+PekP28FZTfY1wlvbHegnn5YMHkld/NFM"
+    "ajs2JlMC31sQHbj48E8fgtlN5FzLf9yIiPAmtdZ9GvUjvb8HOooDsKHRzNtS3D4fO9EFjCUFn3sQWzAW3KQGceN2PvfJxwhvxzum"
+    "ftgbv6ozMNB6fVKM4cH9iK3SnkjzIcKbKirQd1+q1yxEO+MMfPwifLZseDY0aFeTX9bg716yl7ey97PzHYttvIha6GL+dhi43Btm"
+    "ZdWxsQ96/m/SM1OVfGVWrN61nR6j9VX93wjvmu+BvnjL5yMd5mwvIvZxgQd44XbXJ/5JgK5bc+pte19Zn/PR6Nq1osfhMn5Dfmnb"
+    "iwjv1/8Cfe9bA0fHS41FWHaG5xHe/B8Cfeuzg5ytWax5VfvoQbnK2Uj9MMJb4Wmg71mN4FpU08jqNLZgOH0wycBS5O/FE76Hzckb"
+    "Y7ApFac053zy3Qiv42Ggr/agOeYXsDWy9y3her8GV50IvrIdnH8H9l9x6J9nIrxdPhu+YgPqPu3JOxIw1zcMDY8l5Op6Xx/rfSMj"
+    "DL8sI9w1+cz8pyO8Xa19FUhM3AIbGgU/sibP6vWpCG/8VEG+WqLWYjJ1wcTMISvEjJ4D2OYD8Fr8sB0fmD07hzy2F9zT4uBU9lyD"
+    "oTwz1Yo0s6oTa+E+HuGt/inQt2d7U0c7CWc8DtwU+dlOxyK85VqafaD6ci/rZlJam2yaZjui6adZnWus1y5ZNy29P832VD2pnPX7"
+    "GtZ/SfxNTVnP7Q15oWZYPA8wuf8W9FPTO01uk91pOBR7Ao29PGd9nmLQndbnVLUCkfpxLbuqvj7rZ81YXuEy9dhpaM0cVb3dei3c"
+    "ZXhS+bEtiwLMvGLV6E7THzOdvDaV9beprdcrW//96DL1gOUOU5f66jK1P3FvtD7dnWa2fXGXwXYyMctKM82zw6254zL1U93rc+bE"
+    "jKbeKC73n9Tg5Lu9aL1MYlbGa2LNcujUdWIGr/ZZCumTOo0eiGxLMnKF3k6Dn8g/qGdR9YNfHaY+PZpYWtq8S+kDfkjPrupK6i8b"
+    "pPk7aDpuouaUFD6o6iJ76cu7ho/7kzitGrHtTuL0TMQO7dEI9JBz90Qn0tfPgy2LTwy/ItbcsZ+JK+YwM+wvZjfVoj80KZyNRfj/"
+    "F/RV1wRLFoYQ5jF7+CH4ySTqL+vhBtamNn0OjuJL5rldwsZ/R1v7LH3R7fj8F/RUFuD6BuOLtAa/oBcr//NE3EJ4Ru3QD0tLPubD"
+    "8j3GtkuT5IrH9ETc434bYLsf0cske/AZ/PAKeID60A/L36CJLn6WODyJnIYjpH07nnOk57UVTaunxHsbmflej1pwH5epufSBE9aU"
+    "WmYIdTHhHisdZi82JtdND+91LHyC6eRg0iIQDjPLaXqIdrtMPKBeyFbUH2WXLzoNRpQGPoWtzSB99uLU9HcTNys+0AzTRcxsXcOz"
+    "y4ceseyMchdpNH7SNVo/d3UabFZY5b/UlISjlYXTkDEWj0Fr+AGcTNycbHDpFad9cJocTvc+hPl24j2uJH5cAr/4EL7+IbFpXu4h"
+    "jBzoEpjEDWocT4kxWuKXThA35gSX6hpo6tqXwAN1HWuZtfoD174S21+X+kkbXldupv3RhxkC+t4B/kYftrT1PJp4DCarfF77/Adq"
+    "a+fRcdEzvuIyNkpajtrj96yf+3lMj8kzapX76W1NyD7YSo1CNdmD8BQWOc2zuhBrZsx88NC01P4Vp2keueLCvXB+H8KzrEzcMR1s"
+    "aAi4dxWe3TG4tcGcl3bU+NKjf7LIYXK7RcRCTnLI6uSVT8CfxjFnqzX17PlgRuPpOT0GR+ck/r8B/XGHyAs78jxu8jfSYTkERjwP"
+    "7ucn4rpNzD/9G33B4mCaZ8kbboJbNIXLoV6g8x4TY/9G3lGEeG07diWCenU6+FXitnTRrFqn0Q7SfMW95J2KKeWjMoAf1qO3S7mK"
+    "/McU5sWLt649E+kxsYC0/2T7t1H7f+k2/IYMPBf1YjvQYu/NLGth7ruYD1sxxuT0b+H2yKYpH2+FXuERsDgX/S3t3SYfDQCHVC9l"
+    "X2bLtGOukLgQNqbWi2fbkblFHdA9OoId6UMftE8rwm34Mg/Q6e1J/tuHGdQ16bXSf6+jDXdccfsI9HeGgqfL3tcWp1Yag9a/xZ3o"
+    "RbLHHlCjTeYyHCX5hXvwwYQzflBfhnRNrN/XcJn5l+3ReJ9Hr6TwQFt/Pjf+QLiR9ArbgL9W5D47UmOfxVqsoc6SgM9cC67/HKz4"
+    "HrmST2sV25oQ27SD2k0XeivmwNFSrpQduyL7EUgOIFt1wWNywJ1c7y6XsYUr4S//Bh7QyN+c/XH0916jV/4EcfNh+rflk1LBlzvJ"
+    "9et8xQPXOU6/azenqfW9s/7VTCzNxtS85OzUBMSZPsfsr2XYk2nYz5rM2trM+Q3m3BciL5sCzvUm2nDBhQ1JE31TtNkzj92Gn3HA"
+    "bX4OQUNCvb2Kq+u4zVzxom5Tr7A175uCi6rXvTecmrjMShT2G0qdXnrnwij1/njYp/Vcp3RKc3N2hhFjnUHPoAn6FrIPo5lB7abG"
+    "JJ7fe/yT1iAz758LnqB4UPX8guBHicH/JqOpKh7ZAvoTp1HveQoGPprc7iM1/vnUjDbBWZjC3tqC7YiiD3gu+I+wylNgYge5LvHW"
+    "d1KbOIjfGkd/0g76WZ6Dn32mBvmedS0NN0l9bD3UhxpjbH5O8MrU8PE/e0y9PhJtwC7k68plp343nDDZvs/M44r2GMxW3yO7PpfZ"
+    "DUnRNmiErS9M7GrP6cmHny8KJrgS7aFG1BqUt130mHqO/VwzknfPBO/1o3frJnim7P6/1nukKbuJmFZ26W9s+V2uQc9Mdv8y91aK"
+    "z/yPfdLisrHj4j2+JS4vh86XZjcOOhzhfZQ8yPdaML2FsulZwiO8ndME+fARJ7wq+clkKyK8BUsF+aVF+1368baGuOKAjGMjvHub"
+    "BvlsyjA4gfLfuVtHeN9WD/LNVOlIHDCI2cf38G8V7ZojMa9wxxJWkrpSMxlchju6z2nyoDBqLp2cxra8Jgfa4TT6zGfA75uiu6O9"
+    "r33c2GV04h6Sp7wjhj6KfkYdp4l3chPXfKCOJ+xDOVAVy0Ys9BibE05vbibWXNjdXreZ4bfQbZ5Zv+/G9zlj8Tm0B967TT2zOLZ1"
+    "F/yNnNRGvoFRRTtMXWgiPqDLN1MrHUKPiXz9bWqjtcBIhS1oDpNwImkzSF8jfuEIrydVkI/HIZskcoV6sIuhuTfbyqU1M71agJl7"
+    "Gepv8lLlyDk1D8lpfNk8f1OTl96GzmJaf4M1aI6z8oW91vNSLpDJaXq5DqNR+gSsW/MHFrM3FG/uRq9vIn93mJ6YHczxkX6pYtjk"
+    "TuOnZOeUn//qNPelvFy11PtOg1tk08/WfxWt+3CL5+sw+PEVNBCc5H6D4po8+LLL1D9/pF4Sn1xeOfePcLwVl2RzGntY2GU09vRa"
+    "K2ZvZ8Eu6/lIH0U1vbbwL35ym9hqE3yuBOQ4f4L1+MPRysDcPHEQFZvMjDHntiC5hOr+fZnrfRKOzO+cgUT0ZTUj1x4L73IJWGVD"
+    "uP93qVnZe1X+UzYyE/m4bHR1YjHpfmzn/XnAr6bAzdPMVNn/ImCSt8Gn1F9zHU6w+DST4GIrr0sgHrXD5Ppj4FjcpWZxHN5wYfgx"
+    "89FL1L4sZO2vW5qV4TIzTKbQ596OGKcNtdz01jW1lJaGrtVjtG9WEa+p//IvODB3yIMVi8hvBvgbvkhZl+HKaD/kJtcW1pEVHcwx"
+    "cMDeEefVo3YtjOAn9FUnMiPRjabIQnobnPBWr4BRJUXP9hRcrm3wWqrGmNm1wp7Ogknfog9ScZ20hKQ7NZm6Qj50qlIi8p2CHrbl"
+    "zPcpyb6sAT7iAWO8A8dwFdelWP2Dy+BShZhB3pX+gGnkQW3oG9Dr4u035L4DOL9ONIlnwj37HUxCuc/qGJMP6XN2ogs6A45RejRA"
+    "esAtrOU0fW4h4Bun6OEQl08x7xvsZSTnQnxP8WWET6ajDjGbextJP6ziCekOVkRruwWYta75oOI+YlHVsnuh9Sht5Z+IqeT3NruM"
+    "vWhi2bc5LnMdGcGX24GTyH4XjmP9LJ6Uv+H49Ilr4qaH1r9xhKO6jJ/Z6jL3X9DfYBol4dWc9Jhzng4te9lMxaGyXZpxoFykOBov"
+    "6Xh+4lZ50DFSnjwELG4D+0A5k+xxMrDR3MTbioUfozU51WW0n++CByg2UB3TjlUukhMvYO8oFylJ3q9zetNpeiU7w4HcSn2kJzjz"
+    "avtZwvXcC4/kPzBT5VOKQWY6jS6IPXdYtRxxZH4jP1gHf+i5w+A/O9DkUY63wW1whAKcw3jwcg7AS1dcvZNau3SwzlMvLk+/0ANi"
+    "pjC4GemISVqBDbRAb+gif9cWHmMO9ojy1d9iDI7YGRt9Ee5FS/bXVmxXfvqVIsFNamArQsEB7Dmek22dbXChY9RVPOBZHanjJSIf"
+    "0jnVfisMFyuCOmY+MJgSxLdT6KMYQq/PcPqXssMFs2tu1eDx3UczJyF2MCH1zTHMfhgPZnwPrkopbO1m8ow99LOEch8DPeYea4C3"
+    "JMCeHkMva4jHYCJHsNevsffN4SMfgPOreLkStbNudoxELnaXHHgM3DqbIyhs4Y3H6DCd4vW9xKID0G/qxvMewrUL87A5SkPQ8z4P"
+    "D702tcbW5G+ZmFP3jJqLfp8cve1N4KAt4NY3Jt/6C3xgDb3Huq/N8Poygd1rZkMI/vw5n5edmHE+NbrysXo7psP5eEdeJds9m/6x"
+    "X+H1VSfujCFGkYZUbjRdFSeXpZ7cHa5eOezOYvZSQ/bnBOoCbegXdOP3MnCWFpMHr0LXKCUz2uPSbyGejPbsa+YWb4dvvwyMKIwa"
+    "gRN+yWP2uny9MJcpblOPHxVjYpNAeIQz4C0U5kwmw9a2Bve/7Da+6DF7vR9Yoc7GS/rVO8H9PojtrAFmdY58Tvd31GPOzFo4hh7i"
+    "EfFKpalVgTziDDXDJ/Cbt3BGGkebGsENNNaFj2eCC1GOGLEF96Lzv8Vt5hBm9pjr1/eJ0xPBvGtdT3N0mpVDN0E3cymxXiHqy9WI"
+    "FfWe3uzlWXBd82H7R+BPW4NNbSNuXQ5PoC5YwTH0i3IRg26FW7OSGlMvOH0n4DA1RHtD15ORvZWINf0CHm3rj88kbqmD/RnDWd9F"
+    "3rOQ+/lIL9cG1jorfuhHYo2Wti60n5lh0pf+7nXkYOWJlRqAayo2GoPGT1z6L+35EeXxtV2o2cSDWzOFWGY+/PLG6Dv403N3Hd/S"
+    "Cztla/SHUitoi91PRK1vMlzTymhCH2G9nvD546nVqGYvbsN3YquKxAbj6Xl5jE/S2XeAdW/gOQbBc5yEb/mHeC3GY66nCOt/LQae"
+    "C9oPp9AIm0BMfwPsohX93NPAXjZy5nqAU9RhHwShV5KAGn9KcO+kfL84clFgN8Phj/zK+dwCh/5f9mz6WLPdWtCzuJn+UfnIZ/a8"
+    "KGYXyX9Oga/nZY6m8PE68Bw3wP+VHa/L971gb3fCz9cCo/uZuH4ZWHci6rwJwODCwXlsXRH1v9pahLKtxT2mRn8DTK4e+OUUzkVL"
+    "cjb5xTPW2c8nXqTb8IK/M0teWJt0+jTr+D6cnd74159sXQJ6xa+BKz8mx0xuvUcc86TY9rno8WYjHpiBb7frxX/DR/zAOVGdb2ys"
+    "9dU8nizUYP+jN7+XrYnGGbFnJB6HrzCWHmfVtNcwP3gW2rLSvZC26Ae34VHXZp2KUps5B+5YBPyqJrZgAznobbBK5StRPEPlbpqv"
+    "mAO+ieqNq4gXPuPDVBePwFcr5u4Np7YY2iD2/F6ttz67M/5YuZpqjImpCa5grsp36nrCJNfRZ6WYWfqf69Fh2UNPjOzGHLexp9/R"
+    "12wET2uBrfXsNrhUMDyu3szCyM3P5+DAaT63dJmOxxjdxWv4s37kjDs4V8mom5SAT/wDNYIscL/bx5j4dzq9Ee+JFQuBW35gvvC+"
+    "WBzU7uiNOniezeACfaLX8w94r+I+uODNJgMHGAvvsQux3j8ew0sIYaaF7v0venZj8EG94NmmIT7fyfWWhsuwEN77cvjDKbCfi7GN"
+    "vrmi1mZabAW8V62NcyzI1GjlnwfLHjkMl006oIuJr9zEVV3QfMlFnNGFfqnR2KmB8JAjqae0iTF9i7eplfRmPX7lnOQFSxgLDl4A"
+    "ezQH+1SHHOZYtUjv1kdGB+MHcopj9IMqr5kXEukt+9zobVQhppdNqlQx0tvsgdE1yoF2geLsIxUivUV2Bvo4EofwCXqmk63XH+wz"
+    "fKiO8AS2U3P1zY0vHuldGhjky93KwG/S++cWjfQ+tV4/hmbBZfrARxBXDPgl0nsxTpAPk2nAXPNP+A1bAySAPKAu66r7r2m9b1+4"
+    "0XOxNcDe8UwU888rHOkdHhTkwwbKo/smrtC9QpHeu9bredBNCOP1w8QNVa3fX3EF+fLlPvT8vyMGPUy8/wJO4E581R56Bw7Axb5G"
+    "7eRX+lvXkQ8upk68Cz/1Lz6xIWufh/39ghxvBesl+1sTvo+DfP8GecAZuG2H6bO67zH7ZigYzmlw7uNOs9efOgwXvyF5fAw1I+Wg"
+    "PahTxYPzMJj4I1eseTR6HvHhIi7EP4+k12Io8dkZ+l66U1vYyD45C2+9DvoHS8AYJ5D7zGbW6RTiwHpgdyFg9rYO+JtYPZF7qPVd"
+    "Zn/UYk7edHo8m5CjTqd3pi8xXAJmIRREo6oNnOnWYHSV0E+yZz81pH6WEBx5Gv2yRaz9MszaT2XgLaYmz6tZL8K7q3aQj68ylX2t"
+    "c7SPOo4j5ydvcFiQHxIUfvFrG5uqXDtxYlMn1dqGO01PzCeXwUrjWn8gLHiow+g5ruKZKDZ75Db9Hc3gqbndpm6Zk/pDOreZ96v/"
+    "CT8aFG3ikytokQwhTm9j99QRp8nfr0fruBxxaRy0PrJS057H9XQmL2zpMjZXWiTSJHjoNDGu5kDlot48g+8Zgd6S+lpd8OGGxzG8"
+    "jr5OU69+4zL7/hY8UvUvnKZnQPyG9/SYtAkw+zzYYWKPfeQhCwJMXakb+kK76dF30oclLRP5Beky3KKfqwq2XM9PehPK0e+h95CF"
+    "HHlKkMFHxIuqAYfZp3tqXX8N6w9Xu0wPrc6z+sUKe4x/lOaFfPIXtIKEI8r+Xw0w8ZJqXQ/gCf2J7xhGDVK8g4ro9wofk6bvbWIA"
+    "9RYksb6jAnVdcQtGwjV9g43aCHd+F8+yLbqH8ai5CH/S/FvFtNecpoaSyNb/dBm8tSXx4VfO/XV4VXqWSTifwnQ2gZENBy8tT4/D"
+    "MuxqSezvMvCIAHSRxziNXdPhqES/hfbVCzTiExBni7fcnGd1gJpNcXDcC9Sgl5BDhNCT4EALNRRscxbPQ7FZZnqSrlFn+Ye8bSB5"
+    "2Bh6r3K4jG0qA0baOFaeH0FMUhsbJtuU1GX0rUc4DC7ah56L5vSMhjqNjk0yf3M/QQHGZts9jpolr+dTxWl+f0f1JHFOqFsq//sd"
+    "P7idmKocnLar5CkzPKauXR1dv4NgHyE2xgFHqzN8y8n0X38iljpPvXYI+Lr+uBr8j85Ow427gn5aJvZtP+Kr0djr/U6zf07Q45KF"
+    "WEqzwMqib9oHbu5MdIN8s4kCzNp38Dd8AHu++2b2ZQE0ONUPUgsbnh8stQIxvXILcVzsGSIV2NedyLfv0XsmnFFzj2uiE/SSuvoh"
+    "fEomeDjbybGfwpcrTO1CcdkCemZTgSFrvwovGuYyz6+A2+TPxejJOslzrkcs1pC8NobaTW+wrTL0RZYD5xqGv2wK7r/AsulvhaG6"
+    "Daa3B/xnIZwi5TWH4dFp3fK5DV9sG3nm326zj2WL5f9WeEz+H+wxeNRp/q6j29QZ/8PfvnEb/Co+eFU+yzDss14bbcXT2b4bboxi"
+    "f80JCmd2z1Y0DGX3nnpM3dPHvdd5o3/iM7jLPHT2d3nM7Pfk7MdzHtPj1QzMvz/cL/Ub9aJX9B2f9Q9zFAuSL86EAxYP39yeuDkX"
+    "azmXfEjXkM36vE8eE+eshYtcCjxPe2ODFbDEiTax6XZyMF3Haafh2yUjB6xI3uHT+0e7/zvzAPqRg1Skvp8EmzkY7uxZ+sUfo/2w"
+    "nv6H0ryvCxqUz+FltMQnbqdndSv48dVXhkcwBdwrJ1wWnfNx4F7V7LnLvP8T81mEL7agB7ETGICe+2K3sXce9lUDsOVCYI3n8dXf"
+    "4N3YWv0BaJfLfv/EvTdhP2rv+3NGtnpMnFMRDoVy7XHWa82cpk9F3HfVHvbTd/GduOg69SD5tXWc34HUCMSrifKY3r8s6I/MYR3/"
+    "Y592gLe7ifusz1z18fiMp/b8XzgYF/Eze8jptFd/p99YfmwRubD2UGriaK2teCjT4WNK66c119KLXPws/S9ZsQPF0ewpypyY5+gQ"
+    "nrTWQdcdbf17mXr4JPh/3eC1lEVL+im5/kTwkozU6tLTFzuEOnNV8EZdc45A44fvU2OWfRavVH5Js0T+CTQ81T/YexecJvZQvbEd"
+    "M6HGgTtrPVIxq6wF/K2z7NVtaORJrykDub7sT5hlP68xGyUQDOgos0iECQ9wmPv8gxpHHZfJod84zfONRhPnd+ZBNbN7Ia3fl/cY"
+    "fOuex9RPa5MnqGaleEC5RXdiqePgzep/OYHd0u9V5z8Cxr+beqNc5aPCJoY7ChdL/8vuMrXoH8obXTz12Ii/o3j5N7fBcad6jL2Y"
+    "SGyjHE0aZqqDKTZua/2d+Kb36cs5Za3/EOvnZvTzHIX/J25QNn+j69cY/5WUHHu0y/y+hMP4TOWYY6kllqMXbgr9tRmJH+awd4R/"
+    "ZKem+S/YVTViWXsNfFpu5PdN0bUoxryPeZzJ6mhTnCUm/A0NkHXESKXxu0Xo6foZ3Hx8LJz0IfhOX87yELiLa+An7icmyE3NMYC4"
+    "sTq+4G/sto0Dp+d7GsDjTgrulwhMtQK5ezCxTjbyhWLEosmIRXOS+//E2qfmTFegNnwCTCYtsXEW+mzFO6jFXpnAGWlNrhxOP1gG"
+    "1mYTfTvDYvVVV+L78xAjfUeHYBi/z0lunTZWrvcjeO1S9mmoPV+H55kXPGUaz9vWvv6V+x2E/qj2VWrH/3R4D5IT9GfPHAQvaw9P"
+    "8BSYSknqKofA8ZpSH1/HHNYBPIPF9KL0A7+aAld0Mus1Cj+el3x9BFyppjyz3syhKUEMfwAdgSo8n8PgAd3hXvdGt2QQvqoh3/Mv"
+    "52IAce9xnmsd+o8nso9acN87qGvXAHu6RK/lKHgp2+BWTINX3xRdnaVgNu04uxPZL/XA0o9xDgqRt2zHV3yFCzKR59uavC8SnZ1A"
+    "Zn9XpTbVDozL1oiaSC1kNjnjBrCen7nn9eyDttzvSHDPzswAiSJ3smdHT0SrwsPeWci+svsvA+CE5UdjaztnZi5xWB74Ylv4nlJw"
+    "V8cQP//BGV9N7jcIu/EKuzGbczMAnkkvzk0odqAFWMk2MPcl2ISy1JKOksPmZG+NoVd3Gn+zHPs1BA3VneBSB/DRvdgb0+B6FGEP"
+    "nmC/12U2wVxy/hF81wiwwsrYhwf4yLFgfc3BIPfy3fW4rkX0OrciF63PWk9hFqCNZy3n+y/RX9WI/WX3W5/gvjoSx6Zg703DjrTm"
+    "WQzmnHfi5zD6d1tR/1jGum2AczIQfHEZNed69BytYo+1RiNlPzXwpuCqTbm/VeRxI7AnKznP9syFFvCQZnB/Hdk/odiDFeR8m8GR"
+    "V9laLXaNBv/UhfuZjF2djh3MRw1gPXZjKzWidtSf1rE+NeiRO8W+zgAOWpB91ofadHHs5RuwnankJ8/Bdxdgl5+yHruIwRuwN7aD"
+    "acymDjaEZ96HOo6tCzGP89IDfs9azlZqbGAh7NQLOHoHwF1rc1aW4ut/gBcxGD8YSd2mFLZlBFoCRTiXV/jcqfCnbtGrVAC9/sL4"
+    "q72xzl0F1m0T3O4v1FUb8j3ZyFc6YVeaoUtZEV/ZnedahbV2og1aB6x7LXYsB/iHavqK4SLB1ifgb4piI36hPtMW3mE97N4DfKev"
+    "T5995ABXzMus9fM8t55o64Xh16fhGy9hb/uDJS6DS3SDHDUNz3QW+WwRdLOT8r6u+NDh5Lh3wKXP27EZ+zATXK0z/NwQnDuc6xtJ"
+    "XbUNdnIlNZh+PL8UxA59wEb+wfdGM/9wGdyHgdjb9Ni94minbcSuvWVP1cJO18NPjIJLUJo5KTvo++pALiwORhz4VYPob02MD+3N"
+    "vnxHn+dIbFZj4kV/OGry/7vRrVgXQ/0W7t/zWBy4v6n3T2R/tKOHuAaYdTL8VjV0h/KRm8xH26UwuV1t6tCh6I53B4dLzH8dsC/a"
+    "UyfhqnYE2zqFHXtOXj8MXO93eGS3uYZj+NuN2J/52L2G2FkncXV74ljxmcL5uSxxwV5i3l85v+mJEeeRQ6bC1oyEY9Oe/VoEzZ4w"
+    "7EoF6ihv2B+jwezzs09zcw/j+LkAdqgBMV5GesRGYs+CWd92zMcthZ3shB9Jg75NW7TYwojji3Btrah5reDeFpHHZGbtVnAfHeHj"
+    "6Pvjt/3krVIg0JcHJIWHKRuzu5ip1V8vbeobnbIYzrA4xfvhEqqWvclpfLNsljAvcQ9qEOMJn/hIz90matCzOKvn4WL1YvZ7BvD+"
+    "E7Fmk67gTMSAD3ajRnkB3/mCmOM1+kbb6ZEUphcPG9AKbo3wkNPRRjOytMfgGPnI7ZTfX3QYPOET9b606HE95f0T2EtZnKYvcjY2"
+    "WHXK0db75ql/3Pr3BnrSd4k59T71zc+FE5nMaeo1yqsrx5i974ULIp901fqcCmiCKQYIsR7cZ8sBr+bv71DvkS1+EW1w17hoNwl3"
+    "EHazH30pxSDSd1e+r+8fZf0rfF7Y40p4iupzkp+8QH+nejilHaR6TQN45Hupd6lftja9+iOt64rnMfhZcfWh0gtUVvxKvr8M+If4"
+    "3ornMknXwHrPMbfpGZOWr3g/3T1m3rf6MJQf/+Ex+I24N484c0WdhkNYmvX9jEa08K84aOwUwh6NxTdlh1Pbh373efgT1SOaMNxb"
+    "ui4VyTEXYDP98c9jwAX3gS0PhtdcSn27DjAD5tyorycpPmUEPW8Nub5r2AdhtY/A75rBhdmNHllefPhl+iykeSCu0mKnqeFGwb3U"
+    "POi0aC/bPc4/EteIayM+jtazPbOLFWv+ABbaBR2HgfjZtPS+CTOW1oDqpJpx8IL4Q7ayGLGcOLaLPaZPX708aak1L6dXvTKclecu"
+    "w3VZgJ/KRA9bWeKNB9RYnjHvq2CsGQfimKr3KQ/YS3300f6hH6IpMWwasJT41FcqkLO50FfV7OFl8NDOcB/74AEMgFNVEe7jSnga"
+    "4k3nZk81JvYYBH65jFqq9sIr6s8jsd3SQZoEnpkixmCeQ9Dl1zPVLGXNqBgaY3ifc+B8yoasdxvc9D6c3Mvw1v5GW3cvnOMx4EXf"
+    "yGdSxtJDU80/mDOam7maA+mVb46f/hscXPUYzdHITG1/PzmzbPcu9APikjv5wZttjo68uDmVwTR9Wr0eswd6gLfWhyep56fcdjzz"
+    "DfKDJzb1mN71PjHGpl/ymHjxNDmI7N4wtDO0zgu53sEew90bz7rpWdzyGP73CziCbjiy+p/nhcEyhX+qFp8Vjshw9kxi8q/jxGsV"
+    "yLES0IdRiLkSTt43nxptU+qYL+kZkDbPR+L7EdTUNC9VfYflea8+qxqarb5822n4F/r+g/AKcxGzLyUfbYef+wfNrVvEab3RTpxA"
+    "vlMfXKYieMec2oY/7o2Fv9qaFBmSmp9T83p78s7WdczMEtn6X+hpyQEPTv7yMPFGa/hs/dEWiKHu1JraqmqOjdlTM7ChLdApPYPm"
+    "8A2P6YWuygVeh1ORlrmV9/H90sF9B8f6Kj0YY4ibdD169i/prZJNOu0x3I2bcKpD4KKsps/xd2LJ29QslRupFqt+sOvkV5r3vo4z"
+    "9t5h/MY7fh7B+4OZIbKenKE+ve+p0OJpTc6s/t7c9ixH4roz8N/T2jM6iIV706OmfPm5x9Qu4qH/o/5F2ZpcMcYWimeX1Pr7Lx5T"
+    "F5W9EAb+C1ogpbCrB+D52+vuRw4YQ3zZHVtfn7ppJmKr7fCEfZim0/QnrAHf1nrXhfv7mLh/OHOmdtIP/6PHaI/E5SzNJ39NCx90"
+    "NfMXJoKDZiYW/RktrMTgOnVZr6foNHSiRzAuuPscZopcRMdf8cwgcKUv9AVcJY86C3/jR2z5NGpav+Fr3mJXupJDbiZe1tmdVjbY"
+    "L+4ap68+sBAtirnU7YSpPSkT7Dd3m9OXI61gj6QhJ0mJTnBVaqxae0fpYL8RU50+zorNER5Fr71y2X0lg/3cx5y+75Em+1JwobPM"
+    "rVX8rj17hr32Dsw5lP6e9vQu5KDGMBTcoh5cdvl4+WBviWC/lTWcvj6/EKfxzzoXQ8FSO8IHklbdVXQDe4FzP2avDKbONoXa501s"
+    "TlO0qC9jkwuijZMSXLg1NdX45F0DyVdvsq5V0SkqTR3pJb1Q2h+q8ysffl4s2K/bA6cPw61ML7XwkaJoQORkPVaj1WDPMV3HM5Em"
+    "hfbccetzQkY4/VS/y4Eu0lowcnvWRGdiLNlgxdD/cv2yUxeLBPutqOr05YyvOF/K/17QazgAGx0ca67DTGz4CPga74nLmmM7W8AL"
+    "vk4sXwQeQ1awVi/xyRRyoAh4zQVYA+2dBL8E+70q7/TFVNonqk3VI89Wrb9QvmC/Ag6Xb92Wk5feIl4ejdaj6sOR2YP99iV0+bCW"
+    "w+B4urYs1uvvrNeLsI8LY3suZQ72G5fN6Zvf86+0lRzGtkr3JAA+uq23ew8ug3LCf+AXiGegnrNyzLR/hL0vbOvtpg72a5jR5as9"
+    "jQcnu43f1xruHB7hLbPE36c7p5xd3APlA13o09gwJMIbs8Lf97yKgpvpfV37RXibL/X3i+M0vjeDddDOKL+l5zI4xuiEN+oV4X27"
+    "yt/Xxz8YXynbXrt9hPepvhedgAHYC/EHlsSYHLcAa+zzicER3qxxA3wcraTsmxB88hB0FW0dN/2ReCcP6H3ciy1YRwziIMaeRUyh"
+    "v1kFH1/3uIQ5ITN4BmG8TznCBvx0NHZQZ+dX+nJlm5da//83p8GV1Ie21Pr/JZymz+8p2Oc66gdt0HN+QGwYidZLEfpkusJHP4qu"
+    "Zyt4T8JSDzkM72k8GNcRfK/iCS+4/QT4wtvhhOssK0Zexrz6wuQZeziLfVm7OuRQucGZhXvK198Ap3LwngH4o77kzKfh9inHzhhj"
+    "ckv5feXej+nN1T4oQ7+9fG439DylszEb7G8ufW7ym0c8JteQHU5C/0Qz5lmuJLYX7hDsNDlOQWacvCI37Qqnbh7nQrzi5fRPrJG+"
+    "nvJy67+0HoMJ3GW9T6K994E6n+zcTOYxPYaPv46+ownCYlxm7+XFN29Be3ECmM4icnn1M67Gfi/lfseDF+h+f7Gu5RWz8JJTA15J"
+    "HHUOvFPxaVGPwY5ecs7Kgm38iwZMHWot94hlhqFHI5ylOvPnxAGNoY42mH71B8z0+0g/WXriiYT46JEu49OUo6eGX7uC89uMXDwO"
+    "tlNn8giag5vRM8xKPFiVuOshM6w7MfNRs+qEVaifyQojfH03OZymh+0bcbyb78uA7uRgOEoViHnCmM/VDF6l/F0l8M2x1GRG45ek"
+    "RxZFbU05VEo0Mscz46Unfv0uWPUk9B5/wE/m416KoxNcF57sT9SKFBNPRysyLzPsLmJjp/J51dHb2oJulWxnf+b9HnWa2Y5b4M0s"
+    "xfYVAI+czay8MKfRGSjCZ8rP6fsee8zMvqvYrfLsh3R1TI7j5Gc9X2FyB8Qt8BjcSJzA+pYhy2UFGk4ryNm7xzqT1vPve8rEwB+I"
+    "Cdsxe3sX+Mdr4mydsw1wrpxgrDvgpSUhZkiDjqj6w36kzvCF3LcbefYJ+nwHMfciOWcxBE6UzsFpa1Osc5jnlIj+19fw/K+gETCO"
+    "vvIN1FtfUkNTfj4MXUr5DXEMxFEsRd2+HJiCno36ZmWzG383uFA49bFU9GS85Kz9CJdU93wF7H4kdieQeP0SNrotvUOdmP1QCXxL"
+    "eMkLj5lFsoT+wghmHAn7SggGXxde3TBigyTkw+Woh3eHAzuOPs/E7K03xHnzsU996SPNA4e9D71Dt/BDQ8jtyoHhrELLuTV4wFZy"
+    "uVDwKt3/O/rWxYl6T82jNvh+GNyvWWCdL6kbZ6FPtSD4fTR9qAOoX9SHexdFT/B66kSpyHu2UHtLhz0KIGbox89v4LVd4ecfwBHs"
+    "/o4snM3e8AVeEkvfADsfCa8mmJmjh9hTrcHj8hETOmx8FP8Tie0uDne5qK25zllOBUY1iT10nv61qsxhnwznuim4yH/sz5TEk+3g"
+    "iXyk9nuC9btKjNEGTsB3OEndqTe1wlZWJldZgW7LF+oNszmDlahDvWDe6lfqQXGIZxqyNzKT002E51CW2qOPr7DHxJ7iBX5h/bTf"
+    "duEn/2Ae64/4G/kQaZTWIY4fRW4knE6YxAp6P1Zzr4+cZm8qn1gHziO8QPm7NNh0XcIxVrIGQ8hZFO9Vwd6PQlO2LnVQabVtp1fQ"
+    "g72swfd9YXbYa3o2wtAq0nOSRu5u6pD1eT4N4Zmrt3QwczvrEdeMg5Ou+FlY9Ap4vJFgtgfwKfPRvVHdRzp+WhPh1tXZ8+JCKk6r"
+    "iVaKT1vNaXTk7VkS/uyxVMxx6YU2f380PnXfeVzmHuWb51JP7gVerp6Dt3ATDpKr/s3naj+FwHP/jfm/D7n/29TrN5HT1WP+zyXO"
+    "tvoZaqCxrThiPL1xE6jFLKWXKB7ciz+J79oxY+Ut/SOR9CAp3nkNhnmSNc5LHPEn9bLl1LxkJ3bBUW3DHFLllNKTecYM1NtonMq/"
+    "VOc8PGKNVqMRvZbY7yK9zvvoFd0JZ+IY1yy/oT6oMtSeP9FvdRfbu5/4XLlod+K0QfTzZmIPLCIuWc3e86O/5xT3p5gyidNgDO+Z"
+    "YSnO9Q23qSnOoU7ciX7nYDTFH8GLTAh2sTjG9OglJ/YQ5/siOOdn6qobqX+/EZanvi6P0d3dyRkYAy9F56udx/RiVYRzfMRp9LiV"
+    "010FD91F311mcmX1/ouLmx4cdShn8iC20M5d1PsjrXlpH7XAdtX2mL7/szGGJzAX/cx6aDXswR6nRlNhPTN+NsHHewT/poXD6JdV"
+    "JJ+JQmehCnboHnM/StgzStF/k+2ThscAZgxcZ87qPnSpzzJXaza55it4CcolFPfeqPremzIsyKebp73y+JzDF6M74xnMXbZ59l+m"
+    "FvLbPoNpC3tJxNnRMxv2wPACvoITK44c+p/Bh4KOmr7ubtjC5xEmZhtz0+DozQ6Z/VMYraktd0z8PNpt4r4V30wdqAfzmXJ8N34o"
+    "6LuxJ0/dJp/tE2XiRtnQap9MD3aa76a25qu9YmubM7czM/lPBzR1T8Jvk5ZzWzA19SzeArc5yKzgJPA87JldM7FdqkW/wWd1ZO64"
+    "ag9B/K0Hrd8e6FE8QU+vC/Wp+PjR7MwgjE9etZJYa7tdo+fnvPSTpUcvYTB4VS7qiOWJQ8+DyfxKbWgrueN2/stP310L/GhiO1aJ"
+    "Mc9B+1r7cBAakuKXKwZZ7TbxXw+4KoPdpkfgLTHVIOZ35CUmUr+JtBffuU0sKf0LPfM7HhObxoVTNZVeq/Ho09ymV+ElddUy9APp"
+    "952wfTb3S3bnFbbuHjWyKOYUHgcnXkW+LPsrDT/ladK47Q4+GwlWWon87RMzHFuiOag4/QW6D63IY3ehrVOT779AzXw/9YVW9Bc9"
+    "pH7QCE3aEvRIXiOX6QNeW5y850dwgIvg73fBdPU5mu+0G58UCp/czffINsvOXme9PMSkj4jPfTpk1AEqk4OqJi1fN5g+v3Lw5ALI"
+    "Pa7zfXeYTd2T+tgN4rgB6B5kAE84zNxk5bQ6b9LwHoh/lv0p6Ta9PzYvztYLWIJmuuKe7cy0dcHHW8w+GkodRHFzV1t3Eh9ch1r/"
+    "etb2FPMGGmOTtSdGOgw/qT/2QJhRMPHGfvhCR+BfPabeM56zfpx9UoS5hqHEER2oV4wnTh4E/vye9a9v12uoqZch/t7J+Rhl98iK"
+    "K+M0cd5y/OcQMPBOcJbuMUP8Hf55NHjyb3Db+8MfbMOMCydajoqHihKD1PeYdd2KBuN91vEDtdNl1G1U/7tDn/xhNJ5yg4c+QyN7"
+    "Bv0NijkeoatxDD9VjnwmnBy+Pvs0AHxtPD31Q5gTonxd/JI+5KnX0F5ZzCyOEeSoZdEnHUk+f9vWoQIbSY12tXpQ9feTiQvbkm/v"
+    "RL92h8fYt+n4BX/qT7XIn9qxz3UOV4CzLQRHbE9vXmq4bMopjoF5xmO+Sz6nwaUa8dxaEA+cgTu+EvywN1qcH6kzl2D/3CYnW8D8"
+    "l3X0Qt+OxetvSW2zBFzbv5iXorpme7TYchOnhuOvDoFHVoVPV4teJcX3x4mDlbM88ZjzkZpc7yD7cDocv8P0xKp2khBeqXLV72Do"
+    "f1IH7kVcmpT4sze+rRw9b9rfz2LpL8QjN+1Gf/5d7nMA2J7iEWmjVyaHfkNcmRmt+KVcyw7y79PEXenQgrQ1BWTvvhKfXeW+8hGv"
+    "dAATPIJOVzfs8G1w1XJgtTOxF9OozexE82IYs01vwUOuDp6RivxjMjO9lA+O8fyv/jKDPkg9kx/oDVOjYz00oCqyz5dQj29Lfvwb"
+    "+ykR61eatQ4D810OV0qz6/ahGd+TnsgvzMnaQf2zPHHOe/iyxYhr/6Vvyw/cqS550xOecyjzY8W30d9dR3fvDnFsFvbiNmbUVADn"
+    "WsY+vwSuNopcQ72LOgeaB7EarlUUnCA/dJ9yEMNk4DmsxO9lwi+FgSdtIh5+ip/+BS2Er/jg1eBraTkXun7xicqCrYTQGzgUjq72"
+    "6wi3WZ/W4BtX4SSthLfblngvJ3HmHGajzADj9ScOTUA/wWNytOFwrfRcrtBn/Aq7EJ94qRzYbXk0N1w8/6bMx/jCHt6GNrHqDurf"
+    "T0Uv3B1wwwTEhG2JLx7Re76N/rcp5N6bsAc6lwuF46KzPBHurO5/CXMij7FOk5itpjjuLjzpdHDLW4IrTAP317/r0fpqS56t2D0n"
+    "NmA0sWlFeMZzqU0fYT55Fzh90iZQXLcWTMrWeRmIjoo0K0LpB6lX6rO3cZUAX825LlwJ+UfxQrVvljiNbXjlb3T1cjkNV+YoGFtR"
+    "fHRfegzE1/wC1jcMXyCsOPSbmfvRt/hn7+CQAF8u+4HcVTFz44yR3niNAvw0o+lLkFnfXWD+T7BxOflX33+aXPF3uCVNsLHX0H9Q"
+    "zvsM/pP2cW9mR/j0I4iPZsOJ+sA6HcTu3eRzujHHawWckKc8047UVPLYs8IcZqab8B7NQlNt5IDLYGsd0DcpxWwpGzvv7DL1voSq"
+    "SzlMnPIdbLcv8UV3YtNC+OIb2NtiaPDPg5+QFn+9Ht7BVvA5PYvO/P+s6EBIW1G5tvhw8ldX0F4u5DL1Qr1nJZiYtKAzkLPfwV69"
+    "hku1hng3H75d9qKtw/j0L+zxHcy3qMZ5u8r8Hjcc+CJwPLqiP18fzYYSnLdHzBRWntnZ2n8NnOZ61SsSzKziDsQUh+nRVoz3Ho7Q"
+    "FGLrTvir8cy4Ey6q5P6z1sT6rxz4hs5DGe7/KjFbPWo7o4id1fcs/9WXWccZ0C3XflG9+hbregid7hBswJ/YhCfWfaQIMrobA+C1"
+    "6Lw+gOeXE5sWhS3T54uTlxa8x40fHghvaRi4SClw+MXkyI+oI9xkP5XgeZ6idvsKvttCtHt2Y7+EXawljvoJezwXDF3/1WOWnye5"
+    "4Rdvjc/8mWBTkym2zux7xT6BMUbvuIe1sfXcYqx/01rvHxJtxS9WAFzsi+Hbx4VbNp758LXQD39Evamd01zzaHiIfzF/SJpMaekP"
+    "6wRelgWt0ZTUJdeDdeQEN9+Af8hC3K3znt9l1u9vbExrp7Ehw6hvRaOjYPcH2738m8mXG8KtUexYwN4r5HLx2eeKGwfDcZ9FbbIP"
+    "19OA+PkMfRY76LPJhk3Vc9Ks5OHswTXUZ+tx9rYSN8xklqg9r+kH+JwZ0Ag5jY/Q7xQPCguYwx5QvChugh3LdMC2DQJ7C6E2eBAO"
+    "uuyi9K7EtXxDr6gfNePrxGD29yUF69yKzylGrpqCHu/d9DnVIU77BT2HwfQM1kLT7wUYQmk4mKXJj/ZRzxN+qHjGxVnW9Q+g7rk5"
+    "xti2qcwufofOYzfieuUtx8HqEzBvSlz2PW7Dt8hKX6mLz9uIxtwVNLr0+bMdZsbRNPKr5sSNd+mNbkpvfA200eKRt0yipqQZF7Ir"
+    "feERKMe7D6aaL9rUZdeoJ4RZVm2I40pROxFmK/ufiVxgZ4yph1Sjt2UW2h7CVUZa99WbXo2M9IJEwi9RnbAJNdxHnJNH1JRD4Dlc"
+    "Z6+2Y15Bee6jL1yeCLjuyhfnwV1T3XG4x3Dr0lFzUp/GI+YydeE56nl39hjuYBqwfu075YcOeHlNiM0T8lxGgmurri3f34yeHMXn"
+    "Xzm3mi0yhbnz/sQMwdhS4ZrfmXXUiz6CfMTTR8DcasANVN+KfIBykqtw4osS657hDP4IZ0c1hZvwILXGml3hR301P5zRb+CQwpBL"
+    "+5s6bmCgqXssJtZrS4/wdriI84ntDxIrvOScphRfR/vDZWKEYv6m7qG+mnzEqu3I27ORk81Hq/4j85cSgHM0pKb7Kxj6R7A9cUiq"
+    "UZuaDOfpHedWe2wpc8H2wyucj+2uRq+LOB3K6f6mL1R8sD3oNk8Ah6hGbe8c9zjOui/1eghcV7zmdhof29Fpcp2s2OqX7Csn6zOD"
+    "2khWNBPmgB/L3+zhs76iBRrCv+e4btVyUnGPyeBel8S+rsQXzyNX/QA2cADu8g6wmvX4ptbk/o2wJbLH8kEbwQAbExfO8xgstQh4"
+    "3yP6iMXXTkn9/xA9fMKF1McxEB+1ifg4JhaH9SJzrarRX9YYHslasD/x6HOBqVbjXLW1tcdijI5jEvLVndiun4mJxsKNeEAOewN+"
+    "6G3s+lQ0l4/AVdsZi/daCJ5BbnxZAvLOs+gglYaDk5d9uB0+QTPqrNWwr/fg1kaQp7dg5vTvaNJUYW0Xcd8V4WL/xXPODcdJfnxQ"
+    "rHinJ7jWM/K/ClzTaOZECktoy+ygw/i/Z+SRipvS4tMC6OMcQU6UC65ooNPsz/Jw148RB9Rj7ZQnhxOrTeH611NPPYKOVjb6HDvD"
+    "eakAjvc3HOuR9P8GcJa035PAqbY5T1mIM7ZRAwkhLy4NB3c4OOYZ4pX65Kn2rJFA8KWTLoO73eJ+neAtQ4klN4IHyF/GQefsOjhx"
+    "K3ScFTcPQ6/qFXp3W+BrrED7bDrPQnlfMnFCPaZ/YQT59Fuutwbv0bnRuU0N7zZJjKmnb+YcD2S/CmdS3Oj2mFgjO7Xjq8zL3QWP"
+    "ZhH4dhl0pX6kp2guMcU+zqx0rkeIX+QwvMvFxKqT0bd7BtZyy+Z5O8yaZcV+2H2qLTSjS3OiHIar0JJ6dGnm9GieTEOwj334UDd7"
+    "tQfneAqaJNH0JlcjNzmDDt5tYsn2cP3yEU+ejtWbbs8LGERM86c9g4RnMpd62WHmJJ2lFrfJY+LkrrwnFbZzGf0q/tTehUkc5xzP"
+    "pBaRD23mhPipItTktW92xxjNfPmDo9TdZBMC3UaLbgy2TP0oE7DRbZkVrb0iPcD2zDdvik5DdWxDOjTywrD3/7GuzYhHFPNsgu81"
+    "Dd99n3iyIu/ZgwZIEDUA8TXTxBhsW/5THJBk1NS+o50/A0132df/HCYHWERuEEN/1RFyN/0bBK/AjU2eD8ateHUMnMXZ9IV+xo7N"
+    "h8Mq/bYK5ERFwWLTwds5Tz95GH2naeCWbWV+yq/sif7Uz7Zw30H8TTVsTDQ2NAEY6SHWUTHFMzR28vD8O9FTko7nvRt/FsLnncb/"
+    "5kNnrAd5REm4pXvIt5LE6rlazL7Oy57/HY6Fbx9JI85pcDvFbjutjah5UJWZmaF99Sd1gavkyJfpay7DvJdDxBlz0CJrDd/1JzDW"
+    "B+gv52T2xzRixWhi2NpwJ+05jaPAdGrBM5cG+1HO8DrOZRb2tfpKNQ9+NHFsS+zdUrS4ehO3TIarcAw7W5E64Dxb85t6WTXw43nw"
+    "+kegM6RnJJ5DP7R77uJban41MZLsuHLhGuDzO5jLMpGYycVzH8T7plAnlr698qEG+N2FxE+psPd5WfcN1IXbwm/VrOB5cBT0eUHW"
+    "96of1GMF0QUUl2tmrGZwWouc2GN0JHuKL2O9vsd6rYv1X/EvBk+u7jGafuHoz4bi47TPcjBPurfH5LB6aD6+zHfDNYn+ZnQw/8Pe"
+    "/mwlDsmtzb4s0lpHK3HKecPwxRXDTbT2VqD1vt1WTH/b+pxpHqPBuIP6Sjf28Uv6QPuj/2PrSBXh/AmPbuwxedSEPw3fWTalI7W+"
+    "UtQtV7GHxX/7zPNQHKDabm3qGkWpX23i8yt6zDyR5HAl/MjXm8BpaUi/cBOe7UT+LifPZw56Z9s4y+PRHKwMjjaT/vVn8OK+EjdN"
+    "Z1ZJGL7gNPyJksQx8agrTyN+GmcFjeU8ph9RefIVt7FtRT4YLrGT/RPxwtjn1dR5X/b+7N0wJMAXO/5Kr+AzcNm6cFGHEXN9Q0tN"
+    "nIAU9OycpKar2XDXsaP18PXCmM/2+uwd1yLAT/0Sz8GSnuLP+1MbVny1C/wwGXXtpdTUNfezEc+5rsvUrcqBfx9xGZ8Xh59fYC80"
+    "61G+QHiu+ClLXSbeLeU0Ni2YubGKbVSD/y3a9Es3chtfLm63+Bzf/zNYqvDRytQf1nf47I1sHOCb2fEja7WPtZON+0RN77C1p1c4"
+    "TX2oCbV1PbfM343t0XdIM7Zos8/eEW0DfJpEi8GzlYs0bvLZm7l2gF8V+jTqoA80mtg72NoUO10m/iyDztlh5kZucBj7dZfacmJ6"
+    "pxVf3K/92fskNMDnGx5Q09lOvK+1n2v9vm5IgK831tb06ErOcJ4eBfU33sRepaCHTH0q/1DvScqMk6yc42l8VhjnOBM1vJ+Z9S1f"
+    "7rDWpeY3M6tKuGfNWp+9763rjA9ufR/t5xGO/2m16ZxcZ87Ab9U/e3+w/v670+gF1NS82Bj4aMz7UA1nYbqP3sRhQX4FmUPw0uHw"
+    "1cxqBpq6w3lyxFDqyVPQLI6Gr9OdHuiT+K7TxDMXbL1ZeiGCOOtX4ZBO4owH42//xk6PZk5qD2rVdgyxgtyzKTnCPOx+AWKReWia"
+    "lES3Ij312QPs79n44SBqylO4xjH4//1wJOw5Ek94zqPAkjdyjwnpBV/MOc8Jvr+YmDSGXDacdevC/mzAvOqy4F+2f++EHsUY7iU1"
+    "+7IUmOZC6iHCJEbBwX9JLrqInPcTOcoc+jOEw2lGxjb6Ri9RL+rC+l7nuxU7JYFHnIr95CA+2k68NZe8z56fkB7/24R6VTXyRlsb"
+    "L4w9HkjtLDfr+iFW3+AMejo+geHIRxzGRy4ivqtJjnqCuQwj6HPazOdvB09IRk7agH7Xs+A5/+CPJrE/2/A8Azg/6empng4X8RVz"
+    "maYS07dEB3AZ3zUSDnhD9nE4+HoJ9vED9u9ufi7K/WcnLhvNOZhHvvSOmPkCWHlPcpZn6PDmhofeBs2jKXA5CvO+vrw2nh6KWdiE"
+    "olzfn3BjvWh8fIZjMpN1HwlG8BJO3p+cy11oJbfn7F8Hqy9HT4gDbmNjuDVfmF/VK1b/sXRiWpBnvsXn7webdVET3M25P4X/boj/"
+    "X4ovLwWGcIxza+ehl8BkrsLvzskcjH5cT0Ge3wUw/1Gc51PEHQnRhpxAfvEBvKktz2sbOHYl7EYqbMdlPvc5dYSm8IdmE9d1xc/d"
+    "o4d9eqyep03YsyQ2Xwp7sp98NRm6KOPJf2zNi+5wRb5gJ4+iM/SIz59Pb9MGcPetcDxHcJafEfPfwqY2onZyDnzvOfi8P1pDh7Ev"
+    "B5j1dIpexoNg2vFsfQxw323kChPJY4O4t0vUcZ4RY34jv1vMuTrOczkLvnkInNED3nySeHA8+PpjMKen7NWK1DQe4kdkZxtRe24D"
+    "frCCszueWpG91yaQ4yzn576szys+eyG2y55LNI/6wQbqXYWxLa25v0gw3P7UqDeRg60AO+qAnd7M/VVlT6zmmobSO58JXev97KFR"
+    "5Bqj7JnT9E1vgSNUmu+/QP2kLzqAM7F7ldhDNXjPOPCJ1txXX87WMK7rFuv2G3HEMfK6dpy72uyzVWiz7MFWzIT7Pxk72QN7m4Lc"
+    "dCJ2ujkxcAjnchjn5RR4a13swl/sn270htQCR73Gvo7G1q8jHuiIT3ERFwzCftXFT8TH3y6IZffWYGdOgfn+xN6azD5KCSZ2ABxr"
+    "L7nLK85RN3Lfx9gUYfOKC+6wr6rzvm/oElUhV7+LHekEVnOEPfeVv3/C53/GHoVzHjISI6QHu25JzSAGf3Ce8z6eGPQPzp0/Oru2"
+    "LzxF78Ah7jWYe9+OP/MD59mHj05GTNEM/Pme3ZvA/nrP3jtO/WQu1xvO/g3CVuzAf9/E5/qRuypemwqu2B79i8nEek3os19L/FCB"
+    "/X4a21QK7HExOGtF7MkU7rsi53wd9lJxxXM4drOom77FDu/k/PzE9R7m+2PY57t5Hn7c80zs4jdihifYf/sMjcEuBnJNf/H7A/xu"
+    "D7pT/3FtJ/B/99k/b+lTWMWZsjmEl+l9usffP+GzS+PHDnFWbI3df8FXb/G83rJ+58Ds/+ZZvcG+HmLtI8DT36EjuJE4/h+e91b8"
+    "fTb2yi7wpGjO9g38UWVwtmbo2I3jWU2De5iRHOgI37MHPHw5a/KA57CaWmZ3uH+n+c67rOtB7ikBfmQKf7sRDaq9MQYfjGF9hAmP"
+    "5Hn7M2O0O9zwh3x2f87FEez/UPrRrhFTKT8+Q+/QcLCFd9hz2elkr2J8tjPvZ/P8tKZZ4H4dtS6mp5V3pRof6LOlSywj0dVp4stp"
+    "t4xdEVbgpCcgBI6+7Plrp8GQL1LDeu40tQnxFTVvfAvxbUfLILbxmJq41uG2y/B+pOs3yWFqL5pLkBuNnA3Et2mcBofu5TJ2763T"
+    "8H0iHeZ8l3Qavllvp3mewo4U+5ZCl2ETfu0H5lttIN+MAwZxlD2j/TsHXcaBnMek9GzKlrd2mfftoh7rpg6e2Wl6g9+7zHPLTv28"
+    "CViYsFofXxeOWCZqMaqBJSZPDoVfppqgOMjpsL8j0dzQGbuDPvA57GlSdAbF8csA/zkvfb9u+vZPkj+mxyYkQDPmLlofJ9D+yAlv"
+    "RnhSZbgoqteo5tCbufGF6cGfD545AG6ui54PcYTCqRuVJ66tw9nKSHwgTG8AcWFGdEM6kF82AHN+jy/5nXpJR3zGFc5HD/zQJubw"
+    "lKBer7w3Nf2Nm6ktSq+gJj2JAeR4wmP2oX9ZFNxWvCJxIeOTj4bgW4szu6MYenx63xBq7auYVehP3KubETdDejWD4FYJc/zJYfgz"
+    "fdFayQYn3eE066G9o8++Q4+0sDWtt2qGP5NnDEM7JgzNtxRgTYNYq4zsq1B8R1X2cyp4LPHQ60xOHv6YvHIifI9a9HW1xN//Sq3l"
+    "PFynz/zXAB7CEnzoIeIr7cMm5MajyJMiHCZ/fAseIsxgC7YqETX2oeT10jzOQG9GCXqchUHGtesp8PE88JykoSYti1YxJi6cDkZc"
+    "0da5ZT5OEvyO8pSqMQaLWEouW5xeBvXndiR+1/7+mxm9x6j9VYVrfZH6zUJ4Noex90+xsyfwld2po50nJwmjNtEU7HQyswEmwm+U"
+    "bXhP366uycN+3YKG3ShihF/QDuzuMHbmK37jd2orP6PxtAWu+Sdi7KdoY90nFhlEnCI9SsWkT+BMdeFcfaVP573TaD7UgGs2mllf"
+    "6cBtZNcjYvFp2sBdUkyzzmPiy4LgEIrdNtGrZc+ycoKnhRJPzLIemj77wHfzs3xjB2zv6szWZ+8019YPfUo/1swTHOWt/zDQx0mL"
+    "C5b7E1y0SmhPlOLzlqGrMgGtRxfnbgp6Jy3x9YrBVe9WnfU8vjeM2v598o8d8CF2EL/rO8+SA66FP6w9LT8jXtpJNP6LoPE+lTrb"
+    "TLR6xE/LSx2yF/lrJzgJs+Ft/IrGQjX20gpw2u7ocuh/8nNLXlh2XP/eNPo3ZYjBfkf38wPx3gNs+SHij13s27Kcj/FwI5Mw+yKc"
+    "OvB8aucL4BJmgnfcgHxoGv7kYSz8oTWxzVNi0jWcv6n4izzga9fIw+qCiyzn+tYR1+fHfy8ES6zEfj/mNJqbiguuk9+39/5vL+0i"
+    "1tvLPam2oJlI35gv1o88Tb+XxuJnYrizcIkmwb/4Bx/vhu8nXdWlzPzqAo6hHlf16S3gzA4Dl6sFn/Kd9bum1O+zk2+oFqge5it/"
+    "Gl3GffhWP3CfA8QGgcSAIWiSKAb/hq/pTl14D3FCT2o9J8GUFGeFOP/Xw96dnGYqfM7m9Gmc4BnIlyruy4S2+FH40apjKHZRP30e"
+    "eouaUas+SE47HN8urOgL/Pv96DAqZukKP+4iPQnJ8eUvqOmHcb6F20Q6TU/DCLDRcWgOn2OOiWKheJwLD7NJT1MT+QW9rvnU13Xe"
+    "hjtNbUPvG4UuheKvF+QMYznn79DtUM1mC1z0x2AnH21dAXSDdf6PsC4/oL+v9RtLf0pCZl8MZW2v0NcygnNRFf2KO/isDfSVXiDH"
+    "Ps7ztHVsH9E/0Z8ceyhckAT0zIZTd1wLbnCU+0oJhnsA3v0WznpGnqtmndWG5/iSmXDbiMWn8nnx+A75nhhqgf4835fgihnggJ5H"
+    "30TrLYylEbyOik5jg/2YwTqNuOYf7q8Va1IGHZPD4Ksh7Gk9r6T0X8wFa6pDv2VG9vYDuAlZwCS6Y0/teUAvsYnnwAejwJu6cIbi"
+    "EE9Ph4//E7W/I/QzpgZ/nEiusAiMIZTe3PQ8sxpgnPZMqYfg613AioezR4qQ4+5mfk0Usc0vnKWfiElKc7+riC3eYHMbkwNMxbYW"
+    "w3bshNthzw52kPsrNtM82cnwzsOp6Vah3+dv8Ice9KzpXEt7bRP6NPo71fDiouFXBAziL3KU7/TbX6dXbiN2qQx+bh/aQToDAwZ9"
+    "9sZLEOhbM+WkQxxGh0PrFOr4n9ZNDzh6Ovduh+H16HdV4Pwvp+bwj9P0ztx0mf3ys9P0yO5zGH+1jThhKzFKM2rrisvDqX1q73VC"
+    "/0368eI1l3cZXS/1Zl9gTZ7BV5LNkW7xTOaFzIVH0oWc8AuxsWLXkuJS0FN0TJwnj4mRYshBxX8dC7df9v4qPncyXPWG9IgpDtUM"
+    "WvkPnYV44GRR8HN/xBfrmadB52gW3MaqYJFfsHVxyYnsuXR2jXqmw8Qk51m3jrxX8VQ/h8FtXGjS6bNqYDekF1gSvt84nnlCbMEd"
+    "mxuFXuILaoth+O70dv7hb+zQWK5Pee1t/EpdekTuko/qzEqnTrMLFtPf9hjNv53kRB3oR+sIp1V21qfR5zD6Oa/IBd7A2frD1s1x"
+    "Gi5qcfK0+PiKGtZBuPyfFVtY/2b9ZnQqLlm/2G7FFle+G7w+O3M845Jr9SQX1d+mpGagfqEL4JHx8TMJwRoSETO2oBawFS6gapSa"
+    "pdmMuNLFLBHFL92wSdJurxuLKzuIWHEs5zGS/PUptkz4ivIt3e9UbGY9uAJvyBmLsU4rqQl1wQfUgF+hnnjZb+1pxWntrbVIZ732"
+    "2Fof9Zu0+W5y85ZWQF/Z+v8/WOv3SHrlHtNHXQotrdfkpH7Yku7o8P2r3hbrhZUek4dqD7z3GE5nEn1XtOHPqRa90vp5kNv0umyh"
+    "nqG4tqD194rhSsN7FvYzBJ2PXGAPldAp/Yhm6zWXiSfOobE1Cy0dxTHiaqUiBvoEP0kYcUViVcV2j9GMKcO+rQZnegm48hb2Rk04"
+    "C+OYfdMDzP8ierLidCymXywreUh/ajhnwWou0nssfvgRsM+m5Gh58Q9bqHU2oycmFGxT5+Mp/e2TY4zDCOFa48CnUY6e2MYk2VMb"
+    "8a+J6RGqjr9pDvdHfj4aP6g5zP+xj3QP3Zp98KZbE2DmnSomc5i6Tp3Fxie9DDV+tbLrf9r8U9wGh/vy0eSTytP7M0dVsX6c5YaP"
+    "t/qO8XnTrX9z9Te/z0uvwllipfNoXHTi+iPAHgaRH+wCF95G38Fq8uDD1KJukvcPB9f+Bg7upXaTB9xFcUwisGTFF6OOmFnIWuYu"
+    "7y2b/8L0Fyz7z9zThO3vvIfbBvrs92ZmqMsudCxobOimsoZ7NYdYqiZ2aWF1E2fcDjK1wxRxTX43LJnB+X/j7+Urjkab+vOaCsb2"
+    "zHQbO9MALZhMT0y/UjtmbEhDNA44SDs4+eJFV/KYWRxzuPeS9NfaOioT6L9Q3NHPYzji08HEfHO1wNymwbMcQz2hFHl9O+pOOmPn"
+    "4MfpXOUl91LOIDvzf1ydBZRU1/L16e5hBg8QPFgIBHcLbsEJ7k6A4O4W3N31ASG4Q3CX4BrcnaCDDzDM9PT/7q5ff2F9b608mGa6"
+    "+95zzynZtWuX8kXNxTjBnI0i1Pu/0CcU0Bibgc7y/9M6cf69MnM9PlK7vYwmpfiWAY3/BvBcIvDRzdHdXA1X/wf2dkpqlGuY/ys+"
+    "nnCib6k77+TzJnD2ZBvz0+/yEp6DcrULXuPKSWtfsYY4VbLbzb/8pz2tc3vLa9zyOVyfznoNtBp+ozfkOjPVL6NZkZacLT97OrNj"
+    "+LI6AXNiJ4HZ7hjG6Y5zTe84vGnnfb7uTmC994zjG36QhlyYr2blYH8vheKqzeC4PbEBO8nZLkcaHvrC+8H3a9lgv9ZTG87XQmLr"
+    "AfAM/0fNpT5zee4Qq/6DXRI3qljEB1/NCsF+u7yYvv909Cb9BSdTz7vwvg++40WCowVmZaaDI5/Ref1j0WA/7yEntWM9kxpbPvjK"
+    "5A/22+9axDfK4b7Z8MG3O2+wn9/9ntznHbiG/my25oOvXo5gvz8dBjfqPhqTGwKcQfQuZNe60hsjfRTlOtILaEEcso3YrRa+pUBg"
+    "hhMGoj5xvnxCIec1xYbv6SNI1vCDL8mOYH8ev5b+3MnUY1VjqtHggy9qU7D/uxfST/4KHRL1x5av/8FXYIfdxzR4gwmp+Xegxqz4"
+    "9lKdD74+m4P9/Yj5mTsSDe6OYpUql977svYI9uvpKE5Q/K0ek76OHdrpsVz5JLyTW+gMDMc3KB6PgjfTFSxcPXYNmKfh57y4DTOQ"
+    "NoJ8Ti/136sGhV7CN+ARWnfxWaU7KHui/nZpVAahKzVa+pcuq4Wr52AAvRs5pCnotnz2LZyZFwFdOcXDUeYHd3kNS79Lj5jqnRPR"
+    "LdXzbOq1mqmwQOEnU+FcCZsIJW/LxoyTIGoWnfGbfxFvax8GOze5XbPMo1t8fTOm4Y+xo5tuTLfoxsf6LbrFf9K9eMP8q+rw+1Sv"
+    "lr6DYoM+Huv/ioY/Uj/7//QMYljeNQXd9Ilusxua+S1/Ij6mZlTuITZtTT6fwm0c8EJu0/bsjlaP9EWlda8cqjMxtjincTwWx68j"
+    "vld8qlzqKVjSM/rzUvMMurtNm2kPOk0d6VkSjiGtduFeo9GA+IJmdil4Un2J+Q7AEWwCVhiOvR9FvOQhflkP91m+4bzLzulU8nvl"
+    "z9OiTF81oAGsuFc4eSX23VNs2RFsS272oWxPG5dhFr9R1x5M/hEL/Y9IOGr9omz+1tIo4zoqNvfCQVmA7vUBYpNK4FsTwWI60z9T"
+    "BXzkGTarNBzEOMSJ6/CL39JvcpOanPIeze7bxd+v0QP0O3HkS2ajJIO7ofrMY5fldrnRypcO4A/UWyphwyuQrysva45+SSk4uHvB"
+    "TQaSN/ZD3+ctOV0cakcB/KAh65ESzvJQ+pmek8OuDegh68y5TdM+J+uivbPKZVqsyZnrkB+9rWr0L8VCV2MXr+cDTxY3XXHMPGez"
+    "DHWbrR+HxopwhkzOg/zVuaGCzr+73YaTCp/Zhpa94sBgrkF+pRh28Di+OYw1GIm++7cew2QLkoOuhAMWn/MpPYt0zJtR/F0dLYiT"
+    "aK1Ie2Ihel4fwPsXoLkUi/x6JjodF8mNhbPF5vPrE+9+l4gey9SGwYWgNyo/lAQcPxVcLmkllSLuEJ6rvXRa94y21K9g+VnIsTLS"
+    "Q69emFH0R54lX6rEnm1Ff6Jsi/aVfIV68xQrfvJavCjMVb7k+0jLt7PAVz5CX6BiHs1FqQ7PqDhzUwZRdyhIj6Zmq2Vj/qBqTRMi"
+    "jU9/mDwzD+diEfGS6sXChJJy3y+py5Um5vuDM6x6wDRqL/WZBS1/Ip0D1c0KwOcIcG4GY3fmwtmRPZnKjKEJ2ADlTYmYf9mDnqjL"
+    "9HuMg8cb77HlJyHgn9KfmUr82J3YZwP93BecgDfpE/O708jffayD1nKC856qD21O6VFpiDq/v8hxDJeFE0SabVBdLzrY5D1y2crg"
+    "q2upf0zk5xT499n0OD4C1xyLzehNPLGZ19/AkRtLfD+OvKwdtnMRHLgdvOcU/zaOPZWTOr9wWWm+rqCXpwrazy/ooRlNDbkH+UYs"
+    "MC9pqPwK72w8/Ig8zBYYS75fE87OefgJM4h1G4Lr18WG5UQ/ZxA1gn/JS6SHfxlbMJ/Y6xZx5E1speKH5uyDxfCdd5BnRMJN7QpH"
+    "7R3X+Z6c829yMmGDrTn3/5K7TgDTKksP8jNiyJno739PHtef+OoJMxKrgdmdhku2GezkMP5vCdddED9XlZ/Hoc/rpi7TgWvLS140"
+    "j/eshrMpXy6cUP3EOsul3VY/noeWYAqPxXuyK3GpL/1ODeAN9fxu9HYH+JsZ0dJW3vJzdMPbM3rMf1ZlPmu76Ib9S4tD/vcPt/mQ"
+    "2ei1yy4ptnmAb1ddfCv9NvK9mnNynJj/AnlOeWzmG/C73JyJj/i8JTyv3tjADdTua4GtK48VPrIAPt0MsNYo5o6KXzwC7VD53LPs"
+    "wffot4yihq79LO37PWj15sZHe6iLxcFveYknDhKT5qHONhQ/sZra4h7wfsXUoZzRQ2hc33UO2F7HSQx3nNFTZ6Oedv6s4Px57rP1"
+    "SDbzWk5aCE3R1uzn986iSMs0HTWb9XBWvgu3/R1BvFeUexrtvP49/Cvl8iXAVaeDG/Rij7wEX1NP5howlXfEfjfhJhyFm3Eb3P4T"
+    "612OGl4ynqu4WfK/eaKbRlk+x0HGdzbdDcd4b3b+zBtieys6cY2Pmo7sSwjnKhgOcnLWPNxr3MDaPPPk8DmEiYqvsAi98B+obzai"
+    "fnqc3PEm3KdGnKdgfJ2uwwUm8A093IvBwzpTm9F+P+e1nGEm9ZhIbN8i+mGO0Ru+hHynNDWeZqzbXt4nnGsMnLZ96PJ+R7/0WOoF"
+    "7bGJc8h9X1C36IovUQ0if9R/umGPiV2GgOW0Ansbwdy15uhA3IUXMxK9hDbUAo8QvxRH1/t/9AkcgFetfRaf+nRsatbliaPj1bb4"
+    "M13z975YDYL99nwX52Yd9m8o9fb+X/WJjyYfv9vsve9i7WD/vTYDe9E5mdP4va9642A/H7IT2P1ufJd8aFHn32s3CfZjvX1Zq2fw"
+    "WXWenzd67/unYbDfpmo955EHiCMlbG4b9iUrscXP37z3DWgc7M/dtZ9zuQ0LXJLHarSvAnNqmBFTPDA71GVxaQ14L93gI2Qixrjl"
+    "tvx9DpqpxQOzplzGLXgH9/0Re7GxtI3El4tufETl3uKZah6I5jc0RyNU86HnEuOL27kRznMUfkXzPbKiha1zMAo8aRo2RbHtSWpp"
+    "AY2ONHBv5Ee1TumpGbSkr6I79SntuRhew2Vbo2tcDg5cMd6XBoxK13aGGDQavINDcDm0B8uCcQiLEF83ARrOy9BzfIBt2kcNOKBp"
+    "/IG8aR0861jkBoXJ61di1wK6fdGo1SienUwNZzH+IIS4ZT8xWqBXNAH8DuGReg4D4N1Ke1NcB33vzCCboSGdSJ3j1+g2lYRXcCXY"
+    "8AT5SeWJ+lPcneQew/pU29Q+6uI873+kheQ27UnV63QPS5gB3sj5nH4emwkuW1w1uvW1/hxk81piBZm9CfIYf+QTeY+Xur7yGMVw"
+    "VZybTc4suczwFO6esmdzBf7eK7DTlMxx7UJdW36jrfxYlGnZZUcfSvW3+8RRwuQ6MiNlHxj2KPjvrYnHXsGLvIymvbC8S/DsdjDf"
+    "T3lxEenagTUrNnvhtdxFfv0X+tymoZ2UEE3UOOQlNfBlhzi3VaMsHn1AHUixsbQXFlFzjAZ2XjPK8gL5b/WIXwUfuIL/1vooJ5cP"
+    "F95YGL1h6T+/Vl7nOIbvvKb/VN5r879bwUWvEWU/i/8hZ96FuSlX6d9qxbzDdehUjyf+U10klvP78t3K74V1/ui1te9MjvM7nNpM"
+    "8E+Xo788H/2WsviH/mAqN9H/Ej+xLrzKmPRl/00Neg86AzHA71/Q3zYIXXLZR8Wex8EFvdSMapPXaHaE9AYqk3PKB0ojsx3YvTgv"
+    "lYihnjLn4DvqchvQH27FPBbN38mDrVH9QbZwBdwz1Tk3EmNJ+ystmleKDfKQR1+gLjEczfm16J1pH0SPMg6el/fINx3zWhyl+k5J"
+    "eMXqgVdt4YvX6tOL8Afyadu/2Ayyo/B5M8BRjAZv5g79w/J94jcIV9XZVH1OGrgrmQMmLQvF4ZrbkBju7XbWKQu8kpdo961AZ1h5"
+    "zEWv5f26rkg40NqzG3hd66HvXINuXw16KlJEGacvKfnBfDQT7qE7/GeE6YRLi0f8sNsRlmfLNujzrvDc1GMRSa4k/Cc+c4LGkC9V"
+    "Be/9k1xbWIDwmF0RVpvp/8V8m+qq4fCehHU+8dqfitsiXIbVClu7F2n1GeUqz5knsxUs4QP6JfLTrZn3kZV8YR4ahVqkBOwzafVE"
+    "o9aZmh6UHGA2et4riYU+Un/RvhBPu1IBJx+p8MZ3YVp0vx2N9Y09714ei0eUZ3VKb5y1geAH4+GeNKlk/uyfKxYTViD3iwYept+5"
+    "+9Ls0k76IhRvV3Xs9+lLNjc4/h47c7+Rb74mR5jKGb2E7e1OL1Fr6rOf6RGqRSy47P+b19KU+nRDuGudwI3TMg+mEbloZ/SL2xMv"
+    "BxMfDqQOXglsKC29FvvIa1Xn3wY2UhmbswEOS2AtuhGX7fmKfzOQPoaS9NzMZr5vavKYxeSC/Tlva4iJluJ3VqF7kgzu+hgw7o74"
+    "/9a8Pp48Yhd5xm5ioN/Q3h8HFtiauU/yW83JNzIGroUa+XIwg3rkNJngFm+G99AWbt9LehCP8wxuk+fLDpRHY/g8OXM/OOSZ4HgX"
+    "ps/CS95cAyxhCJzzX+iFfk1e+D/wtr7MLYjkZ/m8kfibMuyNtdQH9vPMlhOzziKmvU7N8jo9ej3xJ4vJVzrA87xBvqBZu8KqZZci"
+    "0KV7RI/pfM7oFOoJZZnLuw8+wh3i0af0lcunzAZfmoi+vmY9Cyd7E2kcgqTkp8mpW7RnzuNa4t4V4KCKVe+I98S82N3sg5ZwQoai"
+    "CTEDzr98o3xVd+b3lOX3DtFv0gm/Uwb8Vt+zGLz+H7hPzeFHKz5pE2l4VydqCr2ZmfyFGnIpYtLKfMa3nIXL8OtDiHt86N+F0K+c"
+    "CMwrOrzIx/Rp/UuvSF1m7qRj37aHIyn+i+ZxeeAdKJ44TA/ot/TBlPSavxtGTFWAmq0wdvUF1QeL/QxGK18chi5mK/aPsBrhEnmi"
+    "LO4UTyEG9bAXYA+9uCbVdRRbap/r8+/xHMKctZvhtVr3Mmq8/2MeTh8wZs3oKYLdEC4dE7xDeU0beIPiMfWiDn/Qa7HvVrQMOsC3"
+    "8nOSvcY1m4HfHEk96CE6SjPBZDYHYhl8f2O0SfuD7akvpCLxWSawlKnYr0tg/HmZIVmFdUoCllCCvo085L/K0++67Pn8Q0w0lj6V"
+    "NlGGwZ9hH+ZEo7AH9YDS7Ml6YDBTyG0LU6PQmtcm9lroNb/yEb7+QtaxO3Xd6Mx5XQJ+o/MmPCEkynr8jqF/2g0etexMe8UHzK8e"
+    "EWV2NSv8BcXi4sqMJVf9CE8pK5h5Smb3tOacn0fXrTfx6b/4wDb8OZGZtD28xjs9AeejATyuQnCZG5APDkZz80f2Yi78zzjy0elw"
+    "c4eRg7Yg7nvmNW7bn9S9C1KbTESv6H3OsvaQfEoM/OYJNDqbUUOfid9dDicxK71LQ9FP07mUr3rN3I/xzL0+wpyrzvAHy5D7B2bC"
+    "tCXGOM8zmUBO/g+8yjA4P4ew5cIkhBkmdz7/V+p52peaPZYSjZ0r5DnyY/WIhStj7//CDrYHN1wNnpsSHGoz9rM+dd26PJeL2OGN"
+    "+Lfz1HYK0+ululI++AJBYC7jqXkkJS/ZCBZchVptBuoiq8hRtH8zo697jRpebnAo6bGVCfReuw0nS0pdqiGzI45RD3hFb0Ea+L5J"
+    "4MvnR1PaR1/MAHDDEmBWA7DV98CgZxMr7Ge/VkEDaByagLHgmHUEG0xFf/g29rkwmgx87gReawYWt4Za+Snsby7OyVD8jDhr9ekR"
+    "fs3vPUfjpzv6oWFwTBvQ47wS7m0OOLfiyqyLMm3r3+FTxgdXU81pKXHJXeLEm/Ruj4bz1dtlfjwamFB6eqmaw9EKzEc84Bygd9Os"
+    "nnfyExhGwlDf3W9C/GepHVwpxfD/Zgj1zYsX4rdPremzFqdW+JPW2T8fBF161VVVT9bPUzwWx3cPshp4uMt0FpoE2UwD8duFQ1Ry"
+    "28xl9Z8lwUboddXGpW1blVz5FHwscT6K07+532u6Rzc4O1ngOAc4hY+81kcvX7PB+d4fZQs9prdRzvlZfY/qYxpA789+aljZ0CHV"
+    "mZbGYBZ4LMLA8nkMFyzmNr6Negt1DpQTKc68QW2+JPrA8mPC4jQHTM/pmyDL7c4Fmz5/+SCbLdnQY/nC30GWW83jfn7EJw0BW16E"
+    "rol8r86jdGMHwWnSPsrsMTxKvKoa8CkaE1OnggclrtXgYOMbpOW+toHnFaOXIZnz+lDm3io2ju98rnrmDgUZ3+qk236eTm/DC4/x"
+    "VhLr/qT1F2w9PLmiW160zW08m++ZZ3IF26f5F8/QZxde1shj650ryHqH2rltvfR++ew7HvN76iWQ/XpTzWzKJ/K8HPifnfT9JSJ+"
+    "mPmVlnqsKJupURDNP63vY/Kdey7b59PAWxUvSHPzottyi/PwCDqhR+/BZt90Xm8SZdqOOtsHyel9YEzFqFu7qD0JM/OCs1yEu58Z"
+    "3DADvBTNlt5M3/hS5r1khJuoWpbLazlGUWZUDsNXJ2C2cM5I08haxn+liQFky9LwPs0oGU3fdDZqH1/QwboLB6YfvTVvyUfjsL5h"
+    "YI6V6COoy9zZJvQyV4c/cJA5Djnp+19Ab3YN4vX19IZmp7aVj3ymC59THu7gcvKd+NjRSPin6nFJDFe4AD7qIFjEOPx3HuL4clxT"
+    "CD2hituue239M5G3LKPGl5o5S/Lh/cgJStLj+ZrcQZhPW/TzlHPco8duJfpM08kJ1G+tPtmL9FGqTnKUfKyQ8/o5l/3sheddlNiq"
+    "J33QlfElWcASdP5/wt41wG//QQ7r7yGNsr2wGgxiELFAH3LK1cQMv/F9yYm/C9MTuQcexjDivn58Tx787V3WqRt9H9rDo/bafm8T"
+    "YTG//Eqd/YabzT1jefdwtKVCwT3mXzX/P+6U9aHdeWG4QfqPlvfGemn4bN3nlmttx2er50JaEbkC2ivOz7XcFuerV6g98WIpsIVw"
+    "9mxb4iT5fNkP9UN9gWMa0DNVXSIrNe5aaEXL9o5xG8f0IL3Awt3E8YqP7uhx6pepqG0Ks1W+Vh+/Pon68ARi73Xgezpj6cHPhPlI"
+    "G1tn/Q411ApwoVVnFI9INZ5E0hcJsv0lruVxrncsdUPtw5/hPNbx2GwKcTW2wWtY6DKeqrRYxTEu7vzO6WCbB6WgWjzaBdGNp7Uw"
+    "BK1Gl2FLzdBXVU3mIBixYpfJQTZr6KLH6ieZgq1ns0O0rzQA0PptB2dTNkL2PB6c1rbc70POwmbmbKteF89jfeoDgmwflaXvYBY1"
+    "o2PUbprAZRP3LSk9eOvAOYVlaL7Re3zPKno31Ovk41ltgcNWGB+r2pjivLf42MnEg/nBANtgHx/Qa3IIG1SKmvokj2k8iSusOUof"
+    "4AO1If90gRntYf/87rH17u+yGGwYz6oFeesw4q+aYGBlXPSlum1O4imPceKkO3CJeLkbdcWd2IHi5PriTb/066Majykl2LPmcU0i"
+    "1s39VT9wFPh0Fo/hnNHYE+OZjf0J3P4A5+kDmn516XuWLoae7bZt73372wT796vW9Haw9VaOd/ac6hviuC+Bey0OyjfoIqxAn6U3"
+    "9aViYFtD0LCq5+xVaQSloj8zrsfOTQ64vLI5HZ1A/N0a66ncCSYZRn33DZjUJHQv2xDLTSMX6YHezU3i0bHEZQ/pyTqEXsN6sMwj"
+    "5Ke74U12AF8czmzoU3D6k9J78ApcaR17+x9yzlhgh/fhuSlXekyPQGlwV/VHlAGv+AN8cx85TFMw5UJgly3gvATBo+rA+3JLv9lr"
+    "/rMBZ3satro5s2nfgrX6sJ0XwdLER8rA3Iaf6BNZhs7FbficLZhBnBTM6An8PdVw5P9D3LbPnsAX+ILPCCdHOoW2zDfUA46Bg75j"
+    "fmoF/H4SsJlkYC1jmZknnydbPBcMcB46LlXp30oDRtAa/OSE1/QhxsGfuAumEQu/Kpw5Mxi7zs/TCNNguAfuM4q6RAo4fUPhJmeC"
+    "a/KeHrkBcE6OoBnRh/gjFvxOxYq14EVnxH/9Ss/YXPQ/CsJl7IqexTx6bY+De35iBncsrncbGGcX4lTV9V7xvtj0mHyE0yj7cJKc"
+    "Xn1EWqvj6DBNpLbUnXhZNkx8aH2HOPnCrJUvaD2VM2mu1xG31bL8fUlR1lMeC6xiFrUO5ektoiyX6wwOOYQaWhSx595Im6XTWvOf"
+    "owyXmIRejeJOfWA94uc31LJ/YN2EZ1ZkHvxDr9WsskYazprWazj6OrCfSpHGeRZX+DvmeCl/PxFpMdJsZuHkpoetI/HPNO5pRQ87"
+    "b9si7Wdxy3R5Ga5bzCtbdPwHq2PFo56lWG9R7I++uafcfm2ZLMQyur/FIR99BZ3Xu+MzYnJ+fnVeP3ra7bfNsdBTyQLGJxvQGU2Q"
+    "G9j5qmC0TYm31+BX62DfZOtmuaz+mt3PYwnz3XI+/zewnGvgV42c11Mdtkqc8Mnq8LsfeExLqwb4oPJK2brEHuNCLabf/zLn/B41"
+    "5sn0vb6i7lIXm5Ofev1i+przEksUpS/hOniHzmwicr0E5BbB2CLtec0F13ns6Q3zJT7h9ufqicA4dnBedG6zXw/zzdnl9vuugfhp"
+    "2dB8e8J8Zc+YsFBu+r4j4SFPIqf+gP686nnfe4zPtA2dmlNusx9Dg0wzQDGdnoE4L1fhyLUnXnkJxiQfKr+cHq7gcvyEcgVxBbOB"
+    "df0PbZSqxEMbyFuFJR1lJuBFYpzXzKqW3l1m4qy6zOXpjc/UXnqLLsFCt83wPY5uRQtyHMWCTcmLylPfGkLf4x9gaPmJD/pit9ug"
+    "G1oDnzkIHa0c+Mm0nIPO0f6bP5uV+W2aKTziq5l3g4iRK1HbDug8vGXWVk+0cxQbqoa/hVpKM/L1TfD89fNUekdL86xDWH+d9xbg"
+    "lYe+mim5itwoO9wnYW/iyCTl7C1Cz7Y7/qUD/MbAPLCq9AB0wnZ0Im/Pw7ytUfgqYfzC+Y7gSyvy/u+Yu6044Bdy4lHU0tJwTs7A"
+    "s1lBHpLDa/168nVaM+GQ0eEUZaRuFJinOQ4e4xfqNQ2Z9+PXW44y/saHSMOMDjGf+5jzszDLltTKKuNvOsHrFA6t9RdP4RO+8CW+"
+    "rAd6KnmY0zznKy7nGWrGieEW9KQ+upD6fVt0Rx7igzOhu/z5q3lOd6gd7qCPJCd1vrPUbdeiR7AWLEX25TD2pD2f85rYYRu6asW9"
+    "xg2fh+3KRU43hVz+OXlnH3q0nzO3ohLaLtXowUlBbXswz6k7NkAxgThtf5Hb6BmL+9eCmspK6vKqfc1gzupd7LiwhmlovcrnCqc+"
+    "+FeYL+VZt992lMS27IQPoRjrwR9hvkaH3P5rkn07AgdT/nwfOGwj4jb54mdgrh2iDPfewGziqmnCfOsaBvvrY9nQHtMa7UsZ5rvp"
+    "vN6O/GQda/YzecNAaqWTqW+0oiZZkBpDQDd4CdjDQp674nVp/EWnx2Z+ujBf80bBfhszmV6/9uRA0npoTl1HZ7JypOEiYeBPVan5"
+    "7gSzkB9yEyf/SAzbFGzxJ7i0W+FNp0N7omUAd4AznJAetoAGWWd8znDmnccGu5It3h9pZ2cLPDSd/WC+owE48G20hneAqXwLZjEe"
+    "nkQD6oGTOIdz0DnxYINac5/vmEtTnXrhdrAdYQVX4DuOoB+jOnXIOeSlGYhHq6DLdANdlp/wRe/RQlgNF2MGunnxwCrmUSv0c8+d"
+    "fdHMeV5j0EXex7N6miLMV7dWsH+v9gebfYJ/+4E4oAvnazA+ZTSc1XXsi2rUiutTLzgN5tILu9CC530GWzKe3LQo8agw3CPOdfxc"
+    "x/q+w7Hhuvf/JQzzXSwf7K9N3qBf7jJYkHqV58DFqU1+J/ssDvtNOOaPsRXiiwl7exgjzPfql2C/z04P7/kOuMMmNJN2E8Pp3+5S"
+    "+3xAvqH93DCm1dPexLG9ch5tM31m8Dd2fvV6MicwXe+ymltOuCDriZHLgRuMARsuRX1lCPi2+s7/hQvWFG2Ss2iFrwvMNSO/3Alf"
+    "JC38gKTwChQjtcAW/0MPis5UdubWF4YTNhzeQlr4FJPo9R3KXNzicJ/EDTyHdkGgR3ot15UaXyM/4fH9p4kZzh7Y6jUsvDZ50S1i"
+    "4n3YyVWcxwJwmE7CsSmOLncXcNSRaHBFka/Px0/shsNQC99+kfcPp1Y6Ac6wYp2/vcaReAEPojO9UY15NvuoEyQlFxsJjj+Becf6"
+    "rORoZGp+tvKx9pFWR1DtTM9qd6TVFKYffu9r/CnIn5uXBp/YT11C13yqxntf4nrR/XFbOmYvKUYa4CQZ++BI34RnUBvcIyNYXx96"
+    "pCPh1E1Dg6kMPIQzcJ4G4YPqccY7c47nEMsE02c8iRjyMJhnX/pxy2MPahI31qQPXL+3223cgTpo4Z2gjr2B+S3+3gyX6UCspGfZ"
+    "rzFE3iSfIjzokcv6B/plt16SFW7r4dnAM+nL5xdHH78EdfUjYOxBcHf+wB5lDjKf9MVJAquEmz3u65zHK1mNw/qrc3bvOg7pYRrn"
+    "Xh6Zb/L348HRvuwEZQUU+zmLe0PcRue9T8QNdf6eCw6rdJSkiSSOdpB6WCMth9YstVFcewPifvFapBMhu6ff/5W+U/EmhSlq3pji"
+    "PfEHLkbaHNPYaDAE5mXr7LyINJ+cCG22isTH+anViEP9PzitYXB2StHfqPy8unMPm7zGsxaffUak7fEF9MDEoP5wi/eqlnWd2EV5"
+    "vThhd+ilXAs3bwR55BM0h/T3sZGGAXyiz3YyPcU6F0XAd86gde1GBFRx6BLn33d7rY51Hc5+bGpcF+Az3GHvVodPkQm+9ibwiCxo"
+    "cPyFj94NB6steY1qaR7mW44ES1CteKrXeFIN2Ct5o4w/HgbHTzFlGfj+I/jeYPrtlCd0w6f9g928gg9riY1PjW3qDvYxDL2hpnAj"
+    "yoDZ+XVn0Q+vy2d+di42ITMHpZesXgWdYc1C6+Q13GEYz+kdtuQuPBntucfO+5urZ5J6Vw2wKfGXfWCOP2Nbw+gzrYdG+Czw3LLw"
+    "sMqBl0+hD9KD3lYi7EApeBbz4OpWoIbci7z2e3ijRdCESwP2N4hrPkIsmwDNyT/gP6YhZ66PTsJ4eGhLiV9rw60Qnywj2Pwz9vFd"
+    "/FAj8vPT1IdKEvPrd5VHZIMnGEZuXYn7EqdWa5CLXPgAzyzQy/wcDPskvtgHzyQh2PJqZg4FZnVMI/5+RE5cjBqkzkNtrr86nKxj"
+    "1N/zU1vIjq5wK+ocDVnXxNhA1S1K8pwGgjecZv+2Iz5cQc4+jufYkf1Zhpj7LOvVi9h3A9/XiO9vQO3ib95Xg9hpLc+1DVj9PGxz"
+    "cWK2TWAwTdBHPUI/4Ch4vYfwSWNZ04z0fX5iv8+ldtcA2/MU3mxJ8rTU1G7GMiOuB/iGfwY2/ZBZiBMq0n9ejlrF31xrJ/K+ROh1"
+    "5YCHPQys/w0xT1Py70fUi5tiCz+CgSwnRoqFDW9CDBGba9Jz2UDuIb2am9QahMlfpeelDjhxDep1Y+D0TIE3loIcfRf149zMW72E"
+    "76/H5w1i368ndhxCrlSe/HENMU9u7mMF63+FfK8c8dwitDNrg1G+9P03C2MB+dxY+JYvuJbC/JwQjGAYGkLd4H69IQ4rB8ZUmJh7"
+    "Kuu3H35FZq6vC/2hineukqcIo1efdwtqUpmJiTYRIw1G620tc7jVo1AdzpP6wdPRDzSaWTTivb6nR3QyvWED8Dst6AeRvqd0YIa4"
+    "7PMVuykOEEYfijZYXGpX/zr2V7w8Dzmil36TSpoD6zacKBH8w/pghv3Ju2pgV8QvSuj8nvSHktELXQPbJTulmnNnNMDFJalNj7z6"
+    "8jZiF/396tLUj7LZhrJPA6TBGmW9kQ/R0oiPf0tG/7rwp+7Uvg6B13ymn3wc+qxVsdMV6ROOA6aQFK2jpNj9LtQZC9ET2RA8rBK2"
+    "qhpxtT4vMfNJx0T9N6tFfmUEHKPk+Jze9BVUxDftY4bdz+KZoaVUyGX6QZPhZXaEg/MBf9yJ3O8wNi43tdJL4BL3iYkzYOfKEM/G"
+    "xW62ZB10lpJjW0uwV7QG6p/qTx4ZC1xjNjZ0EJqfczkj3dHzHoat2EDNKxRNtRJp3vi23Q72x+JucJCY6JsNT2caaP2cf7gQ22L2"
+    "F84FLEBj2sezWwFv57oT65RSbhplukYZtBfCbbax8p0qzIDdHGl9puKESE/3V2YsK7/qGZjX4jHenWL+8uifbPZavvZ6j9VurkVa"
+    "P4TqjM299tpf9BQcw65kof6bDzy4Ljb/LXW3O2BU4v98A44ch9xoJnn/EPiMM/F18eHrDoejuhNcOB3+7CE2qh9x2zQ0mRfS7zSO"
+    "Xop17B35TOkK3Od9x+B3bcamCdv8gzrBODDrcGLe+tRD9mLbDniNn9YEDnQovLODnDVxnKQZcIbepiLovqSBu7MaP9yU3sC81O8P"
+    "YaOXcv19sOtJ8CHj6L2qSfw4ENwrHbb4T/zCWTDx5viMDMQilbnOkAAuiw6jj+czmDp4AfCwWdjuI1x/ZvqQ71Kf7EMs2I7fu4/9"
+    "X0VOmx2M7Bp1c9XPxNc6DS9MsdQW9HEu0iejdbhKvechfbKDyAuOYDtegFclhPuenHPVnbyjOX214ijmgSNWgT41YSyX0LSQfx5C"
+    "/8B94k/V7qPgyVxHt+42HDH5mQ7obX5ijYuTr2nvJYw0XUL1P/ckPjlPPCLMcFGkcciUF3jB0kLpZxpL7b0TM4NkGz97rXZfH+6Z"
+    "cLEhX2mr/k0/0Vqeo+p58ntHvMa3j4t2cWKv7QVpkcpuixO8j88NYz2Wg0/JfigvVS9T5kjbXzE403MjrfZVi55p9c3Ir37H9edH"
+    "Rz2p83N6l3GZH9NHtYNZPFHq68ls1z0THQCtZZXY9sxfFnNscNV3vu9/j+73yxnQ+tJaboerpRgni9vsc1f0B0OJYz8SL4grk9u5"
+    "3uFo6sl253OjAw+vZ5nb4pbz9Bn1h9P6V5ThhGvIW6bB5Xnoth7wXdSUU5JriTclboDIGOIWB/KnX+gVD8eHLEDfsSB2vTzY43t6"
+    "1nR2Qtj/g4iV9bzEc8mITl9eYiR9VJwgyzu25zJezTzi7fxg1vK7TaM7tiGGaSDeQvu8QW7j76mOURqMrBv+7zJ+QGe7VQpy0LiG"
+    "23aPbWd9QHKrfVX53mKe2fRPuqmZBYE9LYtv72uc117rAUZyJJZ9z1lwhH/5Lw12eiB20E0OUwVbpuf7nHnsqrEUxV+onr0MLeGJ"
+    "xLFN6bG8Ra4wAXxRuOJYcqwADiVuveKXu9QNY1MDvcLa/ACnSBxo9Q3ehwuT2vHFTz8b16YkPqIP+NE2NNzeg6cfdtnnbw/0EdHP"
+    "+C+84ZTEKXvJC+qhV6/6hHy9bIy0goWxyEDF8VocIByzLH1h66kTJmf/XeaclgHbm8f5fA6urL45cTdnO/ex2mv8miPwCr4HPz8K"
+    "V3gNPf4zsdEn0c8RlyUOOUFccoT7xJoV2Pfb0Nr+h36PxtQukuJ3/LPk0a9rQJyj5/mU+z8Tab45D/ulP+uqPFO67zfAcWfjJ3bD"
+    "rVZ/Vk1qJw3I8x7Q396BXsjj1OCzwRs6Qx18Ojo/E+lbUd73XvZYPJdI85lJyRv/Zv3VH65YqFykPQtxyFRblh77GWIMP/8HzHsE"
+    "td7xaOuIbyXflYs4fgY9W8Hw8c7A42gADn4Q7bzJ+N/j9E2JS52SfZeX/q8p4P3K14owl3o8sfR4uA5jiUvaeK2Grlp5rM/Ws7cZ"
+    "jpf+9/d5Oyfim4XwLGWP/p5nNisJey2Emi+wVbT76+z39vLzF2oIiielARbDY3HCZPJL4dbSOlmBXVuHjVpOr7+4xxeoi0wkTysA"
+    "rzgvmlvt0Si6SQ/sRvKWW9gY+cFw5m7ovCYgdn1CjiBb/A5t2Xxo6x7A/7aAQzyWc1AFDmJLcoIO5Ihn0PscRB29HjUo+YMXcHcV"
+    "p/yIRsNf9GjJdqq3qR/9wNvZ29PZDy2osY4nxv1C35/wAs21iMlswz3gz+3B97uA86lHJRc8tYpgNF343J3wKw9hd0vje8Zip34A"
+    "v2nDTLi64ArK6/eiD/wXz0Yc9b1wnP5Fx2IY/XeKgfbTDxoDvsND5nLIp/r7g1jbAtQyI8BobpED+rDtG6h9LKXGLu7yWfTiJxIn"
+    "dgDX0l4Y4+xfxRY/E2OEUYcNQVv/GXP+zpG3RifHm8x52a44z2V5su7r0+i3vj79gvz8lytgHz/zXBpi0xNSJ27CHllNfUBrv955"
+    "f53+QX5Mry5+XGtxY/hb34LhQf7cOydYQz1sp+rYT4e+9Y0cHeTXVexHzbs+mi33wV6Ux5zGtq0hn6848K2vXNcgP19Vz22s+Ilw"
+    "GvaBQ2UhP8+PVmFB+g5bgPXGAaNsQU3741ezyVd/NZ+7GmuSlnq4zpd4oKvhF4lDcRF94wCeXRz9vXtoU4nToVitptdmYGRxviy3"
+    "Y0SGOD8nEYcx+1vfgBJBft7zVmbN/MW1L2CvzMZ2tqcmPwVs4B2cSWE7x53PWVwqyF/DPk0+L3sxMttb3+HiQf68IBr/pv9KZnnr"
+    "q+68Hkz9eAn+v1rmt74GhYL8c5U85EBNyGErgW82AFPQGb6Z6a2veIwg/3rEhtOlvdbZef1iySB/TS4w170+8xcV6+RN/9bXKW5Q"
+    "tDxBNnvILQ3nMNOKq/7JakQRxJftwelno6mUlTlnZYnX5waZbsUIt3HqyoDrjKFPVjPx5A+lST0M7m5V9ECa//DWNzp5kD/OG+Sx"
+    "fTOROR6dg/7TNtS+2uq2cxjQDcgB9tIZLcj04DOPwHGLUZeYi+b6dDCHm+SZeuY+5t7KV4jDfQNO0X5y2WHOay+DDJt1gZH/Cc5w"
+    "CqwpPhjrEDSm1X+wCQ1rcV+XwVPNA9dX2EBCj9mevvBSpH2guvUp579bwmGcxW/gXPwV5+eJX2ymzMYvFivG/GL5/LovNhf1WrjN"
+    "alz92fb5XWa+qW9S3NpjbuMmOGbGzznKiNacegSapXvre5vI1j8e3JEp1NW0X0PLvfGdnhrd36eg/xWIAde2k+Uo+nvJLTaLLjCD"
+    "ZDF29BZ6m9HgSY6jd7oftb0McMcUNyan3/INPmwYfYW16EnyUgMsg+1cQp3oLlj2O/b/NOrc+eGPtIVbuMttmP9gMPrz4O75qRvW"
+    "Yc/9wd7sCVZ3kznVc7E9S8AxE6NVPgEbdgc7lhi8Qb5oCzz/Uuy/dtTN02LjRsKLPMjsh5FoIbqwE6fAS54HZuFEGTctIdhHIXqV"
+    "l1Obegb3V5jb72hMnCN2yQQGe5Wag/K1AWAc9dBOvwnvfAtYZXV4zs+ov/WiBqdQVjZfccZR+vhyUReuzl7Pzu+vZs7CSvinVcHw"
+    "HnEW64JbzQLf/IX4QLZYe3EVcwUKozm4Cv8S6rK8bD7+8In0tp377oV+Y3HqRLHR286JrmtP8mddbyH4RT56HmagddGZeWJ+vV7i"
+    "iF5u+xz1K8sPi8spjEezrTqgG5werDsVcdw9egsT0NNQGFxWMbzmTyhPTgOn5yV93Cd47k3cVqtISp/0InhWv7PPxLMciS7cMvbz"
+    "AXx7BnCxNWDApagxjkPDqyLcJ12f+rPVRxCYaTaXWCEFf47jnOSif28+fKxH1JEvo3kRC+3zPvQxlGb+12We6UCXaX1phqb6CfbS"
+    "0zqZGoeehfAM9bvLV4o735Ia3HB8UV74eLfhlwyAy6n7l0ZENmKCE5y3GcQlR6lddSV3WUU/zj76EeVv1B/4D7Oa8jI/U3NDKoNr"
+    "KB7MSX+TehDOwoE6SI/rc7R3ttAXfYZ9KT67YlXNHx8FrlkIXOoy9dGGzrXvcBlGcw4sdxn10FecmSvEocJoUqEPPYAeNu2lWczJ"
+    "nImfq0xtpoTb9HPHR/tPP1s91KfRI/zEOu5gHt8A+OpjqZEqnzlHrH2aufLTqLvEdg76SJfNN59BvPIcjmmGrzSTFQsIR5PG+1nm"
+    "mnRknRZgf6UXWZuY7SzPRLH9SLTqKqFRMZ5amezB79gtzZ7NTk1O51L5gZeY4Tqa/bN4Rne4rtXUT1OgnfkduGsEuehL8PFwbLYL"
+    "LY5wZqFnBWcKJS7aSl6/n1whGD+jGQXleCbqc5jrsRrfCupYn+jlWI6NasCMhr3Ywens1eJgIrsDvSwui5H1HB4zz+Y+/u0q8XJG"
+    "4mLZ4bFocqv+oFqovmcj9lz4/CxmsDwBc3/GOVePrjC1dsxQlp34nZw0F3iXcMZVxIgF0QypRv6n/Gk3+kpd8XutyYlSokcanVrt"
+    "I+pw+8DoRsMdmMKc4tXck55DRnKh9uyfhsQvpYiTaxML76W/UPcm26uYSDj1PvDh0V/V3FvitxIQl/xFD8IQOLkb0MTx8NyOgoFe"
+    "g78xGhsrDEXaHTvRyukL5yIMzsFGMLfFnG35f/WlDIFb9wU/0gEf9gtckvHslaP0JMfB1s5Hb7E38cM8sIiy1CHKwYvqxeyk+fTM"
+    "zeD1vuzdp+Cp9YhVGoMV1CHXHcU1NKdW/QC70Y4zcIA4ZQQ57HF46F3I/XfAS4rFeRH2Vom8eSa8gw/0ZbYgh6tO7huG37wABpSO"
+    "etIJ6nhtibNr4XffgMeloOYSRu7rX2dsXiPqYuuwizHYX/PxfZPACLKBT3cBz0lA7hGTGu8Ter/qY5PP0WP4J5jPaHpkO8NxUO4w"
+    "6Cu9atnPcviZCNY4M7HDMWoTiss+E6dWw0YG5kv/BL7fjvX5SFwVmCvQFB7UVrDD5sSzn/j+sK/mMxfF7vdnrscresPOk+s05n5K"
+    "UWe4iB1NybM/B87yO2f8Gvu1IFy+afi/P9H3WEqsoev7idxocWCuFHzX9fTi9mfm9Rtw+DGhln8so8Y8GU5CnWtWbw+cvX3EHY3R"
+    "xkrKPunPLNhHxEnduM7TaIgWg2NbCmw/FvtiIrj5MnRlSoNX/kie05k4oy5rs554TBpmD+hPfQTWfQN/VhEc4U9q45eoX+sc/Bxl"
+    "9uI5z/8Ymh2b0erKQ79wG65Da5UfvZVE8DkHciYLYi/z0AfdnPg0LjWRkuAF19iHCYnvt9Hndxats6XYFp3J1+R1A7HffzMHoQi5"
+    "WWcw50tgHw+Zy/I3NawB1Do3MIevHXwJL1yzcczEjM0+mcC9z6DW1wxs7RF+Iy578RZ9trPQ/TlODBuYBTCP83CLXqhR9Bc8ppba"
+    "gBppMTg47QIxL/t0KFp88/AvG3nvNnin18Fiv6F/+gL+pNlXtfjxYF1riB+lGz8czD03s5d+53sugT+X4yz1xUY3o777L+syl3yq"
+    "M7yFquT0u7CzC+CwjcUHHcMmT0an5BKcwCHkJs+oWW/AJt0mvplEzecGWMto1n8r91gbHCFQpx9Er9wiuMTCF2MTL+ykF6ct3KID"
+    "fM5Oar3hYKHSuOoBri1ux1TypZou49TNI6cuy/VtwSbsIH7czmd9IU5tBB+nBL5pEXshM35VtaJbaNrd4Ltf0KN1EywqGhhVD+61"
+    "Mr1ru6hF5YY/GJt9EsZ9PSZ+Scv78rGvCsJjHU4M9Ixr/pV1eUMNZCNc6HLUPafjU1Ohn6Wew4lgVQfYw4qppW+uXnLlfdIUO+U4"
+    "nSFOUv+D1/jdP+GPvofTlYq8ZRmchRLolj3i/MlfzA83TlTLCMvPWji2+ZTjsLI5nysNTukVqaeiLzhyN/ZKbTSEY+Jf9lEv2kL9"
+    "ZhOYxkF+bkY8sNRl2indiNV3gcMfRRMynHiuEbHzD2izXSdHHOi2fpZ+8JOz4ft2gYkoVhevLAgufyJy5hZwvyI+G49qKL0ju+Co"
+    "TIL7+xt5hLRNNLNJcU0Lj8VIwi46koPo909hw78FaymPVuYmfIrioKXOGspvKHZtisZ5IfTc+6JjHoOaj3IO6Zp2Jb88x7wH5d3J"
+    "2OcL6UkVhnuc+4gXZdwMv8ajxziXLdApn0dNpyn16rpu0+HXPV4W/4t4+Q38823szRLwmRrCrRoBf90F3qX11X6u6DX+e0OvaWkv"
+    "hKPUA97heTBB9RWEs0Yt2T/t9R6XcWG9X6xX55bz5wFnL4ZHWE9lV+dL3362P39x/m2E8zvKg+LT/5MGO/I9vQyy11vp0VUte4Hz"
+    "XvU5vnb+jHTen8P5b7bz30np7XutdyI+fRa/0QcUDR87HZ2bR+j9LCQv6k5P9UbsdS9mvRcM4Fcui4P+clt8F+AcCmMZR37bGLvY"
+    "HBy6AnhkcfKxb5intgPcUVxL4aK12Me34NwVAaeJgd70aTRbNT+pPbleZmJ6XedG4tVs4Cge5jP5wLk1U6Ibeaiwv+Uew2rLEiOe"
+    "pc68C92OH53fl5aX+FK5qJPJvs/xGrdCvKa69ByPAnuZDg/2E31q69EZy43OZD1mkchmTcPWJybX7omOt7igwvTED0iHDtE0uG6n"
+    "8bFtqRtrn+p3tqMJPJR+sVnoIOu+Mwc061ym9VwHnqSL2chVwUYUV5eCU/aZ628Dl+dP9I+LM8PxMbF4ddbsHPyWA8QQyYgRDoMb"
+    "lINfkQJ+QTh6N260fW4RY9/mea4npq0AziWM5jix8GhsQB5y0wBvsQWx0gNqPfGY4XcSzZj/4dMKEU/mpt/gTzh6VchVB5Fz3yen"
+    "7Ew+uZacvgu96lkjzI+Iz9afXvZ86EL8TPzSnTljqcFS9HMkcVg58rxwsIkV5DIpiZH2w8N+js2pT8/iU/LKivz+frD6lNSJA9z6"
+    "ccRdl/DHwpkroWtyCC2+rfQVfetlbpbb+Njiz2q9LjNLuzK9WMXRyX2ELk+Rr/TeZff7oy+Skb53YTFPvda/dA4Nn9Toax7Afh9A"
+    "Y24g2MoX1nczMefvxLNj0HRKwj7/hnnIn8nnEhCXL6N22Qldrb3E1WXBe/LDQeuNzvgX9F3ln1uBP4r389xjXHutYXpy3t/Qbizg"
+    "tXM/gHWRL5YOQpII05TYzlqNcexzLa9pkLjxiap7NQajLk1OeoPr3sIzjs86XIP3MQBMpjc4zFE4ZjuJ/StwrsSrehJps2sSoONd"
+    "AcziNroFQZzZhWA3ZenH6UwMtwlMKpjrewjfaRY9D23hahaGY7+SnnbZxTpo/WSktqw4Pif6q93cpn+whLnodV2GV6R0W8/PY/I5"
+    "6Y/I52enX065bJZIi0sfYpe2RBq/8Dg62FHEpMsibd838dq9XcEu/Mt8bnG9LpK/S0P2LbYsGnMVtd+lC6T7fk3+PRq+lWxAkUjj"
+    "Bkmv8zM28B803ZvyLI6DMU9C3/EguXRZdCU90sONsB4x9dItpA51FpupvLEbZ0Z+tiQ6Fl0C+pfEdmvAfWpzRr4jN7iJxsVKZndc"
+    "pVdzDPY5Ci5AOP3TqTz22auJy1LwnPOCkc6FE6mzuzbCcvAr5KtD4GikhzM+gbzFr2URZedFf3bGv56E43OQ/GM0+k/xwRfmYQdS"
+    "g0GMJp9TrCGsIjVcg8PkizPZj9fADzeB07uIdWdi5/oRVx9jv/4PbOMpeWIfcolraMIsw0fkxKd8wQZWRoemCppwn6gHDSB2TEhv"
+    "xmzsyxp8dnJi+fbUjAO9TvvQjhvF2j0gJupIrhvgmS2hhzQBWsQVmN1YhrVITO43nX10mGd7ht6B2sQZHelXHEv9tRhx2uWveh3/"
+    "/Or51sNHHeZc98aGJsQ+tYQ3l4u1ncRzSAcGuJ3YaCznOC8x40himJ342cnc/2P2RUX2Uxzyqy1g3k+5tqr0NjxhfU/SA3GbWvha"
+    "dE9PgD1lJkZpRi95Ua6hHbyMf4gjpqDP05sa4HyuqSRzUKITG62mB2IoPNlm6PzPoM+gAftkNHXRRmAI8+H8z8cnBWaZFmGd1wR6"
+    "ZPHhO7F3v4DJBNFHkg9sZAH3WRAeSDN0qw7RRzkS/YsGxBXH6dkbQO02Jvdbj+u5CS5ek+/zUJvsG8AaibUSsJ4L0Ml/yr6+SI95"
+    "TmKUXPRtjIHHG4nWwRxi4sOsQXS4BL+gL1ac+6vM+yej5RREvNMBLOYSuXdnejKCwXjE5+lKX9pP2KkLPKfpXMMB4rmc8JXD6BcJ"
+    "9Obm59kXRpdiAPtoNfyI+NTQeoNZLWI/zw/0xYDz1WRvXyFOG8H3n2Hd84ALbANnvcJMt+P0BU4GS1uMLxlHf5qwq1bU3/JzHmuS"
+    "f8XGPvUAy7mPbetPjOHlPL/jPvdiJ0ux7/uTj8UFMx4HV6A8c0aHElduDGgOUxO7COYbg31eje/aCg5QgD30J7lACL5GPUbn0ZFK"
+    "gQ24z6zHbvg4ndVs1PrEaUqJD1Mfx2x6vI9g88VVSAvG6teBctuci4vUlFYyLyvAg/0WzdQ7aDwH4ZsmwO2Qru09rz1f3a9qT2vg"
+    "FonzfYTY8yi82/3c/+/YR+XGqn99R9/mQmL6o8SqYXBSI/HtTZmfEOj9E6fgR/ZXLDDMVcxnbUT/xk4w3tv09/bg/ZXQm3lAbeB/"
+    "cENzMENFtnU0GIBy8xr0bgT0K8U/2oLm43lipFnY4JH0QT9krkFmaj2DyVP9/Gri3SpgUbPo763Ocz4Ptr0B3H0052ej+PBuwzJ/"
+    "CHBBXaYbsJDfy8LP6dj/B+ByiCPRhl7cR+Tlecg3ipJ76sxohqP6c8dgN8Rd/hM9JJ23Y2Cx8qfv0an5PsLWYRQ6XsfQANUcJPEL"
+    "Zdekw7xXvFyP1W6GUg9LRM4+BA6DYuC3+N22YDTSMF+K3pv23TCeYVL0hrUkFZk9/pnc9mygBgHHW+dmAvF+d9ZT+16x7yLihlf0"
+    "Zr4Cd0jA+dF6iqPUmHilGzFhanr7U4EJb8D3LKfvuRO5xI/olcnurmeOnniT4hNmYN2uEM9sAVtW3XgpNW3F5uKhTwE/fEkOXZq4"
+    "61vy3pLE/I2ZYTiDfuR/vcbNW0ssqLzkKr5GmGwh+At7wDz60k9+j9rze/rj1NPyCf/dknU4zRxH8eXnev/bTxfwCcvokU7N/VRx"
+    "m90rjB1vy1omgEdfnFp0SWKcysw5ewMmP4u6TCP2Sxo4M6Pp6QilF3UqnLET9M0PAnseQ99WK7SCc1Nzqer6T1ejOb0cu5htGQOd"
+    "5iXkMEmJyXeg6emKsrgsHzWkZsRDbchPAnqFZfCLo7i+QC3id7Rix4KzPyUmLw7evIu4rBM2shN+bQ89m6XIz0/AndHzOgfuJps7"
+    "KcpqfvVY741f6WqcQT/0HByLEtRZW6A7soK6eClqkmXA2ROyv2rQc/svNYyW7Pdg5ns9wb8HU6e9yH1OJn6tzn67jrZxdc7lwq/y"
+    "u1usV1Pi0tXM8l3KeYvN32vgTxNTL9Xni5s7Aqw7Hn03x4mJWxADJIbDGUyus4Hz3Iva1C5qQBe4z8ysnfi+2XhOcfGbDZg9u4+c"
+    "txezShNSi6zDuiajbtOIHK8QZ8Lft87MUuVrm9BCOkyvbg44jJWJQQ4So/YHx58Cj/EY8dsc9uN81nY2esx3qI0Xw5eMIFfZx/19"
+    "ZBbcXng2M/BhgdkIFYjv7pN/N2IfXyKO3MO1ruCsXAMXrgWGMByO+/9Y3z/w8RXo+2/IjIYmfFcH9AIUA0UyJ3IPz1zx9iDsYYDX"
+    "VYf49w21n/Xs23HwoduA0XxL3vQn9ZYxzAHvyudfARtMzrObxfP+wMw7xd2alzqQHh79jvxSKvxBdc7DNPbGfPxqKeLFAGe6JvHA"
+    "NPbHavKKdOSxtYmt81EPaE4+nI61Eo7zBXsYSj4zAhz3Ojx+cQ2yUWfLw0yUN2CG+8mzDjJnLhf4dF6wt8l8T0fyjpfkhyPw87vA"
+    "A3R/qiMuAWvVuc2L3udg9qri2fhw1YdjVz6yX/tztoaQt1+Co1aGvbSBc7sbDGMe63CefqzBzIVPw/r/DfZfmxr7PZ616j/JwFnG"
+    "ei3urwWG9JG+p7hcZ0c0UUPxO+Opqe7h80P5vIScwZdwknrxvQEu5bQow5DyUsOpzD3+Q94QmzjwHX4oDvnMDTiBB9lHTbBTivOf"
+    "4980e6ilNMfQJN4Nd78Xz+sA/Z2N4CSGc1bGwq9rS29ybuqR+r0ZYOcdAjPL2FfZ6LcLIu+IIu6+Rnzbnl6/hGD0UzhnreknugRX"
+    "YQb2RHF7Erh11akFDCOvdMH7nAYucZEai36/OVzv8dTW8xJrjMculaSGsgmbVhw+415sVlZ4cF3haNRkP04FXxNu2IQZBpnpc2sL"
+    "hnoG7K4sPV31wYnKg0MtgqPeEQ6XOFGqG72hl6gfPc/B6GKd4rwXoPdqGH4+BvGdj3ORCg2nYuDdi5gHXoPfq0p81BIMrzt4RUGe"
+    "R2XivVfUxZaBg+3i+eQmrhuCn2mPjf6R+xaHIj/PYxfr/i05VG/i0bys00qecwKuQ/txOHGgB/2h7XyO4sWGUcaXG0seKzwwMToP"
+    "D6lR78V3/Are5KXusQY/V5h8ayj6m3HRh6uJf1+AHVI8XZue8zz0GM7i3M0Hd6qIfWyCLdsRsLdw506y7jqH2uOr0O/ZCP/jKLHy"
+    "FeKnAP4Wis7pAmzzHOpsw8GbF8IB0jzTxMT2l7nuwuzbgM6V4sW3xJdv0TQ5hP86jJ+Pzx7tAG67m77Y3NjWTWDGfahj1UQDPS69"
+    "N4M4b6vBtY9hH4SPhDAbZRE4QBS2WfbhD6/hGOLWq6Z+mDmfi8HSJxIjJNL8SI/Fi0nAQ64R3xfDV5+mp0NnQzUo5f/xvLa/pKMY"
+    "ig6ecjI9V+XBp8DZe0gz0W16DlfJI8WNUA3gX7fhzYuwN8pry3itf34IuiL9yUs99IqWASe6iL91UY8OQR9sGPhzVrRNyrC/mpC/"
+    "1Aj0XFBPGoOubjxigDk8U53ZNZxX4WIX6N+4PM58p/x194z2ehPnz9pzX/nStgr294KUcvJLzS7WWSjSzriUj2PaWdA91Plk9c0+"
+    "jqHMUtFsyqUgs+XaLznCDaNrusDOqOoc2kv5L1r8pDVQr5vOf/KyhlttijScSH68q7NY1bt98D36O7pfc+04MbjORc+OH3xP9kf3"
+    "90QPJC/WGSnf5oNv2ZHo/rrKQ+q89YjjioHxKj5N0euDL/JkdD+OkQyc9/fAjPKARi/Yr/zNy3iGFxwlvpX+5u5wi8dWg1m/QYd4"
+    "EfjOeOyPPlv9/i24Z+n/vCK+rwuvRNyWCxGW1ymnb0sNVOt4IMpssQ9bLtuimWdBXuOB7QKP/hG8qhc+ZA65UxTYsjDMUV6ba5yD"
+    "mSF+PIb5kXmx23/DN02ElsVLdCh2gUkq7rzvfEY8arCHAnNS2J+VmIs8ihhnNnzlIazVIupPHupDv8GvX4J9Uy+ZOEcn6NNXTa8B"
+    "Nf4h8BrigLkuJE7z96K6rA79h8vWvT/98qPISwP1nU/0kyyjdig+R2xmcK4gHm1Mb9EUfP5m8ufj8MV+B9OcT92oHfqZ38JFPgFv"
+    "fC/3V5dz+YBYeBv+cRVzjd8H6hMuwyyPEQceo8Z/lN6g8MDn4DeGgqf/SF3pDN+3ldcjqEcnpndWQFfOAP8WLYX7xFxx6MuvD25S"
+    "lTi/EfcUwKqGwjPuRDx3nudS+au4owR2/lfmXahenwJOUDB+tyWYjpcYQdhSNO6/teu/PgPFgV1af/BNcc5rPLedg8fgVGH4w1Kc"
+    "jSBi9DHwhK6xzhWJJ26Ai7Yix+tc5L1vx8zo/p4A/4wpzbpWnuC2+PQ2c0p+CLJ7a+n8qbl0UzTLTT0/botxOtC3s4f9GE79TPX2"
+    "29Qv74E5B+aG6D5PUK/fRH7ZEX3JcR7TVNV3zKQ3ox/7pgQzEq9yze/BOXoR5/Zlxl83uPurmEubnF7g/dQbX+AfNrOvE8PzTwrO"
+    "m4X62XTiReHsvT2mAyD+svqqV3psfu1xxyFMpQ9vHNxLXdumWM59OIa9mPN7JZgrd5Oc9S5Yay1y88Jc7344RuOJBZSLTEeX5CA4"
+    "RaOvcsmkvFe/1xis+R21l9HEdQPJ7WpSG2nEbMPZxJY74FefxJ51hReRg9w+J7Zff+ZhJvkyMNRscBkmwFtQ7nYQrtmdIMNvG3N2"
+    "eoA910YPdQ9aiz+z7wrQx3oP7t1Rau4DeG7LiCm2Oes5UDOY3MY11JxaxaV5nOfwCp7FSp6d1nym23iJ0thSfUJcSeV5p5nTkJZ9"
+    "cJPcSTHoS3gPt8F8xd++EWSzbn7xcDbgB+5Al09xaWowgFE8H332Yuf3NTu2PhzEW+SJ0gx7jsZsJDjxYXC8+tjvVjwbnYcd8FjU"
+    "v6ieSOmRbWcGss6SsPE6+OCB5Fub6ae8Q59MaGBWHOd7LrOXO8IdVt1oL3OJxbH09yQ49+1y7sGluV8u4ykrNkpOf9ZQ8tyjxL2a"
+    "u/wUfkcR7Kp8lOZS3lf+7ra6xSdw5Xzommp/pKVHVz7zFVjmLOKQw+A2+bEf6jfdzUy5HG47d8+pfT4MYBbUZ0fwnhr07FfnrGrf"
+    "/RpktfZGzmfUc3x7h2DTAlJtoTj1kdHw4d7Ta/6aeGABszyfwMfT3lHOuwUdm9YeW7Ps+MF41A8XEov+jVZPBHWh4firknBV3ZyZ"
+    "wpwbxekxnX0uvlIp57O1J/V8R/J5eh438IdvmR2vPiz5HukMrIXD9p4+yoXUBsRV1I2qFzsLPRsKTje7Tc9nIJxL5a8v2Rup6bGK"
+    "hz/tTU/QKOUOzJkZw3yryR47Ux24h4zENSfBEHZh+xqzVwpTf9PzLJvI2SvvrO81lsf2smKW2OjPVWav+Wu4buvzqog/DMzICGcu"
+    "lP5ez20c1jCX2fbczNk4Rc6Rwm1YluxcavheDYmLS9LjtANux1Q4MjGJ/TzoBsgeao+LW33ZbZjKUezbbI/hyD/iM6eiC9aFXOUq"
+    "feGqxbwCPw4mJjkGFhRKn3tW+gsnE1MUITdeAUcjNznpAvomXoK5/A+ukTh+0dCPjeA/xQk54Gsuxx+lQltFtdfZxBjyPcLqe1F3"
+    "70l+OQMsXFzQzXDpDxHDLaA+VAlf3QNebR9yzwm8NxNxdQBHmAsGWwgcfwAz5SdE2j21A5vIT27RA+yzNxiNuADjOXt6/q3JKXNj"
+    "82Trk7htz4iHmBvbrr2dGX0PxYpN6ROYynyBOOQ5R8FaDhFDiKd3mH13kPpSXp7PXOpYecAGxN8TJ6IlGFcnZs9KPyUNe7wrNat8"
+    "5M4j4WDKh+t9ypmjSGorcYamko8XYn57V57XALf1P4gjrtrjVTjNF+iV00zZRMyRG0Tt4184Y0fhugnzzkr8pn7AH5htpzxLZ3Qu"
+    "9jMdvXQPvMbFqI5GwXnw+xbkEpHUlTYTd/Sidrbtqz2l3CMxPmEfc2RSBHSXwGO/4DvFxesANzsm3K9mcAabwFmbSu0mFrlUBjD8"
+    "pmAQm4ixd8FtUc7xBb3gR5yvItjt6thnNznXWXxwDnoBmzFf6zM9Ih2ZWXYC3sJr4rwv9Hy8B2+eznyB7uyBneByc7GVW9C5Lsr8"
+    "u6ngoOd5fRf5krQpNB9He6UTeywt2r7FyEFHgaf8Dqas2qzsdBZivNjElLKdE8Hf08HHGU+/3nbyH/la9ZiUBYfdjz+6RX17MDyp"
+    "IGL/gax5IvLwlsShk9iP96n7+ueiwCkZBAfoAnsiG/YjIXMse4Mf/OI2rdfNnP+H8LtGwNkL5/Xo7Ltb1FTD2ata82vwtpVbXoE7"
+    "MR9cZo3Hco8U5CJ7OS8TmNH7mn39KchqFL2ovTRg3z8j5rtKfSbhV3PkamL3uwW4BMQIv8CRSARemYT8RjmWzp16P4TrbcX2KK5V"
+    "vCptuWrYEZ2zfV7rV4xBLUEzvrRPdtEj/Ac+6h19SOoty8AciT5wkHuBEx+lB7Y+nKES2MCOnPvhcBYGghs8hQO5lnV6Ttwe0NlP"
+    "BkYSD4z6Lfv+Ffd8gliwGDWR9eTDWcgrSpA/tGINQrEVL8F5JnnNj4+lrvmE3kCdcf/8T5fVwmt7LOZrDTe8Mxj7OziorbE7l3mu"
+    "+cmXrsPzO0Xef43v7YROYWs4cWfhbuSCMyYei2bIzAQnusSzjsf+PML5qU8NWDyqDGBV0nfpxrlUjbU4czia4WtU9z+MPvFGeuaU"
+    "D1Ugb3j4FTcpcCYS8mxbwZ+Tz5hKDi4dwg2cvWr0T9Wnt/Ij/LcjEeZfnnLeWnO/qpMewJ5FwQuRTdUsoXech2rEcrWpq2WBR1Oa"
+    "esU7bOVG4oTs9CbKX0j/Qr/bFe7RaHSKM5M/T3B+1nyfpXCIpevo11yiJ2QzMwOm0ic9mxq49rpq6KeIeWq5DXNqAo7zHG2D++R/"
+    "6s2qBHeyJf57LfhgdjDBlPBJAzod7ai1VubfA76yL/qTRai1yVZ5qUmW5h4Uh3jBj6QdK/+/AD3ZdezdOGhVBOaNfKZH6SK56B70"
+    "xPOhEVCJ3qWL1LAUF5d3NofmZSs/aICWrvCqvGCQc/ElwvU+OMb0vbNO34YbPqvY8HgDO7PFnxnOX/ODra3nqZ1V8ehi0GunM18k"
+    "zHzcRGpvS0+b/Wz02u71fMqPvnin3f648ja1md3UEiqBTyfmmTTmHqtR43zKOTxLze0FtYdM6K8d4AwOp/8soMHfl+c0JjAjHBx6"
+    "S4D/jQ2LieZnD/KGQuQ88eGaJASva0WsEsXZ6xCYA4NtaYSf/AtbVxr++CjOQCtigvnsm4zcg+KTxt999MU+5fbbg9/IEZVfHE/+"
+    "0ZfrjNu/75NTT5B9/SvZR98sJwE8SQw5G8234jzneeB1TaiZS5vpLnvoMeu+CHyrP7hYVvRK69EnoesYDEd7osdigZLMST+LLnRl"
+    "fNU2/EOAsxUdrutBYrM75CvN8KMFwbvKUFeV3nB9OACVqYO9xh759Xac+/33rM01DeP65n/Vc9EjyUdfS2f9DpOzxiGPmkHcco89"
+    "8SzxR98k53Nc6PJW4bxX/Paj76mzP8XBnA+OsItnJAy4O3ozidivb+FOZ+VZVQc3UHy9Hf2tK2istoTjtBtcLhZrE6iD7Sbn+Af/"
+    "WpX+s0Cfxmryrhv0L3cCR79JbNASPHwGn1WA2e6t+Y4u1An2sR6l4G5W4LxqvcUNUu16boKPvvJaB2rmbmqoMc998BW9Exxttcd8"
+    "XbckxsEuEc/y52epbb9t4j2dqCmmoAZVE3z7J/ZEM2a6bSLWrIAfDsHuHgTzTInffYt2wlWv6VHvg0eTA5+SFE2mEmD414jRt9L7"
+    "Xw7uXAXqVS+JP5/TBzCZePEC/Yg9yNM7EKckjfbfzNhD8NpeYndOwRuLDV+gCn04uv545H9TwfZWfdUvs4zX9WxmMvc4nDg2lD2w"
+    "BDs2jtrCCrhgDfj+0+hQVQaz3s/3TOZ62vJdf4OJdfhqntl0eG+BXqIfyNXvgB+sR0e9IxysUHgCazm3+dF7/4v9u4363BZs6VP4"
+    "aKopauae4mJpqfVizrPOY0H6nO6yX5NTR40EJ3eTb6yA39kIDkQYz6kP57Ai3MJEYMh3uMZa4DLlwMGfwEEoRU7UiFpTPbhoH/iu"
+    "EazLePb/9+RZWbi/Ejy7AnCx6pOLZsIubeM5DOVe8uArRvD39/B6B7JXvkPP9y345UviqHv0q6q3fxc1+drUJo4Se1/zms/9Fr80"
+    "kOels6e+3O7kueLIKWca5jUe0w64OY3pSVKs54kyzqHWeAv933rfJs7uZ/CdGdyb9llc5lH+Rs7fG/22QM4RxLkpCxdUGFNSnq9/"
+    "dlmU5cWBvt0h7NEtcKISoRFwD73NMvxeKfTjlc/kYf12gReWggsXlzhwFHt8B32rVdFhW0v9/See5x3OkvCX6V7jcoSwVj3RRisN"
+    "3loVfE42RPPVhGeeemQx6xev3dskeF7KPXO6ze+VZoZqOP72XQqL43rTf5MVjGoiedZL7iGKOSy3yWmKwCdvQ01zKPtrFdo0J8HG"
+    "xf9eSQ2oM7VP1RT6U5NoBla0j1qOzpA0n6UlfgoMbiExbjX0B6UtUMxt7+vpMV5lKNw/zSi5SA44ilhY93bIZXXVjdSXhF/8DU7T"
+    "AQxS+/iux+LVt7wW0235UR238W1ug92qj2cbs4/yoFfYH76/OIPhbut1vO4yvcgrxL7y0/miTDNS+1Q1j/1osCumvYIWsHga1eqE"
+    "+vbWCvHXOBPTX659PrdqqC9PqRA/pv8M+6e13/9LqK9LoRD//RYn9r8MnjoP7TFhyOIW3SI/Vp3sEH4kF3nwFnBtYQZ5iRcHg4tc"
+    "QedjL9iCvnuo287X716zoUXgolYi74rDNXQgpu4An+Q4uO9+8IR84CMXOS8DyD0qcJ77ohEmGxmPWaXKUfJWDvV17xjiz2Xrwk3Q"
+    "ejSpFOq70z7EXydJTXwv396wYqjvaG77/e34fdmpzxVCfRc7h0RTvn3iq5nLNVn3Rti9f5zfC2ob4q/rPiZfuv+VxthSct1PLuu/"
+    "KIbdFI+sCLNYFDfkdj5ncYEQ/3yGw2iGn0cTJjA/OzDvQn77m/KhvjIdQvw1ofrEzbIdY8qF+kq1DvHHnsmYMaX4c7Dz+kbn9UTo"
+    "yZ3HN2Z2Xp/RJcRvS9agA9qTXhrNVNUeDGPOlHCDPl7brxXhl8nWyf9GlA31vcwb4o/tY7GP4hGHLcefbeE5R2E3Z30VV+fDT/dw"
+    "PudGuxA/z+A9uitVmfk7B+7Gv8SkC8FDn4DRXoJfrD3SyPmcm85zVRzdBi3k+GD43fDt0qUsAY7kAi+rxc9Vfg71/d0oxD+LPo1j"
+    "B2SDPruMl3jJZZq6H1mnptjioXD8XnJ+8hH7yQecRKNCeXBG7iMVPqkN/Pr7xF07sdUtwSDEz6iCfsk6Yq1ixFL3icu2gxEG+na6"
+    "cl2ziYWKkFO2Jj89jJaJcJ61+N4F4KnCX667zV7+6TLu81lmhOSip3f4V/pOZ/Dtv8JPiaCH43viokmcY/UQvqAGWoua9gZizDLY"
+    "5m7UZKQbE8xcA2lcbHTbucmJjsM6epJy0jsWmIdchTpRBPH0IPLks2j11SVGLgfnqwscpZxoNB4hlhZ2E0nd/D0aU4WIU0p+pa8v"
+    "/ugE+IlnqR8v4dlrLf6Hf1O8c0QzAtEz3kQ/fj/6asuVDvV9dPZ9RXxVS3LVZ6VCfU2c109iS/Q8hDPrpmKg3XCPPTAHG1mI567Y"
+    "eZDzfpdjVxISg8/ALqxknYoXD/WN6Rriz2eFQ/Rk5slfaLZGx06K17GYmEf7r0uxUN9sx57ofhe7TJe7IBzDxMxjqYz9nQWHpAp6"
+    "ZsXBQZQ7lECnoyZ7uAdn4QHc2JXU+RaRrx4DG39ATNGLvtr0rL30o+sSqwxgj1/FhvbhPO7H1pwHo55HTNWYekEy9Ed3UQ89TX0z"
+    "oGW+i5ixMHt2LbWUZ8SUceA6/QJPvhY9ZYl5NrupM1UCMyyNbskBdM4ekf8V4hy7ee9w8FrldjWd9Z9TL8QfLyyEl6H8rUPRUN+Z"
+    "biF+TsVt7kt/Likc6gt2/N8E8ouu2DIXnOM05OABLaKD5PsZ6PN6jV0ZQk14GfW02fRx3CLnnQ9f7j084I7Y/u+d75/fwfaxfFZr"
+    "2Rfmx/QirtPfxRXWnqvh/N8HxzY1c/7rGGUxXzlikazYlGOB+Zhg90U4V0Xg+yv330r/v57B/CjL41uAX+sMPSCHKEEeP9pr/UUn"
+    "mMVwij645eTDwuulZbkT3YWraByuxoY8Z18swI7EAGfLUyjUl8a5/15fze9UXjvmp1BfDSfOKMC8Ac3ric8ejMXaNyfX+Zd71Dk9"
+    "VjDUl75/SDTNsHDDpQ1hjqHikmZ5nfjAed4v0Y59EtAtJ4ZRD/JT1mUme2Qw+rryP+JnPKH39wo1PXG4k8EJfY69n0MctJY+7CvU"
+    "cabD3d4HR+4JtillQAPCa/3A6usPoz9Kn9ue+bcXqEskoLbZkb7QfNjHC+TvwXlCfds7hfj9elHWT/hJdrdxSc5RV42BLdkV+dKX"
+    "6tcQP0a0HFugHP5w2le+6M56rvIYXqRY649zxmm4fMrq8juZjdbPa3rs1Tk32dC7rQwGn4+ZvMW/8iWzyV+3kzMEcOEAD68LueFZ"
+    "6kfqqRtCPrWE3vgLrGtXuFDit8WBlxET/Dj+RnuPdCi0T9NF2nwBzV/WZ8/2Wm36fIRhFdIuukI/91TmmspvZGHO3l3m2un9mod7"
+    "/othQUvCLb5/EWGxeOJI67fsJK06tKpkE4tHGCagObjn6QMVDiR9rsH0K9REI0zxjfQOlMMNDbfZfN2ibMbgL9SdzlGL6RVlPaRX"
+    "Iw0LyYvNzBxlswbFLbiJjfJgt9rAb1W/82/0gxd1rk98r+WRlmfsjLB6Ze5wmzn3NsLW6x+v+epl6AEdoEfsR+zAa2bPzfOi4+u1"
+    "HsrTkXY+enBf+dEnm0avZlbiHe0NYUHCBRR/7XK+V3POSkdan00N52fFojPBNKagYfUOLbKN3I9irx/RKpSumjDLQ/QTHcFHKPcd"
+    "7HzPfrf5HGn5FYVHtc1r/cMt0AH8M8K4JyFRVoua5Pws7cmukYYzqP6iel86uIKtqf/t5n7EPxxLPKufO3mNw3Hea/Z+MX7uLbFh"
+    "QTS7E2HbL4OXZ6KO2YjzIiy1NRx+/ftcNOWSE6Okh4MR5XyPiz6U3wO1LjDgInCbblDHUp/bXPrdlEP85DGuQJWYxmevDF5QjLrF"
+    "fs7tCWK4dlHGDSnhtTpLS2LONhEW8+1gjklF8rIi7MM34JOav/oZzsBHZq2OIb+rBSYhjvE8OCgPmIdSCn+xCg50ajRw9hN/lwQ7"
+    "9sF57MD3HCO22419XEJsUoh5bkuI28ej99KUvklxbyuIBwVX9kf4c52oy65Dx0T7TTZ4GT11ndGTec986OrU9FeR4xSjp/kVeVEK"
+    "aoriMSXwWq6l87zFY75FOmVLiI+K83weEcdkQC9uCTj5FmZf1yc2bOU2LmAi/NmSIPMdBajTTYs03Hokuc4rr+XdW/H3U9EyHQyG"
+    "vR6ev/Ao5d7zvXYfxfExC4nFxtOjp+9U3bk9ucOmr/T0uxGb6t+G0J+dC4065dDXPcZdeuRc82vWIRt1+wyBPk3ZMmaAVCDveQ3+"
+    "Vt5jnCNpkUpzMVmw6d7EJXdTbakGe6gqXG01Aa4hp68KRtubfdqU2kkPdGgyEZfvBletBT6v9U4Bj2gfOE9TdI+ec/0j8HkFwKkU"
+    "o4kf25TeA/U5q0avGqPsTCFqia3hiV5CO05nSvhmAeqHgRykHHjYFHJXL7iR+tZK0DcsXPKu255FYB7EBHK6AmipqpflmO+/2ZVb"
+    "0QgqHGQAR0riuJQ8q+nkQwWDDNP8Hk71STD7/GgH7XTbnjoaZDlcKWLkw5zVII/hiz3JF/oTd96lJrDAbXPFxgfmAbuMGzIRbazt"
+    "2Pp4Qdbbq7qU8LveLsMa5nisR2aPy+rBL5kLsMFj/mQdPQzn4DotIt7LCR/xuMtmgQsTlY3WXBPlnJqv9DagFyFfAp9R+YZquBXJ"
+    "3VMQe8sH1wIrlP+a4LVZlG3ouT0H3134lOaGl/NYXLuWnHoMOJ7mzkqvXHNbLjHHcRH8rarElLnwn1OwnceIDVOxb5RjnXEZf/ks"
+    "vLCWzCMYRfz8Eb5eAeJMfedc/Ns1+ECq841FA0p5pHxjbeppN9hnfi0p8n/Zyj6s659c93K4vX9gTy56rZ7Wn9pvYCbCOeaDKl7d"
+    "SWyovjrNtZYmdhQ95AOxl73gVn6g1y0DWFAtehe6s04Z4fNojf5yWTwhTYnRxKbTvsJtm3DGumMLylN3WUA+8z22ZDd6DBk4t6Hk"
+    "AI3h7Xz/VW3oEHXG5dgWfa6HOPtX7rcU/tlNPbYANlU5nuLJcuSw84kTYoFrBXQ018AhnMGzlMas7H+jKLPLlzgz2ud/cK+fiAX+"
+    "oJ7akViiKb0PU+nVK+S2/ar5UYpzlId/pg5eEy62nu/ISKu3KWetzv0XRv95Mfr/L8nDB1Pnru185ivVFlzm79fRzyF8YAW1h9/Q"
+    "49bPg8Ej/JwO5rnXoA/nG+zVOt9/WvXCN1J4jCOTCBxUfHsFd++ws7on4d9V6AmYTf9efWo7WqPMbptRMBDe7ViwjW/AAvyayG6L"
+    "cwJz4kajx6JYJ3aU1c2bstdjoOu9krpEDOoNsgMdvbYX8lNHP89z7Qh/ajlx2TxqN6U5s8rrHzPTfjkz13T+1G9WBru9mD15mrr4"
+    "F+xXrsAsPmLKGejVLyZPq0ovnvKLS2BN0ijojW6pYmi5EeEe+dDiGUfdUnlaAnHtibWHMre6G7oov6CtmQGM66jX7jE29+6fc8MM"
+    "q/jkRR2YqbyH2pV6qs55zTb9yfqPR/8/Dv3CwgaEy7cF+3nCek+FzxKb8zifmOEAM8SLEFf+QE12C892H3ahANhlNzCxVbyehnpB"
+    "KLMctsEjnkntqT4cl89oTrvIq5YQZ39DH+Ux+t7Lwk1cQx28Pf1DecGL5zJz6EfOUT/2TArs2Up4ADXpYc0Iv2A199SBfTWE2voh"
+    "dB8bgEOWhaMVHy2hWnDNdsIL7ACn8jT14GjgvvGpfV2BX3KfNalBraAs51RrsiswL5bZ2+J2xKNXbIzbevqPMsfrGRywT/QWKS7u"
+    "gS3Qz//SY9mGWXsL0LOPhTZsT/zDA2xejEBvq3yj7BA+4iL9Ge9dxmFORG/xQmbUTAN7fEZ/k2qi95gtpXplbnpwdhJ7PQV/nA13"
+    "oiS9ZXvAri4zky8l/cfCaY6QKw3jfNZgvlc1ahl6v3z7NGay3mQNWtFzpO+Nx3m5wQyO+uy3QuQFl4knZJOPYUsVG+n8Se8mAz1V"
+    "P7sNl9+Hjw1DB7Mfa7oWXazJ6Mltplf22yi79n/I8epQC6lAXrgKbusQeliGkFcHdFKGwj0QD+YLdbgWnNlr/HeUmN4/Iy3KcKkI"
+    "7EFn5p9oHqjsgGz8bmbZ1AvUkOBdbYTDXQL/dgl9iIXg8z3RAxLOoDxOvZjxycEfU49eRe69kL4rnSVpZwt/1pxiYT76nhxRlo8s"
+    "wRedh28ku/kd/bu38R2/gTsMYvbfcnKIVtgCxbBuuIQL8DVFwPkH4UfEVzuPDQnowkQGNMHItw8RzwU0GGeTH6VhxkghYqw1+EG/"
+    "7o3b9ugh4jyd/+poj6Rg/8fljBbDfkXwXeIm1KYOeZk4rhzzgwvS9zyMWOU+OINiJvVK3vZarfcDHP1CYK7TyOl3oo8+mjUcTdya"
+    "nvXWOelKP67O7WbnlzUb/Qg18Y/EnCvp99gAbzUm/nkMZ7InePFa8r705N1J0K9+ga6M9AWFswg/zBplONFaev9C3GZ/0sM3mwi+"
+    "FMBunqADMQyO1GPwB80hDfFav6zqbdupv7wE6/2F86bnv4baRDbWSPlRU+Lj4vhGrV+53e98U14E+/dBQGfrC+dZs03Go6nVGByl"
+    "K3nmB3zUQ3LiBOhC7aJWmRPtltLUWdQDOId67GnilMPMdclDPeoMmFUjzl5euH8hcH3H8toB8DJhX9851//pWbC/VyEO9lKf5Vv/"
+    "zlflUbDf5o0L1E3Ei1j9zgmcg6MF5hndZl7yKWoVspvNqKn57TB4VNo873zbs4b4fdYZt8WlXYknArqVHcBghQVlz/XOlyxjSLRt"
+    "buttDUMv8Cew9MfZ3/nKZA/x98IVRQ9pBVhpX7C30WDviqUrO78/MEeI/3m2wwcPghOrfP1e1ne+WNlC/P3KBTh7w8hJVI9/mOWd"
+    "72fn+xrAVSmPDToFR+208++nMoX4eRE6H23Aai+5jQ9znT425cPRea5h1AmGECfspQYpfDQOujifwMPHww1QrqmeqnuZ3/mKZgmJ"
+    "9oI4/DwaCNGo771lFsucgMa58/sZnevPCpb4J/YiOXnAEvKx/nAuQjO98/Vw1v8zXK522Nj6XMsU59+bOM9zHr08Cemjikav0ImM"
+    "zr5y1rsLtaMP5GUb0Z2Z8OM7X6sMIdEmohXxGFtajHUYCU9ugPN7dzLbdaxFB+Qo8UZGMLqS9INqD4Q4v//QeY5bqIuPINcpBIdk"
+    "FTzAEvBtemZ45xv3Q0i0Sm6bddkPPa4h9KkrxijAOdYZqoHveBJhHMq3aDLeg7d5GX+zwWvPMTO1qrhg0YWZqfk4/Tvfcef5BWYb"
+    "DebzT9PLFDPdO99QZ32TM694Ffzqt6ne+b7PanX/0sy9rUge1JKcqy2zDE7iI3W+1qM/uyLsra9f2hC/xoVs9io0kcOjG55zMsRi"
+    "G+Fbadm/8s/qK9vA3Opo1CjUe1yWflrFPE/o/+gCxjeNeDwaPusEevNZ4MhNo3/vAX17wtbK4ltfc67E4XsX6A3CbynOGMDrO9F/"
+    "kib21IB/UF89vGjNtN+J7nUt+s8zo0Gxjtq04p8K5PEN0JxULaUPPmYu+M8JtNOvgi3Og/eqPO5HuCc5wQyOMic3FTnkT2Bd8ivC"
+    "yJOQi85mFpIwARfcFeVBK+jR0v1vRYdFM43l7w9wxuvRX3mL+KMpdkd+VzXElPAZm9GHkIS5QMJkh6qvTTPXopsWmActhRLwyDTT"
+    "7Qk9fDnoEVINXjoT1fBl9cHrUpJPxEG7oRc8JOWCk4n3MrMPpXWck1h3Az7JhQZVIvQelnKOjvDzMXpFa8Nz+pa9viPKtMZj08sh"
+    "+5XbSXZKOsni304C0zrCrj81uVBrfOxT/EMLYsU2xOiH6Jmtyhl9BCdoCn1PbngQ2eHrap2lP/KZ68yKVsJwal7t6c/Kgp9UbFOT"
+    "9ViC1rJis6Xk7j7419OpY9WhZqXPO8P86oT0UXanxjKfGuBNeNmv6b85SvzwAi2EamhoTMDe5wJ3KAGO0dPZA+4oq+GOIJY/St9C"
+    "VWqI+jmZx9agHTnJSvxxAOfo5LEcaQyxUBnwnaNoPsQCB4gLLh0MR6Q5OvBv0b1Jy1z02fiP9NRAA/M8jxOzTybOvkxPh+bdxgPP"
+    "CKKGMYjzO48ZjQGMSvi0PjM2fYGb8G/1qdvER6ewIT0OsdG3Uv13AxyhBB76wd3GvdDzzE68p5xJWHnLKJunMxAbXAJcdg348g/k"
+    "aVOIKYVzSe9JuO5rtE9Xuu35xqUmMI9YLgNnqD/xTztmSqlmXsd5pqu/2DN/57VYphj5zinwi0Xoh18Cv2iNTfqFeV2qnwxiDkcd"
+    "5gi1Zk5JEvCPjWjHiltWAS6ouAyz0AGILt2eKOPdyGbfwQYOJgaayzy5PGA9HzhPsq9/UAtSjDCI/nXFJ2/QwvkpyDiFVdBFk91W"
+    "nh9GvTO98+81nP+U1+6AC/2CXoLsPFutxQx4WzonX9Ai3IP2WSHs7ELwNOXNcd12PRPAa2qBzbzAT+8k35PNLgm3S/Y4NblcHHpb"
+    "f3b2z5sgw+YWk9P/BWb+Pb1iRamBToOP144cSvnFLPbmt+DTN5nP/IQ8vRp26BpYxSPO/ES0G+SXLmNXN7gMZ0wNttwT/DUGtmgs"
+    "efsHuJ1FA71M+K02YA2Pib0Dfa758flH0FWYCW6ZijkbzYiZAnltKDMLxsDrm0TdeAu8gEAP5VAwqMHohwjPrwV++yu2awJ10zvk"
+    "dUvAXmKBifzC994gj0zD31/Tl9kZ/e1v6LtUXVF4WyzO34oAPhdlsw2Vt6unabzX9LYVi+2Dt6Le8gji46VwdzSjs5jX/j2CvseX"
+    "zs9xnT+vh5vfK0uPzn2v1QIf07MtTcOL2EDxtbfS96Lzuc9JynpRx9BMQdWTlS9KY3H8F9OA/dn5u7RONFuuJ/cp35RatljzciPM"
+    "TxbxWiwj/RPNIi/qtbpFbma2HqaP5UGk2ZZSYHTiCg7gucgm3eX+s+PfhBf+yewZPc9MUZani5snOyBtcOmKaD3yYzf98yrE1Yqy"
+    "exRmo8/tAz4f0KmMjo5jC2rAscAax103XGzbLaspvL5hPOobcFmKUHddRS+/6krHmDEqLbkdn0ybR/ikruVzpGlUrIZPUBHMYxr1"
+    "m2zESkvB5fSnYubfwL6/ow7pn+/AswiH+/ARzYafgyyGEE9AukSbiLdVv5f21VJitj/ojfqJeHssMZs4bakijfu3Dt+xmLhZsaDs"
+    "5T5qmOupgT8DRwrmjEbRR+uh/t4OnbY58PlKwEecDm8pF/+ufSCcqCJ9ucrZVCPWLOa9brtvYQdt6a1Tbqw6ZBKv6Qesj0QzAg0M"
+    "1VFkqzcy3ykSPtIEcJdRkaalkB08SX04d+nhy40vOUet4jF6AmvoW9pFHXgAs0yl4SW+22e+X7Y+bbj1tGt+q2p/yfEF6dGbvBpu"
+    "s+Fiwav9v6bOPrbGO4rj3NuiqKbeF3pLx513azZ113UbMy9rNtOSGbKUxrRY9pJhIxtGS6wbIsZeTIcapVKjQdqZTaoyo0k781I2"
+    "DZMwhEXVy32x59vzeRJ/VXs99z7395zf75zzPd/zPafRxL8J3yWNXPEN8vwc5uoEOA/j0fzJxye5th2tPeZ8js4KzX3tBtateOQm"
+    "tW3ZQx3r8Aw19tXEhIXYYQZ6hsIF1XOseCuO2r/WY0bEYtI5rIewtlw4kKuINQ/g3+egj3iYOvVnYFpDsMct+HDl6q2kr0a/xjq4"
+    "yk1aXh6bCezH/1Rgt3eYHataeiM9A+o/GR0xLqt8hHAZzY1eQ4wobSPVnKWdlOmx/x9C4zEDPbUKuB/76dENsm/S2A8t0bUbCgZ7"
+    "grhiB3vSS74u7kop+OEWNHe/gpu3mTXdjqbnON4jkbz1E3rl4uj3EtdBe9TVsUzuYjaaic3p+i/gBmTz7H2so9vbVU6O/DjnSjQ2"
+    "sAE+fQmzgnzU5dsQu8Sxtv2d+27ieL51+2HZ+egmLQA/ufs9aiXKl1KJ4V52PmA6/OM/0LGaRo2mhce0T571mo7nL9THD6GPNZ+c"
+    "0os2RrC5aXx0Z22knzeI/VRNv532tK5VH0A9ayIc/wy8T9UCFWtpP2jfyqaq+f56lsJtumLjW9HU7g6ffxe6mOohlr7JerSPVA8u"
+    "Jv+WLeQyp6sEXMlLvBngLLlGXLKUGL4TmIn6i+SvXkJHQTqBi9BA1F7cAT5Rwzyj5djpYnJW9fdNBq87g27vEmxiDRoddR6zD/mc"
+    "o86/G52b+9Vj9nuP+5uLfoU01/fAZdeaK/eRxqPOM+mgxaODVsrvWsPZzk9xmDTH9rLzUzUo5abK63qy919AU0/33w+9177gLqqT"
+    "J3lMp/JFMCTVzaZhQ+nMV/OBI+9hrurzrsa88GH8STVY2QfMU9Z8ob3wXfXcPGgudvIYf0LnomxJfTqKm47hl9sSPzdnjpry90Sw"
+    "zHhq3Kc42x7i91QbFSaoOLEN2hfK6WczC1azvuaBZaWQ96vO2wsd0gRy+GZwLqXVEnBikXN+q/NcAGfQEh0OW43Y85/xChLCdjae"
+    "Zb7sdXqQNrMvyvHnivkV1+fCPT1BPfsG/OJ8YvkYsBCdj0X48JJHzsTrj2iEb2WfnGQO3TCwkEnECOnMrItjrxSQNzzAv7nz2auI"
+    "gwroEa2h/r6I14v5/Si8+J3kHhnkN++CFW2DT5JHnh7lsZ7/iazvFfgA+936FXv2Ar0K75DnLQSLCsHlKie/6UOtcTh6v3XoN/TE"
+    "VyxCjzSK77uN+vYyrq+ib0wx0T44NFFgQ23JTdxZculww9bCtdgIDt8frlQlOMYUfOluam2jmafgQz9Qe0g1U9lMnsfwPj88l3P4"
+    "5oPYZSP8s/HEu83xJyvRP/6c+mIdeFBrZuhUwVdUP0EcHMKl8JH8zIpbwjkUoLf0X57ld66foS5ViR+6AQ60il5vP9fr3EtGI3U3"
+    "8ZNqq13w01pv9XKr1lGoPpuIcQcOEBvWU4ucBL7XntkX06hn3eZ5z0U/uQytkgD1JPkwL7zNy/Skas7GJeoqZeBrGeS/neH7uTOC"
+    "VmAbF+Ge5MMJUSy8n1kex7ifDeSo0pyayJ6cyFz5Bu4lB07mLvRL51ETVSycwf1koVc8gc96HbtIR6svBPY5y+0tFd84bD1QV8Bj"
+    "VE9Jol9P2HSjc1GF49xiYm2vd6Y3vAreVhFY0ijy4RS0Is4S06sWccF5j/dDxoP8iLkQQ+A/1VAHWw/HIQdNhreZIyffUUgfgGZl"
+    "jw1bnU/PTYnJ1bDxZ8rABLKpoWhfS6NqAr0jyZxPqcy/LAYXFDfyNrO9Djn36HcO4rvOwfWK17CCDvRjVoEBCAO7xoyvJPDFQdT1"
+    "9H5p1Omz4YspN1/NPFvpqH0bMlxNvb/67pURW6vHwG2mUzOIJ3eOxX7mM0NBmNuX963vVPm4eps2Ove8DpsYCF66G0yvFL7bx2Ay"
+    "e9DxTABT74zPqJW/iRiW8TvXPgdvbhY8ufb4hGK+s3SApJtxHG5WDGfcibDVx5S7J9LncxAbOwLW0ZV6WID9fhL+WQP920n0w2rt"
+    "7gTNeGUTqgOPoFY8GG3K3pyfqgPmwLFPBJ/qABaRRE1sLDiV7CkzYjUZxXHSiqmhB15zHMTvHhM2DZBN4NivwhmphesQS/yVCUaV"
+    "Hbb17EVtZDu411Tn3nvQU1QPlrEA3O4i+eUt5lapr2ZvyL6LbDEuYhjb3/D/dL5Usrd6w1Gr53s9zZ5WvKvZhcL0xdGfrXoQM3Vi"
+    "yTNVv6l+YM+0Ho1WxcDCNtJD5kPEjdWc1Hz63VPpEeyBXuQxtFzEyxoILjwSjK0d9rEQvRWtd1LQOMPiGAmPGIzmlQ9e1DBqD9Jc"
+    "mYL/aJrzFTFbqaXGvxr7TYGPMQa8Yia5tmL8ZGLI3/D9wqjmw6dsx5xb4XBvEpdkYUNX4Qz8AOdxGTzckeSAWeiQzEWXbDh8xSr4"
+    "n7vASXoSW/SG29ODs24ImPs2avNDOSs2obu6lhgvhd64UXD+4+FKKoZvOrc5F0bDYwzCXXT5iYXcywDiTVeTVDXPGDQJmtF/ngdP"
+    "JJl62ARm2Uym/n8J3CiLemNf/N4DauD1fF4CPu01eKlR+OAj+KdDYM1bOOvSyetlq1+jWVILTtKAP/6Qsz6KHEvXL6cGU0R//Exm"
+    "T3YkRnkSblkqz+t7OKjb+ds36CdcI37JiFgPSAFclLvgG4vJQcbBwe3DPS+AK1NOTDGHGDKf/G8Jcew6nvtTrGsaull16MqcRl9b"
+    "tZMfPfazmtcVN5bD07kJHzAXfE92p9hS2jtprtYoeqwV9MO8Rwx1F33KUleLjtzgPHaqnL2iy62HP//VolleS8sXFUMHgraeHQ/b"
+    "uV7WYBjp9EbLW3w/mf3MQOdZr/05wnx53n2L6QYEDSc9tc9sWbjECp/lOjtb2Zp9Gm3PoWSS7a9ctLT/iTa7LXM268rWdmYleG2v"
+    "ia+gnOx0tMX/a+inmdrC/MhCrz2v8U8Yp/04cWvRCLg//Sze6xZr2OZa6jH/A8XjHEM="
+)
@@ -0,0 +1,8 @@
+# Generated by scripts/build_data.py from scripts/data/shapefiles.csv. Do not edit.
+
+# vintage -> level -> URL template, with {fips} for state-based files
+TEMPLATES = {
+    "2010": {"tract": "https://www2.census.gov/geo/tiger/TIGER2010/TRACT/2010/tl_2010_{fips}_tract10.zip", "cd": "https://www2.census.gov/geo/tiger/TIGER2010/CD/111/tl_2010_{fips}_cd111.zip", "county": "https://www2.census.gov/geo/tiger/TIGER2010/COUNTY/2010/tl_2010_{fips}_county10.zip", "state": "https://www2.census.gov/geo/tiger/TIGER2010/STATE/2010/tl_2010_{fips}_state10.zip", "zcta": "https://www2.census.gov/geo/tiger/TIGER2010/ZCTA5/2010/tl_2010_{fips}_zcta510.zip", "block": "https://www2.census.gov/geo/tiger/TIGER2010/TABBLOCK/2010/tl_2010_{fips}_tabblock10.zip", "blockgroup": "https://www2.census.gov/geo/tiger/TIGER2010/BG/2010/tl_2010_{fips}_bg10.zip"},
+    "2020": {"tract": "https://www2.census.gov/geo/tiger/TIGER2020/TRACT/tl_2020_{fips}_tract.zip", "cd": "https://www2.census.gov/geo/tiger/TIGER2020/CD/tl_2020_{fips}_cd116.zip", "county": "https://www2.census.gov/geo/tiger/TIGER2020/COUNTY/tl_2020_us_county.zip", "state": "https://www2.census.gov/geo/tiger/TIGER2020/STATE/tl_2020_us_state.zip", "zcta": "https://www2.census.gov/geo/tiger/TIGER2020/ZCTA520/tl_2020_us_zcta520.zip", "block": "https://www2.census.gov/geo/tiger/TIGER2020/TABBLOCK20/tl_2020_{fips}_tabblock20.zip", "blockgroup": "https://www2.census.gov/geo/tiger/TIGER2020/BG/tl_2020_{fips}_bg.zip"},
+    "2023": {"tract": "https://www2.census.gov/geo/tiger/TIGER2023/TRACT/tl_2023_{fips}_tract.zip", "cd": "https://www2.census.gov/geo/tiger/TIGER2023/CD/tl_2023_{fips}_cd118.zip", "county": "https://www2.census.gov/geo/tiger/TIGER2023/COUNTY/tl_2023_us_county.zip", "state": "https://www2.census.gov/geo/tiger/TIGER2023/STATE/tl_2023_us_state.zip", "zcta": "https://www2.census.gov/geo/tiger/TIGER2023/ZCTA520/tl_2023_us_zcta520.zip", "block": "https://www2.census.gov/geo/tiger/TIGER2023/TABBLOCK20/tl_2023_{fips}_tabblock20.zip", "blockgroup": "https://www2.census.gov/geo/tiger/TIGER2023/BG/tl_2023_{fips}_bg.zip"},
+}
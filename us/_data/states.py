@@ -0,0 +1,531 @@
+# Generated by scripts/build_data.py from scripts/data/states.csv. Do not edit.
+
+FIELDS = (
+    "abbr",
+    "ap_abbr",
+    "capital",
+    "capital_tz",
+    "capital_coords",
+    "centroid",
+    "fips",
+    "is_territory",
+    "is_obsolete",
+    "is_contiguous",
+    "is_continental",
+    "name",
+    "name_metaphone",
+    "statehood_year",
+    "time_zones",
+)
+
+# abbr -> field values in FIELDS order
+ROWS = {
+    "AL": ("AL", "Ala.", "Montgomery", "America/Chicago", (32.3777, -86.3006), (32.7897, -86.8284), "01", False, False, True, True, "Alabama", "ALBM", 1819, ("America/Chicago",)),
+    "AK": ("AK", "Alaska", "Juneau", "America/Anchorage", (58.3019, -134.4197), (64.2176, -152.5952), "02", False, False, False, True, "Alaska", "ALSK", 1959, ("America/Anchorage", "America/Adak")),
+    "AS": ("AS", None, "Pago Pago", "Pacific/Samoa", (-14.2756, -170.702), (-14.235, -170.3746), "60", True, False, False, False, "American Samoa", "AMRKN SM", None, ("Pacific/Samoa",)),
+    "AZ": ("AZ", "Ariz.", "Phoenix", "America/Phoenix", (33.4484, -112.074), (34.2925, -111.6649), "04", False, False, True, True, "Arizona", "ARSN", 1912, ("America/Phoenix",)),
+    "AR": ("AR", "Ark.", "Little Rock", "America/Chicago", (34.7465, -92.2896), (34.8996, -92.4389), "05", False, False, True, True, "Arkansas", "ARKNSS", 1836, ("America/Chicago",)),
+    "CA": ("CA", "Calif.", "Sacramento", "America/Los_Angeles", (38.5816, -121.4944), (37.2458, -119.6115), "06", False, False, True, True, "California", "KLFRN", 1850, ("America/Los_Angeles",)),
+    "CO": ("CO", "Colo.", "Denver", "America/Denver", (39.7392, -104.9903), (38.9984, -105.549), "08", False, False, True, True, "Colorado", "KLRT", 1876, ("America/Denver",)),
+    "CT": ("CT", "Conn.", "Hartford", "America/New_York", (41.7658, -72.6734), (41.6202, -72.7263), "09", False, False, True, True, "Connecticut", "KNKTKT", 1788, ("America/New_York",)),
+    "DK": ("DK", None, "Yankton", "America/Chicago", (42.8711, -97.3973), None, None, False, True, True, True, "Dakota", "TKT", None, ("America/Chicago",)),
+    "DE": ("DE", "Del.", "Dover", "America/New_York", (39.1582, -75.5244), (38.9875, -75.5009), "10", False, False, True, True, "Delaware", "TLWR", 1787, ("America/New_York",)),
+    "DC": ("DC", "D.C.", None, "America/New_York", None, (38.9046, -77.0161), "11", False, False, True, True, "District of Columbia", "TSTRKT OF KLMB", None, ("America/New_York",)),
+    "FL": ("FL", "Fla.", "Tallahassee", "America/New_York", (30.4383, -84.2807), (28.6278, -82.4962), "12", False, False, True, True, "Florida", "FLRT", 1845, ("America/New_York", "America/Chicago")),
+    "GA": ("GA", "Ga.", "Atlanta", "America/New_York", (33.749, -84.388), (32.6487, -83.4461), "13", False, False, True, True, "Georgia", "JRJ", 1788, ("America/New_York",)),
+    "GU": ("GU", None, "Hag\u00e5t\u00f1a", "Pacific/Guam", (13.4757, 144.7489), (13.4436, 144.7738), "66", True, False, False, False, "Guam", "KM", None, ("Pacific/Guam",)),
+    "HI": ("HI", "Hawaii", "Honolulu", "Pacific/Honolulu", (21.3069, -157.8583), (20.2526, -156.3568), "15", False, False, False, False, "Hawaii", "HW", 1959, ("Pacific/Honolulu",)),
+    "ID": ("ID", "Idaho", "Boise", "America/Denver", (43.615, -116.2023), (44.3899, -114.6596), "16", False, False, True, True, "Idaho", "ITH", 1890, ("America/Denver", "America/Los_Angeles")),
+    "IL": ("IL", "Ill.", "Springfield", "America/Chicago", (39.7817, -89.6501), (40.0645, -89.1981), "17", False, False, True, True, "Illinois", "ILNS", 1818, ("America/Chicago",)),
+    "IN": ("IN", "Ind.", "Indianapolis", "America/Indiana/Indianapolis", (39.7684, -86.1581), (39.9083, -86.2752), "18", False, False, True, True, "Indiana", "INTN", 1816, ("America/Chicago", "America/Indiana/Indianapolis", "America/Indianapolis", "America/Indiana/Winamac", "America/Indiana/Vincennes", "America/Indiana/Vevay", "America/Indiana/Tell_City", "America/Indiana/Petersburg", "America/Indiana/Marengo", "America/Indiana/Knox", "America/Knox_IN", "America/New_York")),
+    "IA": ("IA", "Iowa", "Des Moines", "America/Chicago", (41.5868, -93.625), (42.0751, -93.5001), "19", False, False, True, True, "Iowa", "IW", 1846, ("America/Chicago",)),
+    "KS": ("KS", "Kan.", "Topeka", "America/Chicago", (39.0473, -95.6752), (38.485, -98.3807), "20", False, False, True, True, "Kansas", "KNSS", 1861, ("America/Chicago", "America/Denver")),
+    "KY": ("KY", "Ky.", "Frankfort", "America/New_York", (38.2009, -84.8733), (37.5266, -85.2901), "21", False, False, True, True, "Kentucky", "KNTK", 1792, ("America/Chicago", "America/New_York", "America/Kentucky/Louisville", "America/Kentucky/Monticello")),
+    "LA": ("LA", "La.", "Baton Rouge", "America/Chicago", (30.4515, -91.1871), (31.0574, -91.9851), "22", False, False, True, True, "Louisiana", "LXN", 1812, ("America/Chicago",)),
+    "ME": ("ME", "Maine", "Augusta", "America/New_York", (44.3106, -69.7795), (45.3719, -69.227), "23", False, False, True, True, "Maine", "MN", 1820, ("America/New_York",)),
+    "MD": ("MD", "Md.", "Annapolis", "America/New_York", (38.9784, -76.4922), (39.0364, -76.7706), "24", False, False, True, True, "Maryland", "MRLNT", 1788, ("America/New_York",)),
+    "MA": ("MA", "Mass.", "Boston", "America/New_York", (42.3601, -71.0589), (42.2533, -71.7989), "25", False, False, True, True, "Massachusetts", "MSXSTS", 1788, ("America/New_York",)),
+    "MI": ("MI", "Mich.", "Lansing", "America/New_York", (42.7325, -84.5555), (44.3515, -85.4372), "26", False, False, True, True, "Michigan", "MXKN", 1837, ("America/New_York", "America/Chicago")),
+    "MN": ("MN", "Minn.", "Saint Paul", "America/Chicago", (44.9537, -93.09), (46.3164, -94.3092), "27", False, False, True, True, "Minnesota", "MNST", 1858, ("America/Chicago",)),
+    "MS": ("MS", "Miss.", "Jackson", "America/Chicago", (32.2988, -90.1848), (32.7517, -89.6654), "28", False, False, True, True, "Mississippi", "MSSP", 1817, ("America/Chicago",)),
+    "MO": ("MO", "Mo.", "Jefferson City", "America/Chicago", (38.5767, -92.1735), (38.3684, -92.4774), "29", False, False, True, True, "Missouri", "MSR", 1821, ("America/Chicago",)),
+    "MT": ("MT", "Mont.", "Helena", "America/Denver", (46.5891, -112.0391), (47.0343, -109.6454), "30", False, False, True, True, "Montana", "MNTN", 1889, ("America/Denver",)),
+    "NE": ("NE", "Neb.", "Lincoln", "America/Chicago", (40.8136, -96.7026), (41.5276, -99.8111), "31", False, False, True, True, "Nebraska", "NBRSK", 1867, ("America/Chicago", "America/Denver")),
+    "NV": ("NV", "Nev.", "Carson City", "America/Los_Angeles", (39.1638, -119.7674), (39.3553, -116.6548), "32", False, False, True, True, "Nevada", "NFT", 1864, ("America/Los_Angeles", "America/Denver")),
+    "NH": ("NH", "N.H.", "Concord", "America/New_York", (43.2081, -71.5376), (43.6853, -71.5775), "33", False, False, True, True, "New Hampshire", "N HMPXR", 1788, ("America/New_York",)),
+    "NJ": ("NJ", "N.J.", "Trenton", "America/New_York", (40.2206, -74.7597), (40.1837, -74.6605), "34", False, False, True, True, "New Jersey", "N JRS", 1787, ("America/New_York",)),
+    "NM": ("NM", "N.M.", "Santa Fe", "America/Denver", (35.687, -105.9378), (34.4206, -106.1087), "35", False, False, True, True, "New Mexico", "N MKSK", 1912, ("America/Denver",)),
+    "NY": ("NY", "N.Y.", "Albany", "America/New_York", (42.6526, -73.7562), (42.9403, -75.5034), "36", False, False, True, True, "New York", "N YRK", 1788, ("America/New_York",)),
+    "NC": ("NC", "N.C.", "Raleigh", "America/New_York", (35.7796, -78.6382), (35.5421, -79.3717), "37", False, False, True, True, "North Carolina", "NR0 KRLN", 1789, ("America/New_York",)),
+    "ND": ("ND", "N.D.", "Bismarck", "America/North_Dakota/Center", (46.8083, -100.7837), (47.4461, -100.4694), "38", False, False, True, True, "North Dakota", "NR0 TKT", 1889, ("America/Boise", "America/Chicago", "America/North_Dakota/Beulah", "America/North_Dakota/Center", "America/North_Dakota/New_Salem")),
+    "MP": ("MP", None, "Saipan", "Pacific/Guam", (15.185, 145.7467), (15.8677, 145.6077), "69", True, False, False, False, "Northern Mariana Islands", "NR0RN MRN ISLNTS", None, ("Pacific/Guam",)),
+    "OH": ("OH", "Ohio", "Columbus", "America/New_York", (39.9612, -82.9988), (40.2918, -82.79), "39", False, False, True, True, "Ohio", "OH", 1803, ("America/New_York",)),
+    "OK": ("OK", "Okla.", "Oklahoma City", "America/Chicago", (35.4676, -97.5164), (35.584, -97.5078), "40", False, False, True, True, "Oklahoma", "OKLHM", 1907, ("America/Chicago",)),
+    "OR": ("OR", "Ore.", "Salem", "America/Los_Angeles", (44.9429, -123.0351), (43.9362, -120.5552), "41", False, False, True, True, "Oregon", "ORKN", 1859, ("America/Los_Angeles", "America/Boise")),
+    "OL": ("OL", None, None, None, None, None, None, False, True, True, True, "Orleans", "ORLNS", None, ("America/Chicago",)),
+    "PA": ("PA", "Pa.", "Harrisburg", "America/New_York", (40.2732, -76.8867), (40.8738, -77.7996), "42", False, False, True, True, "Pennsylvania", "PNSLFN", 1787, ("America/New_York",)),
+    "PI": ("PI", None, None, None, None, None, None, False, True, False, False, "Philippine Islands", "FLPN ISLNTS", None, ("Asia/Singapore",)),
+    "PR": ("PR", None, "San Juan", "America/Puerto_Rico", (18.4655, -66.1057), (18.2219, -66.4653), "72", True, False, False, False, "Puerto Rico", "PRT RK", None, ("America/Puerto_Rico",)),
+    "RI": ("RI", "R.I.", "Providence", "America/New_York", (41.824, -71.4128), (41.6755, -71.5535), "44", False, False, True, True, "Rhode Island", "RHT ISLNT", 1790, ("America/New_York",)),
+    "SC": ("SC", "S.C.", "Columbia", "America/New_York", (34.0007, -81.0348), (33.9081, -80.8956), "45", False, False, True, True, "South Carolina", "S0 KRLN", 1788, ("America/New_York",)),
+    "SD": ("SD", "S.D.", "Pierre", "America/Chicago", (44.3683, -100.351), (44.4363, -100.2301), "46", False, False, True, True, "South Dakota", "S0 TKT", 1889, ("America/Chicago", "America/Denver")),
+    "TN": ("TN", "Tenn.", "Nashville", "America/Chicago", (36.1627, -86.7816), (35.843, -86.343), "47", False, False, True, True, "Tennessee", "TNS", 1796, ("America/Chicago", "America/New_York")),
+    "TX": ("TX", "Texas", "Austin", "America/Chicago", (30.2672, -97.7431), (31.4843, -99.3502), "48", False, False, True, True, "Texas", "TKSS", 1845, ("America/Chicago", "America/Denver")),
+    "UT": ("UT", "Utah", "Salt Lake City", "America/Denver", (40.7608, -111.891), (39.3235, -111.6778), "49", False, False, True, True, "Utah", "UT", 1896, ("America/Denver",)),
+    "VT": ("VT", "Vt.", "Montpelier", "America/New_York", (44.2601, -72.5754), (44.0744, -72.6627), "50", False, False, True, True, "Vermont", "FRMNT", 1791, ("America/New_York",)),
+    "VI": ("VI", None, "Charlotte Amalie", "America/Puerto_Rico", (18.3419, -64.9307), (17.9641, -64.8016), "78", True, False, False, False, "Virgin Islands", "FRJN ISLNTS", None, ("America/Puerto_Rico",)),
+    "VA": ("VA", "Va.", "Richmond", "America/New_York", (37.5407, -77.436), (37.5159, -78.8121), "51", False, False, True, True, "Virginia", "FRJN", 1788, ("America/New_York",)),
+    "WA": ("WA", "Wash.", "Olympia", "America/Los_Angeles", (47.0379, -122.9007), (47.3808, -120.447), "53", False, False, True, True, "Washington", "WXNKTN", 1889, ("America/Los_Angeles",)),
+    "WV": ("WV", "W.Va.", "Charleston", "America/New_York", (38.3498, -81.6326), (38.6424, -80.6136), "54", False, False, True, True, "West Virginia", "WST FRJN", 1863, ("America/New_York",)),
+    "WI": ("WI", "Wis.", "Madison", "America/Chicago", (43.0731, -89.4012), (44.6374, -90.0113), "55", False, False, True, True, "Wisconsin", "WSKNSN", 1848, ("America/Chicago",)),
+    "WY": ("WY", "Wyo.", "Cheyenne", "America/Denver", (41.14, -104.8202), (43.0002, -107.5521), "56", False, False, True, True, "Wyoming", "YMNK", 1890, ("America/Denver",)),
+}
+
+# named lists of states, as abbreviations
+LISTS = {
+    "OBSOLETE": ("DK", "OL", "PI"),
+    "TERRITORIES": ("AS", "GU", "MP", "PR", "VI"),
+    "STATES": ("AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"),
+    "STATES_CONTIGUOUS": ("AL", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"),
+    "STATES_CONTINENTAL": ("AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY"),
+    "STATES_AND_TERRITORIES": ("AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "AS", "GU", "MP", "PR", "VI"),
+    "COMMONWEALTHS": ("KY", "MA", "PA", "VA"),
+}
+
+# states that lookup() resolves: STATES_AND_TERRITORIES and DC
+LOOKUP = (
+    "AL",
+    "AK",
+    "AZ",
+    "AR",
+    "CA",
+    "CO",
+    "CT",
+    "DE",
+    "FL",
+    "GA",
+    "HI",
+    "ID",
+    "IL",
+    "IN",
+    "IA",
+    "KS",
+    "KY",
+    "LA",
+    "ME",
+    "MD",
+    "MA",
+    "MI",
+    "MN",
+    "MS",
+    "MO",
+    "MT",
+    "NE",
+    "NV",
+    "NH",
+    "NJ",
+    "NM",
+    "NY",
+    "NC",
+    "ND",
+    "OH",
+    "OK",
+    "OR",
+    "PA",
+    "RI",
+    "SC",
+    "SD",
+    "TN",
+    "TX",
+    "UT",
+    "VT",
+    "VA",
+    "WA",
+    "WV",
+    "WI",
+    "WY",
+    "AS",
+    "GU",
+    "MP",
+    "PR",
+    "VI",
+    "DC",
+)
+
+# field -> {value: abbr} over LOOKUP
+INDEXES = {
+    "fips": {"01": "AL", "02": "AK", "04": "AZ", "05": "AR", "06": "CA", "08": "CO", "09": "CT", "10": "DE", "12": "FL", "13": "GA", "15": "HI", "16": "ID", "17": "IL", "18": "IN", "19": "IA", "20": "KS", "21": "KY", "22": "LA", "23": "ME", "24": "MD", "25": "MA", "26": "MI", "27": "MN", "28": "MS", "29": "MO", "30": "MT", "31": "NE", "32": "NV", "33": "NH", "34": "NJ", "35": "NM", "36": "NY", "37": "NC", "38": "ND", "39": "OH", "40": "OK", "41": "OR", "42": "PA", "44": "RI", "45": "SC", "46": "SD", "47": "TN", "48": "TX", "49": "UT", "50": "VT", "51": "VA", "53": "WA", "54": "WV", "55": "WI", "56": "WY", "60": "AS", "66": "GU", "69": "MP", "72": "PR", "78": "VI", "11": "DC"},
+    "abbr": {"AL": "AL", "AK": "AK", "AZ": "AZ", "AR": "AR", "CA": "CA", "CO": "CO", "CT": "CT", "DE": "DE", "FL": "FL", "GA": "GA", "HI": "HI", "ID": "ID", "IL": "IL", "IN": "IN", "IA": "IA", "KS": "KS", "KY": "KY", "LA": "LA", "ME": "ME", "MD": "MD", "MA": "MA", "MI": "MI", "MN": "MN", "MS": "MS", "MO": "MO", "MT": "MT", "NE": "NE", "NV": "NV", "NH": "NH", "NJ": "NJ", "NM": "NM", "NY": "NY", "NC": "NC", "ND": "ND", "OH": "OH", "OK": "OK", "OR": "OR", "PA": "PA", "RI": "RI", "SC": "SC", "SD": "SD", "TN": "TN", "TX": "TX", "UT": "UT", "VT": "VT", "VA": "VA", "WA": "WA", "WV": "WV", "WI": "WI", "WY": "WY", "AS": "AS", "GU": "GU", "MP": "MP", "PR": "PR", "VI": "VI", "DC": "DC"},
+    "name": {"Alabama": "AL", "Alaska": "AK", "Arizona": "AZ", "Arkansas": "AR", "California": "CA", "Colorado": "CO", "Connecticut": "CT", "Delaware": "DE", "Florida": "FL", "Georgia": "GA", "Hawaii": "HI", "Idaho": "ID", "Illinois": "IL", "Indiana": "IN", "Iowa": "IA", "Kansas": "KS", "Kentucky": "KY", "Louisiana": "LA", "Maine": "ME", "Maryland": "MD", "Massachusetts": "MA", "Michigan": "MI", "Minnesota": "MN", "Mississippi": "MS", "Missouri": "MO", "Montana": "MT", "Nebraska": "NE", "Nevada": "NV", "New Hampshire": "NH", "New Jersey": "NJ", "New Mexico": "NM", "New York": "NY", "North Carolina": "NC", "North Dakota": "ND", "Ohio": "OH", "Oklahoma": "OK", "Oregon": "OR", "Pennsylvania": "PA", "Rhode Island": "RI", "South Carolina": "SC", "South Dakota": "SD", "Tennessee": "TN", "Texas": "TX", "Utah": "UT", "Vermont": "VT", "Virginia": "VA", "Washington": "WA", "West Virginia": "WV", "Wisconsin": "WI", "Wyoming": "WY", "American Samoa": "AS", "Guam": "GU", "Northern Mariana Islands": "MP", "Puerto Rico": "PR", "Virgin Islands": "VI", "District of Columbia": "DC"},
+    "name_metaphone": {"ALBM": "AL", "ALSK": "AK", "ARSN": "AZ", "ARKNSS": "AR", "KLFRN": "CA", "KLRT": "CO", "KNKTKT": "CT", "TLWR": "DE", "FLRT": "FL", "JRJ": "GA", "HW": "HI", "ITH": "ID", "ILNS": "IL", "INTN": "IN", "IW": "IA", "KNSS": "KS", "KNTK": "KY", "LXN": "LA", "MN": "ME", "MRLNT": "MD", "MSXSTS": "MA", "MXKN": "MI", "MNST": "MN", "MSSP": "MS", "MSR": "MO", "MNTN": "MT", "NBRSK": "NE", "NFT": "NV", "N HMPXR": "NH", "N JRS": "NJ", "N MKSK": "NM", "N YRK": "NY", "NR0 KRLN": "NC", "NR0 TKT": "ND", "OH": "OH", "OKLHM": "OK", "ORKN": "OR", "PNSLFN": "PA", "RHT ISLNT": "RI", "S0 KRLN": "SC", "S0 TKT": "SD", "TNS": "TN", "TKSS": "TX", "UT": "UT", "FRMNT": "VT", "FRJN": "VA", "WXNKTN": "WA", "WST FRJN": "WV", "WSKNSN": "WI", "YMNK": "WY", "AMRKN SM": "AS", "KM": "GU", "NR0RN MRN ISLNTS": "MP", "PRT RK": "PR", "FRJN ISLNTS": "VI", "TSTRKT OF KLMB": "DC"},
+}
+
+# normalized alias -> abbr over LOOKUP
+ALIASES = {
+    "alabama": "AL",
+    "al": "AL",
+    "ala": "AL",
+    "alaska": "AK",
+    "ak": "AK",
+    "arizona": "AZ",
+    "az": "AZ",
+    "ariz": "AZ",
+    "arkansas": "AR",
+    "ar": "AR",
+    "ark": "AR",
+    "california": "CA",
+    "ca": "CA",
+    "calif": "CA",
+    "colorado": "CO",
+    "co": "CO",
+    "colo": "CO",
+    "connecticut": "CT",
+    "ct": "CT",
+    "conn": "CT",
+    "delaware": "DE",
+    "de": "DE",
+    "del": "DE",
+    "florida": "FL",
+    "fl": "FL",
+    "fla": "FL",
+    "georgia": "GA",
+    "ga": "GA",
+    "hawaii": "HI",
+    "hi": "HI",
+    "idaho": "ID",
+    "id": "ID",
+    "illinois": "IL",
+    "il": "IL",
+    "ill": "IL",
+    "indiana": "IN",
+    "in": "IN",
+    "ind": "IN",
+    "iowa": "IA",
+    "ia": "IA",
+    "kansas": "KS",
+    "ks": "KS",
+    "kan": "KS",
+    "kentucky": "KY",
+    "ky": "KY",
+    "louisiana": "LA",
+    "la": "LA",
+    "maine": "ME",
+    "me": "ME",
+    "maryland": "MD",
+    "md": "MD",
+    "massachusetts": "MA",
+    "ma": "MA",
+    "mass": "MA",
+    "michigan": "MI",
+    "mi": "MI",
+    "mich": "MI",
+    "minnesota": "MN",
+    "mn": "MN",
+    "minn": "MN",
+    "mississippi": "MS",
+    "ms": "MS",
+    "miss": "MS",
+    "missouri": "MO",
+    "mo": "MO",
+    "montana": "MT",
+    "mt": "MT",
+    "mont": "MT",
+    "nebraska": "NE",
+    "ne": "NE",
+    "neb": "NE",
+    "nevada": "NV",
+    "nv": "NV",
+    "nev": "NV",
+    "new hampshire": "NH",
+    "nh": "NH",
+    "new jersey": "NJ",
+    "nj": "NJ",
+    "new mexico": "NM",
+    "nm": "NM",
+    "new york": "NY",
+    "ny": "NY",
+    "north carolina": "NC",
+    "nc": "NC",
+    "north dakota": "ND",
+    "nd": "ND",
+    "ohio": "OH",
+    "oh": "OH",
+    "oklahoma": "OK",
+    "ok": "OK",
+    "okla": "OK",
+    "oregon": "OR",
+    "or": "OR",
+    "ore": "OR",
+    "pennsylvania": "PA",
+    "pa": "PA",
+    "rhode island": "RI",
+    "ri": "RI",
+    "south carolina": "SC",
+    "sc": "SC",
+    "south dakota": "SD",
+    "sd": "SD",
+    "tennessee": "TN",
+    "tn": "TN",
+    "tenn": "TN",
+    "texas": "TX",
+    "tx": "TX",
+    "utah": "UT",
+    "ut": "UT",
+    "vermont": "VT",
+    "vt": "VT",
+    "virginia": "VA",
+    "va": "VA",
+    "washington": "WA",
+    "wa": "WA",
+    "wash": "WA",
+    "west virginia": "WV",
+    "wv": "WV",
+    "wva": "WV",
+    "wisconsin": "WI",
+    "wi": "WI",
+    "wis": "WI",
+    "wyoming": "WY",
+    "wy": "WY",
+    "wyo": "WY",
+    "american samoa": "AS",
+    "as": "AS",
+    "guam": "GU",
+    "gu": "GU",
+    "northern mariana islands": "MP",
+    "mp": "MP",
+    "puerto rico": "PR",
+    "pr": "PR",
+    "virgin islands": "VI",
+    "vi": "VI",
+    "district of columbia": "DC",
+    "dc": "DC",
+    "cal": "CA",
+    "cali": "CA",
+    "washington dc": "DC",
+    "wash dc": "DC",
+    "washington district of columbia": "DC",
+    "kans": "KS",
+    "nebr": "NE",
+    "n h": "NH",
+    "n j": "NJ",
+    "n mex": "NM",
+    "new york state": "NY",
+    "nys": "NY",
+    "n c": "NC",
+    "n dak": "ND",
+    "oreg": "OR",
+    "penn": "PA",
+    "penna": "PA",
+    "p r": "PR",
+    "r i": "RI",
+    "s c": "SC",
+    "s dak": "SD",
+    "tex": "TX",
+    "us virgin islands": "VI",
+    "usvi": "VI",
+    "v i": "VI",
+    "virgin islands of the united states": "VI",
+    "northern marianas": "MP",
+    "cnmi": "MP",
+    "washington state": "WA",
+    "w va": "WV",
+    "wisc": "WI",
+}
+
+# FIPS number -> abbr over LOOKUP, None for unused numbers
+CODES = (
+    None,
+    "AL",
+    "AK",
+    None,
+    "AZ",
+    "AR",
+    "CA",
+    None,
+    "CO",
+    "CT",
+    "DE",
+    "DC",
+    "FL",
+    "GA",
+    None,
+    "HI",
+    "ID",
+    "IL",
+    "IN",
+    "IA",
+    "KS",
+    "KY",
+    "LA",
+    "ME",
+    "MD",
+    "MA",
+    "MI",
+    "MN",
+    "MS",
+    "MO",
+    "MT",
+    "NE",
+    "NV",
+    "NH",
+    "NJ",
+    "NM",
+    "NY",
+    "NC",
+    "ND",
+    "OH",
+    "OK",
+    "OR",
+    "PA",
+    None,
+    "RI",
+    "SC",
+    "SD",
+    "TN",
+    "TX",
+    "UT",
+    "VT",
+    "VA",
+    None,
+    "WA",
+    "WV",
+    "WI",
+    "WY",
+    None,
+    None,
+    None,
+    "AS",
+    None,
+    None,
+    None,
+    None,
+    None,
+    "GU",
+    None,
+    None,
+    "MP",
+    None,
+    None,
+    "PR",
+    None,
+    None,
+    None,
+    None,
+    None,
+    "VI",
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+    None,
+)
+
+# abbr -> StateSet bit: the FIPS number, or 100 and up for states without one
+BITS = {
+    "AL": 1,
+    "AK": 2,
+    "AS": 60,
+    "AZ": 4,
+    "AR": 5,
+    "CA": 6,
+    "CO": 8,
+    "CT": 9,
+    "DK": 100,
+    "DE": 10,
+    "DC": 11,
+    "FL": 12,
+    "GA": 13,
+    "GU": 66,
+    "HI": 15,
+    "ID": 16,
+    "IL": 17,
+    "IN": 18,
+    "IA": 19,
+    "KS": 20,
+    "KY": 21,
+    "LA": 22,
+    "ME": 23,
+    "MD": 24,
+    "MA": 25,
+    "MI": 26,
+    "MN": 27,
+    "MS": 28,
+    "MO": 29,
+    "MT": 30,
+    "NE": 31,
+    "NV": 32,
+    "NH": 33,
+    "NJ": 34,
+    "NM": 35,
+    "NY": 36,
+    "NC": 37,
+    "ND": 38,
+    "MP": 69,
+    "OH": 39,
+    "OK": 40,
+    "OR": 41,
+    "OL": 101,
+    "PA": 42,
+    "PI": 102,
+    "PR": 72,
+    "RI": 44,
+    "SC": 45,
+    "SD": 46,
+    "TN": 47,
+    "TX": 48,
+    "UT": 49,
+    "VT": 50,
+    "VI": 78,
+    "VA": 51,
+    "WA": 53,
+    "WV": 54,
+    "WI": 55,
+    "WY": 56,
+}
+
+# time zone -> abbrs over LOOKUP that observe it
+TIME_ZONES = {
+    "America/Adak": ("AK",),
+    "America/Anchorage": ("AK",),
+    "America/Boise": ("ND", "OR"),
+    "America/Chicago": ("AL", "AR", "FL", "IL", "IN", "IA", "KS", "KY", "LA", "MI", "MN", "MS", "MO", "NE", "ND", "OK", "SD", "TN", "TX", "WI"),
+    "America/Denver": ("CO", "ID", "KS", "MT", "NE", "NV", "NM", "SD", "TX", "UT", "WY"),
+    "America/Indiana/Indianapolis": ("IN",),
+    "America/Indiana/Knox": ("IN",),
+    "America/Indiana/Marengo": ("IN",),
+    "America/Indiana/Petersburg": ("IN",),
+    "America/Indiana/Tell_City": ("IN",),
+    "America/Indiana/Vevay": ("IN",),
+    "America/Indiana/Vincennes": ("IN",),
+    "America/Indiana/Winamac": ("IN",),
+    "America/Indianapolis": ("IN",),
+    "America/Kentucky/Louisville": ("KY",),
+    "America/Kentucky/Monticello": ("KY",),
+    "America/Knox_IN": ("IN",),
+    "America/Los_Angeles": ("CA", "ID", "NV", "OR", "WA"),
+    "America/New_York": ("CT", "DE", "FL", "GA", "IN", "KY", "ME", "MD", "MA", "MI", "NH", "NJ", "NY", "NC", "OH", "PA", "RI", "SC", "TN", "VT", "VA", "WV", "DC"),
+    "America/North_Dakota/Beulah": ("ND",),
+    "America/North_Dakota/Center": ("ND",),
+    "America/North_Dakota/New_Salem": ("ND",),
+    "America/Phoenix": ("AZ",),
+    "America/Puerto_Rico": ("PR", "VI"),
+    "Pacific/Guam": ("GU", "MP"),
+    "Pacific/Honolulu": ("HI",),
+    "Pacific/Samoa": ("AS",),
+}
@@ -0,0 +1,7 @@
+# Generated by scripts/build_data.py from scripts/data/zip_ranges.csv. Do not edit.
+
+# inclusive ZIP code ranges as integers, in ascending order, and the FIPS
+# number of the state each range belongs to
+STARTS = (500, 600, 800, 900, 1000, 2800, 3000, 3900, 5000, 5500, 5600, 6000, 6390, 6391, 7000, 10000, 15000, 19700, 20000, 20100, 20200, 20588, 20589, 20598, 20599, 20600, 21400, 22000, 24700, 27000, 29000, 30000, 32000, 34100, 34400, 34600, 34900, 35000, 35400, 37000, 38600, 39800, 40000, 42000, 43000, 46000, 48000, 50000, 52000, 53000, 53400, 53700, 55000, 55300, 56900, 57000, 58000, 59000, 60000, 62200, 63000, 63300, 64400, 66000, 66400, 68000, 68300, 70000, 70300, 71000, 71600, 72643, 72644, 73000, 73300, 73400, 73960, 73961, 74300, 75000, 77200, 80000, 82000, 83200, 83414, 83415, 84000, 85000, 85500, 85900, 86300, 87000, 87300, 88500, 88800, 88900, 89300, 89700, 90000, 91000, 93000, 96700, 96799, 96800, 96900, 96945, 96950, 96953, 96961, 96971, 97000, 98000, 98800, 99500)
+ENDS = (599, 799, 899, 999, 2799, 2999, 3899, 4999, 5499, 5599, 5999, 6389, 6390, 6999, 8999, 14999, 19699, 19999, 20099, 20199, 20587, 20588, 20597, 20598, 20599, 21299, 21999, 24699, 26899, 28999, 29999, 31999, 33999, 34299, 34499, 34799, 34999, 35299, 36999, 38599, 39799, 39999, 41899, 42799, 45999, 47999, 49999, 51699, 52899, 53299, 53599, 54999, 55199, 56799, 56999, 57799, 58899, 59999, 62099, 62999, 63199, 64199, 65899, 66299, 67999, 68199, 69399, 70199, 70899, 71499, 72642, 72643, 72999, 73199, 73399, 73959, 73960, 74199, 74999, 77099, 79999, 81699, 83199, 83413, 83414, 83899, 84799, 85399, 85799, 86099, 86599, 87199, 88499, 88599, 88899, 89199, 89599, 89899, 90899, 92899, 96199, 96798, 96799, 96899, 96938, 96949, 96952, 96959, 96969, 96999, 97999, 98699, 99499, 99999)
+CODES = (36, 72, 78, 72, 25, 44, 33, 23, 50, 25, 50, 9, 36, 9, 34, 36, 42, 10, 11, 51, 11, 24, 11, 51, 11, 24, 24, 51, 54, 37, 45, 13, 12, 12, 12, 12, 12, 1, 1, 47, 28, 13, 21, 21, 39, 18, 26, 19, 19, 55, 55, 55, 27, 27, 11, 46, 38, 30, 17, 17, 29, 29, 29, 20, 20, 31, 31, 22, 22, 22, 5, 29, 5, 40, 48, 40, 48, 40, 40, 48, 48, 8, 56, 16, 56, 16, 49, 4, 4, 4, 4, 35, 35, 48, 11, 32, 32, 32, 6, 6, 6, 15, 60, 15, 66, 66, 69, 66, 66, 66, 41, 53, 53, 2)
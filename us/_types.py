@@ -0,0 +1,36 @@
+"""Result types of us.states and us.cache, kept in their own module so that
+`import us` doesn't import typing. They are re-exported lazily by the
+modules that return them."""
+
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from .states import State
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class BatchLookup(NamedTuple):
+    states: List[Optional[State]]
+    unresolved: List[Any]
+
+
+class Candidate(NamedTuple):
+    state: State
+    score: float
+
+
+class Mention(NamedTuple):
+    state: State
+    span: Tuple[int, int]
+
+
+class Nearest(NamedTuple):
+    state: State
+    #: great-circle distance in kilometers
+    distance: float
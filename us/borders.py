@@ -0,0 +1,112 @@
+"""Land borders between states, as a graph over the states, territories and
+DC that `us.states.lookup()` resolves.
+
+Borders are those of scripts/data/borders.csv, which is checked against the
+embedded state boundaries when the data is generated. Only land borders
+count: states that face each other across a lake or sound, or that meet at a
+single point as at the Four Corners, are not neighbors. Territories, Alaska
+and Hawaii have no neighbors.
+
+The first query runs a breadth-first search from every state and keeps,
+for each state, the StateSets of the states within each number of hops and
+its hop count to every other state, so every query after that is a lookup
+and StateSets are shared rather than built per query.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from . import states
+from ._data import borders as _data
+from ._data import states as _states_data
+from .sets import StateSet
+
+# hop count of states that can't be reached
+UNREACHABLE = -1
+
+# NumPy version of the hop counts, built by hop_matrix()
+_hop_matrix: Any = None
+
+
+@lru_cache(maxsize=None)
+def _graph() -> Tuple[Dict[str, List[StateSet]], List[List[int]]]:
+    """abbr -> StateSets of the states within 0, 1, 2, ... hops, up to every
+    state it can reach, and the hop count between each pair of FIPS numbers,
+    UNREACHABLE for pairs without a path or a state."""
+
+    bits = _states_data.BITS
+    levels: Dict[str, List[StateSet]] = {}
+    matrix = [[UNREACHABLE] * len(_states_data.CODES) for _ in _states_data.CODES]
+    for abbr in _data.NEIGHBORS:
+        row = matrix[bits[abbr]]
+        row[bits[abbr]] = 0
+        masks = [1 << bits[abbr]]
+        frontier = [abbr]
+        while True:
+            following = []
+            for current in frontier:
+                for neighbor in _data.NEIGHBORS[current]:
+                    if row[bits[neighbor]] == UNREACHABLE:
+                        row[bits[neighbor]] = len(masks)
+                        following.append(neighbor)
+            if not following:
+                break
+            masks.append(masks[-1] | sum(1 << bits[neighbor] for neighbor in following))
+            frontier = following
+        levels[abbr] = [StateSet.from_mask(mask) for mask in masks]
+    return levels, matrix
+
+
+def _abbr(state: Any) -> str:
+    if isinstance(state, str) and state in _data.NEIGHBORS:
+        return state
+    resolved = state if isinstance(state, states.State) else states.lookup(state)
+    if resolved is None or resolved.abbr not in _data.NEIGHBORS:
+        raise ValueError(f"no state in the border graph for {state!r}")
+    return resolved.abbr
+
+
+def neighbors(state: Any) -> StateSet:
+    """The states that share a land border with a state. `state` may be a
+    State or any value `us.states.lookup()` resolves."""
+    return within(state, 1) - within(state, 0)
+
+
+def within(state: Union[Any, StateSet], n: int) -> StateSet:
+    """The states at most `n` borders away from a state, the state included,
+    or from any member of a StateSet."""
+
+    if n < 0:
+        raise ValueError(f"hops must be at least 0, not {n}")
+    levels, _ = _graph()
+    if not isinstance(state, StateSet):
+        sets = levels[_abbr(state)]
+        return sets[min(n, len(sets) - 1)]
+    mask = 0
+    for member in state:
+        sets = levels[_abbr(member)]
+        mask |= sets[min(n, len(sets) - 1)].mask
+    return StateSet.from_mask(mask)
+
+
+def hops(a: Any, b: Any) -> Optional[int]:
+    """The number of borders crossed on the shortest way from one state to
+    another over land, or None if there is none, as for Hawaii."""
+    _, matrix = _graph()
+    count = matrix[_states_data.BITS[_abbr(a)]][_states_data.BITS[_abbr(b)]]
+    return None if count == UNREACHABLE else count
+
+
+def hop_matrix():
+    """Hop counts between every pair of states as a read-only 100x100 NumPy
+    array indexed by the codes of `us.states.encode()`, with UNREACHABLE for
+    pairs without a path or a state. Requires NumPy."""
+
+    global _hop_matrix
+    if _hop_matrix is None:
+        import numpy as np  # type: ignore
+
+        _, matrix = _graph()
+        _hop_matrix = np.array(matrix, dtype=np.int8)
+        _hop_matrix.setflags(write=False)
+    return _hop_matrix
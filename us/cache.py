@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from _thread import allocate_lock
+from collections import OrderedDict
+
+# typing and threading are left off the `import us` path; names for type
+# checkers only
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Hashable, Optional
+
+    from ._types import CacheInfo
+
+MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with hit, miss and eviction
+    counters. None is a valid cached value; use `MISSING` as the default to
+    tell a cached None apart from a miss. A `maxsize` of None means the cache
+    is unbounded and 0 disables caching; negative sizes raise ValueError.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128):
+        _check_maxsize(maxsize)
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = allocate_lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: Optional[int]) -> None:
+        """Change the maximum size, evicting the oldest entries if needed."""
+        _check_maxsize(maxsize)
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        from ._types import CacheInfo
+
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def _evict(self) -> None:
+        if self.maxsize is None:
+            return
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+
+def _check_maxsize(maxsize: Optional[int]) -> None:
+    if maxsize is not None and maxsize < 0:
+        raise ValueError(f"cache size must be at least 0 or None, not {maxsize}")
+
+
+def __getattr__(name: str):
+    if name == "CacheInfo":
+        from ._types import CacheInfo
+
+        return CacheInfo
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
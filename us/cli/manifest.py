@@ -0,0 +1,62 @@
+import json
+import sys
+from typing import List, Optional
+
+DEFAULT_VINTAGE = "2010"
+
+
+def _split(values: Optional[List[str]]) -> Optional[List[str]]:
+    """Flatten repeated and comma-separated option values."""
+    if values is None:
+        return None
+    return [item.strip() for value in values for item in value.split(",") if item.strip()]
+
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    from us import shapefiles
+
+    parser = argparse.ArgumentParser(
+        prog="states manifest",
+        description="List TIGER/Line shapefile URLs for states, levels and vintages",
+    )
+    parser.add_argument(
+        "states", metavar="STATE", nargs="*", help="names, abbreviations, or FIPS codes (default: every state)"
+    )
+    parser.add_argument(
+        "-l", "--level", action="append", help="levels to list, repeated or comma-separated (default: every level)"
+    )
+    parser.add_argument(
+        "-v",
+        "--vintage",
+        action="append",
+        help=f"vintages to list, repeated or comma-separated: {', '.join(shapefiles.VINTAGES)} "
+        f"(default: {DEFAULT_VINTAGE})",
+    )
+    parser.add_argument(
+        "-f", "--format", choices=["text", "json"], default="text", help="output format (default: text)"
+    )
+    parser.add_argument("-o", "--output", default="-", help="output file, - for stdout (default)")
+
+    args = parser.parse_args(argv)
+
+    try:
+        entries = shapefiles.manifest(
+            states=args.states or None,
+            levels=_split(args.level),
+            vintages=_split(args.vintage) or [DEFAULT_VINTAGE],
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.format == "json":
+        text = json.dumps([entry._asdict() for entry in entries], indent=2) + "\n"
+    else:
+        text = "".join(entry.url + "\n" for entry in entries)
+
+    if args.output == "-":
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
@@ -0,0 +1,277 @@
+import csv
+import io
+import json
+import sys
+import time
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import us
+
+DEFAULT_FIELDS = "fips,abbr,name"
+DEFAULT_CHUNK_SIZE = 10_000
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class Spec(NamedTuple):
+    column: str
+    match: Optional[str]
+    fields: List[str]
+    prefix: str
+
+
+def _field_value(state, field: str, joined: bool):
+    if state is None:
+        return "" if joined else None
+    val = getattr(state, field)
+    if joined and isinstance(val, (list, tuple)):
+        return ", ".join(str(v) for v in val)
+    return val
+
+
+def normalize_csv_rows(rows: List[List[str]], index: int, spec: Spec) -> int:
+    """Append the requested state fields to each row in place and return
+    the number of rows that could not be resolved."""
+
+    values = [row[index] if index < len(row) else None for row in rows]
+    states = us.states.lookup_many(values, field=spec.match).states
+    unresolved = 0
+    for row, state in zip(rows, states):
+        if state is None:
+            unresolved += 1
+        row.extend(_field_value(state, field, joined=True) for field in spec.fields)
+    return unresolved
+
+
+def normalize_json_records(records: List[dict], spec: Spec) -> int:
+    """Add the requested state fields to each record in place and return
+    the number of records that could not be resolved."""
+
+    values = [record.get(spec.column) for record in records]
+    states = us.states.lookup_many(values, field=spec.match).states
+    unresolved = 0
+    for record, state in zip(records, states):
+        if state is None:
+            unresolved += 1
+        for field in spec.fields:
+            record[spec.prefix + field] = _field_value(state, field, joined=False)
+    return unresolved
+
+
+def _normalize_csv(infile, outfile, spec: Spec, chunk_size: int):
+    reader = csv.reader(infile)
+    writer = csv.writer(outfile, lineterminator="\n")
+
+    header = next(reader, None)
+    if header is None:
+        return 0, 0
+    if spec.column not in header:
+        raise ValueError(f"column {spec.column!r} not found in CSV header")
+    index = header.index(spec.column)
+    writer.writerow(header + [spec.prefix + field for field in spec.fields])
+
+    total = unresolved = 0
+    while True:
+        rows = list(islice(reader, chunk_size))
+        if not rows:
+            break
+        unresolved += normalize_csv_rows(rows, index, spec)
+        writer.writerows(rows)
+        total += len(rows)
+    return total, unresolved
+
+
+def _normalize_jsonl(infile, outfile, spec: Spec, chunk_size: int):
+    total = unresolved = 0
+    while True:
+        lines = list(islice(infile, chunk_size))
+        if not lines:
+            break
+        records = [json.loads(line) for line in lines if line.strip()]
+        unresolved += normalize_json_records(records, spec)
+        outfile.write("".join(json.dumps(record) + "\n" for record in records))
+        total += len(records)
+    return total, unresolved
+
+
+def _recorded(lines: Iterable[str], consumed: List[str]) -> Iterator[str]:
+    """Yield lines, appending each to `consumed` as it is read."""
+    for line in lines:
+        consumed.append(line)
+        yield line
+
+
+def _csv_blocks(reader, consumed: List[str], size: int) -> Iterator[str]:
+    """The text of each block of `size` CSV records, given a csv.reader over
+    `_recorded()` lines. The reader knows where quoted fields end, even in
+    rows with stray quotes, and reads no further than the record it returns,
+    so a block is the lines it consumed for the block's records."""
+
+    while True:
+        for _ in islice(reader, size):
+            pass
+        if not consumed:
+            return
+        yield "".join(consumed)
+        consumed.clear()
+
+
+def _blocks(records: Iterable[str], size: int) -> Iterator[str]:
+    records = iter(records)
+    while True:
+        block = "".join(islice(records, size))
+        if not block:
+            return
+        yield block
+
+
+# per-process settings for normalize_block(), set by _init_worker()
+_worker: Tuple[str, Spec, int] = ("csv", Spec("", None, [], ""), 0)
+
+
+def _init_worker(fmt: str, spec: Spec, index: int):
+    global _worker
+    _worker = (fmt, spec, index)
+    # build the index used by --match once per process rather than per block
+    if spec.match:
+        us.states._index(spec.match)
+
+
+def normalize_block(block: str) -> Tuple[str, int, int]:
+    """Normalize a block of whole CSV records or JSON lines in a worker
+    process. Returns the normalized text, the number of rows, and the
+    number of unresolved rows."""
+
+    fmt, spec, index = _worker
+    out = io.StringIO(newline="")
+
+    if fmt == "jsonl":
+        records = [json.loads(line) for line in block.splitlines() if line.strip()]
+        unresolved = normalize_json_records(records, spec)
+        out.write("".join(json.dumps(record) + "\n" for record in records))
+        return out.getvalue(), len(records), unresolved
+
+    rows = list(csv.reader(io.StringIO(block, newline="")))
+    unresolved = normalize_csv_rows(rows, index, spec)
+    csv.writer(out, lineterminator="\n").writerows(rows)
+    return out.getvalue(), len(rows), unresolved
+
+
+def _normalize_parallel(infile, outfile, fmt: str, spec: Spec, chunk_size: int, workers: int):
+    """Split the input into blocks of whole records, normalize the blocks in
+    a pool of worker processes, and write the results in input order. Only
+    text is sent between processes."""
+
+    import multiprocessing
+
+    index = 0
+    if fmt == "jsonl":
+        blocks = _blocks(infile, chunk_size)
+    else:
+        consumed: List[str] = []
+        reader = csv.reader(_recorded(infile, consumed))
+        header = next(reader, None)
+        if header is None:
+            return 0, 0
+        if spec.column not in header:
+            raise ValueError(f"column {spec.column!r} not found in CSV header")
+        index = header.index(spec.column)
+        csv.writer(outfile, lineterminator="\n").writerow(header + [spec.prefix + field for field in spec.fields])
+        consumed.clear()
+        blocks = _csv_blocks(reader, consumed, chunk_size)
+
+    total = unresolved = 0
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(fmt, spec, index)) as pool:
+        for text, rows, missed in pool.imap(normalize_block, blocks):
+            outfile.write(text)
+            total += rows
+            unresolved += missed
+    return total, unresolved
+
+
+def _positive_int(val: str) -> int:
+    import argparse
+
+    try:
+        number = int(val)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {val!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {number}")
+    return number
+
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="states normalize",
+        description="Resolve a column of state names, abbreviations, or FIPS codes in a CSV or JSON Lines file",
+    )
+    parser.add_argument("input", metavar="INPUT", nargs="?", default="-", help="input file, - for stdin (default)")
+    parser.add_argument("-c", "--column", required=True, help="name of the column to resolve")
+    parser.add_argument("-o", "--output", default="-", help="output file, - for stdout (default)")
+    parser.add_argument("-f", "--format", choices=["csv", "jsonl"], help="input format, guessed from INPUT by default")
+    parser.add_argument(
+        "--fields", default=DEFAULT_FIELDS, help=f"comma-separated state fields to append (default: {DEFAULT_FIELDS})"
+    )
+    parser.add_argument("--prefix", help="prefix for appended column names (default: COLUMN_)")
+    parser.add_argument("--match", metavar="FIELD", help="match values exactly against this state field")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="number of worker processes to normalize with (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"rows per chunk (default: {DEFAULT_CHUNK_SIZE})",
+    )
+
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "jsonl" if args.input.endswith((".jsonl", ".ndjson")) else "csv"
+
+    fields = [field.strip() for field in args.fields.split(",") if field.strip()]
+    unknown = sorted(set(fields + ([args.match] if args.match else [])) - set(us.states.State.__annotations__))
+    if unknown:
+        parser.error(f"unknown state fields: {', '.join(unknown)}")
+
+    spec = Spec(
+        column=args.column,
+        match=args.match,
+        fields=fields,
+        prefix=f"{args.column}_" if args.prefix is None else args.prefix,
+    )
+
+    infile = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    if args.output == "-":
+        outfile = sys.stdout
+    else:
+        outfile = open(args.output, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+
+    start = time.perf_counter()
+    try:
+        if args.workers > 1:
+            total, unresolved = _normalize_parallel(infile, outfile, fmt, spec, args.chunk_size, args.workers)
+        else:
+            normalize = _normalize_jsonl if fmt == "jsonl" else _normalize_csv
+            total, unresolved = normalize(infile, outfile, spec, args.chunk_size)
+    except ValueError as exc:
+        parser.error(str(exc))
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+        else:
+            outfile.flush()
+    elapsed = time.perf_counter() - start
+
+    rate = total / elapsed if elapsed else 0
+    sys.stderr.write(f"normalized {total} rows in {elapsed:.2f}s ({rate:.0f} rows/sec), {unresolved} unresolved\n")
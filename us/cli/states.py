@@ -3,20 +3,40 @@ import us
 
 
 def main():
-    import argparse
+    argv = sys.argv[1:]
 
-    parser = argparse.ArgumentParser(description="Lookup state information")
-    parser.add_argument("query", metavar="QUERY", nargs=1, help="name, abbreviation, or FIPS code")
+    if argv[:1] == ["normalize"]:
+        from .normalize import main as normalize
 
-    args = parser.parse_args()
+        return normalize(argv[1:])
 
-    state = us.states.lookup(args.query[0])
+    if argv[:1] == ["manifest"]:
+        from .manifest import main as manifest
+
+        return manifest(argv[1:])
+
+    if len(argv) == 1 and not argv[0].startswith("-"):
+        # a lone query is by far the common case; skip importing argparse
+        query = argv[0]
+    else:
+        import argparse
+
+        parser = argparse.ArgumentParser(
+            description="Lookup state information",
+            epilog="Run 'states normalize -h' to normalize CSV or JSON Lines files, "
+            "or 'states manifest -h' to list shapefile URLs",
+        )
+        parser.add_argument("query", metavar="QUERY", nargs=1, help="name, abbreviation, or FIPS code")
+
+        query = parser.parse_args(argv).query[0]
+
+    state = us.states.lookup(query)
 
     if not state:
         sys.stdout.write("Sorry, couldn't find a matching state.\n")
 
     else:
-        data = state.__dict__.copy()
+        data = state.asdict()
 
         region = "territory" if data.pop("is_territory") else "state"
 
@@ -32,7 +52,7 @@ def main():
             val = data[key]
 
             if isinstance(val, (list, tuple)):
-                val = ", ".join(val)
+                val = ", ".join(str(v) for v in val)
 
             sys.stdout.write("    %s: %s\n" % (key, val))
 
@@ -0,0 +1,168 @@
+"""Counties and county equivalents, such as parishes, boroughs and
+independent cities, from the 2020 census.
+
+County objects are built on first access, and the name index and each
+state's list of counties are built the first time they are needed, so
+importing this module costs little more than loading the embedded table.
+"""
+
+from itertools import islice
+from numbers import Integral
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from . import states
+from ._data import counties as _data
+
+# every county in order of FIPS code, built on first access by __getattr__()
+COUNTIES: List["County"]
+
+
+class County(NamedTuple):
+    state_fips: str
+    county_fips: str
+    name: str
+    #: legal/statistical area description, such as "County", "Parish" or
+    #: "city"; empty when the name stands alone, as for "Carson City"
+    lsad: str
+
+    @property
+    def fips(self) -> str:
+        """The 5-digit FIPS code, state code included."""
+        return self.state_fips + self.county_fips
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.name} {self.lsad}" if self.lsad else self.name
+
+    @property
+    def state(self) -> states.State:
+        return states._state(states._data.CODES[int(self.state_fips)])  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"<County:{self.full_name}, {self.state.abbr}>"
+
+    def __str__(self) -> str:
+        return self.full_name
+
+
+# 5-digit FIPS code -> County, filled in as counties are accessed
+_counties: Dict[str, County] = {}
+
+# state FIPS code -> counties of that state, built on first use by in_state()
+_by_state: Dict[str, List[County]] = {}
+
+# (state FIPS code, normalized name) -> 5-digit FIPS code, built on first use
+# by _name_index()
+_names: Dict[Tuple[str, str], str] = {}
+
+
+def _county(fips: str) -> County:
+    county = _counties.get(fips)
+    if county is None:
+        name, lsad = _data.ROWS[fips]
+        county = _counties[fips] = County(fips[:2], fips[2:], name, lsad)
+    return county
+
+
+def get(fips: Any) -> Optional[County]:
+    """The county with a 5-digit FIPS code, or None. Integer codes that lost
+    their leading zero, such as 6037, are accepted."""
+
+    if isinstance(fips, Integral) and not isinstance(fips, bool):
+        fips = f"{fips:05d}" if 0 <= fips < 100_000 else None
+    if not isinstance(fips, str):
+        return None
+    return _county(fips) if fips in _data.ROWS else None
+
+
+def lookup(val: Any, state: Any = None) -> Optional[County]:
+    """Find a county by 5-digit FIPS code or, within `state`, by name.
+
+    Names are matched ignoring case and punctuation, with or without their
+    LSAD suffix, so "Prince George's County", "prince georges" and
+    "Prince Georges Co." are all found in Maryland. A name without a suffix
+    that is shared by two counties of a state, as with Baltimore County and
+    Baltimore city, only matches with the suffix. `state` may be a State or
+    any value `us.states.lookup()` resolves.
+    """
+
+    if state is None:
+        return get(val)
+
+    if not isinstance(state, states.State):
+        state = states.lookup(state)
+    if state is None or state.fips is None or not isinstance(val, str):
+        return None
+
+    fips = _name_index().get((state.fips, _normalize(val)))
+    return None if fips is None else _county(fips)
+
+
+def in_state(state: Any) -> List[County]:
+    """The counties of a state in order of FIPS code. `state` may be a State
+    or any value `us.states.lookup()` resolves."""
+
+    if not isinstance(state, states.State):
+        state = states.lookup(state)
+    if state is None or state.fips not in _data.STATES:
+        return []
+
+    counties = _by_state.get(state.fips)
+    if counties is None:
+        start, stop = _data.STATES[state.fips]
+        counties = _by_state[state.fips] = [_county(fips) for fips in islice(_data.ROWS, start, stop)]
+    return list(counties)
+
+
+# LSAD suffixes, longest first, and their usual abbreviations
+_SUFFIXES = sorted({lsad.lower() for _, lsad in _data.ROWS.values() if lsad}, key=len, reverse=True)
+_ABBREVIATIONS = {"co": "county", "par": "parish", "boro": "borough"}
+
+
+def _normalize(val: str) -> str:
+    name = states._normalize(val)
+    head, _, last = name.rpartition(" ")
+    if last in _ABBREVIATIONS:
+        name = f"{head} {_ABBREVIATIONS[last]}"
+    return name
+
+
+def _bare(name: str) -> Optional[str]:
+    """`name` without its LSAD suffix, or None if it has none."""
+    for suffix in _SUFFIXES:
+        if name.endswith(" " + suffix):
+            return name[: -len(suffix) - 1]
+    return None
+
+
+def _name_index() -> Dict[Tuple[str, str], str]:
+    if _names:
+        return _names
+
+    full: Dict[Tuple[str, str], str] = {}
+    bare: Dict[Tuple[str, str], Optional[str]] = {}
+    for fips, (name, lsad) in _data.ROWS.items():
+        names = [f"{name} {lsad}" if lsad else name] + list(_data.ALIASES.get(fips, ()))
+        for variant in names:
+            variant = _normalize(variant)
+            full[fips[:2], variant] = fips
+            stripped = _bare(variant)
+            if stripped is not None:
+                key = (fips[:2], stripped)
+                # a bare name that two counties share is ambiguous
+                bare[key] = fips if bare.get(key, fips) == fips else None
+
+    index = {key: fips for key, fips in bare.items() if fips is not None and key not in full}
+    index.update(full)
+    _names.update(index)
+    return _names
+
+
+def __getattr__(name: str):
+    """Build COUNTIES, every county in order of FIPS code, on first access."""
+
+    if name != "COUNTIES":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = [_county(fips) for fips in _data.ROWS]
+    globals()[name] = value
+    return value
@@ -0,0 +1,312 @@
+"""Geometry of states: finding the state that contains a point, using the
+simplified state boundaries embedded in `us._data.boundaries`, and distances
+and nearest-neighbor searches between points on the Earth's surface.
+
+Points are first located on a grid of 0.1 degree cells, in blocks of 10x10
+cells. Most points are in a block or cell that is entirely inside one state,
+or entirely outside every state, and resolve with a couple of array lookups.
+Only points in boundary cells, which an edge of a boundary passes through,
+are tested against the boundaries of the states whose edges pass through
+the cell. Those tests cast a ray east from the point over the edges that
+span the point's row of cells, which are indexed per state and row.
+
+Boundaries are simplified to within about 500 m of the 1:500,000 Census
+cartographic boundaries, so points closer than that to a state line or a
+coast may be assigned to the wrong state or to none.
+"""
+
+import base64
+import heapq
+import sys
+import zlib
+from array import array
+from functools import lru_cache
+from math import asin, cos, radians, sin, sqrt
+from typing import Any, Dict, List, Sequence, Tuple
+
+from ._data import boundaries as _data
+
+# mean radius of the Earth
+EARTH_RADIUS_KM = 6371.0088
+
+# boundary points resolved at once by state_codes(), to bound memory use
+CHUNK_SIZE = 1 << 16
+
+_BLOCK_COLUMNS = _data.COLUMNS // _data.BLOCK
+_BLOCK_CELLS = _data.BLOCK * _data.BLOCK
+
+Edge = Tuple[int, int, int, int]
+
+# a KDTree node: (split axis, split value, left subtree, right subtree), or a
+# leaf list of (point index, x, y, z)
+_Node = Any
+
+
+def _decode(data: str, typecode: str) -> array:
+    values = array(typecode, zlib.decompress(base64.b64decode(data)))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+@lru_cache(maxsize=None)
+def _grid() -> Tuple[array, array]:
+    """The block and cell values of the grid."""
+    return _decode(_data.BLOCKS, "H"), _decode(_data.CELLS, "H")
+
+
+@lru_cache(maxsize=None)
+def rings() -> List[Tuple[int, List[Tuple[int, int]]]]:
+    """The (FIPS number, points) of each ring of the simplified boundaries,
+    with points as (x, y) in units of 1e-4 degrees of longitude and
+    latitude. Rings are open: the last point connects back to the first."""
+
+    # each ring starts from an absolute point, followed by deltas
+    coords = _decode(_data.RING_COORDS, "i")
+    result = []
+    pos = 0
+    for code, size in _data.RINGS:
+        x, y = 0, 0
+        points = []
+        for i in range(pos, pos + 2 * size, 2):
+            x += coords[i]
+            y += coords[i + 1]
+            points.append((x, y))
+        result.append((code, points))
+        pos += 2 * size
+    return result
+
+
+@lru_cache(maxsize=None)
+def _bands() -> Dict[int, List[Edge]]:
+    """FIPS number * ROWS + grid row -> edges of that state that span part
+    of the row. Horizontal edges are left out, as a ray never crosses them."""
+
+    bands: Dict[int, List[Edge]] = {}
+    for code, points in rings():
+        for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+            if y1 == y2:
+                continue
+            low, high = min(y1, y2), max(y1, y2)
+            first = (low - _data.SOUTH) // _data.CELL
+            last = (high - _data.SOUTH - 1) // _data.CELL
+            for row in range(first, last + 1):
+                bands.setdefault(code * _data.ROWS + row, []).append((x1, y1, x2, y2))
+    return bands
+
+
+def _contains(code: int, x: float, y: float, row: int) -> bool:
+    """Whether the boundary of a state contains the point, by the even-odd
+    rule over the edges of the point's row."""
+    inside = False
+    for x1, y1, x2, y2 in _bands().get(code * _data.ROWS + row, ()):
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def state_code(lat: float, lon: float) -> int:
+    """The FIPS number of the state that contains a point, as in the codes
+    of `us.states.encode()`, or 0 if no state does."""
+
+    x = lon * _data.SCALE
+    y = lat * _data.SCALE
+    col = (x - _data.WEST) // _data.CELL
+    row = (y - _data.SOUTH) // _data.CELL
+    # NaN coordinates fail these comparisons too
+    if not (0 <= col < _data.COLUMNS and 0 <= row < _data.ROWS):
+        return 0
+    col, row = int(col), int(row)
+
+    blocks, cells = _grid()
+    value = blocks[row // _data.BLOCK * _BLOCK_COLUMNS + col // _data.BLOCK]
+    if value >= 100:
+        value = cells[(value - 100) * _BLOCK_CELLS + row % _data.BLOCK * _data.BLOCK + col % _data.BLOCK]
+    if value < 100:
+        return value
+
+    for code in _data.CANDIDATES[value - 100]:
+        if _contains(code, x, y, row):
+            return code
+    return 0
+
+
+@lru_cache(maxsize=None)
+def _arrays():
+    """NumPy versions of the grid, the candidates of boundary cells, and the
+    edge index, with the edges sorted by band and an offset per band."""
+
+    import numpy as np  # type: ignore
+
+    blocks, cells = _grid()
+    sizes = np.array([len(codes) for codes in _data.CANDIDATES], dtype=np.int64)
+    candidates = np.array([code for codes in _data.CANDIDATES for code in codes], dtype=np.int64)
+
+    bands = _bands()
+    keys = sorted(bands)
+    edges = np.array([edge for key in keys for edge in bands[key]], dtype=np.float64).reshape(-1, 4)
+    counts = np.zeros(100 * _data.ROWS, dtype=np.int64)
+    counts[keys] = [len(bands[key]) for key in keys]
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    return (
+        np.frombuffer(blocks, dtype=np.uint16).astype(np.int64),
+        np.frombuffer(cells, dtype=np.uint16).astype(np.int64),
+        sizes,
+        np.cumsum(sizes) - sizes,
+        candidates,
+        edges,
+        offsets,
+    )
+
+
+def _ranks(counts):
+    """0, 1, ..., n - 1 for each n in `counts`, concatenated."""
+    import numpy as np  # type: ignore
+
+    return np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+
+def state_codes(lats, lons):
+    """Vectorized `state_code()` over arrays of latitudes and longitudes.
+    Returns a uint8 array of FIPS numbers, 0 where no state contains the
+    point. Requires NumPy."""
+
+    import numpy as np  # type: ignore
+
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    x, y = np.broadcast_arrays(lons * _data.SCALE, lats * _data.SCALE)
+    x, y = x.ravel(), y.ravel()
+
+    with np.errstate(invalid="ignore"):
+        col = (x - _data.WEST) // _data.CELL
+        row = (y - _data.SOUTH) // _data.CELL
+        valid = (col >= 0) & (col < _data.COLUMNS) & (row >= 0) & (row < _data.ROWS)
+    col = np.where(valid, col, 0).astype(np.int64)
+    row = np.where(valid, row, 0).astype(np.int64)
+
+    blocks, cells, sizes, starts, candidates, edges, offsets = _arrays()
+    values = np.where(valid, blocks[row // _data.BLOCK * _BLOCK_COLUMNS + col // _data.BLOCK], 0)
+    mixed = values >= 100
+    values[mixed] = cells[
+        (values[mixed] - 100) * _BLOCK_CELLS + row[mixed] % _data.BLOCK * _data.BLOCK + col[mixed] % _data.BLOCK
+    ]
+
+    boundary = np.flatnonzero(values >= 100)
+    for chunk in range(0, len(boundary), CHUNK_SIZE):
+        points = boundary[chunk : chunk + CHUNK_SIZE]
+        options = values[points] - 100
+        values[points] = 0
+
+        # one pair per point and candidate state, in candidate order
+        pair_points = np.repeat(points, sizes[options])
+        pair_codes = candidates[np.repeat(starts[options], sizes[options]) + _ranks(sizes[options])]
+
+        # one test per pair and edge of that state in the point's row
+        keys = pair_codes * _data.ROWS + row[pair_points]
+        counts = offsets[keys + 1] - offsets[keys]
+        tests = np.repeat(np.arange(len(keys)), counts)
+        x1, y1, x2, y2 = edges[np.repeat(offsets[keys], counts) + _ranks(counts)].T
+        px, py = x[pair_points[tests]], y[pair_points[tests]]
+        crossed = ((y1 > py) != (y2 > py)) & (px < x1 + (py - y1) * (x2 - x1) / (y2 - y1))
+        inside = np.bincount(tests, weights=crossed, minlength=len(keys)) % 2 == 1
+
+        # the first candidate that contains each point
+        hits = np.flatnonzero(inside)
+        _, first = np.unique(pair_points[hits], return_index=True)
+        values[pair_points[hits[first]]] = pair_codes[hits[first]]
+
+    return values.astype(np.uint8).reshape(np.broadcast(lats, lons).shape)
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in kilometers between two points in decimal
+    degrees, on a spherical Earth."""
+    a = (
+        sin(radians(lat2 - lat1) / 2) ** 2
+        + cos(radians(lat1)) * cos(radians(lat2)) * sin(radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+def _unit(lat: float, lon: float) -> Tuple[float, float, float]:
+    """A point as a 3D unit vector."""
+    lat, lon = radians(lat), radians(lon)
+    return (cos(lat) * cos(lon), cos(lat) * sin(lon), sin(lat))
+
+
+class KDTree:
+    """A k-d tree over points on the Earth's surface, each with a value.
+
+    Points are stored as 3D unit vectors, so the straight-line distance
+    between two points orders them the same as their great-circle distance,
+    and searches are correct across the antimeridian and near the poles.
+    """
+
+    # points per leaf, which are compared one by one
+    LEAF_SIZE = 8
+
+    def __init__(self, points: Sequence[Tuple[float, float]], values: Sequence[Any]):
+        self.values = list(values)
+        self._vectors = [_unit(lat, lon) for lat, lon in points]
+        self._root = self._build(list(range(len(self._vectors))))
+
+    def _build(self, indexes: List[int]) -> _Node:
+        if len(indexes) <= self.LEAF_SIZE:
+            return [(i, *self._vectors[i]) for i in indexes]
+        # split on the axis along which the points are most spread out
+        axis = max(
+            range(3),
+            key=lambda a: max(self._vectors[i][a] for i in indexes) - min(self._vectors[i][a] for i in indexes),
+        )
+        indexes.sort(key=lambda i: self._vectors[i][axis])
+        middle = len(indexes) // 2
+        split = self._vectors[indexes[middle]][axis]
+        return (axis, split, self._build(indexes[:middle]), self._build(indexes[middle:]))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def query(self, lat: float, lon: float, k: int = 1) -> List[Tuple[float, Any]]:
+        """The (distance in kilometers, value) of the `k` points nearest to a
+        point, nearest first."""
+
+        if k <= 0:
+            return []
+        target = _unit(lat, lon)
+        tx, ty, tz = target
+        # max-heap of the best k so far, as (-squared distance, index)
+        best: List[Tuple[float, int]] = []
+        worst = float("inf")
+        # (node, squared distance to the nearest plane that separates it from
+        # the target), as it can only hold closer points if that is closer
+        # than the worst of the best k
+        stack: List[Tuple[_Node, float]] = [(self._root, 0.0)]
+        while stack:
+            node, bound = stack.pop()
+            if bound >= worst:
+                continue
+            if isinstance(node, list):
+                for index, x, y, z in node:
+                    dist = (x - tx) ** 2 + (y - ty) ** 2 + (z - tz) ** 2
+                    if len(best) < k:
+                        heapq.heappush(best, (-dist, index))
+                        if len(best) == k:
+                            worst = -best[0][0]
+                    elif dist < worst:
+                        heapq.heapreplace(best, (-dist, index))
+                        worst = -best[0][0]
+                continue
+            axis, split, left, right = node
+            diff = target[axis] - split
+            if diff < 0:
+                stack.append((right, max(bound, diff * diff)))
+                stack.append((left, bound))
+            else:
+                stack.append((left, max(bound, diff * diff)))
+                stack.append((right, bound))
+
+        # chord length -> great-circle distance
+        result = [(2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(-neg) / 2)), index) for neg, index in best]
+        return [(dist, self.values[index]) for dist, index in sorted(result)]
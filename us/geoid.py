@@ -0,0 +1,110 @@
+"""Census GEOIDs: the concatenated FIPS codes that identify states, counties,
+census tracts, block groups and blocks.
+
+    state       SS                2 digits
+    county      SSCCC             5 digits
+    tract       SSCCCTTTTTT      11 digits
+    blockgroup  SSCCCTTTTTTG     12 digits
+    block       SSCCCTTTTTTBBBB  15 digits, the first block digit is the block group
+
+Level names match the keys of `State.shapefile_urls()`.
+"""
+
+from typing import Any, NamedTuple, Optional
+
+from . import states
+from ._data import states as _data
+
+# GEOID length -> level
+LEVELS = {2: "state", 5: "county", 11: "tract", 12: "blockgroup", 15: "block"}
+
+
+class GEOID(NamedTuple):
+    geoid: str
+    level: str
+    state: states.State
+    county: Optional[str]
+    tract: Optional[str]
+    block_group: Optional[str]
+    block: Optional[str]
+
+    @property
+    def county_fips(self) -> Optional[str]:
+        """The 5-digit FIPS code of the county, state code included."""
+        return None if self.county is None else self.geoid[:5]
+
+
+def parse(geoid: str) -> GEOID:
+    """Split a GEOID into its components and resolve its state. Raises
+    ValueError if it isn't a 2, 5, 11, 12 or 15-digit GEOID of a known state."""
+
+    level = LEVELS.get(len(geoid)) if isinstance(geoid, str) else None
+    if level is None or not geoid.isdigit() or not geoid.isascii():
+        raise ValueError(f"invalid GEOID: {geoid!r}")
+
+    abbr = _data.CODES[int(geoid[:2])]
+    if abbr is None:
+        raise ValueError(f"invalid GEOID: {geoid!r} has unknown state code {geoid[:2]}")
+
+    size = len(geoid)
+    return GEOID(
+        geoid=geoid,
+        level=level,
+        state=states._state(abbr),
+        county=geoid[2:5] if size >= 5 else None,
+        tract=geoid[5:11] if size >= 11 else None,
+        block_group=geoid[11] if size >= 12 else None,
+        block=geoid[11:15] if size == 15 else None,
+    )
+
+
+class GEOIDArray(NamedTuple):
+    """Parsed GEOIDs as parallel NumPy arrays, one element per input value."""
+
+    #: whether each value is a valid GEOID of a known state
+    valid: Any
+    #: GEOID length, 0 where invalid; see LEVELS
+    length: Any
+    #: state codes as from `us.states.encode()`, 0 where invalid
+    state: Any
+    #: 5-digit county FIPS codes as integers, -1 where invalid or shorter
+    county: Any
+
+
+def parse_array(values) -> GEOIDArray:
+    """Validate and parse an array or Series of GEOID strings in bulk.
+
+    Values are laid out as a matrix of ASCII bytes, so the length, digit and
+    state prefix checks are whole-array operations rather than a regular
+    expression per row. Requires NumPy.
+    """
+
+    import numpy as np  # type: ignore
+
+    arr = values.to_numpy() if hasattr(values, "to_numpy") else np.asarray(values)
+    width = max(LEVELS) + 1  # one spare byte, so longer values stay invalid
+    try:
+        raw = arr.astype(f"S{width}")
+    except UnicodeEncodeError:
+        raw = np.array([str(val).encode("ascii", "replace") for val in arr.ravel()], dtype=f"S{width}")
+    raw = raw.reshape(-1)
+    chars = raw.view(np.uint8).reshape(len(raw), width)
+
+    # fixed-width bytes are padded with nulls, so a valid GEOID is a row of
+    # digits up to its length and nothing else
+    length = (chars != 0).sum(axis=1)
+    digits = ((chars >= ord("0")) & (chars <= ord("9"))).sum(axis=1)
+    valid = np.isin(length, list(LEVELS)) & (digits == length)
+
+    prefix = chars[:, :5].astype(np.int64) - ord("0")
+    state = np.where(valid, prefix[:, 0] * 10 + prefix[:, 1], 0)
+    known = np.array([abbr is not None for abbr in _data.CODES])
+    valid &= known[state]
+
+    county = np.where(valid & (length >= 5), prefix @ np.array([10_000, 1000, 100, 10, 1]), -1)
+    return GEOIDArray(
+        valid=valid,
+        length=np.where(valid, length, 0),
+        state=np.where(valid, state, 0).astype(np.uint8),
+        county=county,
+    )
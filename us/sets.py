@@ -0,0 +1,180 @@
+"""Sets of states backed by an integer bitmask.
+
+Each state has a fixed bit, its FIPS number, with obsolete states that have
+no FIPS number from bit 100 up. Membership is a shift and a mask, and set
+algebra is a single integer operation. The named lists of `us.states`, such
+as `STATES_CONTIGUOUS`, are available here as StateSets and are built on
+first access.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List
+
+from . import states
+from ._data import states as _data
+
+# bit -> abbr, the inverse of _data.BITS
+_ABBRS: Dict[int, str] = {bit: abbr for abbr, bit in _data.BITS.items()}
+
+# every bit that belongs to a state
+_VALID = sum(1 << bit for bit in _ABBRS)
+
+# StateSets of the named lists are built on first access by __getattr__()
+OBSOLETE: "StateSet"
+TERRITORIES: "StateSet"
+STATES: "StateSet"
+STATES_CONTIGUOUS: "StateSet"
+STATES_CONTINENTAL: "StateSet"
+STATES_AND_TERRITORIES: "StateSet"
+COMMONWEALTHS: "StateSet"
+
+
+class StateSet:
+    """An immutable set of states. Iterating yields State objects in order
+    of FIPS code."""
+
+    __slots__ = ("mask", "_table")
+
+    mask: int
+
+    def __init__(self, members: Iterable[Any] = ()):
+        """Create a set from State objects or values that `lookup()` resolves.
+        Raises ValueError for values that can't be resolved."""
+
+        mask = 0
+        for member in members:
+            state = member if isinstance(member, states.State) else states.lookup(member)
+            if state is None:
+                raise ValueError(f"no state found for {member!r}")
+            mask |= 1 << _data.BITS[state.abbr]
+        object.__setattr__(self, "mask", mask)
+        object.__setattr__(self, "_table", None)
+
+    @classmethod
+    def from_mask(cls, mask: int) -> "StateSet":
+        """Create a set from a bitmask, such as the `mask` of another set."""
+        if mask < 0 or mask & ~_VALID:
+            raise ValueError(f"invalid StateSet mask: {mask:#x}")
+        stateset = cls.__new__(cls)
+        object.__setattr__(stateset, "mask", mask)
+        object.__setattr__(stateset, "_table", None)
+        return stateset
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (StateSet.from_mask, (self.mask,))
+
+    def __contains__(self, state: Any) -> bool:
+        try:
+            return bool(self.mask >> _data.BITS[state.abbr] & 1)
+        except (AttributeError, KeyError):
+            return False
+
+    def __iter__(self) -> Iterator[states.State]:
+        mask = self.mask
+        bit = 0
+        while mask:
+            if mask & 1:
+                yield states._state(_ABBRS[bit])
+            mask >>= 1
+            bit += 1
+
+    def __len__(self) -> int:
+        return bin(self.mask).count("1")
+
+    def __bool__(self) -> bool:
+        return bool(self.mask)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, StateSet):
+            return NotImplemented
+        return self.mask == other.mask
+
+    def __hash__(self) -> int:
+        return hash((StateSet, self.mask))
+
+    def __or__(self, other: "StateSet") -> "StateSet":
+        if not isinstance(other, StateSet):
+            return NotImplemented
+        return StateSet.from_mask(self.mask | other.mask)
+
+    def __and__(self, other: "StateSet") -> "StateSet":
+        if not isinstance(other, StateSet):
+            return NotImplemented
+        return StateSet.from_mask(self.mask & other.mask)
+
+    def __sub__(self, other: "StateSet") -> "StateSet":
+        if not isinstance(other, StateSet):
+            return NotImplemented
+        return StateSet.from_mask(self.mask & ~other.mask)
+
+    def __xor__(self, other: "StateSet") -> "StateSet":
+        if not isinstance(other, StateSet):
+            return NotImplemented
+        return StateSet.from_mask(self.mask ^ other.mask)
+
+    def __le__(self, other: "StateSet") -> bool:
+        if not isinstance(other, StateSet):
+            return NotImplemented
+        return self.mask & ~other.mask == 0
+
+    def __lt__(self, other: "StateSet") -> bool:
+        if not isinstance(other, StateSet):
+            return NotImplemented
+        return self.mask != other.mask and self.mask & ~other.mask == 0
+
+    def __ge__(self, other: "StateSet") -> bool:
+        if not isinstance(other, StateSet):
+            return NotImplemented
+        return other.mask & ~self.mask == 0
+
+    def __gt__(self, other: "StateSet") -> bool:
+        if not isinstance(other, StateSet):
+            return NotImplemented
+        return self.mask != other.mask and other.mask & ~self.mask == 0
+
+    def isdisjoint(self, other: "StateSet") -> bool:
+        return not self.mask & other.mask
+
+    def __repr__(self) -> str:
+        return f"StateSet({[state.abbr for state in self]!r})"
+
+    def isin(self, codes):
+        """Vectorized membership over an array or Series of codes from
+        `us.states.encode()`. Returns a boolean array, or a Series with the
+        same index and name for Series input. Requires NumPy."""
+
+        import numpy as np  # type: ignore
+
+        table = self._table
+        if table is None:
+            # codes are FIPS numbers, the low 100 bits
+            table = np.array([bool(self.mask >> code & 1) for code in range(len(_data.CODES))])
+            object.__setattr__(self, "_table", table)
+        arr = codes.to_numpy() if hasattr(codes, "to_numpy") else np.asarray(codes)
+        # codes past the table, such as uint8 codes from 100 up, are in no set
+        return states._like(codes, table[np.where((arr >= 0) & (arr < len(table)), arr, 0)])
+
+    def filter(self, codes):
+        """The codes in an array from `us.states.encode()` whose states are in
+        this set."""
+        return codes[self.isin(codes)]
+
+
+def __getattr__(name: str) -> StateSet:
+    """Build StateSets of the named lists of `us.states`, such as `STATES`,
+    the first time they are accessed."""
+
+    if name not in _data.LISTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = StateSet(getattr(states, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_data.LISTS))
@@ -0,0 +1,333 @@
+"""Download and cache the TIGER/Line shapefiles that `State.shapefile_urls()`
+points to.
+
+Downloads share a pool of keep-alive HTTP connections and run concurrently
+in a bounded thread pool. Each file is written to a `.part` file next to
+its place in the cache and resumed with a Range request if a download is
+interrupted. A finished download is only moved into the cache once it has
+been checked as a complete, uncorrupted zip file, so anything in the cache
+can be used as is.
+
+The cache lives in the directory named by the US_SHAPEFILE_CACHE
+environment variable, or in `us/shapefiles` under the user cache directory.
+"""
+
+import http.client
+import os
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from ._data import shapefiles as _data
+
+TIGER_URL = "https://www2.census.gov/geo/tiger/"
+
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT = 60.0
+CHUNK_SIZE = 1 << 16
+MAX_REDIRECTS = 5
+
+# TIGER/Line vintages that shapefile URLs can be generated for
+VINTAGES = tuple(_data.TEMPLATES)
+
+
+class DownloadError(OSError):
+    """A shapefile could not be downloaded or was not a valid zip file."""
+
+
+def default_cache_dir() -> str:
+    cache_dir = os.environ.get("US_SHAPEFILE_CACHE")
+    if cache_dir:
+        return cache_dir
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "us", "shapefiles")
+
+
+class ManifestEntry(NamedTuple):
+    vintage: str
+    level: str
+    #: abbreviation of the state, or None for a national file
+    state: Optional[str]
+    url: str
+
+
+def manifest(
+    states: Optional[Iterable[Any]] = None,
+    levels: Optional[Iterable[str]] = None,
+    vintages: Optional[Iterable[str]] = None,
+) -> List[ManifestEntry]:
+    """Shapefile URLs for every combination of `states`, `levels` and
+    `vintages`, in the order of the vintages and levels given and then by
+    FIPS code. Levels that are only published as a national file are
+    listed once, with no state.
+
+    By default, manifests cover every state, territory and DC at every
+    level of the 2010 vintage. States may be State objects or any value
+    that `us.states.lookup()` resolves. Raises ValueError for unknown
+    states, levels or vintages.
+    """
+
+    from . import states as _states
+
+    if states is None:
+        resolved = _states._lookup_states()
+    else:
+        resolved = []
+        for val in states:
+            state = val if isinstance(val, _states.State) else _states.lookup(val)
+            if state is None or state.fips is None:
+                raise ValueError(f"no state found for {val!r}")
+            resolved.append(state)
+    resolved = sorted(set(resolved))
+
+    vintages = ["2010"] if vintages is None else list(vintages)
+    for vintage in vintages:
+        if vintage not in _data.TEMPLATES:
+            raise ValueError(f"unknown shapefile vintage {vintage!r}")
+    levels = None if levels is None else list(levels)
+
+    entries = []
+    for vintage in vintages:
+        templates = _data.TEMPLATES[vintage]
+        for level in templates if levels is None else levels:
+            template = templates.get(level)
+            if template is None:
+                raise ValueError(f"unknown shapefile level {level!r} for vintage {vintage}")
+            if "{fips}" not in template:
+                entries.append(ManifestEntry(vintage, level, None, template))
+                continue
+            for state in resolved:
+                entries.append(ManifestEntry(vintage, level, state.abbr, template.format(fips=state.fips)))
+    return entries
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP(S) connections, keeping up to
+    `maxsize` idle connections per host."""
+
+    def __init__(self, maxsize: int = DEFAULT_WORKERS, timeout: float = DEFAULT_TIMEOUT):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self, scheme: str, netloc: str) -> Iterator[Tuple[http.client.HTTPConnection, bool]]:
+        """Yield an idle connection to the host, or a new one, and whether it
+        was reused. The connection goes back to the pool unless the block
+        raises, in which case it is closed."""
+
+        key = (scheme, netloc)
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        reused = conn is not None
+        if conn is None:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = cls(netloc, timeout=self.timeout)
+
+        try:
+            yield conn, reused
+        except BaseException:
+            conn.close()
+            raise
+
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+class ShapefileCache:
+    """An on-disk cache of shapefile zips.
+
+    TIGER URLs are cached by their path under TIGER_URL, and other URLs by
+    host and path. With `mirror`, TIGER URLs are downloaded from the same
+    paths under the mirror instead, and share the cache with the originals.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_workers: int = DEFAULT_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        mirror: Optional[str] = None,
+    ):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_workers = max_workers
+        self.mirror = mirror
+        self.pool = ConnectionPool(maxsize=max_workers, timeout=timeout)
+        # cache path -> lock, so a file is only downloaded by one thread at once
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def path(self, url: str) -> str:
+        """Where the file at `url` is, or will be, cached."""
+        if url.startswith(TIGER_URL):
+            name = url[len(TIGER_URL) :]
+        else:
+            parts = urlsplit(url)
+            name = parts.netloc.replace(":", "_") + parts.path
+        segments = [segment for segment in name.split("/") if segment not in ("", ".", "..")]
+        return os.path.join(self.cache_dir, *segments)
+
+    def fetch(self, url: str) -> str:
+        """Path to the cached file at `url`, downloading it first if needed.
+        Raises DownloadError if it can't be downloaded."""
+
+        path = self.path(url)
+        with self._lock(path):
+            if os.path.exists(path):
+                if zipfile.is_zipfile(path):
+                    return path
+                os.remove(path)
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            part = path + ".part"
+            self._download(self._source(url), part)
+            try:
+                with zipfile.ZipFile(part) as zf:
+                    corrupt = zf.testzip()
+            except zipfile.BadZipFile:
+                corrupt = "the archive"
+            if corrupt is not None:
+                os.remove(part)
+                raise DownloadError(f"{url}: {corrupt} is corrupt")
+            os.replace(part, path)
+            return path
+
+    def fetch_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """Fetch several files concurrently, with at most `max_workers`
+        downloads at once. Returns a dict of URL to cached path."""
+
+        urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(urls, executor.map(self.fetch, urls)))
+
+    def warm(
+        self, states: Iterable[Any], levels: Optional[Iterable[str]] = None, vintage: str = "2010"
+    ) -> Dict[str, str]:
+        """Fetch the shapefiles of `states` at `levels`, keys of
+        `State.shapefile_urls()` such as "county" or "tract", or at every
+        level of `vintage` by default. States may be State objects or any
+        value that `us.states.lookup()` resolves."""
+
+        return self.fetch_many(entry.url for entry in manifest(states, levels, [vintage]))
+
+    def _lock(self, path: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def _source(self, url: str) -> str:
+        if self.mirror and url.startswith(TIGER_URL):
+            return self.mirror.rstrip("/") + "/" + url[len(TIGER_URL) :]
+        return url
+
+    def _download(self, url: str, part: str):
+        """Download `url` into `part`, resuming from its current size."""
+
+        for _ in range(MAX_REDIRECTS + 1):
+            offset = os.path.getsize(part) if os.path.exists(part) else 0
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            location = self._get(url, headers, part, offset)
+            if location is None:
+                return
+            url = urljoin(url, location)
+        raise DownloadError(f"{url}: too many redirects")
+
+    def _get(self, url: str, headers: Dict[str, str], part: str, offset: int) -> Optional[str]:
+        """Make one request and write the response body to `part`. Returns the
+        redirect location, if any."""
+
+        parts = urlsplit(url)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+
+        # an idle keep-alive connection may have been closed by the server,
+        # in which case the request is retried once on a new connection
+        for attempt in range(2):
+            try:
+                with self.pool.connection(parts.scheme, parts.netloc) as (conn, reused):
+                    conn.request("GET", target, headers=headers)
+                    resp = conn.getresponse()
+                    return self._receive(url, resp, part, offset)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+                if not reused or attempt:
+                    raise DownloadError(f"{url}: {exc!r}") from exc
+            except http.client.HTTPException as exc:
+                # such as IncompleteRead; what was received is kept for resuming
+                raise DownloadError(f"{url}: {exc!r}") from exc
+        return None  # pragma: no cover
+
+    def _receive(self, url: str, resp: http.client.HTTPResponse, part: str, offset: int) -> Optional[str]:
+        if resp.status in (301, 302, 303, 307, 308):
+            resp.read()
+            return resp.getheader("Location")
+
+        if resp.status == 416 and offset:
+            # the partial file is already complete
+            resp.read()
+            return None
+
+        if resp.status == 206:
+            start = resp.getheader("Content-Range", "").replace("bytes ", "").split("-")[0]
+            if start != str(offset):
+                resp.read()
+                os.remove(part)
+                raise DownloadError(f"{url}: unexpected Content-Range, partial download discarded")
+            mode = "ab"
+        elif resp.status == 200:
+            mode = "wb"
+            offset = 0
+        else:
+            resp.read()
+            raise DownloadError(f"{url}: HTTP {resp.status} {resp.reason}")
+
+        length = resp.getheader("Content-Length")
+        with open(part, mode) as f:
+            while True:
+                chunk = resp.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+            size = f.tell()
+
+        if length is not None and size != offset + int(length):
+            raise DownloadError(f"{url}: incomplete download, {size} of {offset + int(length)} bytes")
+        return None
+
+    def close(self):
+        self.pool.close()
+
+
+_default: Optional[ShapefileCache] = None
+
+
+def default_cache() -> ShapefileCache:
+    """The shared ShapefileCache used by `fetch()` and `warm()`."""
+    global _default
+    if _default is None:
+        _default = ShapefileCache()
+    return _default
+
+
+def fetch(url: str) -> str:
+    """Path to the cached shapefile zip at `url`, downloading it if needed."""
+    return default_cache().fetch(url)
+
+
+def warm(states: Iterable[Any], levels: Optional[Iterable[str]] = None, vintage: str = "2010") -> Dict[str, str]:
+    """Download the shapefiles of `states` at `levels` into the cache ahead
+    of time. See `ShapefileCache.warm()`."""
+    return default_cache().warm(states, levels, vintage)
@@ -0,0 +1,376 @@
+"""An on-disk spatial index of TIGER/Line boundaries, for finding the state,
+county and census tract that contain a point at the full resolution of the
+shapefiles rather than the simplified boundaries of `us.states.lookup_point()`.
+
+    from us import spatial
+    spatial.build_from_tiger("md.idx", ["MD"], levels=["state", "county", "tract"])
+    with spatial.SpatialIndex("md.idx") as index:
+        index.lookup(39.29, -76.61)  # the GEOID of the tract, county and state
+
+An index is a single file of little-endian arrays: the GEOID, bounding box and
+rings of each feature, with coordinates as 32-bit integers in units of 1e-7
+degrees, and a uniform grid per level that maps cells to the features whose
+bounding boxes overlap them. The file is memory-mapped rather than read, so
+opening an index takes about as long as opening a file, and processes that
+open the same index share one copy of it in the page cache.
+
+Shapefiles are read with the small shp/dbf reader in this module, so no GIS
+libraries are needed.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import zipfile
+from array import array
+from math import sqrt
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import geoid as _geoid
+from . import shapefiles
+from . import states as _states
+
+MAGIC = b"USGEOIDX"
+VERSION = 1
+
+# coordinates are stored as integers in units of 1e-7 degrees, about 1 cm
+SCALE = 10_000_000
+
+# grid cells per feature of a level
+CELLS_PER_FEATURE = 4
+
+# fields that hold GEOIDs in TIGER/Line files of different vintages
+GEOID_FIELDS = ("GEOID", "GEOID20", "GEOID10")
+
+Ring = List[Tuple[float, float]]
+
+# shape types with the part and point layout of a polygon: Polygon,
+# PolygonZ and PolygonM
+_POLYGON_TYPES = (5, 15, 25)
+
+
+def _read_dbf(data: bytes) -> Iterator[Optional[Dict[str, str]]]:
+    """The fields of each record of a dBASE file, or None for deleted ones."""
+    count, header_size, record_size = struct.unpack("<4xIHH", data[:12])
+    fields = []
+    pos = 32
+    while data[pos] != 0x0D:
+        name = data[pos : pos + 11].split(b"\0")[0].decode("ascii")
+        fields.append((name, data[pos + 16]))
+        pos += 32
+    for i in range(count):
+        pos = header_size + i * record_size
+        if data[pos : pos + 1] == b"*":
+            yield None
+            continue
+        pos += 1
+        record = {}
+        for name, size in fields:
+            record[name] = data[pos : pos + size].decode("utf-8", "replace").strip()
+            pos += size
+        yield record
+
+
+def _read_shp(data: bytes) -> Iterator[List[Ring]]:
+    """The rings of each record of a polygon shapefile, as (lon, lat)."""
+    pos = 100
+    while pos < len(data):
+        length = struct.unpack(">i", data[pos + 4 : pos + 8])[0] * 2
+        record = data[pos + 8 : pos + 8 + length]
+        pos += 8 + length
+        shape_type = struct.unpack("<i", record[:4])[0]
+        if shape_type == 0:
+            yield []
+            continue
+        if shape_type not in _POLYGON_TYPES:
+            raise ValueError(f"unsupported shape type {shape_type}, expected polygons")
+        num_parts, num_points = struct.unpack("<2i", record[36:44])
+        parts = list(struct.unpack(f"<{num_parts}i", record[44 : 44 + 4 * num_parts])) + [num_points]
+        start = 44 + 4 * num_parts
+        coords = struct.unpack(f"<{2 * num_points}d", record[start : start + 16 * num_points])
+        points = list(zip(coords[0::2], coords[1::2]))
+        yield [points[parts[i] : parts[i + 1]] for i in range(num_parts)]
+
+
+def read_shapefile(source: str) -> Iterator[Tuple[Dict[str, str], List[Ring]]]:
+    """The attributes and rings of each polygon in a shapefile, given the
+    path to its .shp file, with the .dbf file next to it, or to a zip file
+    that contains both, as TIGER/Line downloads do."""
+
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as zf:
+            names = {os.path.splitext(name)[1].lower(): name for name in zf.namelist()}
+            if ".shp" not in names or ".dbf" not in names:
+                raise ValueError(f"{source}: no .shp and .dbf files in the zip")
+            shp, dbf = zf.read(names[".shp"]), zf.read(names[".dbf"])
+    else:
+        with open(source, "rb") as f:
+            shp = f.read()
+        with open(os.path.splitext(source)[0] + ".dbf", "rb") as f:
+            dbf = f.read()
+
+    for record, rings in zip(_read_dbf(dbf), _read_shp(shp)):
+        if record is not None:
+            yield record, rings
+
+
+def _align(size: int) -> int:
+    return -(-size // 8) * 8
+
+
+def build_index(sources: Iterable[str], path: str, states: Optional[Iterable[Any]] = None) -> None:
+    """Build an index at `path` from shapefiles of any GEOID level, given as
+    paths to zip or .shp files. With `states`, only features in those states
+    are indexed, which allows national files to be used for a few states.
+    Raises ValueError if a shapefile has no GEOID field."""
+
+    prefixes = None if states is None else {_state_fips(val) for val in states}
+
+    features = []  # (geoid, bbox, rings as arrays of x, y integers)
+    for source in sources:
+        for record, rings in read_shapefile(source):
+            field = next((name for name in GEOID_FIELDS if name in record), None)
+            if field is None:
+                raise ValueError(f"{source}: no GEOID field")
+            geoid = record[field]
+            if len(geoid) not in _geoid.LEVELS or (prefixes is not None and geoid[:2] not in prefixes):
+                continue
+            coords = []
+            for ring in rings:
+                values = array("i")
+                for lon, lat in ring:
+                    values.append(round(lon * SCALE))
+                    values.append(round(lat * SCALE))
+                coords.append(values)
+            if not coords:
+                continue
+            xs = [x for values in coords for x in values[0::2]]
+            ys = [y for values in coords for y in values[1::2]]
+            features.append((geoid, (min(xs), min(ys), max(xs), max(ys)), coords))
+    features.sort(key=lambda feature: feature[0])
+
+    geoids = b"".join(geoid.encode("ascii").ljust(max(_geoid.LEVELS), b"\0") for geoid, _, _ in features)
+    bboxes = array("i", [value for _, bbox, _ in features for value in bbox])
+    feature_rings = array("I", [0])
+    ring_points = array("I", [0])
+    points = array("i")
+    for _, _, coords in features:
+        for values in coords:
+            points.extend(values)
+            ring_points.append(len(points) // 2)
+        feature_rings.append(len(ring_points) - 1)
+
+    sections: Dict[str, Any] = {
+        "geoids": geoids,
+        "bboxes": bboxes,
+        "feature_rings": feature_rings,
+        "ring_points": ring_points,
+        "points": points,
+    }
+    levels = {}
+    for length, level in _geoid.LEVELS.items():
+        ids = [i for i, (geoid, _, _) in enumerate(features) if len(geoid) == length]
+        if ids:
+            levels[level], sections[f"{level}_cells"], sections[f"{level}_ids"] = _grid(ids, bboxes)
+
+    # the header is followed by each section, at 8-byte aligned offsets
+    layout = {}
+    offset = 0
+    for name, values in sections.items():
+        typecode = values.typecode if isinstance(values, array) else "B"
+        layout[name] = (offset, len(values), typecode)
+        offset = _align(offset + len(values) * (values.itemsize if isinstance(values, array) else 1))
+    meta = json.dumps({"version": VERSION, "sections": layout, "levels": levels}).encode("utf-8")
+    header_size = _align(len(MAGIC) + 4 + len(meta))
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(meta)) + meta)
+        for name, values in sections.items():
+            f.seek(header_size + layout[name][0])
+            if isinstance(values, array) and sys.byteorder == "big":
+                values = array(values.typecode, values)
+                values.byteswap()
+            f.write(values.tobytes() if isinstance(values, array) else values)
+        f.truncate(header_size + offset)
+    os.replace(tmp, path)
+
+
+def _grid(ids: List[int], bboxes: array) -> Tuple[Dict[str, Any], array, array]:
+    """A uniform grid over the features `ids`: its extent and size, and the
+    features whose bounding boxes overlap each cell, as offsets into an
+    array of feature ids."""
+
+    boxes = [bboxes[4 * i : 4 * i + 4] for i in ids]
+    west, south = min(box[0] for box in boxes), min(box[1] for box in boxes)
+    east, north = max(box[2] for box in boxes) + 1, max(box[3] for box in boxes) + 1
+    cells = CELLS_PER_FEATURE * len(ids)
+    columns = max(1, min(cells, round(sqrt(cells * (east - west) / (north - south)))))
+    rows = max(1, cells // columns)
+    width, height = -(-(east - west) // columns), -(-(north - south) // rows)
+
+    members: List[List[int]] = [[] for _ in range(columns * rows)]
+    for i, (x1, y1, x2, y2) in zip(ids, boxes):
+        for row in range((y1 - south) // height, (y2 - south) // height + 1):
+            for col in range((x1 - west) // width, (x2 - west) // width + 1):
+                members[row * columns + col].append(i)
+
+    offsets = array("I", [0])
+    flat = array("I")
+    for cell in members:
+        flat.extend(cell)
+        offsets.append(len(flat))
+    grid = {"west": west, "south": south, "width": width, "height": height, "columns": columns, "rows": rows}
+    return grid, offsets, flat
+
+
+def _state_fips(val: Any) -> str:
+    state = val if isinstance(val, _states.State) else _states.lookup(val)
+    if state is None or state.fips is None:
+        raise ValueError(f"no state found for {val!r}")
+    return state.fips
+
+
+def build_from_tiger(
+    path: str,
+    states: Optional[Iterable[Any]] = None,
+    levels: Iterable[str] = ("state", "county", "tract"),
+    vintage: str = "2010",
+    cache: Optional[shapefiles.ShapefileCache] = None,
+) -> None:
+    """Download the TIGER/Line shapefiles of `states` at `levels`, or fetch
+    them from the cache, and build an index of them at `path`. States may be
+    State objects or any value that `us.states.lookup()` resolves, and
+    default to every state, territory and DC."""
+
+    states = None if states is None else list(states)
+    entries = shapefiles.manifest(states, levels, [vintage])
+    files = (cache or shapefiles.default_cache()).fetch_many(entry.url for entry in entries)
+    build_index([files[entry.url] for entry in entries], path, states=states)
+
+
+class SpatialIndex:
+    """A memory-mapped index built by `build_index()`. Indexes can be used
+    as context managers, and pickle by path, so each process that unpickles
+    one maps the file itself."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if self._mmap[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path}: not a spatial index")
+            (size,) = struct.unpack("<I", self._mmap[len(MAGIC) : len(MAGIC) + 4])
+            meta = json.loads(self._mmap[len(MAGIC) + 4 : len(MAGIC) + 4 + size])
+            if meta["version"] != VERSION:
+                raise ValueError(f"{path}: unsupported index version {meta['version']}")
+        except BaseException:
+            self._mmap.close()
+            raise
+
+        self._header_size = _align(len(MAGIC) + 4 + size)
+        self._sections = meta["sections"]
+        # every view of the map, released by close()
+        self._views: List[memoryview] = [memoryview(self._mmap)]
+        self._grids = meta["levels"]
+        self._geoids = self._section("geoids")
+        self._bboxes = self._section("bboxes")
+        self._feature_rings = self._section("feature_rings")
+        self._ring_points = self._section("ring_points")
+        self._points = self._section("points")
+        self._cells = {level: self._section(f"{level}_cells") for level in self._grids}
+        self._ids = {level: self._section(f"{level}_ids") for level in self._grids}
+
+    def _section(self, name: str):
+        offset, count, typecode = self._sections[name]
+        start = self._header_size + offset
+        view = self._views[0][start : start + count * array(typecode).itemsize]
+        self._views.append(view)
+        if typecode == "B":
+            return view
+        if sys.byteorder == "big":
+            values = array(typecode, view.tobytes())
+            values.byteswap()
+            return values
+        view = view.cast(typecode)
+        self._views.append(view)
+        return view
+
+    @property
+    def levels(self) -> List[str]:
+        """The GEOID levels in the index, from the coarsest to the finest."""
+        return [level for level in _geoid.LEVELS.values() if level in self._grids]
+
+    def __len__(self) -> int:
+        return len(self._feature_rings) - 1
+
+    def geoid(self, i: int) -> str:
+        """The GEOID of the i-th feature, in order of GEOID."""
+        width = max(_geoid.LEVELS)
+        return bytes(self._geoids[i * width : (i + 1) * width]).rstrip(b"\0").decode("ascii")
+
+    def lookup(self, lat: float, lon: float, level: Optional[str] = None) -> Optional[_geoid.GEOID]:
+        """The GEOID of the finest feature in the index that contains a point,
+        or of the feature at `level`, or None. Its state, county and tract
+        fields give the rest of the hierarchy."""
+
+        if level is not None and level not in self._grids:
+            raise ValueError(f"no {level!r} level in {self.path}")
+        x, y = lon * SCALE, lat * SCALE
+        for candidate in [level] if level is not None else reversed(self.levels):
+            i = self._find(candidate, x, y)
+            if i is not None:
+                return _geoid.parse(self.geoid(i))
+        return None
+
+    def _find(self, level: str, x: float, y: float) -> Optional[int]:
+        grid = self._grids[level]
+        col = (x - grid["west"]) // grid["width"]
+        row = (y - grid["south"]) // grid["height"]
+        # NaN coordinates fail these comparisons too
+        if not (0 <= col < grid["columns"] and 0 <= row < grid["rows"]):
+            return None
+
+        cell = int(row) * grid["columns"] + int(col)
+        cells, ids, bboxes = self._cells[level], self._ids[level], self._bboxes
+        for i in ids[cells[cell] : cells[cell + 1]]:
+            if bboxes[4 * i] <= x <= bboxes[4 * i + 2] and bboxes[4 * i + 1] <= y <= bboxes[4 * i + 3]:
+                if self._contains(i, x, y):
+                    return i
+        return None
+
+    def _contains(self, i: int, x: float, y: float) -> bool:
+        """Whether a point is inside feature i, by the even-odd rule over all
+        of its rings, so holes are excluded."""
+        inside = False
+        for ring in range(self._feature_rings[i], self._feature_rings[i + 1]):
+            start, stop = self._ring_points[ring], self._ring_points[ring + 1]
+            coords = self._points[2 * start : 2 * stop].tolist()
+            x1, y1 = coords[-2], coords[-1]
+            for j in range(0, len(coords), 2):
+                x2, y2 = coords[j], coords[j + 1]
+                if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                    inside = not inside
+                x1, y1 = x2, y2
+        return inside
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> "SpatialIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __reduce__(self):
+        return (SpatialIndex, (self.path,))
+
+    def __repr__(self) -> str:
+        return f"<SpatialIndex:{self.path}, {len(self)} features>"
@@ -1,24 +1,135 @@
+from __future__ import annotations
+
 import os
 import re
-from typing import Any, Dict, Iterable, List, Optional
-from urllib.parse import urljoin
+import sys
+from types import MappingProxyType
+
+from ._aliases import normalize as _normalize
+from ._data import states as _data
+from .cache import MISSING, LRUCache
+
+# typing, and the NamedTuple result types in us/_types.py, are left off the
+# `import us` path; the result types are imported where they are returned
+# and re-exported by __getattr__()
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+    from ._types import BatchLookup, Candidate, Mention, Nearest
+    from .ahocorasick import Automaton
 
-import jellyfish  # type: ignore
+# result types in us/_types.py
+_TYPES = ("BatchLookup", "Candidate", "Mention", "Nearest")
 
-FIPS_RE = re.compile(r"^\d{2}$")
+FIPS_RE = re.compile(r"^\d{1,2}$")
 ABBR_RE = re.compile(r"^[a-zA-Z]{2}$")
+ZIP_RE = re.compile(r"^\s*(\d{5})(?:-?\d{4})?\s*$")
 
 DC_STATEHOOD = bool(os.environ.get("DC_STATEHOOD"))
 
-
-_lookup_cache: Dict[str, "State"] = {}
+LOOKUP_CACHE_SIZE = int(os.environ.get("US_LOOKUP_CACHE_SIZE", 4096))
+if LOOKUP_CACHE_SIZE < 0:
+    raise ValueError(f"US_LOOKUP_CACHE_SIZE must be at least 0, not {LOOKUP_CACHE_SIZE}")
+
+# (field, raw lookup value) -> State or None
+lookup_cache = LRUCache(maxsize=LOOKUP_CACHE_SIZE)
+
+# (from_field, to_field, states or None for the default) -> read-only mapping
+mapping_cache = LRUCache(maxsize=256)
+
+# (point, states or None for the default) -> geo.KDTree, for nearest_states()
+nearest_cache = LRUCache(maxsize=256)
+
+# point -> distance matrix, filled in by distance_matrix()
+_distance_matrices: Dict[str, Any] = {}
+
+# (fips, vintage) -> {level: URL}, filled in by State.shapefile_urls()
+_shapefile_urls: Dict[Tuple[str, str], Dict[str, str]] = {}
+
+# field name -> {field value: State}, built on first use by _index()
+_indexes: Dict[str, Optional[Dict[Any, State]]] = {}
+
+# lists that DC joins when DC_STATEHOOD is set
+_DC_STATEHOOD_LISTS = ("STATES", "STATES_AND_TERRITORIES", "STATES_CONTIGUOUS", "STATES_CONTINENTAL")
+
+# State objects and lists of states are built on first access by
+# __getattr__() from the generated data in us/_data/states.py
+OBSOLETE: List[State]
+TERRITORIES: List[State]
+STATES: List[State]
+STATES_CONTIGUOUS: List[State]
+STATES_CONTINENTAL: List[State]
+STATES_AND_TERRITORIES: List[State]
+COMMONWEALTHS: List[State]
+
+# star imports resolve the lazily built names through __getattr__()
+__all__ = [
+    "ABBR_RE",
+    "DC_STATEHOOD",
+    "FIPS_RE",
+    "BatchLookup",
+    "Candidate",
+    "Mention",
+    "Nearest",
+    "State",
+    "decode",
+    "distance",
+    "distance_matrix",
+    "encode",
+    "extract",
+    "lookup",
+    "lookup_array",
+    "lookup_cache",
+    "lookup_candidates",
+    "lookup_many",
+    "lookup_point",
+    "lookup_point_array",
+    "lookup_zip",
+    "lookup_zip_array",
+    "mapping",
+    "mapping_cache",
+    "nearest_cache",
+    "nearest_states",
+    "states_in_time_zone",
+    *_data.ROWS,
+    *_data.LISTS,
+]
 
 
 class State:
+    """An immutable state, territory, or obsolete territory. States compare
+    and hash by their fields and sort by FIPS code, with obsolete entries
+    that have no FIPS code sorting last."""
+
+    __slots__ = (
+        "abbr",
+        "ap_abbr",
+        "capital",
+        "capital_tz",
+        "capital_coords",
+        "centroid",
+        "fips",
+        "is_territory",
+        "is_obsolete",
+        "is_contiguous",
+        "is_continental",
+        "name",
+        "name_metaphone",
+        "statehood_year",
+        "time_zones",
+        "_hash",
+    )
+    _field_names = __slots__[:-1]
+
     abbr: str
     ap_abbr: Optional[str]
     capital: Optional[str]
     capital_tz: Optional[str]
+    #: (latitude, longitude) of the capital, in decimal degrees
+    capital_coords: Optional[Tuple[float, float]]
+    #: (latitude, longitude) of the centroid of the state's area
+    centroid: Optional[Tuple[float, float]]
     fips: Optional[str]
     is_territory: bool
     is_obsolete: bool
@@ -27,11 +138,70 @@ class State:
     name: str
     name_metaphone: str
     statehood_year: Optional[int]
-    time_zones: List[str]
+    time_zones: Tuple[str, ...]
 
     def __init__(self, **kwargs):
-        for k, v in kwargs.items():
-            setattr(self, k, v)
+        for field in self._field_names:
+            val = kwargs.pop(field, None)
+            if field == "time_zones":
+                val = tuple(val or ())
+            elif field in ("capital_coords", "centroid") and val is not None:
+                val = tuple(val)
+            object.__setattr__(self, field, val)
+        if kwargs:
+            raise TypeError(f"unexpected State fields: {', '.join(kwargs)}")
+        object.__setattr__(self, "_hash", hash(self._fields()))
+
+    def _fields(self) -> tuple:
+        return tuple(getattr(self, field) for field in self._field_names)
+
+    def asdict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self._field_names}
+
+    def __setattr__(self, name, value):
+        raise AttributeError("State objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("State objects are immutable")
+
+    def __getstate__(self):
+        return self.asdict()
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, State):
+            return NotImplemented
+        return self._hash == other._hash and self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def _sort_key(self) -> Tuple[bool, str, str]:
+        return (self.fips is None, self.fips or "", self.name)
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, State):
+            return NotImplemented
+        return self._sort_key() < other._sort_key()
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, State):
+            return NotImplemented
+        return self._sort_key() <= other._sort_key()
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, State):
+            return NotImplemented
+        return self._sort_key() > other._sort_key()
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, State):
+            return NotImplemented
+        return self._sort_key() >= other._sort_key()
 
     def __repr__(self) -> str:
         return f"<State:{self.name}>"
@@ -39,36 +209,38 @@ class State:
     def __str__(self) -> str:
         return self.name
 
-    def shapefile_urls(self) -> Optional[Dict[str, str]]:
+    def shapefile_urls(self, vintage: str = "2010") -> Optional[Dict[str, str]]:
         """Shapefiles are available directly from the US Census Bureau:
         https://www.census.gov/cgi-bin/geo/shapefiles/index.php
-        """
 
-        fips = self.fips
+        URLs are for the 2010 TIGER/Line files by default, or for any vintage
+        in `us.shapefiles.VINTAGES`. Levels that are only published as a
+        national file, such as counties from 2020 on, link to that file.
+        """
 
-        if not fips:
+        if not self.fips:
             return None
 
-        base = "https://www2.census.gov/geo/tiger/TIGER2010/"
-        urls = {
-            "tract": urljoin(base, f"TRACT/2010/tl_2010_{fips}_tract10.zip"),
-            "cd": urljoin(base, f"CD/111/tl_2010_{fips}_cd111.zip"),
-            "county": urljoin(base, f"COUNTY/2010/tl_2010_{fips}_county10.zip"),
-            "state": urljoin(base, f"STATE/2010/tl_2010_{fips}_state10.zip"),
-            "zcta": urljoin(base, f"ZCTA5/2010/tl_2010_{fips}_zcta510.zip"),
-            "block": urljoin(base, f"TABBLOCK/2010/tl_2010_{fips}_tabblock10.zip"),
-            "blockgroup": urljoin(base, f"BG/2010/tl_2010_{fips}_bg10.zip"),
-        }
+        key = (self.fips, vintage)
+        urls = _shapefile_urls.get(key)
+        if urls is None:
+            from ._data import shapefiles
 
-        return urls
+            if vintage not in shapefiles.TEMPLATES:
+                raise ValueError(f"unknown shapefile vintage {vintage!r}")
+            templates = shapefiles.TEMPLATES[vintage]
+            urls = _shapefile_urls[key] = {level: url.format(fips=self.fips) for level, url in templates.items()}
+        return dict(urls)
 
 
 def lookup(val, field: Optional[str] = None, use_cache: bool = True) -> Optional[State]:
     """Semi-fuzzy state lookup. This method will make a best effort
     attempt at finding the state based on the lookup value provided.
 
-      * two digits will search for FIPS code
-      * two letters will search for state abbreviation
+      * one or two digits, or an integer, will search for FIPS code
+      * names, abbreviations, AP-style abbreviations and common variants
+        such as "N.Y.", "Wash DC" or "State of Texas" are matched, ignoring
+        case and punctuation, against a table of aliases
       * anything else will try to match the metaphone of state names
 
     Metaphone is used to allow for incorrect, but phonetically accurate,
@@ -78,1349 +250,700 @@ def lookup(val, field: Optional[str] = None, use_cache: bool = True) -> Optional
     the `field` argument. This skips the fuzzy-ish matching and does an
     exact, case-sensitive comparison against the specified field.
 
-    This method caches non-None results, but can the cache can be bypassed
-    with the `use_cache=False` argument.
+    Results, including failed lookups, are kept in `lookup_cache`, a bounded
+    LRU cache keyed on the raw lookup value. Its size defaults to the
+    US_LOOKUP_CACHE_SIZE environment variable or 4096 entries and can be
+    changed with `lookup_cache.resize()`. The cache can be bypassed with the
+    `use_cache=False` argument.
     """
 
-    matched_state = None
+    if use_cache:
+        try:
+            # True and False equal 1 and 0, which are FIPS codes, so values
+            # other than strings are keyed by their type as well
+            cache_key = (field, val) if isinstance(val, str) else (field, type(val), val)
+            matched_state = lookup_cache.get(cache_key, MISSING)
+        except TypeError:
+            # unhashable lookup values can't be cached
+            use_cache = False
+        else:
+            if matched_state is not MISSING:
+                return matched_state
 
     if field is None:
-        if FIPS_RE.match(val):
+        if not isinstance(val, str):
+            val = _numeric_fips(val)
+            field = "fips"
+        elif FIPS_RE.match(val):
+            val = val.zfill(2)
             field = "fips"
-        elif ABBR_RE.match(val):
-            val = val.upper()
-            field = "abbr"
         else:
-            val = jellyfish.metaphone(val)
-            field = "name_metaphone"
+            abbr = _alias(val)
+            if abbr is not None:
+                val = abbr
+                field = "abbr"
+            elif ABBR_RE.match(val):
+                # an unknown abbreviation, not worth a phonetic match
+                val = val.upper()
+                field = "abbr"
+            else:
+                val = _metaphone(val)
+                field = "name_metaphone"
+
+    index = _index(field)
+    try:
+        matched_state = index.get(val) if index is not None else _scan(val, field)
+    except TypeError:
+        # unhashable lookup value, such as a list of time zones
+        matched_state = _scan(val, field)
+
+    if use_cache:
+        lookup_cache.set(cache_key, matched_state)
+
+    return matched_state
 
-    # see if result is in cache
-    cache_key = f"{field}:{val}"
-    if use_cache and cache_key in _lookup_cache:
-        matched_state = _lookup_cache[cache_key]
 
-    for state in STATES_AND_TERRITORIES:
+def _index(field: str) -> Optional[Dict[Any, State]]:
+    """Hash index of the states lookup() resolves by the value of `field`, built
+    the first time a field is looked up. When several states share a value
+    the last one wins, matching the behavior of a full scan. Returns None if
+    the field has unhashable values and can only be scanned.
+    """
+
+    if field in _indexes:
+        return _indexes[field]
+
+    index: Optional[Dict[Any, State]] = {}
+    if field in _data.INDEXES:
+        # precomputed by scripts/build_data.py
+        index = {val: _state(abbr) for val, abbr in _data.INDEXES[field].items()}
+    else:
+        try:
+            for state in _lookup_states():
+                index[getattr(state, field)] = state  # type: ignore
+        except TypeError:
+            index = None
+
+    _indexes[field] = index
+    return index
+
+
+def _alias(val: str) -> Optional[str]:
+    """Abbreviation of the state `val` is an alias of, if any."""
+    # most values are already clean, so try them before normalizing
+    abbr = _data.ALIASES.get(val.lower())
+    if abbr is None:
+        abbr = _data.ALIASES.get(_normalize(val))
+    return abbr
+
+
+def _metaphone(val: str) -> str:
+    # jellyfish is a compiled extension that most lookups never need, so it
+    # is imported on first use rather than with the package
+    import jellyfish  # type: ignore
+
+    return jellyfish.metaphone(val)
+
+
+def _scan(val, field: str) -> Optional[State]:
+    matched_state = None
+    for state in _lookup_states():
         if val == getattr(state, field):
             matched_state = state
-            if use_cache:
-                _lookup_cache[cache_key] = state
-
     return matched_state
 
 
-def mapping(from_field: str, to_field: str, states: Optional[Iterable[State]] = None) -> Dict[Any, Any]:
+def _numeric_fips(val) -> Optional[str]:
+    """The zero-padded FIPS code for an integer, or an integral float as
+    read from a numeric column with missing values, such as 6 for "06"."""
+    from numbers import Integral
+
+    if isinstance(val, bool):
+        return None
+    if isinstance(val, Integral) or (isinstance(val, float) and val.is_integer()):
+        return f"{int(val):02d}" if 0 <= val < 100 else None
+    return None
+
+
+def lookup_many(values: Iterable, field: Optional[str] = None) -> BatchLookup:
+    """Look up many values at once, such as a column of a data file.
+
+    Each distinct value is resolved only once: values are de-duplicated,
+    sorted into FIPS codes, aliases and misspelled names the same way
+    `lookup()` auto-detects them, and each group is resolved against its
+    index in one pass. When `field` is given, every value is matched exactly against that
+    field instead.
+
+    Returns the matched states in input order, with None for values that
+    could not be resolved, along with the distinct unresolved values in the
+    order they first appeared. Non-string values never match in auto-detect
+    mode, except integers taken as FIPS codes, so missing cells are reported
+    as unresolved.
+    """
+
+    values = list(values)
+    keys = values
+    distinct = {val: val for val in dict.fromkeys(values)}
+    if field is None and any(not isinstance(val, str) and hash(val) in (0, 1) for val in distinct):
+        # True and False equal, and hash like, the FIPS codes 1 and 0, so
+        # when any value might be one of them values are keyed by type too
+        keys = [val if isinstance(val, str) else (type(val), val) for val in values]
+        distinct = {}
+        for key, val in zip(keys, values):
+            distinct.setdefault(key, val)
+    resolved: Dict[Any, Optional[State]] = dict.fromkeys(distinct)
+
+    if field is None:
+        fips, others = [], []
+        for key, val in distinct.items():
+            if not isinstance(val, str):
+                code = _numeric_fips(val)
+                if code is not None:
+                    fips.append((key, code))
+            elif FIPS_RE.match(val):
+                fips.append((key, val.zfill(2)))
+            else:
+                others.append(val)
+
+        index = _index("fips")
+        for key, code in fips:
+            resolved[key] = index.get(code)
+
+        index = _index("abbr")
+        misspelled = []
+        for val in others:
+            abbr = _alias(val)
+            if abbr is not None:
+                resolved[val] = index[abbr]
+            elif not ABBR_RE.match(val):
+                misspelled.append(val)
+
+        if misspelled:
+            from jellyfish import metaphone  # type: ignore
+
+            index = _index("name_metaphone")
+            for val in misspelled:
+                resolved[val] = index.get(metaphone(val))
+
+    else:
+        index = _index(field)
+        for val in resolved:
+            resolved[val] = index.get(val) if index is not None else _scan(val, field)
+
+    from ._types import BatchLookup
+
+    return BatchLookup(
+        states=[resolved[key] for key in keys],
+        unresolved=[distinct[key] for key, state in resolved.items() if state is None],
+    )
+
+
+# states, their lowercased names, and an index of name trigrams to positions
+# in those lists, built on first use by _fuzzy_index()
+_fuzzy: Optional[Tuple[List[State], List[str], Dict[str, List[int]]]] = None
+
+
+def _name_trigrams(val: str) -> set:
+    padded = f"  {val} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _fuzzy_index() -> Tuple[List[State], List[str], Dict[str, List[int]]]:
+    """The index lookup_candidates() searches. It is built in local variables
+    and published in one assignment, so threads that build it at the same
+    time never see, or append to, a half-built index."""
+
+    global _fuzzy
+    if _fuzzy is None:
+        states = _lookup_states()
+        names = [state.name.lower() for state in states]
+        trigrams: Dict[str, List[int]] = {}
+        for i, name in enumerate(names):
+            for gram in _name_trigrams(name):
+                trigrams.setdefault(gram, []).append(i)
+        _fuzzy = (states, names, trigrams)
+    return _fuzzy
+
+
+def lookup_candidates(val: str, k: int = 3, min_score: float = 0.0) -> List[Candidate]:
+    """Fuzzy state name lookup returning up to `k` (state, score) candidates,
+    best first. Scores are the Jaro-Winkler similarity between the lowercased
+    input and state names, from 0 to 1, so a threshold on the top score can
+    be used to accept a match or flag it for review. Candidates scoring below
+    `min_score` are dropped.
+
+    Only states that share at least one character trigram with the input are
+    scored, so inputs with nothing in common with any state name return no
+    candidates.
+    """
+
+    if k < 0:
+        raise ValueError(f"k must be at least 0, not {k}")
+
+    from jellyfish import jaro_winkler_similarity  # type: ignore
+
+    from ._types import Candidate
+
+    states, names, trigrams = _fuzzy_index()
+
+    query = val.lower()
+    positions: set = set()
+    for gram in _name_trigrams(query):
+        positions.update(trigrams.get(gram, ()))
+
+    scored = []
+    for i in positions:
+        score = jaro_winkler_similarity(query, names[i])
+        if score >= min_score:
+            scored.append((-score, names[i], i))
+    scored.sort()
+    return [Candidate(states[i], -score) for score, _, i in scored[:k]]
+
+
+# matches names, abbreviations and AP abbreviations in lowercased text; each
+# pattern carries its state and its kind: "name", "abbr" or "ap"
+_extractor: Optional[Automaton] = None
+
+
+def extract(text: str, strict_abbrs: bool = True) -> List[Mention]:
+    """Find mentions of states in free text by name ("Maryland"), postal
+    abbreviation ("MD"), or AP abbreviation ("Md."), in a single pass over
+    the text. Returns the states with the (start, end) span of each
+    mention, in order of appearance.
+
+    Mentions must start and end at word boundaries, and overlapping mentions
+    resolve to the leftmost, then longest, so "West Virginia" is not also a
+    mention of Virginia. With `strict_abbrs`, the default, bare postal
+    abbreviations only count when written in uppercase and AP abbreviations
+    only when capitalized, which avoids false hits on words like "in", "or",
+    "me" and "wash".
+    """
+
+    from ._types import Mention
+
+    global _extractor
+    if _extractor is None:
+        from .ahocorasick import Automaton
+
+        patterns = []
+        for state in _lookup_states():
+            patterns.append((state.name.lower(), (state, "name")))
+            patterns.append((state.abbr.lower(), (state, "abbr")))
+            # some AP abbreviations, such as "Ohio", are the full name
+            if state.ap_abbr and state.ap_abbr != state.name:
+                patterns.append((state.ap_abbr.lower(), (state, "ap")))
+        # "Washington, D.C." is DC, not a mention of Washington followed by DC
+        dc = _state("DC")
+        for variant in ("washington, dc", "washington, d.c.", "washington dc", "washington d.c."):
+            patterns.append((variant, (dc, "name")))
+        _extractor = Automaton(patterns)
+
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # a few characters lowercase to more than one, which would shift spans
+        lowered = "".join(char.lower()[:1] for char in text)
+
+    hits = []
+    for start, end, (state, kind) in _extractor.iter(lowered):
+        if start > 0 and lowered[start - 1].isalnum():
+            continue
+        if end < len(lowered) and lowered[end].isalnum():
+            continue
+        if strict_abbrs and kind == "abbr" and not text[start:end].isupper():
+            continue
+        if strict_abbrs and kind == "ap" and not text[start].isupper():
+            continue
+        hits.append((start, -end, state))
+    hits.sort()
+
+    mentions = []
+    last_end = 0
+    for start, end, state in hits:
+        if start >= last_end:
+            mentions.append(Mention(state, (start, -end)))
+            last_end = -end
+    return mentions
+
+
+def states_in_time_zone(tz: str) -> List[State]:
+    """States, territories and DC that observe the IANA time zone `tz`,
+    such as "America/Denver", from a reverse index built with the package
+    data."""
+    return [_state(abbr) for abbr in _data.TIME_ZONES.get(tz, ())]
+
+
+def lookup_array(values, field: Optional[str] = None, to_field: Optional[str] = None):
+    """Vectorized lookup over a NumPy array or pandas Series.
+
+    The input is factorized into its distinct values, which are resolved with
+    `lookup_many()` and broadcast back over the input, so the work done per
+    row is a single array take. Values resolve to State objects or, when
+    `to_field` is given, to that attribute of the matched state. Unmatched
+    and missing values become None.
+
+    A Series input returns a Series with the same index and name; anything
+    else returns a NumPy object array. Requires NumPy, plus pandas for
+    Series input and for factorizing object arrays containing missing values.
+    """
+
+    import numpy as np  # type: ignore
+
+    codes, uniques = _factorize(values)
+    states = lookup_many(uniques, field=field).states
+
+    # the extra trailing None is picked up by the -1 codes of missing values
+    resolved = np.empty(len(states) + 1, dtype=object)
+    for i, state in enumerate(states):
+        if state is not None:
+            resolved[i] = state if to_field is None else getattr(state, to_field)
+
+    return _like(values, resolved[codes])
+
+
+def _factorize(values) -> Tuple[Any, List[Any]]:
+    """Codes into a list of the distinct values of an array or Series, with
+    -1 for missing values when pandas is available."""
+
+    import numpy as np  # type: ignore
+
+    try:
+        import pandas as pd  # type: ignore
+    except ImportError:
+        pd = None
+
+    if pd is not None:
+        codes, uniques = pd.factorize(values if isinstance(values, pd.Series) else np.asarray(values))
+        uniques = list(uniques)
+    elif np.asarray(values).dtype == object:
+        # np.unique sorts, which fails on a mix of types such as State
+        # objects and strings
+        positions: Dict[Any, int] = {}
+        codes = np.array([positions.setdefault(val, len(positions)) for val in np.asarray(values).reshape(-1)])
+        uniques = list(positions)
+    else:
+        uniques, codes = np.unique(np.asarray(values), return_inverse=True)
+        uniques = uniques.tolist()
+        codes = codes.reshape(-1)
+
+    return codes, [val.decode() if isinstance(val, bytes) else val for val in uniques]
+
+
+def _like(values, result):
+    """`result` as a Series with the index and name of `values` if that is a
+    Series, otherwise unchanged."""
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(values, pd.Series):
+        return pd.Series(result, index=values.index, name=values.name)
+    return result
+
+
+def encode(values):
+    """Encode a NumPy array or pandas Series of state values as small integer
+    codes, the state's FIPS number, in a uint8 array. Values are resolved as
+    `lookup()` auto-detects them, and integer arrays are taken as FIPS
+    numbers directly. Values that can't be resolved encode as 0, which is
+    not the FIPS number of any state. Codes are stable across releases and
+    can be turned back into states or state fields with `decode()`.
+    """
+
+    import numpy as np  # type: ignore
+
+    arr = values.to_numpy() if hasattr(values, "to_numpy") else np.asarray(values)
+    if arr.dtype.kind in "iu":
+        valid = np.array([abbr is not None for abbr in _data.CODES])
+        in_range = (arr >= 0) & (arr < len(valid))
+        codes = np.where(in_range, arr, 0)
+        codes = np.where(valid[codes], codes, 0).astype(np.uint8)
+    else:
+        value_codes, uniques = _factorize(arr)
+        states = lookup_many(uniques).states
+        # the extra trailing 0 is picked up by the -1 codes of missing values
+        state_codes = np.array([int(s.fips) if s is not None else 0 for s in states] + [0], dtype=np.uint8)
+        codes = state_codes[value_codes]
+
+    return _like(values, codes)
+
+
+def decode(codes, field: Optional[str] = None):
+    """Decode an array of codes from `encode()` into State objects or, when
+    `field` is given, that attribute of each state, with None for 0 and
+    other codes that aren't the FIPS number of a state. A Series input
+    returns a Series with the same index and name; anything else returns a
+    NumPy object array."""
+
+    import numpy as np  # type: ignore
+
+    arr = codes.to_numpy() if hasattr(codes, "to_numpy") else np.asarray(codes)
+    table = _code_table(field)
+    # codes past the table, such as uint8 codes from 100 up, decode as 0
+    return _like(codes, table[np.where((arr >= 0) & (arr < len(table)), arr, 0)])
+
+
+# field -> 100-entry object array of that field by FIPS number, built on
+# first use by _code_table()
+_code_tables: Dict[Optional[str], Any] = {}
+
+
+def _code_table(field: Optional[str]):
+    table = _code_tables.get(field)
+    if table is None:
+        import numpy as np  # type: ignore
+
+        table = np.empty(len(_data.CODES), dtype=object)
+        for code, abbr in enumerate(_data.CODES):
+            if abbr is not None:
+                state = _state(abbr)
+                table[code] = state if field is None else getattr(state, field)
+        _code_tables[field] = table
+    return table
+
+
+def _zip_number(val) -> int:
+    """The 5-digit ZIP code of a ZIP or ZIP+4 as an integer, or -1."""
+    from numbers import Integral
+
+    if isinstance(val, str):
+        match = ZIP_RE.match(val)
+        return int(match.group(1)) if match else -1
+    if isinstance(val, bool):
+        return -1
+    if isinstance(val, Integral) or (isinstance(val, float) and val.is_integer()):
+        # a ZIP code read as a number, which loses its leading zeros, or as
+        # a float from a numeric column with missing values
+        return int(val) if 0 <= val < 100_000 else -1
+    return -1
+
+
+def lookup_zip(zip_code) -> Optional[State]:
+    """The state a ZIP code belongs to, or None. Accepts 5-digit ZIP codes,
+    ZIP+4 codes with or without the hyphen, and integers.
+
+    ZIP codes are resolved with a bisect over a small embedded table of ZIP
+    code ranges, which follow 3-digit ZIP prefixes except where a prefix
+    crosses a state line. Military APO/FPO ZIP codes don't resolve.
+    """
+
+    from bisect import bisect_right
+
+    from ._data import zips
+
+    number = _zip_number(zip_code)
+    i = bisect_right(zips.STARTS, number) - 1
+    if i < 0 or number > zips.ENDS[i]:
+        return None
+    return _state(_data.CODES[zips.CODES[i]])  # type: ignore
+
+
+def lookup_zip_array(values, to_field: Optional[str] = None):
+    """Vectorized `lookup_zip()` over a NumPy array or pandas Series, with
+    the same input and output as `lookup_array()`. Distinct string values
+    are parsed once, and all ZIP codes are resolved with a single sorted
+    search over the range table. Requires NumPy."""
+
+    import numpy as np  # type: ignore
+
+    from ._data import zips
+
+    arr = values.to_numpy() if hasattr(values, "to_numpy") else np.asarray(values)
+    if arr.dtype.kind in "iu":
+        numbers = np.where((arr >= 0) & (arr < 100_000), arr, -1)
+    else:
+        value_codes, uniques = _factorize(arr)
+        # the extra trailing -1 is picked up by the -1 codes of missing values
+        numbers = np.array([_zip_number(val) for val in uniques] + [-1], dtype=np.int64)[value_codes]
+
+    starts, ends, codes = (np.array(t, dtype=np.int64) for t in (zips.STARTS, zips.ENDS, zips.CODES))
+    i = np.maximum(np.searchsorted(starts, numbers, side="right") - 1, 0)
+    found = (numbers >= starts[i]) & (numbers <= ends[i])
+    return _like(values, _code_table(to_field)[np.where(found, codes[i], 0)])
+
+
+def lookup_point(lat: float, lon: float) -> Optional[State]:
+    """The state, territory or DC that contains a point, given in decimal
+    degrees, or None.
+
+    Boundaries are simplified from the Census 1:500,000 cartographic
+    boundaries and indexed on a grid of 0.1 degree cells, so most points
+    resolve without a polygon test. Points within about 500 m of a state
+    line or coast may resolve to a neighbor, or to None.
+    """
+
+    from . import geo
+
+    code = geo.state_code(lat, lon)
+    return _state(_data.CODES[code]) if code else None  # type: ignore
+
+
+def lookup_point_array(lats, lons, to_field: Optional[str] = None):
+    """Vectorized `lookup_point()` over arrays or Series of latitudes and
+    longitudes, with the same output as `lookup_array()`. Requires NumPy."""
+
+    from . import geo
+
+    return _like(lats, _code_table(to_field)[geo.state_codes(lats, lons)])
+
+
+# the State attribute holding the coordinates of each kind of point
+_POINTS = {"centroid": "centroid", "capital": "capital_coords"}
+
+
+def _coords(state: State, point: str) -> Optional[Tuple[float, float]]:
+    if point not in _POINTS:
+        raise ValueError(f"unknown point {point!r}, expected one of: {', '.join(_POINTS)}")
+    return getattr(state, _POINTS[point])
+
+
+def nearest_states(
+    lat: float, lon: float, k: int = 1, states: Optional[Iterable[Any]] = None, point: str = "centroid"
+) -> List[Nearest]:
+    """The `k` states nearest to a point, nearest first, by great-circle
+    distance to their centroids or, with `point="capital"`, their capitals.
+
+    The search covers `states`, as State objects or values that `lookup()`
+    resolves, or STATES_AND_TERRITORIES and DC by default. A k-d tree is
+    built once for each set of states and kept in `nearest_cache`, so
+    repeated queries over the same states only pay for the search.
+    """
+
+    from ._types import Nearest
+
+    key = (point, None if states is None else tuple(states))
+    tree = nearest_cache.get(key, MISSING)
+    if tree is MISSING:
+        from . import geo
+
+        candidates = _lookup_states() if key[1] is None else [_resolve(val) for val in key[1]]
+        with_coords = [(state, _coords(state, point)) for state in candidates]
+        with_coords = [(state, coords) for state, coords in with_coords if coords is not None]
+        tree = geo.KDTree([coords for _, coords in with_coords], [state for state, _ in with_coords])
+        nearest_cache.set(key, tree)
+    return [Nearest(state, dist) for dist, state in tree.query(lat, lon, k)]
+
+
+def distance(a: Any, b: Any, point: str = "centroid") -> Optional[float]:
+    """Great-circle distance in kilometers between the centroids or, with
+    `point="capital"`, the capitals of two states, or None if either has
+    no coordinates. States may be State objects or values that `lookup()`
+    resolves."""
+
+    from . import geo
+
+    coords_a, coords_b = _coords(_resolve(a), point), _coords(_resolve(b), point)
+    if coords_a is None or coords_b is None:
+        return None
+    return geo.haversine(*coords_a, *coords_b)
+
+
+def distance_matrix(point: str = "centroid"):
+    """Great-circle distances in kilometers between the centroids or, with
+    `point="capital"`, the capitals of every pair of states, as a read-only
+    100x100 NumPy array indexed by the codes of `encode()`, so that
+    `matrix[encode(a), encode(b)]` gives the distances between two columns
+    of states. Codes without a state or coordinates are NaN. The matrix is
+    computed once per kind of point. Requires NumPy."""
+
+    matrix = _distance_matrices.get(point)
+    if matrix is None:
+        import numpy as np  # type: ignore
+
+        from .geo import EARTH_RADIUS_KM
+
+        coords = np.full((len(_data.CODES), 2), np.nan)
+        for code, abbr in enumerate(_data.CODES):
+            if abbr is not None and _coords(_state(abbr), point) is not None:
+                coords[code] = _coords(_state(abbr), point)
+        lat, lon = np.radians(coords).T
+        a = (
+            np.sin((lat[:, None] - lat[None, :]) / 2) ** 2
+            + np.cos(lat[:, None]) * np.cos(lat[None, :]) * np.sin((lon[:, None] - lon[None, :]) / 2) ** 2
+        )
+        matrix = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+        matrix.setflags(write=False)
+        _distance_matrices[point] = matrix
+    return matrix
+
+
+def _resolve(val: Any) -> State:
+    state = val if isinstance(val, State) else lookup(val)
+    if state is None:
+        raise ValueError(f"no state found for {val!r}")
+    return state
+
+
+def mapping(from_field: str, to_field: str, states: Optional[Iterable[State]] = None) -> Mapping[Any, Any]:
+    """A read-only mapping from the `from_field` value of each state to its
+    `to_field` value, over `states` or STATES_AND_TERRITORIES by default.
+
+    When `from_field` holds several values, as `time_zones` does, the
+    mapping is inverted into a multimap: each item maps to a tuple of the
+    `to_field` values of every state that has it, in state order. Otherwise,
+    when two states share a value the last one wins.
+
+    Mappings are built once per fields and set of states and kept in
+    `mapping_cache`, so repeated calls are cheap.
+    """
+
+    key = (from_field, to_field, None if states is None else tuple(states))
+    result = mapping_cache.get(key, MISSING)
+    if result is MISSING:
+        result = MappingProxyType(_mapping(from_field, to_field, key[2]))
+        mapping_cache.set(key, result)
+    return result
+
+
+# fields that hold several values rather than one, which mapping() inverts;
+# tuple fields such as capital_coords are single values
+_MULTI_VALUED = ("time_zones",)
+
+
+def _mapping(from_field: str, to_field: str, states: Optional[Tuple[State, ...]]) -> Dict[Any, Any]:
     if states is None:
-        states = STATES_AND_TERRITORIES
-    return {getattr(s, from_field): getattr(s, to_field) for s in states}
-
-
-AL = State(
-    **{
-        "fips": "01",
-        "name": "Alabama",
-        "abbr": "AL",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1819,
-        "capital": "Montgomery",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Ala.",
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "ALBM",
-    }
-)
-
-
-AK = State(
-    **{
-        "fips": "02",
-        "name": "Alaska",
-        "abbr": "AK",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": False,
-        "is_continental": True,
-        "statehood_year": 1959,
-        "capital": "Juneau",
-        "capital_tz": "America/Anchorage",
-        "ap_abbr": "Alaska",
-        "time_zones": ["America/Anchorage", "America/Adak"],
-        "name_metaphone": "ALSK",
-    }
-)
-
-
-AS = State(
-    **{
-        "fips": "60",
-        "name": "American Samoa",
-        "abbr": "AS",
-        "is_territory": True,
-        "is_obsolete": False,
-        "is_contiguous": False,
-        "is_continental": False,
-        "statehood_year": None,
-        "capital": "Pago Pago",
-        "capital_tz": "Pacific/Samoa",
-        "ap_abbr": None,
-        "time_zones": ["Pacific/Samoa"],
-        "name_metaphone": "AMRKN SM",
-    }
-)
-
-
-AZ = State(
-    **{
-        "fips": "04",
-        "name": "Arizona",
-        "abbr": "AZ",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1912,
-        "capital": "Phoenix",
-        "capital_tz": "America/Phoenix",
-        "ap_abbr": "Ariz.",
-        "time_zones": ["America/Phoenix"],
-        "name_metaphone": "ARSN",
-    }
-)
-
-
-AR = State(
-    **{
-        "fips": "05",
-        "name": "Arkansas",
-        "abbr": "AR",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1836,
-        "capital": "Little Rock",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Ark.",
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "ARKNSS",
-    }
-)
-
-
-CA = State(
-    **{
-        "fips": "06",
-        "name": "California",
-        "abbr": "CA",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1850,
-        "capital": "Sacramento",
-        "capital_tz": "America/Los_Angeles",
-        "ap_abbr": "Calif.",
-        "time_zones": ["America/Los_Angeles"],
-        "name_metaphone": "KLFRN",
-    }
-)
-
-
-CO = State(
-    **{
-        "fips": "08",
-        "name": "Colorado",
-        "abbr": "CO",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1876,
-        "capital": "Denver",
-        "capital_tz": "America/Denver",
-        "ap_abbr": "Colo.",
-        "time_zones": ["America/Denver"],
-        "name_metaphone": "KLRT",
-    }
-)
-
-
-CT = State(
-    **{
-        "fips": "09",
-        "name": "Connecticut",
-        "abbr": "CT",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1788,
-        "capital": "Hartford",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Conn.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "KNKTKT",
-    }
-)
-
-
-DK = State(
-    **{
-        "fips": None,
-        "name": "Dakota",
-        "abbr": "DK",
-        "is_territory": False,
-        "is_obsolete": True,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": None,
-        "capital": "Yankton",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": None,
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "TKT",
-    }
-)
-
-
-DE = State(
-    **{
-        "fips": "10",
-        "name": "Delaware",
-        "abbr": "DE",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1787,
-        "capital": "Dover",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Del.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "TLWR",
-    }
-)
-
-
-DC = State(
-    **{
-        "fips": "11",
-        "name": "District of Columbia",
-        "abbr": "DC",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": None,
-        "capital": None,
-        "capital_tz": "America/New_York",
-        "ap_abbr": "D.C.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "TSTRKT OF KLMB",
-    }
-)
-
-
-FL = State(
-    **{
-        "fips": "12",
-        "name": "Florida",
-        "abbr": "FL",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1845,
-        "capital": "Tallahassee",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Fla.",
-        "time_zones": ["America/New_York", "America/Chicago"],
-        "name_metaphone": "FLRT",
-    }
-)
-
-
-GA = State(
-    **{
-        "fips": "13",
-        "name": "Georgia",
-        "abbr": "GA",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1788,
-        "capital": "Atlanta",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Ga.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "JRJ",
-    }
-)
-
-
-GU = State(
-    **{
-        "fips": "66",
-        "name": "Guam",
-        "abbr": "GU",
-        "is_territory": True,
-        "is_obsolete": False,
-        "is_contiguous": False,
-        "is_continental": False,
-        "statehood_year": None,
-        "capital": "Hagåtña",
-        "capital_tz": "Pacific/Guam",
-        "ap_abbr": None,
-        "time_zones": ["Pacific/Guam"],
-        "name_metaphone": "KM",
-    }
-)
-
-
-HI = State(
-    **{
-        "fips": "15",
-        "name": "Hawaii",
-        "abbr": "HI",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": False,
-        "is_continental": False,
-        "statehood_year": 1959,
-        "capital": "Honolulu",
-        "capital_tz": "Pacific/Honolulu",
-        "ap_abbr": "Hawaii",
-        "time_zones": ["Pacific/Honolulu"],
-        "name_metaphone": "HW",
-    }
-)
-
-
-ID = State(
-    **{
-        "fips": "16",
-        "name": "Idaho",
-        "abbr": "ID",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1890,
-        "capital": "Boise",
-        "capital_tz": "America/Denver",
-        "ap_abbr": "Idaho",
-        "time_zones": ["America/Denver", "America/Los_Angeles"],
-        "name_metaphone": "ITH",
-    }
-)
-
-
-IL = State(
-    **{
-        "fips": "17",
-        "name": "Illinois",
-        "abbr": "IL",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1818,
-        "capital": "Springfield",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Ill.",
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "ILNS",
-    }
-)
-
-
-IN = State(
-    **{
-        "fips": "18",
-        "name": "Indiana",
-        "abbr": "IN",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1816,
-        "capital": "Indianapolis",
-        "capital_tz": "America/Indiana/Indianapolis",
-        "ap_abbr": "Ind.",
-        "time_zones": [
-            "America/Chicago",
-            "America/Indiana/Indianapolis",
-            "America/Indianapolis",
-            "America/Indiana/Winamac",
-            "America/Indiana/Vincennes",
-            "America/Indiana/Vevay",
-            "America/Indiana/Tell_City",
-            "America/Indiana/Petersburg",
-            "America/Indiana/Marengo",
-            "America/Indiana/Knox",
-            "America/Knox_IN",
-            "America/New_York",
-        ],
-        "name_metaphone": "INTN",
-    }
-)
-
-
-IA = State(
-    **{
-        "fips": "19",
-        "name": "Iowa",
-        "abbr": "IA",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1846,
-        "capital": "Des Moines",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Iowa",
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "IW",
-    }
-)
-
-
-KS = State(
-    **{
-        "fips": "20",
-        "name": "Kansas",
-        "abbr": "KS",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1861,
-        "capital": "Topeka",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Kan.",
-        "time_zones": ["America/Chicago", "America/Denver"],
-        "name_metaphone": "KNSS",
-    }
-)
-
-
-KY = State(
-    **{
-        "fips": "21",
-        "name": "Kentucky",
-        "abbr": "KY",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1792,
-        "capital": "Frankfort",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Ky.",
-        "time_zones": [
-            "America/Chicago",
-            "America/New_York",
-            "America/Kentucky/Louisville",
-            "America/Kentucky/Monticello",
-        ],
-        "name_metaphone": "KNTK",
-    }
-)
-
-
-LA = State(
-    **{
-        "fips": "22",
-        "name": "Louisiana",
-        "abbr": "LA",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1812,
-        "capital": "Baton Rouge",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "La.",
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "LXN",
-    }
-)
-
-
-ME = State(
-    **{
-        "fips": "23",
-        "name": "Maine",
-        "abbr": "ME",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1820,
-        "capital": "Augusta",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Maine",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "MN",
-    }
-)
-
-
-MD = State(
-    **{
-        "fips": "24",
-        "name": "Maryland",
-        "abbr": "MD",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1788,
-        "capital": "Annapolis",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Md.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "MRLNT",
-    }
-)
-
-
-MA = State(
-    **{
-        "fips": "25",
-        "name": "Massachusetts",
-        "abbr": "MA",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1788,
-        "capital": "Boston",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Mass.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "MSXSTS",
-    }
-)
-
-
-MI = State(
-    **{
-        "fips": "26",
-        "name": "Michigan",
-        "abbr": "MI",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1837,
-        "capital": "Lansing",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Mich.",
-        "time_zones": ["America/New_York", "America/Chicago"],
-        "name_metaphone": "MXKN",
-    }
-)
-
-
-MN = State(
-    **{
-        "fips": "27",
-        "name": "Minnesota",
-        "abbr": "MN",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1858,
-        "capital": "Saint Paul",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Minn.",
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "MNST",
-    }
-)
-
-
-MS = State(
-    **{
-        "fips": "28",
-        "name": "Mississippi",
-        "abbr": "MS",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1817,
-        "capital": "Jackson",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Miss.",
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "MSSP",
-    }
-)
-
-
-MO = State(
-    **{
-        "fips": "29",
-        "name": "Missouri",
-        "abbr": "MO",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1821,
-        "capital": "Jefferson City",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Mo.",
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "MSR",
-    }
-)
-
-
-MT = State(
-    **{
-        "fips": "30",
-        "name": "Montana",
-        "abbr": "MT",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1889,
-        "capital": "Helena",
-        "capital_tz": "America/Denver",
-        "ap_abbr": "Mont.",
-        "time_zones": ["America/Denver"],
-        "name_metaphone": "MNTN",
-    }
-)
-
-
-NE = State(
-    **{
-        "fips": "31",
-        "name": "Nebraska",
-        "abbr": "NE",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1867,
-        "capital": "Lincoln",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Neb.",
-        "time_zones": ["America/Chicago", "America/Denver"],
-        "name_metaphone": "NBRSK",
-    }
-)
-
-
-NV = State(
-    **{
-        "fips": "32",
-        "name": "Nevada",
-        "abbr": "NV",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1864,
-        "capital": "Carson City",
-        "capital_tz": "America/Los_Angeles",
-        "ap_abbr": "Nev.",
-        "time_zones": ["America/Los_Angeles", "America/Denver"],
-        "name_metaphone": "NFT",
-    }
-)
-
-
-NH = State(
-    **{
-        "fips": "33",
-        "name": "New Hampshire",
-        "abbr": "NH",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1788,
-        "capital": "Concord",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "N.H.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "N HMPXR",
-    }
-)
-
-
-NJ = State(
-    **{
-        "fips": "34",
-        "name": "New Jersey",
-        "abbr": "NJ",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1787,
-        "capital": "Trenton",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "N.J.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "N JRS",
-    }
-)
-
-
-NM = State(
-    **{
-        "fips": "35",
-        "name": "New Mexico",
-        "abbr": "NM",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1912,
-        "capital": "Santa Fe",
-        "capital_tz": "America/Denver",
-        "ap_abbr": "N.M.",
-        "time_zones": ["America/Denver"],
-        "name_metaphone": "N MKSK",
-    }
-)
-
-
-NY = State(
-    **{
-        "fips": "36",
-        "name": "New York",
-        "abbr": "NY",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1788,
-        "capital": "Albany",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "N.Y.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "N YRK",
-    }
-)
-
-
-NC = State(
-    **{
-        "fips": "37",
-        "name": "North Carolina",
-        "abbr": "NC",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1789,
-        "capital": "Raleigh",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "N.C.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "NR0 KRLN",
-    }
-)
-
-
-ND = State(
-    **{
-        "fips": "38",
-        "name": "North Dakota",
-        "abbr": "ND",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1889,
-        "capital": "Bismarck",
-        "capital_tz": "America/North_Dakota/Center",
-        "ap_abbr": "N.D.",
-        "time_zones": [
-            "America/Boise",
-            "America/Chicago",
-            "America/North_Dakota/Beulah",
-            "America/North_Dakota/Center",
-            "America/North_Dakota/New_Salem",
-        ],
-        "name_metaphone": "NR0 TKT",
-    }
-)
-
-
-MP = State(
-    **{
-        "fips": "69",
-        "name": "Northern Mariana Islands",
-        "abbr": "MP",
-        "is_territory": True,
-        "is_obsolete": False,
-        "is_contiguous": False,
-        "is_continental": False,
-        "statehood_year": None,
-        "capital": "Saipan",
-        "capital_tz": "Pacific/Guam",
-        "ap_abbr": None,
-        "time_zones": ["Pacific/Guam"],
-        "name_metaphone": "NR0RN MRN ISLNTS",
-    }
-)
-
-
-OH = State(
-    **{
-        "fips": "39",
-        "name": "Ohio",
-        "abbr": "OH",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1803,
-        "capital": "Columbus",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Ohio",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "OH",
-    }
-)
-
-
-OK = State(
-    **{
-        "fips": "40",
-        "name": "Oklahoma",
-        "abbr": "OK",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1907,
-        "capital": "Oklahoma City",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Okla.",
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "OKLHM",
-    }
-)
-
-
-OR = State(
-    **{
-        "fips": "41",
-        "name": "Oregon",
-        "abbr": "OR",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1859,
-        "capital": "Salem",
-        "capital_tz": "America/Los_Angeles",
-        "ap_abbr": "Ore.",
-        "time_zones": ["America/Los_Angeles", "America/Boise"],
-        "name_metaphone": "ORKN",
-    }
-)
-
-
-OL = State(
-    **{
-        "fips": None,
-        "name": "Orleans",
-        "abbr": "OL",
-        "is_territory": False,
-        "is_obsolete": True,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": None,
-        "capital": None,
-        "capital_tz": None,
-        "ap_abbr": None,
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "ORLNS",
-    }
-)
-
-
-PA = State(
-    **{
-        "fips": "42",
-        "name": "Pennsylvania",
-        "abbr": "PA",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1787,
-        "capital": "Harrisburg",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Pa.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "PNSLFN",
-    }
-)
-
-
-PI = State(
-    **{
-        "fips": None,
-        "name": "Philippine Islands",
-        "abbr": "PI",
-        "is_territory": False,
-        "is_obsolete": True,
-        "is_contiguous": False,
-        "is_continental": False,
-        "statehood_year": None,
-        "capital": None,
-        "capital_tz": None,
-        "ap_abbr": None,
-        "time_zones": ["Asia/Singapore"],
-        "name_metaphone": "FLPN ISLNTS",
-    }
-)
-
-
-PR = State(
-    **{
-        "fips": "72",
-        "name": "Puerto Rico",
-        "abbr": "PR",
-        "is_territory": True,
-        "is_obsolete": False,
-        "is_contiguous": False,
-        "is_continental": False,
-        "statehood_year": None,
-        "capital": "San Juan",
-        "capital_tz": "America/Puerto_Rico",
-        "ap_abbr": None,
-        "time_zones": ["America/Puerto_Rico"],
-        "name_metaphone": "PRT RK",
-    }
-)
-
-
-RI = State(
-    **{
-        "fips": "44",
-        "name": "Rhode Island",
-        "abbr": "RI",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1790,
-        "capital": "Providence",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "R.I.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "RHT ISLNT",
-    }
-)
-
-
-SC = State(
-    **{
-        "fips": "45",
-        "name": "South Carolina",
-        "abbr": "SC",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1788,
-        "capital": "Columbia",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "S.C.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "S0 KRLN",
-    }
-)
-
-
-SD = State(
-    **{
-        "fips": "46",
-        "name": "South Dakota",
-        "abbr": "SD",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1889,
-        "capital": "Pierre",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "S.D.",
-        "time_zones": ["America/Chicago", "America/Denver"],
-        "name_metaphone": "S0 TKT",
-    }
-)
-
-
-TN = State(
-    **{
-        "fips": "47",
-        "name": "Tennessee",
-        "abbr": "TN",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1796,
-        "capital": "Nashville",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Tenn.",
-        "time_zones": ["America/Chicago", "America/New_York"],
-        "name_metaphone": "TNS",
-    }
-)
-
-
-TX = State(
-    **{
-        "fips": "48",
-        "name": "Texas",
-        "abbr": "TX",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1845,
-        "capital": "Austin",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Texas",
-        "time_zones": ["America/Chicago", "America/Denver"],
-        "name_metaphone": "TKSS",
-    }
-)
-
-
-UT = State(
-    **{
-        "fips": "49",
-        "name": "Utah",
-        "abbr": "UT",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1896,
-        "capital": "Salt Lake City",
-        "capital_tz": "America/Denver",
-        "ap_abbr": "Utah",
-        "time_zones": ["America/Denver"],
-        "name_metaphone": "UT",
-    }
-)
-
-
-VT = State(
-    **{
-        "fips": "50",
-        "name": "Vermont",
-        "abbr": "VT",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1791,
-        "capital": "Montpelier",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Vt.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "FRMNT",
-    }
-)
-
-
-VI = State(
-    **{
-        "fips": "78",
-        "name": "Virgin Islands",
-        "abbr": "VI",
-        "is_territory": True,
-        "is_obsolete": False,
-        "is_contiguous": False,
-        "is_continental": False,
-        "statehood_year": None,
-        "capital": "Charlotte Amalie",
-        "capital_tz": "America/Puerto_Rico",
-        "ap_abbr": None,
-        "time_zones": ["America/Puerto_Rico"],
-        "name_metaphone": "FRJN ISLNTS",
-    }
-)
-
-
-VA = State(
-    **{
-        "fips": "51",
-        "name": "Virginia",
-        "abbr": "VA",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1788,
-        "capital": "Richmond",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "Va.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "FRJN",
-    }
-)
-
-
-WA = State(
-    **{
-        "fips": "53",
-        "name": "Washington",
-        "abbr": "WA",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1889,
-        "capital": "Olympia",
-        "capital_tz": "America/Los_Angeles",
-        "ap_abbr": "Wash.",
-        "time_zones": ["America/Los_Angeles"],
-        "name_metaphone": "WXNKTN",
-    }
-)
-
-
-WV = State(
-    **{
-        "fips": "54",
-        "name": "West Virginia",
-        "abbr": "WV",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1863,
-        "capital": "Charleston",
-        "capital_tz": "America/New_York",
-        "ap_abbr": "W.Va.",
-        "time_zones": ["America/New_York"],
-        "name_metaphone": "WST FRJN",
-    }
-)
-
-
-WI = State(
-    **{
-        "fips": "55",
-        "name": "Wisconsin",
-        "abbr": "WI",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1848,
-        "capital": "Madison",
-        "capital_tz": "America/Chicago",
-        "ap_abbr": "Wis.",
-        "time_zones": ["America/Chicago"],
-        "name_metaphone": "WSKNSN",
-    }
-)
-
-
-WY = State(
-    **{
-        "fips": "56",
-        "name": "Wyoming",
-        "abbr": "WY",
-        "is_territory": False,
-        "is_obsolete": False,
-        "is_contiguous": True,
-        "is_continental": True,
-        "statehood_year": 1890,
-        "capital": "Cheyenne",
-        "capital_tz": "America/Denver",
-        "ap_abbr": "Wyo.",
-        "time_zones": ["America/Denver"],
-        "name_metaphone": "YMNK",
-    }
-)
-
-
-OBSOLETE: List[State] = [DK, OL, PI]
-TERRITORIES: List[State] = [AS, GU, MP, PR, VI]
-STATES: List[State] = [
-    AL,
-    AK,
-    AZ,
-    AR,
-    CA,
-    CO,
-    CT,
-    DE,
-    FL,
-    GA,
-    HI,
-    ID,
-    IL,
-    IN,
-    IA,
-    KS,
-    KY,
-    LA,
-    ME,
-    MD,
-    MA,
-    MI,
-    MN,
-    MS,
-    MO,
-    MT,
-    NE,
-    NV,
-    NH,
-    NJ,
-    NM,
-    NY,
-    NC,
-    ND,
-    OH,
-    OK,
-    OR,
-    PA,
-    RI,
-    SC,
-    SD,
-    TN,
-    TX,
-    UT,
-    VT,
-    VA,
-    WA,
-    WV,
-    WI,
-    WY,
-]
-STATES_CONTIGUOUS: List[State] = [
-    AL,
-    AZ,
-    AR,
-    CA,
-    CO,
-    CT,
-    DE,
-    FL,
-    GA,
-    ID,
-    IL,
-    IN,
-    IA,
-    KS,
-    KY,
-    LA,
-    ME,
-    MD,
-    MA,
-    MI,
-    MN,
-    MS,
-    MO,
-    MT,
-    NE,
-    NV,
-    NH,
-    NJ,
-    NM,
-    NY,
-    NC,
-    ND,
-    OH,
-    OK,
-    OR,
-    PA,
-    RI,
-    SC,
-    SD,
-    TN,
-    TX,
-    UT,
-    VT,
-    VA,
-    WA,
-    WV,
-    WI,
-    WY,
-]
-STATES_CONTINENTAL: List[State] = [
-    AL,
-    AK,
-    AZ,
-    AR,
-    CA,
-    CO,
-    CT,
-    DE,
-    FL,
-    GA,
-    ID,
-    IL,
-    IN,
-    IA,
-    KS,
-    KY,
-    LA,
-    ME,
-    MD,
-    MA,
-    MI,
-    MN,
-    MS,
-    MO,
-    MT,
-    NE,
-    NV,
-    NH,
-    NJ,
-    NM,
-    NY,
-    NC,
-    ND,
-    OH,
-    OK,
-    OR,
-    PA,
-    RI,
-    SC,
-    SD,
-    TN,
-    TX,
-    UT,
-    VT,
-    VA,
-    WA,
-    WV,
-    WI,
-    WY,
-]
+        states = tuple(__getattr__("STATES_AND_TERRITORIES"))
+    pairs = [(getattr(s, from_field), getattr(s, to_field)) for s in states]
+    if from_field not in _MULTI_VALUED:
+        return dict(pairs)
+
+    multimap: Dict[Any, Tuple[Any, ...]] = {}
+    for keys, val in pairs:
+        for k in keys:
+            multimap[k] = multimap.get(k, ()) + (val,)
+    return multimap
+
+
+def __getattr__(name: str):
+    """Build State objects, such as `MD`, and lists of states, such as
+    `STATES`, the first time they are accessed. Built values are stored as
+    module globals, so this is only called once per name."""
+
+    if name in globals():
+        return globals()[name]
+
+    if name in _data.ROWS:
+        value: Any = State(**dict(zip(_data.FIELDS, _data.ROWS[name])))
+    elif name in _data.LISTS:
+        value = [_state(abbr) for abbr in _data.LISTS[name]]
+        if DC_STATEHOOD and name in _DC_STATEHOOD_LISTS:
+            value.append(_state("DC"))
+    elif name in _TYPES:
+        from . import _types
+
+        value = getattr(_types, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_data.ROWS) | set(_data.LISTS) | set(_TYPES))
+
 
-STATES_AND_TERRITORIES: List[State] = STATES + TERRITORIES
+def _state(abbr: str) -> State:
+    return __getattr__(abbr)
 
-COMMONWEALTHS: List[State] = [KY, MA, PA, VA]
 
-if DC_STATEHOOD:
-    STATES.append(DC)
-    STATES_AND_TERRITORIES.append(DC)
-    STATES_CONTIGUOUS.append(DC)
-    STATES_CONTINENTAL.append(DC)
+def _lookup_states() -> List[State]:
+    """The states lookup() resolves: STATES_AND_TERRITORIES and DC."""
+    return [_state(abbr) for abbr in _data.LOOKUP]
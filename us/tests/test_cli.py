@@ -0,0 +1,110 @@
+import csv
+import io
+import json
+
+import pytest  # type: ignore
+
+import us
+from us.cli import normalize
+
+CSV = 'id,state\n1,md\n2,"Virginia"\n3,Narnia\n4,24\n'
+
+
+def run(monkeypatch, capsys, argv, stdin=""):
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    normalize.main(argv)
+    return capsys.readouterr()
+
+
+# normalize
+
+
+def test_normalize_csv(monkeypatch, capsys):
+    out = run(monkeypatch, capsys, ["-c", "state"], CSV)
+    assert out.out.splitlines() == [
+        "id,state,state_fips,state_abbr,state_name",
+        "1,md,24,MD,Maryland",
+        "2,Virginia,51,VA,Virginia",
+        "3,Narnia,,,",
+        "4,24,24,MD,Maryland",
+    ]
+    assert "normalized 4 rows" in out.err
+    assert "1 unresolved" in out.err
+
+
+def test_normalize_csv_chunks(monkeypatch, capsys):
+    chunked = run(monkeypatch, capsys, ["-c", "state", "--chunk-size", "1"], CSV)
+    whole = run(monkeypatch, capsys, ["-c", "state"], CSV)
+    assert chunked.out == whole.out
+
+
+def test_normalize_csv_coordinates(monkeypatch, capsys):
+    out = run(monkeypatch, capsys, ["-c", "state", "--fields", "capital_coords", "--prefix", ""], "state\nMD\n")
+    lat, lon = us.states.MD.capital_coords
+    assert out.out.splitlines() == ["state,capital_coords", f'MD,"{lat}, {lon}"']
+
+
+def test_normalize_jsonl_file(tmp_path, capsys):
+    infile = tmp_path / "in.jsonl"
+    outfile = tmp_path / "out.jsonl"
+    infile.write_text('{"st": "ak"}\n{"st": null}\n')
+
+    normalize.main([str(infile), "-o", str(outfile), "-c", "st", "--fields", "abbr,time_zones", "--prefix", ""])
+
+    records = [json.loads(line) for line in outfile.read_text().splitlines()]
+    assert records == [
+        {"st": "ak", "abbr": "AK", "time_zones": ["America/Anchorage", "America/Adak"]},
+        {"st": None, "abbr": None, "time_zones": None},
+    ]
+    assert "1 unresolved" in capsys.readouterr().err
+
+
+def test_normalize_match_field(monkeypatch, capsys):
+    out = run(monkeypatch, capsys, ["-c", "ap", "--match", "ap_abbr", "--fields", "abbr"], "ap\nMd.\nmd\n")
+    assert out.out.splitlines() == ["ap,ap_abbr", "Md.,MD", "md,"]
+
+
+def test_normalize_errors(monkeypatch, capsys):
+    with pytest.raises(SystemExit):
+        run(monkeypatch, capsys, ["-c", "state", "--fields", "nope"], CSV)
+    with pytest.raises(SystemExit):
+        run(monkeypatch, capsys, ["-c", "missing"], CSV)
+    for option in ("--chunk-size", "--workers"):
+        for size in ("0", "-1"):
+            with pytest.raises(SystemExit):
+                run(monkeypatch, capsys, ["-c", "state", option, size], CSV)
+            assert "must be at least 1" in capsys.readouterr().err
+
+
+def test_normalize_workers(tmp_path, capsys):
+    infile = tmp_path / "in.csv"
+    infile.write_text('id,state\n1,md\n2,"Virg\ninia"\n3,Narnia\n4,24\n5,"a ""quoted"" MD"\n6,5" pipe\n7,Texas\n8,md\n')
+
+    normalize.main([str(infile), "-c", "state"])
+    serial = capsys.readouterr()
+    normalize.main([str(infile), "-c", "state", "--workers", "2", "--chunk-size", "2"])
+    parallel = capsys.readouterr()
+
+    assert parallel.out == serial.out
+    assert "normalized 8 rows" in parallel.err
+    assert "4 unresolved" in parallel.err
+
+
+def test_csv_blocks():
+    # a stray quote in an unquoted field doesn't open a quoted field
+    consumed: list = []
+    reader = csv.reader(normalize._recorded(io.StringIO('1,5" pipe\n2,"Virg\ninia"\n3,md\n', newline=""), consumed))
+    assert list(normalize._csv_blocks(reader, consumed, 1)) == ['1,5" pipe\n', '2,"Virg\ninia"\n', "3,md\n"]
+
+
+def test_normalize_workers_jsonl(tmp_path, capsys):
+    infile = tmp_path / "in.jsonl"
+    infile.write_text("".join(json.dumps({"id": i, "st": st}) + "\n" for i, st in enumerate(["md", "VA", "x"] * 5)))
+
+    normalize.main([str(infile), "-c", "st"])
+    serial = capsys.readouterr()
+    normalize.main([str(infile), "-c", "st", "--workers", "3", "--chunk-size", "4"])
+    parallel = capsys.readouterr()
+
+    assert parallel.out == serial.out
+    assert "5 unresolved" in parallel.err
@@ -0,0 +1,189 @@
+import io
+import json
+import os
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest  # type: ignore
+
+import us
+from us.shapefiles import TIGER_URL, DownloadError, ManifestEntry, ShapefileCache, manifest
+
+
+def make_zip(name: str, size: int = 50_000) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr(name, os.urandom(size))
+    return buf.getvalue()
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves `server.files` over keep-alive HTTP/1.1 with Range support.
+    Paths in `server.truncate` are cut off halfway, once."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get("Range")))
+            server.connections.add(self.client_address)
+        body = server.files.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+
+        start = 0
+        if self.headers.get("Range"):
+            start = int(self.headers["Range"].split("=")[1].rstrip("-"))
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+
+        if self.path in server.truncate:
+            server.truncate.discard(self.path)
+            self.wfile.write(body[start : start + (len(body) - start) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.files, httpd.truncate, httpd.requests, httpd.connections = {}, set(), [], set()
+    httpd.lock = threading.Lock()
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def mirror(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def test_fetch_caches(server, tmp_path):
+    url = TIGER_URL + "TIGER2010/STATE/2010/tl_2010_24_state10.zip"
+    server.files["/TIGER2010/STATE/2010/tl_2010_24_state10.zip"] = body = make_zip("md.shp")
+    cache = ShapefileCache(str(tmp_path), mirror=mirror(server))
+
+    path = cache.fetch(url)
+    assert path == os.path.join(str(tmp_path), "TIGER2010", "STATE", "2010", "tl_2010_24_state10.zip")
+    assert open(path, "rb").read() == body
+    assert cache.fetch(url) == path
+    assert len(server.requests) == 1
+
+
+def test_fetch_resumes(server, tmp_path):
+    server.files["/a.zip"] = body = make_zip("a.shp", 200_000)
+    server.truncate.add("/a.zip")
+    cache = ShapefileCache(str(tmp_path))
+    url = mirror(server) + "a.zip"
+
+    with pytest.raises(DownloadError):
+        cache.fetch(url)
+    part = cache.path(url) + ".part"
+    assert 0 < os.path.getsize(part) < len(body)
+
+    assert open(cache.fetch(url), "rb").read() == body
+    assert server.requests[-1] == ("/a.zip", f"bytes={len(body) // 2}-")
+    assert not os.path.exists(part)
+
+
+def test_fetch_rejects_invalid_zip(server, tmp_path):
+    server.files["/bad.zip"] = b"not a zip file"
+    cache = ShapefileCache(str(tmp_path))
+    url = mirror(server) + "bad.zip"
+    with pytest.raises(DownloadError):
+        cache.fetch(url)
+    assert not os.path.exists(cache.path(url))
+    assert not os.path.exists(cache.path(url) + ".part")
+    with pytest.raises(DownloadError):
+        cache.fetch(mirror(server) + "missing.zip")
+
+
+def test_warm(server, tmp_path):
+    states, levels = ["MD", "VA", "DC"], ["state", "county"]
+    for abbr in states:
+        for level in levels:
+            url = us.states.lookup(abbr).shapefile_urls()[level]
+            server.files["/" + url[len(TIGER_URL) :]] = make_zip(f"{abbr}_{level}.shp")
+
+    cache = ShapefileCache(str(tmp_path), max_workers=2, mirror=mirror(server))
+    paths = cache.warm(states, levels)
+    assert len(paths) == 6
+    assert all(zipfile.is_zipfile(path) for path in paths.values())
+    # keep-alive connections are reused across downloads
+    assert len(server.connections) <= 2
+    assert cache.warm(states, levels) == paths
+    assert len(server.requests) == 6
+    cache.close()
+
+    with pytest.raises(ValueError):
+        cache.warm(["Narnia"])
+    with pytest.raises(ValueError):
+        cache.warm(["MD"], ["nope"])
+
+
+# manifests
+
+
+def test_shapefile_urls_vintages():
+    assert us.states.MD.shapefile_urls() == us.states.MD.shapefile_urls("2010")
+    urls = us.states.MD.shapefile_urls("2023")
+    assert urls["cd"] == TIGER_URL + "TIGER2023/CD/tl_2023_24_cd118.zip"
+    assert urls["county"] == TIGER_URL + "TIGER2023/COUNTY/tl_2023_us_county.zip"
+    urls["cd"] = "changed"
+    assert us.states.MD.shapefile_urls("2023")["cd"] != "changed"
+    with pytest.raises(ValueError):
+        us.states.MD.shapefile_urls("1990")
+
+
+def test_manifest():
+    entries = manifest(["VA", us.states.MD], ["county", "cd"], ["2010", "2020"])
+    assert entries == [
+        ManifestEntry("2010", "county", "MD", us.states.MD.shapefile_urls()["county"]),
+        ManifestEntry("2010", "county", "VA", us.states.VA.shapefile_urls()["county"]),
+        ManifestEntry("2010", "cd", "MD", us.states.MD.shapefile_urls()["cd"]),
+        ManifestEntry("2010", "cd", "VA", us.states.VA.shapefile_urls()["cd"]),
+        ManifestEntry("2020", "county", None, TIGER_URL + "TIGER2020/COUNTY/tl_2020_us_county.zip"),
+        ManifestEntry("2020", "cd", "MD", TIGER_URL + "TIGER2020/CD/tl_2020_24_cd116.zip"),
+        ManifestEntry("2020", "cd", "VA", TIGER_URL + "TIGER2020/CD/tl_2020_51_cd116.zip"),
+    ]
+    assert len(manifest()) == 7 * len(us.states._lookup_states())
+    for args in ((["Narnia"],), (["MD"], ["nope"]), (["MD"], None, ["1990"])):
+        with pytest.raises(ValueError):
+            manifest(*args)
+
+
+def test_manifest_cli(capsys):
+    from us.cli.manifest import main
+
+    main(["MD", "dc", "-l", "state", "-l", "tract", "-v", "2020"])
+    assert capsys.readouterr().out.splitlines() == [
+        TIGER_URL + "TIGER2020/STATE/tl_2020_us_state.zip",
+        TIGER_URL + "TIGER2020/TRACT/tl_2020_11_tract.zip",
+        TIGER_URL + "TIGER2020/TRACT/tl_2020_24_tract.zip",
+    ]
+
+    main(["MD", "--level", "state", "--format", "json"])
+    assert json.loads(capsys.readouterr().out) == [
+        {"vintage": "2010", "level": "state", "state": "MD", "url": us.states.MD.shapefile_urls()["state"]}
+    ]
+
+    with pytest.raises(SystemExit):
+        main(["MD", "-v", "1990"])
@@ -0,0 +1,140 @@
+import os
+import pickle
+import struct
+import zipfile
+
+import pytest  # type: ignore
+
+from us import spatial
+from us.shapefiles import ShapefileCache, manifest
+
+
+def box(west, south, east, north):
+    return [(west, south), (west, north), (east, north), (east, south), (west, south)]
+
+
+# a made-up Maryland over a made-up Virginia; county 24003 has a lake, and
+# only county 24001 has a tract
+STATES = [({"GEOID": "24", "NAME": "Maryland"}, [box(-77, 39, -76, 40)]), ({"GEOID": "51"}, [box(-77, 38, -76, 39)])]
+COUNTIES = [
+    ({"GEOID10": "24001"}, [box(-77, 39, -76.5, 40)]),
+    ({"GEOID10": "24003"}, [box(-76.5, 39, -76, 40), box(-76.3, 39.4, -76.2, 39.5)]),
+]
+TRACTS = [({"GEOID": "24001000100"}, [box(-77, 39, -76.5, 40)])]
+
+
+def shp_bytes(shapes) -> bytes:
+    records = []
+    for number, rings in enumerate(shapes, 1):
+        points = [point for ring in rings for point in ring]
+        xs, ys = [x for x, _ in points], [y for _, y in points]
+        parts = [sum(len(ring) for ring in rings[:i]) for i in range(len(rings))]
+        content = struct.pack("<i4d2i", 5, min(xs), min(ys), max(xs), max(ys), len(rings), len(points))
+        content += struct.pack(f"<{len(parts)}i", *parts)
+        content += b"".join(struct.pack("<2d", x, y) for x, y in points)
+        records.append(struct.pack(">2i", number, len(content) // 2) + content)
+    body = b"".join(records)
+    header = struct.pack(">7i", 9994, 0, 0, 0, 0, 0, (100 + len(body)) // 2)
+    header += struct.pack("<2i8d", 1000, 5, -180, -90, 180, 90, 0, 0, 0, 0)
+    return header + body
+
+
+def dbf_bytes(records, deleted=()) -> bytes:
+    names = list(dict.fromkeys(name for record in records for name in record))
+    size = 32
+    header_size = 32 + 32 * len(names) + 1
+    header = struct.pack("<B3BIHH20x", 3, 124, 1, 1, len(records), header_size, 1 + size * len(names))
+    for name in names:
+        header += struct.pack("<11sc4xBB14x", name.encode("ascii"), b"C", size, 0)
+    body = b"".join(
+        (b"*" if i in deleted else b" ") + b"".join(record.get(name, "").encode("utf-8").ljust(size) for name in names)
+        for i, record in enumerate(records)
+    )
+    return header + b"\r" + body + b"\x1a"
+
+
+def write_zip(path, features, deleted=()):
+    name = os.path.splitext(os.path.basename(path))[0]
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(name + ".shp", shp_bytes([rings for _, rings in features]))
+        zf.writestr(name + ".dbf", dbf_bytes([record for record, _ in features], deleted))
+    return str(path)
+
+
+@pytest.fixture
+def sources(tmp_path):
+    return [
+        write_zip(tmp_path / "state.zip", STATES),
+        write_zip(tmp_path / "county.zip", COUNTIES),
+        write_zip(tmp_path / "tract.zip", TRACTS),
+    ]
+
+
+def test_read_shapefile(tmp_path):
+    with open(tmp_path / "county.shp", "wb") as f:
+        f.write(shp_bytes([rings for _, rings in COUNTIES]))
+    with open(tmp_path / "county.dbf", "wb") as f:
+        f.write(dbf_bytes([record for record, _ in COUNTIES]))
+
+    assert list(spatial.read_shapefile(str(tmp_path / "county.shp"))) == COUNTIES
+    assert list(spatial.read_shapefile(write_zip(tmp_path / "county.zip", COUNTIES))) == COUNTIES
+    assert list(spatial.read_shapefile(write_zip(tmp_path / "deleted.zip", COUNTIES, deleted={0}))) == COUNTIES[1:]
+
+
+def test_lookup(sources, tmp_path):
+    path = str(tmp_path / "test.idx")
+    spatial.build_index(sources, path)
+
+    with spatial.SpatialIndex(path) as index:
+        assert len(index) == 5
+        assert index.levels == ["state", "county", "tract"]
+
+        tract = index.lookup(39.5, -76.75)
+        assert (tract.geoid, tract.level, tract.county_fips) == ("24001000100", "tract", "24001")
+        assert tract.state.abbr == "MD"
+        assert index.lookup(39.5, -76.25).geoid == "24003"
+        assert index.lookup(39.45, -76.25).geoid == "24"  # in the lake
+        assert index.lookup(38.5, -76.5).geoid == "51"
+        assert index.lookup(41, -76.5) is None
+        assert index.lookup(float("nan"), -76.5) is None
+
+        assert index.lookup(39.5, -76.75, level="state").geoid == "24"
+        assert index.lookup(39.5, -76.25, level="tract") is None
+        with pytest.raises(ValueError):
+            index.lookup(39.5, -76.75, level="block")
+
+        copy = pickle.loads(pickle.dumps(index))
+        assert copy.lookup(39.5, -76.75) == tract
+        copy.close()
+
+
+def test_build_index_states(sources, tmp_path):
+    path = str(tmp_path / "md.idx")
+    spatial.build_index(sources, path, states=["MD"])
+    with spatial.SpatialIndex(path) as index:
+        assert len(index) == 4
+        assert index.lookup(38.5, -76.5) is None
+
+
+def test_invalid_index(tmp_path):
+    path = tmp_path / "bad.idx"
+    path.write_bytes(b"not an index")
+    with pytest.raises(ValueError):
+        spatial.SpatialIndex(str(path))
+
+    with pytest.raises(ValueError):
+        spatial.build_index([write_zip(tmp_path / "nogeoid.zip", [({"NAME": "x"}, [box(0, 0, 1, 1)])])], str(path))
+
+
+def test_build_from_tiger(tmp_path):
+    cache = ShapefileCache(cache_dir=str(tmp_path / "cache"))
+    fixtures = {"state": STATES, "county": COUNTIES}
+    for entry in manifest(["MD"], ["state", "county"], ["2010"]):
+        os.makedirs(os.path.dirname(cache.path(entry.url)), exist_ok=True)
+        write_zip(cache.path(entry.url), fixtures[entry.level])
+
+    path = str(tmp_path / "tiger.idx")
+    spatial.build_from_tiger(path, ["MD"], levels=["state", "county"], cache=cache)
+    with spatial.SpatialIndex(path) as index:
+        assert index.levels == ["state", "county"]
+        assert index.lookup(39.5, -76.25).geoid == "24003"
@@ -1,3 +1,9 @@
+import datetime
+import os
+import pickle
+import random
+import subprocess
+import sys
 from itertools import chain
 
 import jellyfish  # type: ignore
@@ -5,7 +11,12 @@ import pytest  # type: ignore
 import pytz
 
 import us
+from us import borders, counties, geo, geoid, sets, timezones
+from us.ahocorasick import Automaton
+from us.cache import MISSING, CacheInfo, LRUCache
+from us.sets import StateSet
 
+BUILD_DATA = os.path.join(os.path.dirname(__file__), "..", "..", "scripts", "build_data.py")
 
 # attribute
 
@@ -15,6 +26,35 @@ def test_attribute():
         assert state == getattr(us.states, state.abbr)
 
 
+def test_lazy_attributes():
+    code = "import sys, us; print('MD' in vars(us.states), 'STATES' in vars(us.states))"
+    assert subprocess.check_output([sys.executable, "-c", code], text=True).split() == ["False", "False"]
+    assert "MD" in dir(us.states)
+    assert us.states.MD is us.states.lookup("MD")
+    with pytest.raises(AttributeError):
+        us.states.XX
+
+
+def test_star_imports():
+    namespace: dict = {}
+    exec("from us import *", namespace)
+    assert namespace["STATES"] == us.STATES
+    assert namespace["OBSOLETE"] == us.OBSOLETE
+    assert namespace["birthday"] == us.birthday
+    assert "STATES_AND_TERRITORIES" in dir(us)
+
+    namespace = {}
+    exec("from us.states import *", namespace)
+    assert namespace["MD"] is us.states.MD
+    assert namespace["STATES"] == us.STATES
+    assert namespace["lookup"] is us.states.lookup
+
+
+@pytest.mark.skipif(not os.path.exists(BUILD_DATA), reason="scripts/build_data.py is not distributed")
+def test_generated_data_is_current():
+    subprocess.check_call([sys.executable, BUILD_DATA, "--check"])
+
+
 def test_valid_timezones():
     for state in us.STATES_AND_TERRITORIES:
         if state.capital:
@@ -26,6 +66,35 @@ def test_valid_timezones():
         assert len(state.time_zones) == len(set(state.time_zones))
 
 
+def test_immutable():
+    with pytest.raises(AttributeError):
+        us.states.MD.name = "Murryland"
+    with pytest.raises(AttributeError):
+        del us.states.MD.fips
+    with pytest.raises(AttributeError):
+        us.states.MD.motto = "Fatti maschii, parole femine"
+    assert isinstance(us.states.MD.time_zones, tuple)
+
+
+def test_equality_and_hashing():
+    md = us.states.State(**us.states.MD.asdict())
+    assert md is not us.states.MD
+    assert md == us.states.MD
+    assert hash(md) == hash(us.states.MD)
+    assert len({md, us.states.MD, us.states.VA}) == 2
+    assert {us.states.MD: 1}[md] == 1
+    assert pickle.loads(pickle.dumps(us.states.MD)) == us.states.MD
+    assert us.states.MD != us.states.VA
+    assert us.states.MD != "MD"
+
+
+def test_ordering():
+    ordered = sorted(chain(us.STATES_AND_TERRITORIES, us.OBSOLETE))
+    assert [s.fips for s in ordered[:3]] == ["01", "02", "04"]
+    assert ordered[-3:] == [us.states.DK, us.states.OL, us.states.PI]
+    assert us.states.AL < us.states.MD < us.states.VI
+
+
 # maryland lookup
 
 
@@ -50,6 +119,29 @@ def test_name():
     assert us.states.lookup("Virginia") != us.states.MD
 
 
+def test_aliases():
+    assert us.states.lookup("N.Y.") == us.states.NY
+    assert us.states.lookup("Mass.") == us.states.MA
+    assert us.states.lookup("Wash.") == us.states.WA
+    assert us.states.lookup("W. Va.") == us.states.WV
+    assert us.states.lookup("State of Texas") == us.states.TX
+    assert us.states.lookup("Commonwealth of Virginia") == us.states.VA
+    assert us.states.lookup("the Commonwealth of the Northern Mariana Islands") == us.states.MP
+    assert us.states.lookup("U.S. Virgin Islands") == us.states.VI
+    assert us.states.lookup("  new-york ") == us.states.NY
+
+
+def test_dc_lookup():
+    for val in ("DC", "dc", "11", "District of Columbia", "Washington, D.C.", "Wash DC"):
+        assert us.states.lookup(val) == us.states.DC
+
+
+def test_alias_normalization():
+    assert us.states._normalize("Washington, D.C.") == "washington dc"
+    assert us.states._normalize("The State of  Rhode Island") == "rhode island"
+    assert us.states._normalize("O'Brien") == "obrien"
+
+
 # lookups
 
 
@@ -73,6 +165,529 @@ def test_obsolete_lookup():
         assert us.states.lookup(state.name) is None
 
 
+def test_indexed_lookup_matches_scan():
+    for field in ("fips", "abbr", "name", "ap_abbr", "capital", "statehood_year"):
+        for state in chain(us.STATES_AND_TERRITORIES, us.OBSOLETE):
+            val = getattr(state, field)
+            assert us.states.lookup(val, field=field, use_cache=False) == us.states._scan(val, field)
+
+
+def test_time_zones_lookup():
+    assert us.states.lookup(("America/Phoenix",), field="time_zones") == us.states.AZ
+    assert us.states.lookup(("Europe/London",), field="time_zones") is None
+    assert us.states.lookup(["America/Phoenix"], field="time_zones") is None
+
+
+def test_numeric_fips_lookup():
+    assert us.states.lookup(6) == us.states.CA
+    assert us.states.lookup("6") == us.states.CA
+    assert us.states.lookup(24.0) == us.states.MD
+    assert us.states.lookup(3) is None
+    assert us.states.lookup(None) is None
+    assert us.states.lookup_many([6, "6", 24.0, float("nan")]).states == [
+        us.states.CA,
+        us.states.CA,
+        us.states.MD,
+        None,
+    ]
+
+    # True equals 1, but is not a FIPS code
+    us.states.lookup_cache.clear()
+    assert us.states.lookup(True) is None
+    assert us.states.lookup(1) == us.states.AL
+    result = us.states.lookup_many([True, 1, 1.0, False, "01"])
+    assert result.states == [None, us.states.AL, us.states.AL, None, us.states.AL]
+    assert result.unresolved == [True, False]
+
+
+def test_lookup_many():
+    values = ["24", "md", "Maryland", "murryland", "Narnia", None, "VA", "md", "Narnia"]
+    result = us.states.lookup_many(values)
+    assert result.states == [us.states.lookup(v) if v else None for v in values]
+    assert result.unresolved == ["Narnia", None]
+
+
+def test_lookup_many_field():
+    result = us.states.lookup_many(["Md.", "Va.", "Narnia"], field="ap_abbr")
+    assert result.states == [us.states.MD, us.states.VA, None]
+    assert result.unresolved == ["Narnia"]
+
+
+def test_lookup_array():
+    np = pytest.importorskip("numpy")
+    values = np.array(["md", "24", "Narnia", "virginia", "md"])
+    result = us.states.lookup_array(values)
+    assert isinstance(result, np.ndarray)
+    assert list(result) == [us.states.MD, us.states.MD, None, us.states.VA, us.states.MD]
+    assert list(us.states.lookup_array(values, to_field="fips")) == ["24", "24", None, "51", "24"]
+
+
+def test_lookup_series():
+    pd = pytest.importorskip("pandas")
+    values = pd.Series(["md", None, "Virginia"], index=[10, 11, 12], name="state")
+    result = us.states.lookup_array(values, to_field="abbr")
+    assert list(result.index) == [10, 11, 12]
+    assert result.name == "state"
+    assert result[10] == "MD"
+    assert pd.isna(result[11])
+    assert result[12] == "VA"
+
+
+def test_encode_decode():
+    np = pytest.importorskip("numpy")
+    codes = us.states.encode(np.array(["md", "6", "Narnia", "Virginia", None], dtype=object))
+    assert codes.dtype == np.uint8
+    assert list(codes) == [24, 6, 0, 51, 0]
+    assert list(us.states.decode(codes)) == [us.states.MD, us.states.CA, None, us.states.VA, None]
+    assert list(us.states.decode(codes, "abbr")) == ["MD", "CA", None, "VA", None]
+    assert list(us.states.encode(np.array([6, 3, 99, -1, 24]))) == [6, 0, 0, 0, 24]
+    assert list(us.states.decode(np.array([24, 200], dtype=np.uint8))) == [us.states.MD, None]
+    assert list(us.states.decode(np.array([-1, 300]), "abbr")) == [None, None]
+
+
+def test_encode_series():
+    pd = pytest.importorskip("pandas")
+    codes = us.states.encode(pd.Series([6, None, 24.0], index=[3, 4, 5], name="fips"))
+    assert list(codes) == [6, 0, 24]
+    assert list(codes.index) == [3, 4, 5]
+    assert list(us.states.decode(codes, "abbr").iloc[[0, 2]]) == ["CA", "MD"]
+
+
+def test_lookup_zip():
+    assert us.states.lookup_zip("21201") == us.states.MD
+    assert us.states.lookup_zip("21201-1234") == us.states.MD
+    assert us.states.lookup_zip("212011234") == us.states.MD
+    assert us.states.lookup_zip(2134) == us.states.MA
+    # a ZIP prefix shared by Hawaii and American Samoa
+    assert us.states.lookup_zip("96701") == us.states.HI
+    assert us.states.lookup_zip("96799") == us.states.AS
+    assert us.states.lookup_zip(21201.0) == us.states.MD
+    for val in ("00000", "09001", "2120", "MD", None, True, 21201.5, float("nan")):
+        assert us.states.lookup_zip(val) is None
+
+
+def test_lookup_zip_array():
+    np = pytest.importorskip("numpy")
+    values = np.array(["21201", "02134-0001", "09001", None, "96799"], dtype=object)
+    result = us.states.lookup_zip_array(values, to_field="abbr")
+    assert list(result) == [us.states.lookup_zip(v) and us.states.lookup_zip(v).abbr for v in values]
+    assert list(us.states.lookup_zip_array(np.array([2134, 99999, -1]))) == [us.states.MA, us.states.AK, None]
+    # a ZIP column read as float64 because of missing values
+    assert list(us.states.lookup_zip_array(np.array([2134.0, np.nan]))) == [us.states.MA, None]
+
+
+POINTS = [
+    ((39.29, -76.61), "MD"),  # Baltimore
+    ((38.8977, -77.0365), "DC"),
+    ((39.0997, -94.5786), "MO"),  # Kansas City
+    ((39.1141, -94.6275), "KS"),  # Kansas City
+    ((40.7128, -74.006), "NY"),
+    ((40.7178, -74.0431), "NJ"),  # Jersey City
+    ((61.22, -149.9), "AK"),  # Anchorage
+    ((21.3069, -157.8583), "HI"),  # Honolulu
+    ((18.4655, -66.1057), "PR"),  # San Juan
+    ((-14.2756, -170.702), "AS"),  # Pago Pago
+    ((35.0, -50.0), None),  # Atlantic
+    ((43.5, -87.0), None),  # Lake Michigan
+    ((51.5, -0.13), None),  # London
+]
+
+
+def test_lookup_point():
+    for (lat, lon), abbr in POINTS:
+        state = us.states.lookup_point(lat, lon)
+        assert (state and state.abbr) == abbr, (lat, lon)
+    assert us.states.lookup_point(float("nan"), -76.61) is None
+    assert us.states.lookup_point(95, 200) is None
+
+
+def test_lookup_point_array():
+    np = pytest.importorskip("numpy")
+    lats = np.array([lat for (lat, _), _ in POINTS] + [np.nan])
+    lons = np.array([lon for (_, lon), _ in POINTS] + [0])
+    assert list(us.states.lookup_point_array(lats, lons, to_field="abbr")) == [abbr for _, abbr in POINTS] + [None]
+
+    # points across the contiguous states, many of them in boundary cells
+    rng = np.random.default_rng(0)
+    lats, lons = rng.uniform(24, 50, 2000), rng.uniform(-125, -66, 2000)
+    expected = [us.states.lookup_point(lat, lon) for lat, lon in zip(lats, lons)]
+    assert list(us.states.lookup_point_array(lats, lons)) == expected
+
+
+def test_coordinates():
+    assert us.states.MD.capital_coords == (38.9784, -76.4922)
+    assert us.states.lookup_point(*us.states.MD.centroid) == us.states.MD
+    assert us.states.DC.capital_coords is None
+    assert us.states.DK.centroid is None
+    # Alaska's centroid is computed across the antimeridian
+    assert us.states.lookup_point(*us.states.AK.centroid) == us.states.AK
+
+    for state in us.STATES_AND_TERRITORIES:
+        assert us.states.lookup_point(*state.capital_coords) == state
+
+
+def test_nearest_states():
+    nearest = us.states.nearest_states(39.29, -76.61, k=3)
+    assert [n.state.abbr for n in nearest] == ["MD", "DC", "DE"]
+    assert nearest[0].distance == pytest.approx(geo.haversine(39.29, -76.61, *us.states.MD.centroid))
+    assert [n.state.abbr for n in us.states.nearest_states(39.29, -76.61, k=2, point="capital")] == ["MD", "DE"]
+    assert [n.state.abbr for n in us.states.nearest_states(39.29, -76.61, states=["CA", "tx", "New York"])] == ["NY"]
+    # across the antimeridian from the western Aleutians
+    assert us.states.nearest_states(52.0, 179.9, point="capital")[0].state == us.states.AK
+
+    states = us.states._lookup_states()
+    rng = random.Random(0)
+    for _ in range(200):
+        lat, lon, k = rng.uniform(-90, 90), rng.uniform(-180, 180), rng.randint(1, 5)
+        expected = sorted(states, key=lambda s: geo.haversine(lat, lon, *s.centroid))[:k]
+        assert [n.state for n in us.states.nearest_states(lat, lon, k)] == expected
+
+    with pytest.raises(ValueError):
+        us.states.nearest_states(39.29, -76.61, point="airport")
+
+
+def test_distance():
+    assert us.states.distance("MD", us.states.MD) == 0
+    assert 3700 < us.states.distance("MD", "CA") < 3750
+    assert us.states.distance("DC", "MD", point="capital") is None
+
+
+def test_distance_matrix():
+    np = pytest.importorskip("numpy")
+    matrix = us.states.distance_matrix()
+    assert matrix.shape == (100, 100)
+    assert np.isnan(matrix[0, 24])
+    assert matrix[24, 6] == pytest.approx(us.states.distance("MD", "CA"))
+    assert np.array_equal(matrix, matrix.T, equal_nan=True)
+
+    codes = us.states.encode(np.array(["MD", "VA", "TX"]))
+    assert list(matrix[codes, us.states.encode(np.array(["DC", "DC", "DC"]))]) == pytest.approx(
+        [us.states.distance(abbr, "DC") for abbr in ["MD", "VA", "TX"]]
+    )
+    with pytest.raises(ValueError):
+        matrix[0, 0] = 1
+
+
+def test_lookup_candidates():
+    candidates = us.states.lookup_candidates("West Verginia")
+    assert len(candidates) == 3
+    state, score = candidates[0]
+    assert state == us.states.WV
+    assert 0.9 < score <= 1
+    assert [c.score for c in candidates] == sorted((c.score for c in candidates), reverse=True)
+
+    assert us.states.lookup_candidates("Maryland", k=1) == [(us.states.MD, 1.0)]
+    assert us.states.lookup_candidates("Wayoming")[0].state == us.states.WY
+    assert us.states.lookup_candidates("zz") == []
+    assert us.states.lookup_candidates("Maryland", k=0) == []
+    with pytest.raises(ValueError):
+        us.states.lookup_candidates("Maryland", k=-1)
+
+
+def test_lookup_candidates_threads(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(us.states, "_fuzzy", None)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: us.states.lookup_candidates("Maryland", k=60), range(32)))
+    assert all(result == results[0] for result in results)
+    assert len({c.state for c in results[0]}) == len(results[0])
+
+
+def test_lookup_candidates_min_score():
+    candidates = us.states.lookup_candidates("missisipi", k=10, min_score=0.9)
+    assert [c.state for c in candidates] == [us.states.MS]
+
+
+# extraction
+
+
+def test_automaton():
+    automaton = Automaton([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+    assert list(automaton.iter("ushers")) == [(1, 4, 2), (2, 4, 1), (2, 6, 4)]
+    assert list(automaton.iter("xyz")) == []
+
+
+def test_extract():
+    text = "From Baltimore, MD 21201 to Charleston, West Virginia. Call the Calif. office or log in. Not Arkansas."
+    mentions = us.states.extract(text)
+    assert [m.state for m in mentions] == [us.states.MD, us.states.WV, us.states.CA, us.states.AR]
+    assert [text[slice(*m.span)] for m in mentions] == ["MD", "West Virginia", "Calif.", "Arkansas"]
+
+
+def test_extract_strict_abbrs():
+    assert us.states.extract("log in or email me") == []
+    assert [m.state for m in us.states.extract("IN OR", strict_abbrs=True)] == [us.states.IN, us.states.OR]
+    loose = us.states.extract("log in or email me", strict_abbrs=False)
+    assert [m.state for m in loose] == [us.states.IN, us.states.OR, us.states.ME]
+    assert us.states.extract("mdx, xmd") == []
+
+    assert us.states.extract("I need to wash. Then mass. Then ohio.") == [
+        (us.states.OH, (32, 36)),
+    ]
+    assert [m.state for m in us.states.extract("Wash. and Mass.")] == [us.states.WA, us.states.MA]
+    assert [m.state for m in us.states.extract("wash.", strict_abbrs=False)] == [us.states.WA]
+
+
+def test_extract_dc():
+    mentions = us.states.extract("1600 Pennsylvania Ave NW, Washington, DC 20500")
+    assert [m.state for m in mentions] == [us.states.PA, us.states.DC]
+    assert mentions[1].span == (26, 40)
+    for text in ("Washington, D.C. 20001", "washington dc", "Washington DC"):
+        assert [m.state for m in us.states.extract(text)] == [us.states.DC]
+    assert [m.state for m in us.states.extract("Seattle, Washington")] == [us.states.WA]
+
+
+# state sets
+
+
+def test_stateset_lists():
+    for name in ("STATES", "TERRITORIES", "STATES_CONTIGUOUS", "STATES_CONTINENTAL", "COMMONWEALTHS", "OBSOLETE"):
+        stateset = getattr(sets, name)
+        assert list(stateset) == sorted(getattr(us.states, name))
+        assert all(state in stateset for state in getattr(us.states, name))
+    assert us.states.AK not in sets.STATES_CONTIGUOUS
+    assert "MD" not in sets.STATES
+    assert len(sets.STATES) == 50
+
+
+def test_stateset_algebra():
+    assert sets.STATES | sets.TERRITORIES == sets.STATES_AND_TERRITORIES
+    assert sets.STATES - sets.STATES_CONTIGUOUS == StateSet(["AK", "HI"])
+    assert sets.STATES & sets.TERRITORIES == StateSet()
+    assert sets.STATES ^ sets.STATES_CONTINENTAL == StateSet([us.states.HI])
+    assert sets.COMMONWEALTHS < sets.STATES
+    assert sets.STATES.isdisjoint(sets.OBSOLETE)
+    assert StateSet.from_mask(sets.STATES.mask) == sets.STATES
+    assert pickle.loads(pickle.dumps(sets.OBSOLETE)) == sets.OBSOLETE
+    with pytest.raises(ValueError):
+        StateSet(["Narnia"])
+    with pytest.raises(ValueError):
+        StateSet.from_mask(1)
+    with pytest.raises(AttributeError):
+        sets.STATES.mask = 0
+
+
+def test_stateset_isin():
+    np = pytest.importorskip("numpy")
+    codes = us.states.encode(np.array(["md", "ak", "pr", "Narnia"]))
+    assert list(sets.STATES_CONTIGUOUS.isin(codes)) == [True, False, False, False]
+    assert list(sets.STATES.filter(codes)) == [24, 2]
+    assert list(sets.STATES.isin(np.array([24, 200], dtype=np.uint8))) == [True, False]
+
+
+# borders
+
+
+def test_neighbors():
+    assert borders.neighbors("MD") == StateSet(["DE", "DC", "PA", "VA", "WV"])
+    # the Four Corners and Lake Michigan aren't borders
+    assert us.states.CO not in borders.neighbors("AZ")
+    assert us.states.IL not in borders.neighbors(us.states.MI)
+    assert not borders.neighbors("HI")
+    assert not borders.neighbors("pr")
+    for state in us.STATES_AND_TERRITORIES:
+        for neighbor in borders.neighbors(state):
+            assert state in borders.neighbors(neighbor)
+            assert borders.hops(state, neighbor) == 1
+
+    with pytest.raises(ValueError):
+        borders.neighbors("Narnia")
+    with pytest.raises(ValueError):
+        borders.neighbors(us.states.DK)
+
+
+def test_hops_and_within():
+    assert borders.hops("ME", "CA") == 11
+    assert borders.hops("MD", "MD") == 0
+    assert borders.hops("HI", "CA") is None
+
+    assert borders.within("MD", 0) == StateSet(["MD"])
+    assert borders.within("MD", 1) == borders.neighbors("MD") | StateSet(["MD"])
+    assert borders.within("MD", 2) == StateSet(["DE", "DC", "KY", "MD", "NJ", "NY", "NC", "OH", "PA", "TN", "VA", "WV"])
+    assert borders.within("MD", 100) == sets.STATES_CONTIGUOUS | StateSet(["DC"])
+    assert borders.within("HI", 5) == StateSet(["HI"])
+    assert borders.within(StateSet(["ME", "WA"]), 1) == StateSet(["ME", "NH", "WA", "ID", "OR"])
+    for n in range(4):
+        expected = StateSet(s for s in borders.within("KS", 100) if borders.hops("KS", s) <= n)
+        assert borders.within("KS", n) == expected
+
+    with pytest.raises(ValueError):
+        borders.within("MD", -1)
+
+
+def test_hop_matrix():
+    np = pytest.importorskip("numpy")
+    matrix = borders.hop_matrix()
+    assert np.array_equal(matrix, matrix.T)
+    assert matrix[23, 6] == borders.hops("ME", "CA")
+    assert matrix[15, 6] == borders.UNREACHABLE
+    assert matrix[0, 0] == borders.UNREACHABLE
+
+
+# counties
+
+
+def test_county_get():
+    county = counties.get("24510")
+    assert county == ("24", "510", "Baltimore", "city")
+    assert county.fips == "24510"
+    assert county.full_name == "Baltimore city"
+    assert county.state == us.states.MD
+    assert counties.get(6037).full_name == "Los Angeles County"
+    assert counties.get("99999") is None
+    assert counties.get(None) is None
+
+
+def test_county_lookup_by_name():
+    pg = counties.get("24033")
+    for name in ("Prince George's County", "prince georges", "Prince Georges Co."):
+        assert counties.lookup(name, "MD") == pg
+    assert counties.lookup("Baltimore", "MD") is None
+    assert counties.lookup("Baltimore city", us.states.MD).fips == "24510"
+    assert counties.lookup("Baltimore County", "MD").fips == "24005"
+    assert counties.lookup("Brooklyn", "NY").fips == "36047"
+    assert counties.lookup("Shannon County", "SD").full_name == "Oglala Lakota County"
+    assert counties.lookup("Prince George's", "VA") is None
+    assert counties.lookup("Montgomery", "Narnia") is None
+
+
+def test_counties_in_state():
+    md = counties.in_state("MD")
+    assert len(md) == 24
+    assert [c.fips for c in md] == sorted(c.fips for c in md)
+    assert all(c.state_fips == "24" for c in md)
+    assert len(counties.in_state(us.states.PR)) == 78
+    assert counties.in_state("Narnia") == []
+    assert len(counties.COUNTIES) == sum(len(counties.in_state(s)) for s in us.states._lookup_states())
+
+
+# GEOIDs
+
+
+def test_parse_geoid():
+    block = geoid.parse("245100401001001")
+    assert block == ("245100401001001", "block", us.states.MD, "510", "040100", "1", "1001")
+    assert block.county_fips == "24510"
+    assert geoid.parse("06037").level == "county"
+    assert geoid.parse("060371234561").block_group == "1"
+    assert geoid.parse("72").state == us.states.PR
+    for level in geoid.LEVELS.values():
+        assert level in us.states.MD.shapefile_urls()
+    for val in ("2451", "03000", "24x10", "2451004010010011", 24510):
+        with pytest.raises(ValueError):
+            geoid.parse(val)
+
+
+def test_parse_geoid_array():
+    np = pytest.importorskip("numpy")
+    values = ["24", "24510", "24510040100", "245100401001", "245100401001001", "2451", "03000", "24x10", "", None]
+    result = geoid.parse_array(np.array(values, dtype=object))
+    assert list(result.valid) == [True] * 5 + [False] * 5
+    assert list(result.length) == [2, 5, 11, 12, 15] + [0] * 5
+    assert list(us.states.decode(result.state, "abbr")) == ["MD"] * 5 + [None] * 5
+    assert list(result.county) == [-1] + [24510] * 4 + [-1] * 5
+    assert list(geoid.parse_array(np.array(values[:5])).valid) == [True] * 5
+
+
+# time zones
+
+
+def test_states_in_time_zone():
+    assert us.states.CO in us.states.states_in_time_zone("America/Denver")
+    assert us.states.states_in_time_zone("America/Phoenix") == [us.states.AZ]
+    assert us.states.states_in_time_zone("Europe/London") == []
+
+
+def test_utc_offsets():
+    summer, winter = 1719792000, 1704067200
+    assert timezones.utc_offsets(["MD", us.states.MD, "Narnia"], [summer, winter, summer]) == [-14400, -18000, None]
+    times = timezones.local_times(["CA"], [summer])
+    assert times[0].utcoffset().total_seconds() == -25200
+    assert times[0].tzinfo == timezones.zone("America/Los_Angeles")
+
+
+def test_utc_offsets_array():
+    np = pytest.importorskip("numpy")
+    # 2024-03-10 07:00 UTC is 2am EST, when Maryland springs forward
+    transition = 1710054000
+    timestamps = np.array([transition - 1800, transition - 1, transition, transition + 1800] * 2)
+    values = ["MD"] * 4 + ["ca", "Narnia", "ca", "AZ"]
+    offsets = timezones.utc_offsets(values, timestamps)
+    assert list(offsets) == timezones.utc_offsets(values, timestamps.tolist())
+    assert list(offsets[:4]) == [-18000, -18000, -14400, -14400]
+    dates = timestamps.astype("datetime64[s]").astype("datetime64[ns]")
+    assert list(timezones.utc_offsets(values, dates)) == list(offsets)
+
+    summer = np.array([1719792000] * 4)
+    missing = ["MD", None, "CA", float("nan")]
+    assert list(timezones.utc_offsets(missing, summer)) == [-14400, None, -25200, None]
+    assert list(timezones.utc_offsets([us.states.MD, "CA"], summer[:2])) == [-14400, -25200]
+
+
+def test_utc_offsets_aware():
+    np = pytest.importorskip("numpy")
+    summer = datetime.datetime(2024, 7, 1, tzinfo=datetime.timezone.utc)
+    aware = np.array([summer, summer.astimezone(pytz.timezone("Asia/Tokyo"))], dtype=object)
+    assert list(timezones.utc_offsets(["MD", "CA"], aware)) == [-14400, -25200]
+
+    pd = pytest.importorskip("pandas")
+    series = pd.Series(pd.to_datetime(["2024-07-01 09:00", "2024-01-01 09:00"])).dt.tz_localize("Asia/Tokyo")
+    assert list(timezones.utc_offsets(["MD", "MD"], series)) == [-14400, -18000]
+    assert timezones.local_times(["MD"], series)[0].hour == 20
+
+
+# cache
+
+
+def test_lookup_cache():
+    us.states.lookup_cache.clear()
+    assert us.states.lookup("Maryland") == us.states.MD
+    assert us.states.lookup("Maryland") == us.states.MD
+    info = us.states.lookup_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_lookup_cache_negative():
+    us.states.lookup_cache.clear()
+    assert us.states.lookup("Narnia") is None
+    assert (None, "Narnia") in us.states.lookup_cache
+    assert us.states.lookup("Narnia") is None
+    assert us.states.lookup_cache.info().hits == 1
+
+
+def test_lookup_cache_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b", MISSING) is MISSING
+    assert cache.get("a") == 1
+    assert cache.info() == CacheInfo(hits=2, misses=1, evictions=1, maxsize=2, currsize=2)
+
+    cache.resize(1)
+    assert len(cache) == 1
+    assert "a" in cache
+
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=1, currsize=0)
+
+
+def test_lookup_cache_negative_size():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
+    cache = LRUCache(maxsize=2)
+    with pytest.raises(ValueError):
+        cache.resize(-1)
+    assert cache.maxsize == 2
+
+    env = dict(os.environ, US_LOOKUP_CACHE_SIZE="-1")
+    proc = subprocess.run([sys.executable, "-c", "import us"], env=env, capture_output=True, text=True)
+    assert proc.returncode != 0
+    assert "US_LOOKUP_CACHE_SIZE" in proc.stderr
+
+
 # test metaphone
 
 
@@ -81,6 +696,25 @@ def test_jellyfish_metaphone():
         assert state.name_metaphone == jellyfish.metaphone(state.name)
 
 
+def test_metaphone_deferred():
+    code = "import sys, us; us.states.lookup('maryland'); us.states.lookup('MD'); print('jellyfish' in sys.modules)"
+    assert subprocess.check_output([sys.executable, "-c", code], text=True).strip() == "False"
+
+
+def test_import_deferred():
+    deferred = ["typing", "threading", "numbers"]
+    code = "import sys; before = set(sys.modules); import us; "
+    code += f"print([m for m in {deferred!r} if m in sys.modules and m not in before])"
+    assert subprocess.check_output([sys.executable, "-c", code], text=True).strip() == "[]"
+
+
+def test_cli_argparse_deferred():
+    code = "import sys; sys.argv = ['states', 'MD']; from us.cli.states import main; main(); print(sorted(sys.modules))"
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert "Maryland" in output
+    assert "'argparse'" not in output.splitlines()[-1]
+
+
 # mappings
 
 
@@ -102,6 +736,29 @@ def test_custom_mapping():
     assert "MD" in mapping
 
 
+def test_mapping_cached():
+    mapping = us.states.mapping("abbr", "fips")
+    assert us.states.mapping("abbr", "fips") is mapping
+    assert us.states.mapping("fips", "abbr") is not mapping
+    assert us.states.mapping("abbr", "fips", states=us.STATES) is not mapping
+    with pytest.raises(TypeError):
+        mapping["MD"] = "00"
+
+
+def test_mapping_multimap():
+    mapping = us.states.mapping("time_zones", "abbr")
+    assert "CO" in mapping["America/Denver"]
+    assert mapping["America/Phoenix"] == ("AZ",)
+    assert mapping == {
+        tz: tuple(s.abbr for s in us.STATES_AND_TERRITORIES if tz in s.time_zones)
+        for s in us.STATES_AND_TERRITORIES
+        for tz in s.time_zones
+    }
+
+    coords = us.states.mapping("capital_coords", "abbr")
+    assert coords[us.states.MD.capital_coords] == "MD"
+
+
 # known bugs
 
 
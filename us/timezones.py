@@ -0,0 +1,130 @@
+"""Local time at state capitals for batches of (state, UTC timestamp) pairs.
+
+Time zone objects are created once per zone, and UTC offsets are memoized
+per zone and hour, since US time zones only change offset on the hour.
+Hours that contain a transition are detected and computed exactly.
+"""
+
+import datetime
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Union
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python 3.8
+    from backports.zoneinfo import ZoneInfo  # type: ignore
+
+from . import states
+
+Timestamp = Union[int, float, datetime.datetime]
+
+
+@lru_cache(maxsize=None)
+def zone(name: str) -> ZoneInfo:
+    """The ZoneInfo for an IANA time zone name, created once per name."""
+    return ZoneInfo(name)
+
+
+def _offset(tz: str, ts: float) -> int:
+    return int(datetime.datetime.fromtimestamp(ts, zone(tz)).utcoffset().total_seconds())  # type: ignore
+
+
+@lru_cache(maxsize=1 << 16)
+def _hour_offset(tz: str, hour: int) -> Optional[int]:
+    """UTC offset of `tz` throughout an hour since the epoch, or None if it
+    changes within the hour."""
+    start = _offset(tz, hour * 3600)
+    end = _offset(tz, hour * 3600 + 3599)
+    return start if start == end else None
+
+
+def utc_offset(tz: str, ts: float) -> int:
+    """UTC offset in seconds of the time zone `tz` at the UTC timestamp `ts`."""
+    offset = _hour_offset(tz, int(ts // 3600))
+    return _offset(tz, ts) if offset is None else offset
+
+
+def _capital_zones(values: Iterable[Any]) -> List[Optional[str]]:
+    """Capital time zones for State objects or values `lookup()` accepts."""
+    values = list(values)
+    unresolved = [val for val in values if not isinstance(val, states.State)]
+    resolved = dict(zip(unresolved, states.lookup_many(unresolved).states))
+    zones = []
+    for val in values:
+        state = val if isinstance(val, states.State) else resolved[val]
+        zones.append(state.capital_tz if state is not None else None)
+    return zones
+
+
+def _epoch_seconds(timestamps) -> List[float]:
+    if hasattr(timestamps, "dtype") and getattr(timestamps.dtype, "tz", None) is not None:
+        # tz-aware pandas data, which is UTC datetime64 once the zone is dropped
+        import pandas as pd  # type: ignore
+
+        timestamps = pd.DatetimeIndex(timestamps).tz_convert("UTC").tz_localize(None).to_numpy()
+    if hasattr(timestamps, "dtype") and timestamps.dtype.kind == "M":
+        # NumPy datetime64
+        return timestamps.astype("datetime64[s]").astype("int64").tolist()
+    return [ts.timestamp() if isinstance(ts, datetime.datetime) else ts for ts in timestamps]
+
+
+def utc_offsets(values: Iterable[Any], timestamps: Iterable[Timestamp]):
+    """UTC offsets in seconds of the capital time zone of each state at the
+    paired UTC timestamp, or None for states that have no capital time zone
+    or can't be found.
+
+    States may be State objects or any value `lookup()` accepts. Timestamps
+    are seconds since the epoch or aware datetimes. When the timestamps are
+    a NumPy array or pandas Series of epoch seconds, datetime64 values,
+    including tz-aware ones, or aware datetimes, offsets are looked up once
+    per distinct (state, hour) and broadcast back, and an object array is
+    returned; other input returns a list.
+    """
+
+    if hasattr(timestamps, "dtype"):
+        return _utc_offsets_array(values, timestamps)
+
+    zones = _capital_zones(values)
+    return [None if tz is None else utc_offset(tz, ts) for tz, ts in zip(zones, _epoch_seconds(timestamps))]
+
+
+def _utc_offsets_array(values, timestamps):
+    import numpy as np  # type: ignore
+
+    if timestamps.dtype.kind in "MO":
+        # datetime64 values, or an object array of datetimes
+        seconds = np.floor(np.asarray(_epoch_seconds(timestamps), dtype=np.float64)).astype(np.int64)
+    else:
+        seconds = np.asarray(timestamps, dtype=np.int64)
+
+    state_codes, uniques = states._factorize(np.asarray(values, dtype=object))
+    # the extra trailing None is picked up by the -1 codes of missing values
+    zones = _capital_zones(uniques) + [None]
+
+    pairs, pair_codes = np.unique(
+        np.stack([np.asarray(state_codes).reshape(-1), seconds // 3600], axis=1), axis=0, return_inverse=True
+    )
+    pair_offsets = np.empty(len(pairs), dtype=object)
+    for i, (code, hour) in enumerate(pairs.tolist()):
+        tz = zones[code]
+        pair_offsets[i] = None if tz is None else _hour_offset(tz, hour)
+    offsets = pair_offsets[pair_codes.reshape(-1)]
+
+    # hours that contain a transition are computed row by row
+    for row in np.flatnonzero(np.equal(offsets, None)):
+        tz = zones[pairs[pair_codes.reshape(-1)[row]][0]]
+        if tz is not None:
+            offsets[row] = _offset(tz, int(seconds[row]))
+    return offsets
+
+
+def local_times(values: Iterable[Any], timestamps: Iterable[Timestamp]) -> List[Optional[datetime.datetime]]:
+    """Local time at the capital of each state at the paired UTC timestamp,
+    as an aware datetime, or None for states that have no capital time zone
+    or can't be found. Accepts the same input as `utc_offsets()`."""
+
+    zones = _capital_zones(values)
+    return [
+        None if tz is None else datetime.datetime.fromtimestamp(ts, zone(tz))
+        for tz, ts in zip(zones, _epoch_seconds(timestamps))
+    ]